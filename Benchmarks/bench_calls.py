@@ -0,0 +1,90 @@
+"""Measures calls per second of the hot Dear PyGui commands.
+
+The fast call commands (set_value, get_value, configure_item, draw_*, add_*_series,
+append_series_data, set_table_item) are timed next to a few regular commands so the
+gain is visible in a single run. To compare two builds, run the script against each
+and diff the output:
+
+    python bench_calls.py --json before.json   (old build)
+    python bench_calls.py --json after.json    (new build)
+
+Cases are keyed by the command they time. Commands the build does not have
+(append_series_data on older builds) are reported as skipped.
+"""
+import argparse
+import json
+import time
+
+import dearpygui.core
+from dearpygui.core import *
+from dearpygui.simple import *
+
+
+def setup():
+    with window("bench"):
+        add_drawing("drawing", width=200, height=200)
+        add_plot("plot")
+        add_table("table", ["a", "b"])
+        add_text("text")
+    add_value("value", 0)
+    set_table_data("table", [["a", "b"] for _ in range(10)])
+
+
+def cases():
+    xs = [float(i) for i in range(100)]
+    return {
+        # fast call commands
+        "set_value": lambda: set_value("value", 1),
+        "get_value": lambda: get_value("value"),
+        "configure_item": lambda: configure_item("text", show=True),
+        "draw_line": lambda: draw_line("drawing", [0, 0], [10, 10], [255, 0, 0, 255], 1, tag="line"),
+        "add_line_series": lambda: add_line_series("plot", "series", xs, xs),
+        "append_series_data": lambda: append_series_data("plot", "stream", [1.0], [1.0], max_points=2000),
+        "set_table_item": lambda: set_table_item("table", 0, 0, "x"),
+        # regular commands for reference
+        "does_item_exist": lambda: does_item_exist("text"),
+        "get_item_type": lambda: get_item_type("text"),
+    }
+
+
+def run(func, duration):
+    # warm up, then time batches until the duration is used up
+    for _ in range(100):
+        func()
+
+    calls = 0
+    start = time.perf_counter()
+    elapsed = 0.0
+    while elapsed < duration:
+        for _ in range(1000):
+            func()
+        calls += 1000
+        elapsed = time.perf_counter() - start
+
+    return calls / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--duration", type=float, default=1.0, help="seconds spent on each command")
+    parser.add_argument("--json", help="write the results to this file")
+    args = parser.parse_args()
+
+    setup()
+
+    results = {}
+    for name, func in cases().items():
+        if not hasattr(dearpygui.core, name):
+            results[name] = None
+            print(f"{name:<20}{'skipped':>14}")
+            continue
+        results[name] = run(func, args.duration)
+        print(f"{name:<20}{results[name]:>14,.0f} calls/s")
+
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump(results, file, indent=4)
+
+
+if __name__ == "__main__":
+    main()
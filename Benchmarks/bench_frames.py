@@ -0,0 +1,200 @@
+"""Measures frame times of standard scenes rendered through the headless viewport.
+
+Each scene runs in its own process so peak RSS belongs to that scene alone. A
+scene is built, rendered for a few warm up frames and then timed frame by frame:
+
+    widgets   10k basic widgets in one window
+    table     100k row table
+    plot      1M point line series
+    drawing   50k draw commands
+    logger    logger holding 1M lines
+
+Results (p50/p99 ms per frame, peak RSS) are printed and optionally written as
+JSON. Pass a previous run to --compare to flag regressions:
+
+    python bench_frames.py --json 0.9.json
+    python bench_frames.py --json 1.0.json --compare 0.9.json
+"""
+import argparse
+import json
+import math
+import platform
+import subprocess
+import sys
+import time
+
+SCENES = ["widgets", "table", "plot", "drawing", "logger"]
+
+
+def scaled(count, scale):
+    return max(1, int(count * scale))
+
+
+def build_widgets(dpg, simple, scale):
+    with simple.window("bench", width=1280, height=800):
+        for i in range(scaled(2000, scale)):
+            dpg.add_text(f"text{i}")
+            dpg.add_button(f"button{i}")
+            dpg.add_checkbox(f"checkbox{i}")
+            dpg.add_slider_float(f"slider{i}")
+            dpg.add_input_text(f"input{i}")
+
+
+def build_table(dpg, simple, scale):
+    columns = ["id", "name", "value", "status"]
+    with simple.window("bench", width=1280, height=800):
+        dpg.add_table("table", columns, height=-1)
+    rows = [[str(i), f"row{i}", str(i * 0.5), "ok"] for i in range(scaled(100_000, scale))]
+    dpg.set_table_data("table", rows)
+
+
+def build_plot(dpg, simple, scale):
+    count = scaled(1_000_000, scale)
+    x = [i * 0.001 for i in range(count)]
+    y = [math.sin(v) for v in x]
+    with simple.window("bench", width=1280, height=800):
+        dpg.add_plot("plot", height=-1)
+    dpg.add_line_series("plot", "series", x, y)
+
+
+def build_drawing(dpg, simple, scale):
+    with simple.window("bench", width=1280, height=800):
+        dpg.add_drawing("drawing", width=1200, height=760)
+    for i in range(scaled(50_000, scale)):
+        x = (i * 7) % 1200
+        y = (i * 13) % 760
+        dpg.draw_line("drawing", [x, y], [x + 20, y + 20], [255, 0, 0, 255], 1)
+
+
+def build_logger(dpg, simple, scale):
+    with simple.window("bench", width=1280, height=800):
+        dpg.add_logger("logger", log_level=0, autosize_x=True, autosize_y=True)
+    for i in range(scaled(1_000_000, scale)):
+        dpg.log_info(f"line {i}", logger="logger")
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    index = max(0, math.ceil(fraction * len(ordered)) - 1)
+    return ordered[index]
+
+
+def peak_rss_mb():
+    try:
+        import resource
+    except ImportError:  # windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on linux, bytes on macos
+    return peak / (1024.0 * 1024.0) if sys.platform == "darwin" else peak / 1024.0
+
+
+def run_scene(name, frames, warmup, scale):
+    import dearpygui.core as dpg
+    import dearpygui.simple as simple
+
+    dpg.set_headless(True)
+    dpg.set_vsync(False)
+    dpg.set_main_window_size(1280, 800)
+
+    start = time.perf_counter()
+    globals()["build_" + name](dpg, simple, scale)
+    dpg.setup_dearpygui()
+    for _ in range(warmup):
+        dpg.render_dearpygui_frame()
+    setup = time.perf_counter() - start
+
+    times = []
+    for _ in range(frames):
+        frame_start = time.perf_counter()
+        dpg.render_dearpygui_frame()
+        times.append((time.perf_counter() - frame_start) * 1000.0)
+
+    dpg.cleanup_dearpygui()
+
+    return {
+        "setup_s": setup,
+        "p50_ms": percentile(times, 0.50),
+        "p99_ms": percentile(times, 0.99),
+        "mean_ms": sum(times) / len(times),
+        "max_ms": max(times),
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def spawn_scene(name, args):
+    command = [sys.executable, __file__, "--scene", name, "--frames", str(args.frames),
+               "--warmup", str(args.warmup), "--scale", str(args.scale)]
+    output = subprocess.run(command, check=True, stdout=subprocess.PIPE, universal_newlines=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def compare(results, baseline, threshold):
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get("scenes", {}).get(name)
+        if previous is None:
+            continue
+        for key in ("p50_ms", "p99_ms", "peak_rss_mb"):
+            if current.get(key) is None or not previous.get(key):
+                continue
+            change = current[key] / previous[key] - 1.0
+            flag = "  REGRESSION" if change > threshold else ""
+            print(f"{name:<10}{key:<14}{previous[key]:>10.2f} -> {current[key]:>10.2f} ({change:+.1%}){flag}")
+            if flag:
+                regressions.append((name, key))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenes", nargs="+", choices=SCENES, default=SCENES, help="scenes to run")
+    parser.add_argument("--frames", type=int, default=300, help="timed frames per scene")
+    parser.add_argument("--warmup", type=int, default=10, help="untimed frames before timing")
+    parser.add_argument("--scale", type=float, default=1.0, help="multiplies every scene's size")
+    parser.add_argument("--json", help="write the results to this file")
+    parser.add_argument("--compare", help="previous results to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10, help="relative increase reported as a regression")
+    parser.add_argument("--scene", choices=SCENES, help=argparse.SUPPRESS)  # worker process
+    args = parser.parse_args()
+
+    if args.scene:
+        print(json.dumps(run_scene(args.scene, args.frames, args.warmup, args.scale)))
+        return
+
+    results = {}
+    for name in args.scenes:
+        results[name] = spawn_scene(name, args)
+        result = results[name]
+        rss = "n/a" if result["peak_rss_mb"] is None else f"{result['peak_rss_mb']:.1f} MB"
+        print(f"{name:<10}p50 {result['p50_ms']:>8.2f} ms   p99 {result['p99_ms']:>8.2f} ms   peak rss {rss}")
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "frames": args.frames,
+            "scale": args.scale,
+        },
+        "scenes": results,
+    }
+
+    try:
+        import dearpygui.core as dpg
+        report["meta"]["dearpygui"] = dpg.get_dearpygui_version()
+    except ImportError:
+        pass
+
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump(report, file, indent=4)
+
+    if args.compare:
+        with open(args.compare) as file:
+            regressions = compare(results, json.load(file), args.threshold)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
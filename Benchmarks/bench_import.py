@@ -0,0 +1,48 @@
+"""Measures how long `import dearpygui.core` takes in a fresh interpreter.
+
+Each run starts a new process, the same way short-lived worker processes do, and
+subtracts the startup time of an interpreter that imports nothing.
+
+    python bench_import.py --runs 20 --json import.json
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+
+def spawn(code):
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-c", code], check=True)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10, help="number of processes to start")
+    parser.add_argument("--json", help="write the results to this file")
+    args = parser.parse_args()
+
+    baseline = [spawn("pass") for _ in range(args.runs)]
+    imports = [spawn("import dearpygui.core") for _ in range(args.runs)]
+    first_call = [spawn("import dearpygui.core as dpg; dpg.does_item_exist('x')") for _ in range(args.runs)]
+
+    startup = statistics.median(baseline)
+    results = {
+        "import_ms": (statistics.median(imports) - startup) * 1000.0,
+        "import_min_ms": (min(imports) - min(baseline)) * 1000.0,
+        "import_and_first_call_ms": (statistics.median(first_call) - startup) * 1000.0,
+    }
+
+    for name, value in results.items():
+        print(f"{name:<28}{value:>10.2f}")
+
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump(results, file, indent=4)
+
+
+if __name__ == "__main__":
+    main()
@@ -14,12 +14,16 @@ set(MARVEL_SOURCES
 	"$<$<PLATFORM_ID:Linux>:src/platform/Linux/mvUtilities.cpp>"
 	"$<$<PLATFORM_ID:Linux>:src/platform/Linux/mvLinuxWindow.cpp>"
 
+	"src/platform/Headless/mvHeadlessWindow.cpp"
+
 	"src/core/mvEvents.cpp"
 	"src/core/mvApp.cpp"
 	"src/core/mvAppLog.cpp"
 	"src/core/mvInput.cpp"
 	"src/core/mvWindow.cpp"
 	"src/core/mvProfiler.cpp"
+	"src/core/mvFrameScheduler.cpp"
+	"src/core/mvParallel.cpp"
 
 	"src/core/Theming/mvAppItemStyleManager.cpp"
 	"src/core/Theming/mvAppItemTheme.cpp"
@@ -46,6 +50,7 @@ set(MARVEL_SOURCES
 	"src/core/PythonUtilities/mvPyObject.cpp"
 	"src/core/PythonUtilities/mvPythonTranslator.cpp"
 	"src/core/PythonUtilities/mvPythonParser.cpp"
+	"src/core/PythonUtilities/mvPythonCommand.cpp"
 	"src/core/PythonUtilities/mvPythonExceptions.cpp"
 	"src/core/PythonUtilities/mvGlobalIntepreterLock.cpp"
 
@@ -108,6 +113,9 @@ set(MARVEL_SOURCES
 	"src/core/AppItems/composite/mvDebugWindow.cpp"
 	"src/core/AppItems/composite/mvDocWindow.cpp"
 	"src/core/AppItems/composite/mvTable.cpp"
+	"src/core/AppItems/composite/mvTableColumn.cpp"
+	"src/core/AppItems/composite/mvTableIndex.cpp"
+	"src/core/AppItems/composite/mvTableSelection.cpp"
 	"src/core/AppItems/composite/mvLogger.cpp"
 	"src/core/AppItems/composite/mvStyleWindow.cpp"
 	"src/core/AppItems/composite/mvMetricsWindow.cpp"
@@ -115,6 +123,10 @@ set(MARVEL_SOURCES
 	
 	"src/core/AppItems/plots/mvPlot.cpp"
 	"src/core/AppItems/plots/mvAreaSeries.cpp"
+	"src/core/AppItems/plots/mvCandleLOD.cpp"
+	"src/core/AppItems/plots/mvHeatSeries.cpp"
+	"src/core/AppItems/plots/mvSeriesLOD.cpp"
+	"src/core/AppItems/plots/mvSeriesIndex.cpp"
 
 	# implot
 	"vendor/implot/implot.cpp"
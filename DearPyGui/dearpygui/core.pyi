@@ -1,4 +1,4 @@
-from typing import List, Any, Callable
+from typing import List, Any, Callable, Union
 from dearpygui.core import *
 
 ##########################################################
@@ -6,7 +6,7 @@ from dearpygui.core import *
 ##########################################################
 
 # ~ Dear PyGui Version: master
-def add_about_window(name: str, *, width: int = -1, height: int = -1, x_pos: int = 200, y_pos: int = 200, autosize: bool = False, no_resize: bool = False, no_title_bar: bool = False, no_move: bool = False, no_scrollbar: bool = False, no_collapse: bool = False, horizontal_scrollbar: bool = False, no_focus_on_appearing: bool = False, no_bring_to_front_on_focus: bool = False, no_close: bool = False, no_background: bool = False, label: str = '', show: bool = True) -> None:
+def add_about_window(name: str, *, width: int = -1, height: int = -1, x_pos: int = 200, y_pos: int = 200, autosize: bool = False, no_resize: bool = False, no_title_bar: bool = False, no_move: bool = False, no_scrollbar: bool = False, no_collapse: bool = False, horizontal_scrollbar: bool = False, no_focus_on_appearing: bool = False, no_bring_to_front_on_focus: bool = False, no_close: bool = False, no_background: bool = False, label: str = '', show: bool = True) -> int:
 	"""Creates an about window."""
 	...
 
@@ -14,23 +14,23 @@ def add_additional_font(file: str, size: float = 13.0, glyph_ranges: str = '', *
 	"""Adds additional font."""
 	...
 
-def add_annotation(plot: str, text: str, x: float, y: float, xoffset: float, yoffset: float, *, color: List[float] = (0, 0, 0, -1), clamped: bool = True, tag: str = '') -> None:
+def add_annotation(plot: Union[int, str], text: str, x: float, y: float, xoffset: float, yoffset: float, *, color: List[float] = (0, 0, 0, -1), clamped: bool = True, tag: str = '') -> None:
 	"""Adds an annotation to a plot."""
 	...
 
-def add_area_series(plot: str, name: str, x: List[float], y: List[float], color: List[float], fill: List[float], *, weight: float = 1.0, update_bounds: bool = True, axis: int = 0) -> None:
+def add_area_series(plot: Union[int, str], name: str, x: List[float], y: List[float], color: List[float], fill: List[float], *, weight: float = 1.0, update_bounds: bool = True, axis: int = 0) -> None:
 	"""Adds an area series to a plot."""
 	...
 
-def add_bar_series(plot: str, name: str, x: List[float], y: List[float], *, weight: float = 1.0, horizontal: bool = False, update_bounds: bool = True, axis: int = 0) -> None:
+def add_bar_series(plot: Union[int, str], name: str, x: List[float], y: List[float], *, weight: float = 1.0, horizontal: bool = False, update_bounds: bool = True, axis: int = 0, x_source: str = '', y_source: str = '') -> None:
 	"""Adds a bar series to a plot."""
 	...
 
-def add_button(name: str, *, small: bool = False, arrow: bool = False, direction: int = 0, callback: Callable = None, callback_data: Any = None, tip: str = '', parent: str = '', before: str = '', width: int = 0, height: int = 0, label: str = '', show: bool = True, enabled: bool = True) -> None:
+def add_button(name: str, *, small: bool = False, arrow: bool = False, direction: int = 0, callback: Callable = None, callback_data: Any = None, tip: str = '', parent: Union[int, str] = '', before: Union[int, str] = '', width: int = 0, height: int = 0, label: str = '', show: bool = True, enabled: bool = True) -> int:
 	"""Adds a button."""
 	...
 
-def add_candle_series(plot: str, name: str, date: List[float], opens: List[float], highs: List[float], lows: List[float], closes: List[float], *, tooltip: bool = True, bull_color: List[float] = (0, 255, 113, 255), bear_color: List[float] = (218, 13, 79, 255), weight: float = 0.25, update_bounds: bool = True, axis: int = 0) -> None:
+def add_candle_series(plot: Union[int, str], name: str, date: List[float], opens: List[float], highs: List[float], lows: List[float], closes: List[float], *, tooltip: bool = True, bull_color: List[float] = (0, 255, 113, 255), bear_color: List[float] = (218, 13, 79, 255), weight: float = 0.25, update_bounds: bool = True, axis: int = 0) -> None:
 	"""Adds a candle series to a plot."""
 	...
 
@@ -38,47 +38,47 @@ def add_character_remap(destination: int, source: int) -> None:
 	"""Remaps characters."""
 	...
 
-def add_checkbox(name: str, *, default_value: int = False, callback: Callable = None, callback_data: Any = None, tip: str = '', parent: str = '', before: str = '', source: str = '', label: str = '', show: bool = True, enabled: bool = True) -> None:
+def add_checkbox(name: str, *, default_value: int = False, callback: Callable = None, callback_data: Any = None, tip: str = '', parent: Union[int, str] = '', before: Union[int, str] = '', source: str = '', label: str = '', show: bool = True, enabled: bool = True) -> int:
 	"""Adds a checkbox widget."""
 	...
 
-def add_child(name: str, *, show: bool = True, tip: str = '', parent: str = '', before: str = '', width: int = 0, height: int = 0, border: bool = True, autosize_x: bool = False, autosize_y: bool = False, no_scrollbar: bool = False, horizontal_scrollbar: bool = False, menubar: bool = False) -> None:
+def add_child(name: str, *, show: bool = True, tip: str = '', parent: Union[int, str] = '', before: Union[int, str] = '', width: int = 0, height: int = 0, border: bool = True, autosize_x: bool = False, autosize_y: bool = False, no_scrollbar: bool = False, horizontal_scrollbar: bool = False, menubar: bool = False) -> int:
 	"""Adds an embedded child window. Will show scrollbars when items do not fit. Must be followed by a call to end."""
 	...
 
-def add_collapsing_header(name: str, *, label: str = '', show: bool = True, tip: str = '', parent: str = '', before: str = '', closable: bool = False, default_open: bool = False, open_on_double_click: bool = False, open_on_arrow: bool = False, leaf: bool = False, bullet: bool = False) -> None:
+def add_collapsing_header(name: str, *, label: str = '', show: bool = True, tip: str = '', parent: Union[int, str] = '', before: Union[int, str] = '', closable: bool = False, default_open: bool = False, open_on_double_click: bool = False, open_on_arrow: bool = False, leaf: bool = False, bullet: bool = False) -> int:
 	"""Adds a collapsing header to add items to. Must be closed with the end command."""
 	...
 
-def add_color_button(name: str, color: List[float], *, callback: Callable = None, callback_data: Any = None, tip: str = '', parent: str = '', before: str = '', width: int = 0, height: int = 0, show: bool = True, no_alpha: bool = False, no_border: bool = False, no_drag_drop: bool = False) -> None:
+def add_color_button(name: str, color: List[float], *, callback: Callable = None, callback_data: Any = None, tip: str = '', parent: Union[int, str] = '', before: Union[int, str] = '', width: int = 0, height: int = 0, show: bool = True, no_alpha: bool = False, no_border: bool = False, no_drag_drop: bool = False) -> int:
 	"""Adds a color button."""
 	...
 
-def add_color_edit3(name: str, *, default_value: List[int] = (0, 0, 0, 255), callback: Callable = None, callback_data: Any = None, tip: str = '', parent: str = '', before: str = '', source: str = '', width: int = 0, height: int = 0, label: str = '', show: bool = True, no_alpha: bool = False, no_picker: bool = False, no_options: bool = False, no_small_preview: bool = False, no_inputs: bool = False, no_tooltip: bool = False, no_label: bool = False, no_drag_drop: bool = False, alpha_bar: bool = False, alpha_preview: bool = False, alpha_preview_half: bool = False, display_rgb: bool = False, display_hsv: bool = False, display_hex: bool = False, uint8: bool = False, floats: bool = False, input_rgb: bool = False, input_hsv: bool = False) -> None:
+def add_color_edit3(name: str, *, default_value: List[int] = (0, 0, 0, 255), callback: Callable = None, callback_data: Any = None, tip: str = '', parent: Union[int, str] = '', before: Union[int, str] = '', source: str = '', width: int = 0, height: int = 0, label: str = '', show: bool = True, no_alpha: bool = False, no_picker: bool = False, no_options: bool = False, no_small_preview: bool = False, no_inputs: bool = False, no_tooltip: bool = False, no_label: bool = False, no_drag_drop: bool = False, alpha_bar: bool = False, alpha_preview: bool = False, alpha_preview_half: bool = False, display_rgb: bool = False, display_hsv: bool = False, display_hex: bool = False, uint8: bool = False, floats: bool = False, input_rgb: bool = False, input_hsv: bool = False) -> int:
 	"""Adds an rgb color editing widget. Click and draging the color square will copy the color to be applied on any other color widget."""
 	...
 
-def add_color_edit4(name: str, *, default_value: List[int] = (0, 0, 0, 255), callback: Callable = None, callback_data: Any = None, tip: str = '', parent: str = '', before: str = '', source: str = '', width: int = 0, height: int = 0, label: str = '', show: bool = True, no_alpha: bool = False, no_picker: bool = False, no_options: bool = False, no_small_preview: bool = False, no_inputs: bool = False, no_tooltip: bool = False, no_label: bool = False, no_drag_drop: bool = False, alpha_bar: bool = False, alpha_preview: bool = False, alpha_preview_half: bool = False, display_rgb: bool = False, display_hsv: bool = False, display_hex: bool = False, uint8: bool = False, floats: bool = False, input_rgb: bool = False, input_hsv: bool = False) -> None:
+def add_color_edit4(name: str, *, default_value: List[int] = (0, 0, 0, 255), callback: Callable = None, callback_data: Any = None, tip: str = '', parent: Union[int, str] = '', before: Union[int, str] = '', source: str = '', width: int = 0, height: int = 0, label: str = '', show: bool = True, no_alpha: bool = False, no_picker: bool = False, no_options: bool = False, no_small_preview: bool = False, no_inputs: bool = False, no_tooltip: bool = False, no_label: bool = False, no_drag_drop: bool = False, alpha_bar: bool = False, alpha_preview: bool = False, alpha_preview_half: bool = False, display_rgb: bool = False, display_hsv: bool = False, display_hex: bool = False, uint8: bool = False, floats: bool = False, input_rgb: bool = False, input_hsv: bool = False) -> int:
 	"""Adds an rgba color editing widget. Click and draging the color square will copy the color to be applied on any other color widget."""
 	...
 
-def add_color_picker3(name: str, *, default_value: List[int] = (0, 0, 0, 255), callback: Callable = None, callback_data: Any = None, tip: str = '', parent: str = '', before: str = '', source: str = '', width: int = 0, height: int = 0, label: str = '', show: bool = True, no_alpha: bool = False, no_small_preview: bool = False, no_inputs: bool = False, no_tooltip: bool = False, no_label: bool = False, no_side_preview: bool = False, alpha_bar: bool = False, alpha_preview: bool = False, alpha_preview_half: bool = False, display_rgb: bool = False, display_hsv: bool = False, display_hex: bool = False, uint8: bool = False, floats: bool = False, picker_hue_bar: bool = False, picker_hue_wheel: bool = False, input_rgb: bool = False, input_hsv: bool = False) -> None:
+def add_color_picker3(name: str, *, default_value: List[int] = (0, 0, 0, 255), callback: Callable = None, callback_data: Any = None, tip: str = '', parent: Union[int, str] = '', before: Union[int, str] = '', source: str = '', width: int = 0, height: int = 0, label: str = '', show: bool = True, no_alpha: bool = False, no_small_preview: bool = False, no_inputs: bool = False, no_tooltip: bool = False, no_label: bool = False, no_side_preview: bool = False, alpha_bar: bool = False, alpha_preview: bool = False, alpha_preview_half: bool = False, display_rgb: bool = False, display_hsv: bool = False, display_hex: bool = False, uint8: bool = False, floats: bool = False, picker_hue_bar: bool = False, picker_hue_wheel: bool = False, input_rgb: bool = False, input_hsv: bool = False) -> int:
 	"""Adds an rgb color picking widget. Click and draging the color square will copy the color to be applied on any other color widget. Right Click allows the style of the color picker to be changed."""
 	...
 
-def add_color_picker4(name: str, *, default_value: List[int] = (0, 0, 0, 255), callback: Callable = None, callback_data: Any = None, tip: str = '', parent: str = '', before: str = '', source: str = '', width: int = 0, height: int = 0, label: str = '', show: bool = True, no_alpha: bool = False, no_small_preview: bool = False, no_inputs: bool = False, no_tooltip: bool = False, no_label: bool = False, no_side_preview: bool = False, alpha_bar: bool = False, alpha_preview: bool = False, alpha_preview_half: bool = False, display_rgb: bool = False, display_hsv: bool = False, display_hex: bool = False, uint8: bool = False, floats: bool = False, picker_hue_bar: bool = False, picker_hue_wheel: bool = False, input_rgb: bool = False, input_hsv: bool = False) -> None:
+def add_color_picker4(name: str, *, default_value: List[int] = (0, 0, 0, 255), callback: Callable = None, callback_data: Any = None, tip: str = '', parent: Union[int, str] = '', before: Union[int, str] = '', source: str = '', width: int = 0, height: int = 0, label: str = '', show: bool = True, no_alpha: bool = False, no_small_preview: bool = False, no_inputs: bool = False, no_tooltip: bool = False, no_label: bool = False, no_side_preview: bool = False, alpha_bar: bool = False, alpha_preview: bool = False, alpha_preview_half: bool = False, display_rgb: bool = False, display_hsv: bool = False, display_hex: bool = False, uint8: bool = False, floats: bool = False, picker_hue_bar: bool = False, picker_hue_wheel: bool = False, input_rgb: bool = False, input_hsv: bool = False) -> int:
 	"""Adds an rgba color picking widget. Click and draging the color square will copy the color to be applied on any other color widget. Right Click allows the style of the color picker to be changed"""
 	...
 
-def add_column(table: str, name: str, column: List[str]) -> None:
+def add_column(table: Union[int, str], name: str, column: List[str]) -> None:
 	"""Adds a column to the end of a table."""
 	...
 
-def add_columns(name: str, columns: int, *, border: bool = True, show: bool = True, parent: str = '', before: str = '') -> None:
+def add_columns(name: str, columns: int, *, border: bool = True, show: bool = True, parent: Union[int, str] = '', before: Union[int, str] = '') -> int:
 	"""Sets columns."""
 	...
 
-def add_combo(name: str, *, items: List[str] = (), default_value: str = '', callback: Callable = None, callback_data: Any = None, tip: str = '', parent: str = '', before: str = '', source: str = '', enabled: bool = True, width: int = 0, label: str = '', show: bool = True, popup_align_left: bool = False, height_small: bool = False, height_regular: bool = False, height_large: bool = False, height_largest: bool = False, no_arrow_button: bool = False, no_preview: bool = False) -> None:
+def add_combo(name: str, *, items: List[str] = (), default_value: str = '', callback: Callable = None, callback_data: Any = None, tip: str = '', parent: Union[int, str] = '', before: Union[int, str] = '', source: str = '', enabled: bool = True, width: int = 0, label: str = '', show: bool = True, popup_align_left: bool = False, height_small: bool = False, height_regular: bool = False, height_large: bool = False, height_largest: bool = False, no_arrow_button: bool = False, no_preview: bool = False) -> int:
 	"""Adds a combo."""
 	...
 
@@ -86,287 +86,291 @@ def add_data(name: str, data: Any) -> None:
 	"""Adds data for later retrieval."""
 	...
 
-def add_date_picker(name: str, *, default_value: dict = {'month_day': 14, 'year':20, 'month':5}, level: int = 0, callback: Callable = None, callback_data: Any = None, tip: str = '', parent: str = '', before: str = '', show: bool = True) -> None:
+def add_date_picker(name: str, *, default_value: dict = {'month_day': 14, 'year':20, 'month':5}, level: int = 0, callback: Callable = None, callback_data: Any = None, tip: str = '', parent: Union[int, str] = '', before: Union[int, str] = '', show: bool = True) -> int:
 	"""Adds a data selector widget."""
 	...
 
-def add_debug_window(name: str, *, width: int = 700, height: int = 500, x_pos: int = 200, y_pos: int = 200, autosize: bool = False, no_resize: bool = False, no_title_bar: bool = False, no_move: bool = False, no_scrollbar: bool = False, no_collapse: bool = False, horizontal_scrollbar: bool = False, no_focus_on_appearing: bool = False, no_bring_to_front_on_focus: bool = False, no_close: bool = False, no_background: bool = False, label: str = '', show: bool = True) -> None:
+def add_debug_window(name: str, *, width: int = 700, height: int = 500, x_pos: int = 200, y_pos: int = 200, autosize: bool = False, no_resize: bool = False, no_title_bar: bool = False, no_move: bool = False, no_scrollbar: bool = False, no_collapse: bool = False, horizontal_scrollbar: bool = False, no_focus_on_appearing: bool = False, no_bring_to_front_on_focus: bool = False, no_close: bool = False, no_background: bool = False, label: str = '', show: bool = True) -> int:
 	"""Creates a debug window."""
 	...
 
-def add_doc_window(name: str, *, width: int = -1, height: int = -1, x_pos: int = 200, y_pos: int = 200, autosize: bool = True, no_resize: bool = False, no_title_bar: bool = False, no_move: bool = False, no_scrollbar: bool = False, no_collapse: bool = False, horizontal_scrollbar: bool = False, no_focus_on_appearing: bool = False, no_bring_to_front_on_focus: bool = False, no_close: bool = False, no_background: bool = False, label: str = '', show: bool = True) -> None:
+def add_doc_window(name: str, *, width: int = -1, height: int = -1, x_pos: int = 200, y_pos: int = 200, autosize: bool = True, no_resize: bool = False, no_title_bar: bool = False, no_move: bool = False, no_scrollbar: bool = False, no_collapse: bool = False, horizontal_scrollbar: bool = False, no_focus_on_appearing: bool = False, no_bring_to_front_on_focus: bool = False, no_close: bool = False, no_background: bool = False, label: str = '', show: bool = True) -> int:
 	"""Creates a documentation window."""
 	...
 
-def add_drag_float(name: str, *, default_value: float = 0.0, speed: float = 1.0, min_value: float = 0.0, max_value: float = 100.0, format: str = '%0.3f', callback: Callable = None, callback_data: Any = None, tip: str = '', parent: str = '', before: str = '', source: str = '', enabled: bool = True, width: int = 0, no_input: bool = False, clamped: bool = False, label: str = '', show: bool = True) -> None:
+def add_drag_float(name: str, *, default_value: float = 0.0, speed: float = 1.0, min_value: float = 0.0, max_value: float = 100.0, format: str = '%0.3f', callback: Callable = None, callback_data: Any = None, tip: str = '', parent: Union[int, str] = '', before: Union[int, str] = '', source: str = '', enabled: bool = True, width: int = 0, no_input: bool = False, clamped: bool = False, label: str = '', show: bool = True) -> int:
 	"""Adds drag for a single float value. CTRL+Click to directly modify the value."""
 	...
 
-def add_drag_float2(name: str, *, default_value: List[float] = (0.0, 0.0), speed: float = 1.0, min_value: float = 0.0, max_value: float = 100.0, format: str = '%0.3f', callback: Callable = None, callback_data: Any = None, tip: str = '', parent: str = '', before: str = '', source: str = '', enabled: bool = True, width: int = 0, no_input: bool = False, clamped: bool = False, label: str = '', show: bool = True) -> None:
+def add_drag_float2(name: str, *, default_value: List[float] = (0.0, 0.0), speed: float = 1.0, min_value: float = 0.0, max_value: float = 100.0, format: str = '%0.3f', callback: Callable = None, callback_data: Any = None, tip: str = '', parent: Union[int, str] = '', before: Union[int, str] = '', source: str = '', enabled: bool = True, width: int = 0, no_input: bool = False, clamped: bool = False, label: str = '', show: bool = True) -> int:
 	"""Adds drag for a 2 float values. CTRL+Click to directly modify the value."""
 	...
 
-def add_drag_float3(name: str, *, default_value: List[float] = (0.0, 0.0, 0.0), speed: float = 1.0, min_value: float = 0.0, max_value: float = 100.0, format: str = '%0.3f', callback: Callable = None, callback_data: Any = None, tip: str = '', parent: str = '', before: str = '', source: str = '', enabled: bool = True, width: int = 0, no_input: bool = False, clamped: bool = False, label: str = '', show: bool = True) -> None:
+def add_drag_float3(name: str, *, default_value: List[float] = (0.0, 0.0, 0.0), speed: float = 1.0, min_value: float = 0.0, max_value: float = 100.0, format: str = '%0.3f', callback: Callable = None, callback_data: Any = None, tip: str = '', parent: Union[int, str] = '', before: Union[int, str] = '', source: str = '', enabled: bool = True, width: int = 0, no_input: bool = False, clamped: bool = False, label: str = '', show: bool = True) -> int:
 	"""Adds drag for a 3 float values. CTRL+Click to directly modify the value."""
 	...
 
-def add_drag_float4(name: str, *, default_value: List[float] = (0.0, 0.0, 0.0, 0.0), speed: float = 1.0, min_value: float = 0.0, max_value: float = 100.0, format: str = '%0.3f', callback: Callable = None, callback_data: Any = None, tip: str = '', parent: str = '', before: str = '', source: str = '', enabled: bool = True, width: int = 0, no_input: bool = False, clamped: bool = False, label: str = '', show: bool = True) -> None:
+def add_drag_float4(name: str, *, default_value: List[float] = (0.0, 0.0, 0.0, 0.0), speed: float = 1.0, min_value: float = 0.0, max_value: float = 100.0, format: str = '%0.3f', callback: Callable = None, callback_data: Any = None, tip: str = '', parent: Union[int, str] = '', before: Union[int, str] = '', source: str = '', enabled: bool = True, width: int = 0, no_input: bool = False, clamped: bool = False, label: str = '', show: bool = True) -> int:
 	"""Adds drag for a 4 float values. CTRL+Click to directly modify the value."""
 	...
 
-def add_drag_int(name: str, *, default_value: int = 0, speed: float = 1.0, min_value: int = 0, max_value: int = 100, format: str = '%d', callback: Callable = None, callback_data: Any = None, tip: str = '', parent: str = '', before: str = '', source: str = '', enabled: bool = True, width: int = 0, no_input: bool = False, clamped: bool = False, label: str = '', show: bool = True) -> None:
+def add_drag_int(name: str, *, default_value: int = 0, speed: float = 1.0, min_value: int = 0, max_value: int = 100, format: str = '%d', callback: Callable = None, callback_data: Any = None, tip: str = '', parent: Union[int, str] = '', before: Union[int, str] = '', source: str = '', enabled: bool = True, width: int = 0, no_input: bool = False, clamped: bool = False, label: str = '', show: bool = True) -> int:
 	"""Adds drag for a single int value. CTRL+Click to directly modify the value."""
 	...
 
-def add_drag_int2(name: str, *, default_value: List[int] = (0, 0), speed: float = 1.0, min_value: int = 0, max_value: int = 100, format: str = '%d', callback: Callable = None, callback_data: Any = None, tip: str = '', parent: str = '', before: str = '', source: str = '', enabled: bool = True, width: int = 0, no_input: bool = False, clamped: bool = False, label: str = '', show: bool = True) -> None:
+def add_drag_int2(name: str, *, default_value: List[int] = (0, 0), speed: float = 1.0, min_value: int = 0, max_value: int = 100, format: str = '%d', callback: Callable = None, callback_data: Any = None, tip: str = '', parent: Union[int, str] = '', before: Union[int, str] = '', source: str = '', enabled: bool = True, width: int = 0, no_input: bool = False, clamped: bool = False, label: str = '', show: bool = True) -> int:
 	"""Adds drag for a 2 int values. CTRL+Click to directly modify the value."""
 	...
 
-def add_drag_int3(name: str, *, default_value: List[int] = (0, 0, 0), speed: float = 1.0, min_value: int = 0, max_value: int = 100, format: str = '%d', callback: Callable = None, callback_data: Any = None, tip: str = '', parent: str = '', before: str = '', source: str = '', enabled: bool = True, width: int = 0, no_input: bool = False, clamped: bool = False, label: str = '', show: bool = True) -> None:
+def add_drag_int3(name: str, *, default_value: List[int] = (0, 0, 0), speed: float = 1.0, min_value: int = 0, max_value: int = 100, format: str = '%d', callback: Callable = None, callback_data: Any = None, tip: str = '', parent: Union[int, str] = '', before: Union[int, str] = '', source: str = '', enabled: bool = True, width: int = 0, no_input: bool = False, clamped: bool = False, label: str = '', show: bool = True) -> int:
 	"""Adds drag for a 3 int values. CTRL+Click to directly modify the value."""
 	...
 
-def add_drag_int4(name: str, *, default_value: List[int] = (0, 0, 0, 0), speed: float = 1.0, min_value: int = 0, max_value: int = 100, format: str = '%d', callback: Callable = None, callback_data: Any = None, tip: str = '', parent: str = '', before: str = '', source: str = '', enabled: bool = True, width: int = 0, no_input: bool = False, clamped: bool = False, label: str = '', show: bool = True) -> None:
+def add_drag_int4(name: str, *, default_value: List[int] = (0, 0, 0, 0), speed: float = 1.0, min_value: int = 0, max_value: int = 100, format: str = '%d', callback: Callable = None, callback_data: Any = None, tip: str = '', parent: Union[int, str] = '', before: Union[int, str] = '', source: str = '', enabled: bool = True, width: int = 0, no_input: bool = False, clamped: bool = False, label: str = '', show: bool = True) -> int:
 	"""Adds drag for a 4 int values. CTRL+Click to directly modify the value."""
 	...
 
-def add_drag_line(plot: str, name: str, *, source: str = '', color: List[float] = (0, 0, 0, -1), thickness: float = -1, y_line: bool = False, show_label: bool = True, callback: Callable = None, default_value: float = 0.0) -> None:
+def add_drag_line(plot: Union[int, str], name: str, *, source: str = '', color: List[float] = (0, 0, 0, -1), thickness: float = -1, y_line: bool = False, show_label: bool = True, callback: Callable = None, default_value: float = 0.0) -> None:
 	"""Adds a drag line to a plot."""
 	...
 
-def add_drag_point(plot: str, name: str, *, source: str = '', color: List[float] = (0, 0, 0, -1), radius: float = 4.0, show_label: bool = True, callback: Callable = None, default_x: float = 0.0, default_y: float = 0.0) -> None:
+def add_drag_point(plot: Union[int, str], name: str, *, source: str = '', color: List[float] = (0, 0, 0, -1), radius: float = 4.0, show_label: bool = True, callback: Callable = None, default_x: float = 0.0, default_y: float = 0.0) -> None:
 	"""Adds a drag point to a plot."""
 	...
 
-def add_drawing(name: str, *, tip: str = '', parent: str = '', before: str = '', width: int = 0, height: int = 0, show: bool = True) -> None:
+def add_drawing(name: str, *, tip: str = '', parent: Union[int, str] = '', before: Union[int, str] = '', width: int = 0, height: int = 0, show: bool = True) -> int:
 	"""Adds a drawing widget."""
 	...
 
-def add_dummy(*, width: int = 0, height: int = 0, name: str = 'dummy', parent: str = '', before: str = '', show: bool = True) -> None:
+def add_dummy(*, width: int = 0, height: int = 0, name: str = 'dummy', parent: Union[int, str] = '', before: Union[int, str] = '', show: bool = True) -> int:
 	"""Adds a spacer or 'dummy' object."""
 	...
 
-def add_error_series(plot: str, name: str, x: List[float], y: List[float], negative: List[float], positive: List[float], *, horizontal: bool = False, update_bounds: bool = True, color: List[float] = (0, 0, 0, -1), axis: int = 0) -> None:
+def add_error_series(plot: Union[int, str], name: str, x: List[float], y: List[float], negative: List[float], positive: List[float], *, horizontal: bool = False, update_bounds: bool = True, color: List[float] = (0, 0, 0, -1), axis: int = 0) -> None:
 	"""Adds an error series to a plot."""
 	...
 
-def add_group(name: str, *, show: bool = True, tip: str = '', parent: str = '', before: str = '', width: int = 0, horizontal: bool = False, horizontal_spacing: float = -1) -> None:
+def add_group(name: str, *, show: bool = True, tip: str = '', parent: Union[int, str] = '', before: Union[int, str] = '', width: int = 0, horizontal: bool = False, horizontal_spacing: float = -1) -> int:
 	"""Creates a group that other widgets can belong to. The group allows item commands to be issued for all of its members.				Must be closed with the end command."""
 	...
 
-def add_heat_series(plot: str, name: str, values: List[float], rows: int, columns: int, scale_min: float, scale_max: float, *, format: str = '%0.1f', bounds_min: List[float] = (0.0, 0.0), bounds_max: List[float] = (1.0, 1.0), update_bounds: bool = True, axis: int = 0) -> None:
+def add_heat_series(plot: Union[int, str], name: str, values: List[float], rows: int, columns: int, scale_min: float, scale_max: float, *, format: str = '%0.1f', bounds_min: List[float] = (0.0, 0.0), bounds_max: List[float] = (1.0, 1.0), update_bounds: bool = True, axis: int = 0, texture: bool = False) -> None:
 	"""Adds a heat series to a plot."""
 	...
 
-def add_image(name: str, value: str, *, tint_color: List[float] = (255, 255, 255, 255), border_color: List[float] = (0, 0, 0, 0), tip: str = '', parent: str = '', before: str = '', source: str = '', width: int = 0, height: int = 0, uv_min: List[float] = (0.0, 0.0), uv_max: List[float] = (1.0, 1.0), show: bool = True) -> None:
+def add_image(name: str, value: str, *, tint_color: List[float] = (255, 255, 255, 255), border_color: List[float] = (0, 0, 0, 0), tip: str = '', parent: Union[int, str] = '', before: Union[int, str] = '', source: str = '', width: int = 0, height: int = 0, uv_min: List[float] = (0.0, 0.0), uv_max: List[float] = (1.0, 1.0), show: bool = True) -> int:
 	"""Adds an image.uv_min and uv_max represent the normalized texture coordinates of the original image that will be shown.Using(0,0)->(1,1) texture coordinates will generally display the entire texture"""
 	...
 
-def add_image_button(name: str, value: str, *, callback: Callable = None, callback_data: Any = None, tint_color: List[float] = (255, 255, 255, 255), background_color: List[float] = (0, 0, 0, 0), tip: str = '', parent: str = '', before: str = '', width: int = 0, height: int = 0, frame_padding: int = -1, uv_min: List[float] = (0.0, 0.0), uv_max: List[float] = (1.0, 1.0), show: bool = True) -> None:
+def add_image_button(name: str, value: str, *, callback: Callable = None, callback_data: Any = None, tint_color: List[float] = (255, 255, 255, 255), background_color: List[float] = (0, 0, 0, 0), tip: str = '', parent: Union[int, str] = '', before: Union[int, str] = '', width: int = 0, height: int = 0, frame_padding: int = -1, uv_min: List[float] = (0.0, 0.0), uv_max: List[float] = (1.0, 1.0), show: bool = True) -> int:
 	"""Adds an image button.uv_min and uv_max represent the normalized texture coordinates of the original image that will be shown.Using(0,0)->(1,1) texture coordinates will generally display the entire texture"""
 	...
 
-def add_image_series(plot: str, name: str, value: str, bounds_min: List[float], bounds_max: List[float], *, uv_min: List[float] = (0.0, 0.0), uv_max: List[float] = (1.0, 1.0), tint_color: List[int] = (255, 255, 255, 255), update_bounds: bool = True, axis: int = 0) -> None:
+def add_image_series(plot: Union[int, str], name: str, value: str, bounds_min: List[float], bounds_max: List[float], *, uv_min: List[float] = (0.0, 0.0), uv_max: List[float] = (1.0, 1.0), tint_color: List[int] = (255, 255, 255, 255), update_bounds: bool = True, axis: int = 0) -> None:
 	"""Adds a image series to a plot."""
 	...
 
-def add_indent(*, name: str = 'indent', offset: float = 0.0, parent: str = '', before: str = '', show: bool = True) -> None:
+def add_indent(*, name: str = 'indent', offset: float = 0.0, parent: Union[int, str] = '', before: Union[int, str] = '', show: bool = True) -> int:
 	"""Adds an indent to following items. Must be closed with the unindent command."""
 	...
 
-def add_input_float(name: str, *, default_value: float = 0.0, min_value: float = 0, max_value: float = 100, min_clamped: bool = False, max_clamped: bool = False, format: str = '%.3f', callback: Callable = None, callback_data: Any = None, tip: str = '', parent: str = '', before: str = '', source: str = '', enabled: bool = True, width: int = 0, on_enter: bool = False, label: str = '', show: bool = True, step: float = 0.1, step_fast: float = 1.0, readonly: bool = False) -> None:
+def add_input_float(name: str, *, default_value: float = 0.0, min_value: float = 0, max_value: float = 100, min_clamped: bool = False, max_clamped: bool = False, format: str = '%.3f', callback: Callable = None, callback_data: Any = None, tip: str = '', parent: Union[int, str] = '', before: Union[int, str] = '', source: str = '', enabled: bool = True, width: int = 0, on_enter: bool = False, label: str = '', show: bool = True, step: float = 0.1, step_fast: float = 1.0, readonly: bool = False) -> int:
 	"""Adds input for float values."""
 	...
 
-def add_input_float2(name: str, *, default_value: List[float] = (0.0, 0.0), min_value: float = 0, max_value: float = 100, min_clamped: bool = False, max_clamped: bool = False, format: str = '%.3f', callback: Callable = None, callback_data: Any = None, tip: str = '', parent: str = '', before: str = '', source: str = '', enabled: bool = True, width: int = 0, on_enter: bool = False, label: str = '', show: bool = True, readonly: bool = False) -> None:
+def add_input_float2(name: str, *, default_value: List[float] = (0.0, 0.0), min_value: float = 0, max_value: float = 100, min_clamped: bool = False, max_clamped: bool = False, format: str = '%.3f', callback: Callable = None, callback_data: Any = None, tip: str = '', parent: Union[int, str] = '', before: Union[int, str] = '', source: str = '', enabled: bool = True, width: int = 0, on_enter: bool = False, label: str = '', show: bool = True, readonly: bool = False) -> int:
 	"""Adds input for 2 float values."""
 	...
 
-def add_input_float3(name: str, *, default_value: List[float] = (0.0, 0.0, 0.0), min_value: float = 0, max_value: float = 100, min_clamped: bool = False, max_clamped: bool = False, format: str = '%.3f', callback: Callable = None, callback_data: Any = None, tip: str = '', parent: str = '', before: str = '', source: str = '', enabled: bool = True, width: int = 0, on_enter: bool = False, label: str = '', show: bool = True, readonly: bool = False) -> None:
+def add_input_float3(name: str, *, default_value: List[float] = (0.0, 0.0, 0.0), min_value: float = 0, max_value: float = 100, min_clamped: bool = False, max_clamped: bool = False, format: str = '%.3f', callback: Callable = None, callback_data: Any = None, tip: str = '', parent: Union[int, str] = '', before: Union[int, str] = '', source: str = '', enabled: bool = True, width: int = 0, on_enter: bool = False, label: str = '', show: bool = True, readonly: bool = False) -> int:
 	"""Adds input for 3 float values."""
 	...
 
-def add_input_float4(name: str, *, default_value: List[float] = (0.0, 0.0, 0.0, 0.0), min_value: float = 0, max_value: float = 100, min_clamped: bool = False, max_clamped: bool = False, format: str = '%.3f', callback: Callable = None, callback_data: Any = None, tip: str = '', parent: str = '', before: str = '', source: str = '', enabled: bool = True, width: int = 0, on_enter: bool = False, label: str = '', show: bool = True, readonly: bool = False) -> None:
+def add_input_float4(name: str, *, default_value: List[float] = (0.0, 0.0, 0.0, 0.0), min_value: float = 0, max_value: float = 100, min_clamped: bool = False, max_clamped: bool = False, format: str = '%.3f', callback: Callable = None, callback_data: Any = None, tip: str = '', parent: Union[int, str] = '', before: Union[int, str] = '', source: str = '', enabled: bool = True, width: int = 0, on_enter: bool = False, label: str = '', show: bool = True, readonly: bool = False) -> int:
 	"""Adds input for 4 float values."""
 	...
 
-def add_input_int(name: str, *, default_value: int = 0, min_value: int = 0, max_value: int = 100, min_clamped: bool = False, max_clamped: bool = False, callback: Callable = None, callback_data: Any = None, tip: str = '', parent: str = '', before: str = '', source: str = '', enabled: bool = True, width: int = 0, on_enter: bool = False, label: str = '', show: bool = True, step: int = 1, step_fast: int = 100, readonly: bool = False) -> None:
+def add_input_int(name: str, *, default_value: int = 0, min_value: int = 0, max_value: int = 100, min_clamped: bool = False, max_clamped: bool = False, callback: Callable = None, callback_data: Any = None, tip: str = '', parent: Union[int, str] = '', before: Union[int, str] = '', source: str = '', enabled: bool = True, width: int = 0, on_enter: bool = False, label: str = '', show: bool = True, step: int = 1, step_fast: int = 100, readonly: bool = False) -> int:
 	"""Adds input for integer values."""
 	...
 
-def add_input_int2(name: str, *, default_value: List[int] = (0, 0), min_value: int = 0, max_value: int = 100, min_clamped: bool = False, max_clamped: bool = False, callback: Callable = None, callback_data: Any = None, tip: str = '', parent: str = '', before: str = '', source: str = '', enabled: bool = True, width: int = 0, on_enter: bool = False, label: str = '', show: bool = True, readonly: bool = False) -> None:
+def add_input_int2(name: str, *, default_value: List[int] = (0, 0), min_value: int = 0, max_value: int = 100, min_clamped: bool = False, max_clamped: bool = False, callback: Callable = None, callback_data: Any = None, tip: str = '', parent: Union[int, str] = '', before: Union[int, str] = '', source: str = '', enabled: bool = True, width: int = 0, on_enter: bool = False, label: str = '', show: bool = True, readonly: bool = False) -> int:
 	"""Adds input for 2 integer values."""
 	...
 
-def add_input_int3(name: str, *, default_value: List[int] = (0, 0, 0), min_value: int = 0, max_value: int = 100, min_clamped: bool = False, max_clamped: bool = False, callback: Callable = None, callback_data: Any = None, tip: str = '', parent: str = '', before: str = '', source: str = '', enabled: bool = True, width: int = 0, on_enter: bool = False, label: str = '', show: bool = True, readonly: bool = False) -> None:
+def add_input_int3(name: str, *, default_value: List[int] = (0, 0, 0), min_value: int = 0, max_value: int = 100, min_clamped: bool = False, max_clamped: bool = False, callback: Callable = None, callback_data: Any = None, tip: str = '', parent: Union[int, str] = '', before: Union[int, str] = '', source: str = '', enabled: bool = True, width: int = 0, on_enter: bool = False, label: str = '', show: bool = True, readonly: bool = False) -> int:
 	"""Adds input for 3 integer values."""
 	...
 
-def add_input_int4(name: str, *, default_value: List[int] = (0, 0, 0, 0), min_value: int = 0, max_value: int = 100, min_clamped: bool = False, max_clamped: bool = False, callback: Callable = None, callback_data: Any = None, tip: str = '', parent: str = '', before: str = '', source: str = '', enabled: bool = True, width: int = 0, on_enter: bool = False, label: str = '', show: bool = True, readonly: bool = False) -> None:
+def add_input_int4(name: str, *, default_value: List[int] = (0, 0, 0, 0), min_value: int = 0, max_value: int = 100, min_clamped: bool = False, max_clamped: bool = False, callback: Callable = None, callback_data: Any = None, tip: str = '', parent: Union[int, str] = '', before: Union[int, str] = '', source: str = '', enabled: bool = True, width: int = 0, on_enter: bool = False, label: str = '', show: bool = True, readonly: bool = False) -> int:
 	"""Adds input for 4 integer values."""
 	...
 
-def add_input_text(name: str, *, default_value: str = '', hint: str = '', multiline: bool = False, no_spaces: bool = False, uppercase: bool = False, tab_input: bool = False, decimal: bool = False, hexadecimal: bool = False, readonly: bool = False, password: bool = False, scientific: bool = False, callback: Callable = None, callback_data: Any = None, tip: str = '', parent: str = '', before: str = '', source: str = '', enabled: bool = True, width: int = 0, height: int = 0, on_enter: bool = False, label: str = '', show: bool = True) -> None:
+def add_input_text(name: str, *, default_value: str = '', hint: str = '', multiline: bool = False, no_spaces: bool = False, uppercase: bool = False, tab_input: bool = False, decimal: bool = False, hexadecimal: bool = False, readonly: bool = False, password: bool = False, scientific: bool = False, callback: Callable = None, callback_data: Any = None, tip: str = '', parent: Union[int, str] = '', before: Union[int, str] = '', source: str = '', enabled: bool = True, width: int = 0, height: int = 0, on_enter: bool = False, label: str = '', show: bool = True) -> int:
 	"""Adds input for text values."""
 	...
 
-def add_label_text(name: str, *, default_value: str = '', color: List[float] = (0, 0, 0, -1), tip: str = '', parent: str = '', before: str = '', source: str = '', label: str = '', show: bool = True) -> None:
+def add_label_text(name: str, *, default_value: str = '', color: List[float] = (0, 0, 0, -1), tip: str = '', parent: Union[int, str] = '', before: Union[int, str] = '', source: str = '', label: str = '', show: bool = True) -> int:
 	"""Adds text with a label. Useful for output values."""
 	...
 
-def add_line_series(plot: str, name: str, x: List[float], y: List[float], *, color: List[float] = (0, 0, 0, -1), weight: float = 1.0, update_bounds: bool = True, axis: int = 0) -> None:
+def add_line_series(plot: Union[int, str], name: str, x: List[float], y: List[float], *, color: List[float] = (0, 0, 0, -1), weight: float = 1.0, update_bounds: bool = True, axis: int = 0, x_source: str = '', y_source: str = '') -> None:
 	"""Adds a line series to a plot."""
 	...
 
-def add_listbox(name: str, *, items: List[str] = (), default_value: int = 0, callback: Callable = None, callback_data: Any = None, tip: str = '', parent: str = '', before: str = '', source: str = '', enabled: bool = True, width: int = 0, num_items: int = 3, label: str = '', show: bool = True) -> None:
+def add_listbox(name: str, *, items: List[str] = (), default_value: int = 0, callback: Callable = None, callback_data: Any = None, tip: str = '', parent: Union[int, str] = '', before: Union[int, str] = '', source: str = '', enabled: bool = True, width: int = 0, num_items: int = 3, label: str = '', show: bool = True) -> int:
 	"""Adds a listbox."""
 	...
 
-def add_logger(name: str, *, log_level: int = 1, auto_scroll: bool = True, auto_scroll_button: bool = True, clear_button: bool = True, copy_button: bool = True, filter: bool = True, width: int = 0, height: int = 0, parent: str = '', before: str = '', show: bool = True, autosize_x: bool = False, autosize_y: bool = False) -> None:
+def add_logger(name: str, *, log_level: int = 1, auto_scroll: bool = True, auto_scroll_button: bool = True, clear_button: bool = True, copy_button: bool = True, filter: bool = True, width: int = 0, height: int = 0, parent: Union[int, str] = '', before: Union[int, str] = '', show: bool = True, autosize_x: bool = False, autosize_y: bool = False) -> int:
 	"""Adds a logging widget."""
 	...
 
-def add_managed_columns(name: str, columns: int, *, border: bool = True, show: bool = True, parent: str = '', before: str = '') -> None:
+def add_managed_columns(name: str, columns: int, *, border: bool = True, show: bool = True, parent: Union[int, str] = '', before: Union[int, str] = '') -> int:
 	"""Adds managed columns."""
 	...
 
-def add_menu(name: str, *, label: str = '', show: bool = True, parent: str = '', before: str = '', enabled: bool = True) -> None:
+def add_menu(name: str, *, label: str = '', show: bool = True, parent: Union[int, str] = '', before: Union[int, str] = '', enabled: bool = True) -> int:
 	"""Adds a menu to an existing menu bar. Must be followed by a call to end."""
 	...
 
-def add_menu_bar(name: str, *, show: bool = True, parent: str = '', before: str = '') -> None:
+def add_menu_bar(name: str, *, show: bool = True, parent: Union[int, str] = '', before: Union[int, str] = '') -> int:
 	"""Adds a menu bar to a window. Must be followed by a call to end."""
 	...
 
-def add_menu_item(name: str, *, shortcut: str = '', check: bool = False, callback: Callable = None, callback_data: Any = None, label: str = '', show: bool = True, enabled: bool = True, parent: str = '', before: str = '') -> None:
+def add_menu_item(name: str, *, shortcut: str = '', check: bool = False, callback: Callable = None, callback_data: Any = None, label: str = '', show: bool = True, enabled: bool = True, parent: Union[int, str] = '', before: Union[int, str] = '') -> int:
 	"""Adds a menu item to an existing menu."""
 	...
 
-def add_metrics_window(name: str, *, width: int = 700, height: int = 500, x_pos: int = 200, y_pos: int = 200, autosize: bool = False, no_resize: bool = False, no_title_bar: bool = False, no_move: bool = False, no_scrollbar: bool = False, no_collapse: bool = False, horizontal_scrollbar: bool = False, no_focus_on_appearing: bool = False, no_bring_to_front_on_focus: bool = False, no_close: bool = False, no_background: bool = False, label: str = '', show: bool = True) -> None:
+def add_metrics_window(name: str, *, width: int = 700, height: int = 500, x_pos: int = 200, y_pos: int = 200, autosize: bool = False, no_resize: bool = False, no_title_bar: bool = False, no_move: bool = False, no_scrollbar: bool = False, no_collapse: bool = False, horizontal_scrollbar: bool = False, no_focus_on_appearing: bool = False, no_bring_to_front_on_focus: bool = False, no_close: bool = False, no_background: bool = False, label: str = '', show: bool = True) -> int:
 	"""Creates a metrics window."""
 	...
 
-def add_next_column(*, name: str = 'next_collumn', show: bool = True, parent: str = '', before: str = '') -> None:
+def add_next_column(*, name: str = 'next_collumn', show: bool = True, parent: Union[int, str] = '', before: Union[int, str] = '') -> int:
 	"""Changes to next column."""
 	...
 
-def add_pie_series(plot: str, name: str, values: List[float], labels: List[str], x: float, y: float, radius: float, *, normalize: bool = False, angle: float = 90.0, format: str = '%0.2f', update_bounds: bool = True, axis: int = 0) -> None:
+def add_pie_series(plot: Union[int, str], name: str, values: List[float], labels: List[str], x: float, y: float, radius: float, *, normalize: bool = False, angle: float = 90.0, format: str = '%0.2f', update_bounds: bool = True, axis: int = 0) -> None:
 	"""Adds a pie series to a plot."""
 	...
 
-def add_plot(name: str, *, x_axis_name: str = '', y_axis_name: str = '', no_legend: bool = False, no_menus: bool = False, no_box_select: bool = False, no_mouse_pos: bool = False, no_highlight: bool = False, no_child: bool = False, query: bool = False, crosshairs: bool = False, anti_aliased: bool = False, equal_aspects: bool = False, yaxis2: bool = False, yaxis3: bool = False, xaxis_no_gridlines: bool = False, xaxis_no_tick_marks: bool = False, xaxis_no_tick_labels: bool = False, xaxis_log_scale: bool = False, xaxis_time: bool = False, xaxis_invert: bool = False, xaxis_lock_min: bool = False, xaxis_lock_max: bool = False, yaxis_no_gridlines: bool = False, yaxis_no_tick_marks: bool = False, yaxis_no_tick_labels: bool = False, yaxis_log_scale: bool = False, yaxis_invert: bool = False, yaxis_lock_min: bool = False, yaxis_lock_max: bool = False, y2axis_no_gridlines: bool = False, y2axis_no_tick_marks: bool = False, y2axis_no_tick_labels: bool = False, y2axis_log_scale: bool = False, y2axis_invert: bool = False, y2axis_lock_min: bool = False, y2axis_lock_max: bool = False, y3axis_no_gridlines: bool = False, y3axis_no_tick_marks: bool = False, y3axis_no_tick_labels: bool = False, y3axis_log_scale: bool = False, y3axis_invert: bool = False, y3axis_lock_min: bool = False, y3axis_lock_max: bool = False, parent: str = '', before: str = '', width: int = -1, height: int = -1, query_callback: Callable = None, show_color_scale: bool = False, scale_min: float = 0.0, scale_max: float = 1.0, scale_height: int = 100, label: str = '', show: bool = True, show_annotations: bool = True, show_drag_lines: bool = True, show_drag_points: bool = True) -> None:
+def add_plot(name: str, *, x_axis_name: str = '', y_axis_name: str = '', no_legend: bool = False, no_menus: bool = False, no_box_select: bool = False, no_mouse_pos: bool = False, no_highlight: bool = False, no_child: bool = False, query: bool = False, crosshairs: bool = False, anti_aliased: bool = False, equal_aspects: bool = False, yaxis2: bool = False, yaxis3: bool = False, xaxis_no_gridlines: bool = False, xaxis_no_tick_marks: bool = False, xaxis_no_tick_labels: bool = False, xaxis_log_scale: bool = False, xaxis_time: bool = False, xaxis_invert: bool = False, xaxis_lock_min: bool = False, xaxis_lock_max: bool = False, yaxis_no_gridlines: bool = False, yaxis_no_tick_marks: bool = False, yaxis_no_tick_labels: bool = False, yaxis_log_scale: bool = False, yaxis_invert: bool = False, yaxis_lock_min: bool = False, yaxis_lock_max: bool = False, y2axis_no_gridlines: bool = False, y2axis_no_tick_marks: bool = False, y2axis_no_tick_labels: bool = False, y2axis_log_scale: bool = False, y2axis_invert: bool = False, y2axis_lock_min: bool = False, y2axis_lock_max: bool = False, y3axis_no_gridlines: bool = False, y3axis_no_tick_marks: bool = False, y3axis_no_tick_labels: bool = False, y3axis_log_scale: bool = False, y3axis_invert: bool = False, y3axis_lock_min: bool = False, y3axis_lock_max: bool = False, parent: Union[int, str] = '', before: Union[int, str] = '', width: int = -1, height: int = -1, query_callback: Callable = None, show_color_scale: bool = False, scale_min: float = 0.0, scale_max: float = 1.0, scale_height: int = 100, label: str = '', show: bool = True, show_annotations: bool = True, show_drag_lines: bool = True, show_drag_points: bool = True) -> int:
 	"""Adds a plot widget."""
 	...
 
-def add_popup(popupparent: str, name: str, *, mousebutton: int = 1, modal: bool = False, parent: str = '', before: str = '', width: int = 0, height: int = 0, show: bool = True) -> None:
+def add_popup(popupparent: Union[int, str], name: str, *, mousebutton: int = 1, modal: bool = False, parent: Union[int, str] = '', before: Union[int, str] = '', width: int = 0, height: int = 0, show: bool = True) -> int:
 	"""Adds a popup window for an item. This command must come immediately after the item the popup is for. Must be followed by a call to end."""
 	...
 
-def add_progress_bar(name: str, *, default_value: float = 0.0, overlay: str = '', tip: str = '', parent: str = '', before: str = '', source: str = '', width: int = 0, height: int = 0, show: bool = True) -> None:
+def add_progress_bar(name: str, *, default_value: float = 0.0, overlay: str = '', tip: str = '', parent: Union[int, str] = '', before: Union[int, str] = '', source: str = '', width: int = 0, height: int = 0, show: bool = True) -> int:
 	"""Adds a progress bar."""
 	...
 
-def add_radio_button(name: str, *, items: List[str] = (), default_value: int = 0, callback: Callable = None, callback_data: Any = None, tip: str = '', parent: str = '', before: str = '', source: str = '', enabled: bool = True, horizontal: bool = False, show: bool = True) -> None:
+def add_radio_button(name: str, *, items: List[str] = (), default_value: int = 0, callback: Callable = None, callback_data: Any = None, tip: str = '', parent: Union[int, str] = '', before: Union[int, str] = '', source: str = '', enabled: bool = True, horizontal: bool = False, show: bool = True) -> int:
 	"""Adds a set of radio buttons. If items is empty, nothing will be shown."""
 	...
 
-def add_row(table: str, row: List[str]) -> None:
+def add_row(table: Union[int, str], row: List[str]) -> None:
 	"""Adds a row to the end of a table."""
 	...
 
-def add_same_line(*, name: str = 'sameline', xoffset: float = 0.0, spacing: float = -1.0, parent: str = '', before: str = '', show: bool = True) -> None:
+def add_same_line(*, name: str = 'sameline', xoffset: float = 0.0, spacing: float = -1.0, parent: Union[int, str] = '', before: Union[int, str] = '', show: bool = True) -> int:
 	"""Places a widget on the same line as the previous widget. Can also be used for horizontal spacing."""
 	...
 
-def add_scatter_series(plot: str, name: str, x: List[float], y: List[float], *, marker: int = 0, size: float = 4.0, weight: float = 1.0, outline: List[float] = (0, 0, 0, -1), fill: List[float] = (0, 0, 0, -1), update_bounds: bool = True, xy_data_format: bool = False, axis: int = 0) -> None:
+def add_scatter_series(plot: Union[int, str], name: str, x: List[float], y: List[float], *, marker: int = 0, size: float = 4.0, weight: float = 1.0, outline: List[float] = (0, 0, 0, -1), fill: List[float] = (0, 0, 0, -1), update_bounds: bool = True, xy_data_format: bool = False, axis: int = 0, x_source: str = '', y_source: str = '') -> None:
 	"""Adds a scatter series to a plot."""
 	...
 
-def add_selectable(name: str, *, default_value: bool = False, callback: Callable = None, callback_data: Any = None, tip: str = '', parent: str = '', before: str = '', source: str = '', enabled: bool = True, label: str = '', show: bool = True, span_columns: bool = False) -> None:
+def add_selectable(name: str, *, default_value: bool = False, callback: Callable = None, callback_data: Any = None, tip: str = '', parent: Union[int, str] = '', before: Union[int, str] = '', source: str = '', enabled: bool = True, label: str = '', show: bool = True, span_columns: bool = False) -> int:
 	"""Adds a selectable."""
 	...
 
-def add_separator(*, name: str = 'separator', tip: str = '', parent: str = '', before: str = '') -> None:
+def add_separator(*, name: str = 'separator', tip: str = '', parent: Union[int, str] = '', before: Union[int, str] = '') -> int:
 	"""Adds a horizontal line."""
 	...
 
-def add_shade_series(plot: str, name: str, x: List[float], y1: List[float], *, y2: List[float] = ..., color: List[float] = (0, 0, 0, -1), fill: List[float] = (0, 0, 0, -1), weight: float = 1.0, update_bounds: bool = True, axis: int = 0) -> None:
+def add_shade_series(plot: Union[int, str], name: str, x: List[float], y1: List[float], *, y2: List[float] = ..., color: List[float] = (0, 0, 0, -1), fill: List[float] = (0, 0, 0, -1), weight: float = 1.0, update_bounds: bool = True, axis: int = 0) -> None:
 	"""Adds a shade series to a plot."""
 	...
 
-def add_simple_plot(name: str, *, value: List[float] = (), overlay: str = '', minscale: float = 0.0, maxscale: float = 0.0, histogram: bool = False, tip: str = '', parent: str = '', before: str = '', width: int = 0, height: int = 0, source: str = '', label: str = '', show: bool = True) -> None:
+def add_simple_plot(name: str, *, value: List[float] = (), overlay: str = '', minscale: float = 0.0, maxscale: float = 0.0, histogram: bool = False, tip: str = '', parent: Union[int, str] = '', before: Union[int, str] = '', width: int = 0, height: int = 0, source: str = '', label: str = '', show: bool = True) -> int:
 	"""A simple plot for visualization of a set of values"""
 	...
 
-def add_slider_float(name: str, *, default_value: float = 0.0, min_value: float = 0.0, max_value: float = 100.0, format: str = '%.3f', vertical: bool = False, callback: Callable = None, callback_data: Any = None, tip: str = '', parent: str = '', before: str = '', source: str = '', enabled: bool = True, width: int = 0, height: int = 0, no_input: bool = False, clamped: bool = False, label: str = '', show: bool = True) -> None:
+def add_slider_float(name: str, *, default_value: float = 0.0, min_value: float = 0.0, max_value: float = 100.0, format: str = '%.3f', vertical: bool = False, callback: Callable = None, callback_data: Any = None, tip: str = '', parent: Union[int, str] = '', before: Union[int, str] = '', source: str = '', enabled: bool = True, width: int = 0, height: int = 0, no_input: bool = False, clamped: bool = False, label: str = '', show: bool = True) -> int:
 	"""Adds slider for a single float value. CTRL+Click to directly modify the value."""
 	...
 
-def add_slider_float2(name: str, *, default_value: List[float] = (0.0, 0.0), min_value: float = 0.0, max_value: float = 100.0, format: str = '%.3f', callback: Callable = None, callback_data: Any = None, tip: str = '', parent: str = '', before: str = '', source: str = '', enabled: bool = True, width: int = 0, no_input: bool = False, clamped: bool = False, label: str = '', show: bool = True) -> None:
+def add_slider_float2(name: str, *, default_value: List[float] = (0.0, 0.0), min_value: float = 0.0, max_value: float = 100.0, format: str = '%.3f', callback: Callable = None, callback_data: Any = None, tip: str = '', parent: Union[int, str] = '', before: Union[int, str] = '', source: str = '', enabled: bool = True, width: int = 0, no_input: bool = False, clamped: bool = False, label: str = '', show: bool = True) -> int:
 	"""Adds slider for a 2 float values. CTRL+Click to directly modify the value."""
 	...
 
-def add_slider_float3(name: str, *, default_value: List[float] = (0.0, 0.0, 0.0), min_value: float = 0.0, max_value: float = 100.0, format: str = '%.3f', callback: Callable = None, callback_data: Any = None, tip: str = '', parent: str = '', before: str = '', source: str = '', enabled: bool = True, width: int = 0, no_input: bool = False, clamped: bool = False, label: str = '', show: bool = True) -> None:
+def add_slider_float3(name: str, *, default_value: List[float] = (0.0, 0.0, 0.0), min_value: float = 0.0, max_value: float = 100.0, format: str = '%.3f', callback: Callable = None, callback_data: Any = None, tip: str = '', parent: Union[int, str] = '', before: Union[int, str] = '', source: str = '', enabled: bool = True, width: int = 0, no_input: bool = False, clamped: bool = False, label: str = '', show: bool = True) -> int:
 	"""Adds slider for a 3 float values. CTRL+Click to directly modify the value."""
 	...
 
-def add_slider_float4(name: str, *, default_value: List[float] = (0.0, 0.0, 0.0, 0.0), min_value: float = 0.0, max_value: float = 100.0, format: str = '%.3f', callback: Callable = None, callback_data: Any = None, tip: str = '', parent: str = '', before: str = '', source: str = '', enabled: bool = True, width: int = 0, no_input: bool = False, clamped: bool = False, label: str = '', show: bool = True) -> None:
+def add_slider_float4(name: str, *, default_value: List[float] = (0.0, 0.0, 0.0, 0.0), min_value: float = 0.0, max_value: float = 100.0, format: str = '%.3f', callback: Callable = None, callback_data: Any = None, tip: str = '', parent: Union[int, str] = '', before: Union[int, str] = '', source: str = '', enabled: bool = True, width: int = 0, no_input: bool = False, clamped: bool = False, label: str = '', show: bool = True) -> int:
 	"""Adds slider for a 4 float values. CTRL+Click to directly modify the value."""
 	...
 
-def add_slider_int(name: str, *, default_value: int = 0, min_value: int = 0, max_value: int = 100, format: str = '%d', vertical: bool = False, callback: Callable = None, callback_data: Any = None, tip: str = '', parent: str = '', before: str = '', source: str = '', enabled: bool = True, width: int = 0, height: int = 0, no_input: bool = False, clamped: bool = False, label: str = '', show: bool = True) -> None:
+def add_slider_int(name: str, *, default_value: int = 0, min_value: int = 0, max_value: int = 100, format: str = '%d', vertical: bool = False, callback: Callable = None, callback_data: Any = None, tip: str = '', parent: Union[int, str] = '', before: Union[int, str] = '', source: str = '', enabled: bool = True, width: int = 0, height: int = 0, no_input: bool = False, clamped: bool = False, label: str = '', show: bool = True) -> int:
 	"""Adds slider for a single int value. CTRL+Click to directly modify the value."""
 	...
 
-def add_slider_int2(name: str, *, default_value: List[int] = (0, 0), min_value: int = 0, max_value: int = 100, format: str = '%d', callback: Callable = None, callback_data: Any = None, tip: str = '', parent: str = '', before: str = '', source: str = '', enabled: bool = True, width: int = 0, no_input: bool = False, clamped: bool = False, label: str = '', show: bool = True) -> None:
+def add_slider_int2(name: str, *, default_value: List[int] = (0, 0), min_value: int = 0, max_value: int = 100, format: str = '%d', callback: Callable = None, callback_data: Any = None, tip: str = '', parent: Union[int, str] = '', before: Union[int, str] = '', source: str = '', enabled: bool = True, width: int = 0, no_input: bool = False, clamped: bool = False, label: str = '', show: bool = True) -> int:
 	"""Adds slider for a 2 int values. CTRL+Click to directly modify the value."""
 	...
 
-def add_slider_int3(name: str, *, default_value: List[int] = (0, 0, 0), min_value: int = 0, max_value: int = 100, format: str = '%d', callback: Callable = None, callback_data: Any = None, tip: str = '', parent: str = '', before: str = '', source: str = '', enabled: bool = True, width: int = 0, no_input: bool = False, clamped: bool = False, label: str = '', show: bool = True) -> None:
+def add_slider_int3(name: str, *, default_value: List[int] = (0, 0, 0), min_value: int = 0, max_value: int = 100, format: str = '%d', callback: Callable = None, callback_data: Any = None, tip: str = '', parent: Union[int, str] = '', before: Union[int, str] = '', source: str = '', enabled: bool = True, width: int = 0, no_input: bool = False, clamped: bool = False, label: str = '', show: bool = True) -> int:
 	"""Adds slider for a 3 int values. CTRL+Click to directly modify the value."""
 	...
 
-def add_slider_int4(name: str, *, default_value: List[int] = (0, 0, 0, 0), min_value: int = 0, max_value: int = 100, format: str = '%d', callback: Callable = None, callback_data: Any = None, tip: str = '', parent: str = '', before: str = '', source: str = '', enabled: bool = True, width: int = 0, no_input: bool = False, clamped: bool = False, label: str = '', show: bool = True) -> None:
+def add_slider_int4(name: str, *, default_value: List[int] = (0, 0, 0, 0), min_value: int = 0, max_value: int = 100, format: str = '%d', callback: Callable = None, callback_data: Any = None, tip: str = '', parent: Union[int, str] = '', before: Union[int, str] = '', source: str = '', enabled: bool = True, width: int = 0, no_input: bool = False, clamped: bool = False, label: str = '', show: bool = True) -> int:
 	"""Adds slider for a 4 int values. CTRL+Click to directly modify the value."""
 	...
 
-def add_spacing(*, name: str = 'spacing', count: int = 1, parent: str = '', before: str = '', show: bool = True) -> None:
+def add_spacing(*, name: str = 'spacing', count: int = 1, parent: Union[int, str] = '', before: Union[int, str] = '', show: bool = True) -> int:
 	"""Adds vertical spacing."""
 	...
 
-def add_stair_series(plot: str, name: str, x: List[float], y: List[float], *, color: List[float] = (0, 0, 0, -1), weight: float = 1.0, update_bounds: bool = True, axis: int = 0) -> None:
+def add_stair_series(plot: Union[int, str], name: str, x: List[float], y: List[float], *, color: List[float] = (0, 0, 0, -1), weight: float = 1.0, update_bounds: bool = True, axis: int = 0, x_source: str = '', y_source: str = '') -> None:
 	"""Adds a stair series to a plot."""
 	...
 
-def add_stem_series(plot: str, name: str, x: List[float], y: List[float], *, marker: int = 0, size: float = 4.0, weight: float = 1.0, outline: List[float] = (0, 0, 0, -1), fill: List[float] = (0, 0, 0, -1), update_bounds: bool = True, axis: int = 0) -> None:
+def add_stem_series(plot: Union[int, str], name: str, x: List[float], y: List[float], *, marker: int = 0, size: float = 4.0, weight: float = 1.0, outline: List[float] = (0, 0, 0, -1), fill: List[float] = (0, 0, 0, -1), update_bounds: bool = True, axis: int = 0, x_source: str = '', y_source: str = '') -> None:
 	"""Adds a stem series to a plot."""
 	...
 
-def add_style_window(name: str, *, width: int = 700, height: int = 500, x_pos: int = 200, y_pos: int = 200, autosize: bool = False, no_resize: bool = False, no_title_bar: bool = False, no_move: bool = False, no_scrollbar: bool = False, no_collapse: bool = False, horizontal_scrollbar: bool = False, no_focus_on_appearing: bool = False, no_bring_to_front_on_focus: bool = False, no_close: bool = False, no_background: bool = False, label: str = '', show: bool = True) -> None:
+def add_style_window(name: str, *, width: int = 700, height: int = 500, x_pos: int = 200, y_pos: int = 200, autosize: bool = False, no_resize: bool = False, no_title_bar: bool = False, no_move: bool = False, no_scrollbar: bool = False, no_collapse: bool = False, horizontal_scrollbar: bool = False, no_focus_on_appearing: bool = False, no_bring_to_front_on_focus: bool = False, no_close: bool = False, no_background: bool = False, label: str = '', show: bool = True) -> int:
 	"""Creates a style window."""
 	...
 
-def add_tab(name: str, *, closable: bool = False, label: str = '', show: bool = True, no_reorder: bool = False, leading: bool = False, trailing: bool = False, no_tooltip: bool = False, tip: str = '', parent: str = '', before: str = '') -> None:
+def add_tab(name: str, *, closable: bool = False, label: str = '', show: bool = True, no_reorder: bool = False, leading: bool = False, trailing: bool = False, no_tooltip: bool = False, tip: str = '', parent: Union[int, str] = '', before: Union[int, str] = '') -> int:
 	"""Adds a tab to a tab bar. Must be closed with the end command."""
 	...
 
-def add_tab_bar(name: str, *, reorderable: bool = False, callback: Callable = None, callback_data: Any = None, show: bool = True, parent: str = '', before: str = '') -> None:
+def add_tab_bar(name: str, *, reorderable: bool = False, callback: Callable = None, callback_data: Any = None, show: bool = True, parent: Union[int, str] = '', before: Union[int, str] = '') -> int:
 	"""Adds a tab bar."""
 	...
 
-def add_tab_button(name: str, *, label: str = '', show: bool = True, no_reorder: bool = False, leading: bool = False, trailing: bool = False, no_tooltip: bool = False, tip: str = '', callback: Callable = None, callback_data: Any = None, parent: str = '', before: str = '') -> None:
+def add_tab_button(name: str, *, label: str = '', show: bool = True, no_reorder: bool = False, leading: bool = False, trailing: bool = False, no_tooltip: bool = False, tip: str = '', callback: Callable = None, callback_data: Any = None, parent: Union[int, str] = '', before: Union[int, str] = '') -> int:
 	"""Adds a tab button to a tab bar"""
 	...
 
-def add_table(name: str, headers: List[str], *, callback: Callable = None, callback_data: Any = None, parent: str = '', before: str = '', width: int = 0, height: int = 200, show: bool = True) -> None:
+def add_table(name: str, headers: List[str], *, callback: Callable = None, callback_data: Any = None, parent: Union[int, str] = '', before: Union[int, str] = '', width: int = 0, height: int = 200, show: bool = True) -> int:
 	"""Adds table."""
 	...
 
-def add_text(name: str, *, wrap: int = 0, color: List[float] = (0, 0, 0, -1), bullet: bool = False, tip: str = '', parent: str = '', before: str = '', source: str = '', default_value: str = '', show: bool = True) -> None:
+def add_table_filter(table: Union[int, str], value: str, *, column: int = -1, comparison: str = 'contains', case_sensitive: bool = False) -> None:
+	"""Hides rows whose cells do not match, rows have to match every filter."""
+	...
+
+def add_text(name: str, *, wrap: int = 0, color: List[float] = (0, 0, 0, -1), bullet: bool = False, tip: str = '', parent: Union[int, str] = '', before: Union[int, str] = '', source: str = '', default_value: str = '', show: bool = True) -> int:
 	"""Adds text"""
 	...
 
-def add_text_point(plot: str, name: str, x: float, y: float, *, vertical: bool = False, xoffset: int = 0.0, yoffset: int = 0.0, update_bounds: bool = True, axis: int = 0) -> None:
+def add_text_point(plot: Union[int, str], name: str, x: float, y: float, *, vertical: bool = False, xoffset: int = 0.0, yoffset: int = 0.0, update_bounds: bool = True, axis: int = 0) -> None:
 	"""Adds a point with text to a plot."""
 	...
 
@@ -374,15 +378,15 @@ def add_texture(name: str, data: List[int], width: int, height: int, *, format:
 	"""Adds a texture."""
 	...
 
-def add_time_picker(name: str, *, default_value: dict = {'hour': 14, 'min': 32, 'sec': 23}, hour24: bool = False, callback: Callable = None, callback_data: Any = None, tip: str = '', parent: str = '', before: str = '', show: bool = True) -> None:
+def add_time_picker(name: str, *, default_value: dict = {'hour': 14, 'min': 32, 'sec': 23}, hour24: bool = False, callback: Callable = None, callback_data: Any = None, tip: str = '', parent: Union[int, str] = '', before: Union[int, str] = '', show: bool = True) -> int:
 	"""Adds a time selector widget."""
 	...
 
-def add_tooltip(tipparent: str, name: str, *, parent: str = '', before: str = '', show: bool = True) -> None:
+def add_tooltip(tipparent: Union[int, str], name: str, *, parent: Union[int, str] = '', before: Union[int, str] = '', show: bool = True) -> int:
 	"""Adds an advanced tool tip for an item. This command must come immediately after the item the tip is for."""
 	...
 
-def add_tree_node(name: str, *, label: str = '', show: bool = True, tip: str = '', parent: str = '', before: str = '', default_open: bool = False, open_on_double_click: bool = False, open_on_arrow: bool = False, leaf: bool = False, bullet: bool = False) -> None:
+def add_tree_node(name: str, *, label: str = '', show: bool = True, tip: str = '', parent: Union[int, str] = '', before: Union[int, str] = '', default_open: bool = False, open_on_double_click: bool = False, open_on_arrow: bool = False, leaf: bool = False, bullet: bool = False) -> int:
 	"""Adds a tree node to add items to. Must be closed with the end command."""
 	...
 
@@ -390,15 +394,23 @@ def add_value(name: str, value: Any) -> None:
 	"""Adds a value to the value storage."""
 	...
 
-def add_window(name: str, *, width: int = -1, height: int = -1, x_pos: int = 200, y_pos: int = 200, autosize: bool = False, no_resize: bool = False, no_title_bar: bool = False, no_move: bool = False, no_scrollbar: bool = False, no_collapse: bool = False, horizontal_scrollbar: bool = False, no_focus_on_appearing: bool = False, no_bring_to_front_on_focus: bool = False, menubar: bool = False, no_close: bool = False, no_background: bool = False, label: str = '', show: bool = True, on_close: Callable = None) -> None:
+def add_window(name: str, *, width: int = -1, height: int = -1, x_pos: int = 200, y_pos: int = 200, autosize: bool = False, no_resize: bool = False, no_title_bar: bool = False, no_move: bool = False, no_scrollbar: bool = False, no_collapse: bool = False, horizontal_scrollbar: bool = False, no_focus_on_appearing: bool = False, no_bring_to_front_on_focus: bool = False, menubar: bool = False, no_close: bool = False, no_background: bool = False, label: str = '', show: bool = True, on_close: Callable = None) -> int:
 	"""Creates a new window for following items to be added to."""
 	...
 
-def bring_draw_command_forward(drawing: str, tag: str) -> None:
+def append_series_data(plot: Union[int, str], series: str, x: List[float], y: List[float], *, max_points: int = 0, update_bounds: bool = True) -> None:
+	"""Appends points to a line, scatter, stair, stem or bar series without resending the existing data. Creates a line series if it does not exist. Once max_points is reached the oldest points are overwritten."""
+	...
+
+def bring_draw_command_forward(drawing: Union[int, str], tag: str) -> None:
 	"""Brings draw command forward."""
 	...
 
-def bring_draw_command_to_front(drawing: str, tag: str) -> None:
+def begin_batch() -> None:
+	"""Starts queuing item creation. Queued items are added under a single lock when the batch ends."""
+	...
+
+def bring_draw_command_to_front(drawing: Union[int, str], tag: str) -> None:
 	"""Brings draw command to front."""
 	...
 
@@ -406,38 +418,50 @@ def cleanup_dearpygui() -> None:
 	"""Cleans up DearPyGui after calling setup_dearpygui."""
 	...
 
-def clear_drawing(draw: str) -> None:
+def clear_drawing(draw: Union[int, str]) -> None:
 	"""Clears a drawing."""
 	...
 
-def clear_item_color(item: str) -> None:
+def clear_item_color(item: Union[int, str]) -> None:
 	"""Clears individual color styles for an item."""
 	...
 
-def clear_item_style_vars(item: str) -> None:
+def clear_item_style_vars(item: Union[int, str]) -> None:
 	"""Clears individual styles variables for an item."""
 	...
 
-def clear_log(*, logger: str = '') -> None:
+def clear_log(*, logger: Union[int, str] = '') -> None:
 	"""Clears the logger."""
 	...
 
-def clear_plot(plot: str) -> None:
+def clear_plot(plot: Union[int, str]) -> None:
 	"""Clears a plot."""
 	...
 
-def clear_table(table: str) -> None:
+def clear_table(table: Union[int, str]) -> None:
 	"""Clears data in a table"""
 	...
 
-def close_popup(item: str) -> None:
+def clear_table_filters(table: Union[int, str]) -> None:
+	"""Removes all filters of a table."""
+	...
+
+def clear_table_selections(table: Union[int, str]) -> None:
+	"""Unselects every cell of a table."""
+	...
+
+def close_popup(item: Union[int, str]) -> None:
 	"""Closes a popup."""
 	...
 
-def configure_item(item: str, **Kwargs) -> None:
+def configure_item(item: Union[int, str], **Kwargs) -> None:
 	"""Configures an item"""
 	...
 
+def configure_items(items: dict) -> None:
+	"""Configures many items at once"""
+	...
+
 def decref_value(name: str) -> None:
 	"""Decreases the reference count of a value."""
 	...
@@ -446,11 +470,11 @@ def decrement_texture(name: str) -> None:
 	"""Decrements a texture."""
 	...
 
-def delete_annotation(plot: str, name: str) -> None:
+def delete_annotation(plot: Union[int, str], name: str) -> None:
 	"""Deletes an annotation"""
 	...
 
-def delete_column(table: str, column: int) -> None:
+def delete_column(table: Union[int, str], column: int) -> None:
 	"""Delete a column in a table."""
 	...
 
@@ -458,75 +482,75 @@ def delete_data(name: str) -> None:
 	"""Deletes data from storage."""
 	...
 
-def delete_drag_line(plot: str, name: str) -> None:
+def delete_drag_line(plot: Union[int, str], name: str) -> None:
 	"""Deletes a drag line if it exists."""
 	...
 
-def delete_drag_point(plot: str, name: str) -> None:
+def delete_drag_point(plot: Union[int, str], name: str) -> None:
 	"""Deletes a drag point if it exists."""
 	...
 
-def delete_draw_command(drawing: str, tag: str) -> None:
+def delete_draw_command(drawing: Union[int, str], tag: str) -> None:
 	"""Deletes a drawing item."""
 	...
 
-def delete_item(item: str, *, children_only: bool = False) -> None:
+def delete_item(item: Union[int, str], *, children_only: bool = False) -> None:
 	"""Deletes an item if it exists."""
 	...
 
-def delete_row(table: str, row: int) -> None:
+def delete_row(table: Union[int, str], row: int) -> None:
 	"""Delete a row in a table."""
 	...
 
-def delete_series(plot: str, series: str) -> None:
+def delete_series(plot: Union[int, str], series: str) -> None:
 	"""Deletes a series if it exists."""
 	...
 
-def does_item_exist(item: str) -> bool:
+def does_item_exist(item: Union[int, str]) -> bool:
 	"""Checks if item exists."""
 	...
 
-def draw_arrow(drawing: str, p1: List[float], p2: List[float], color: List[int], thickness: int, size: int, *, tag: str = '') -> None:
+def draw_arrow(drawing: Union[int, str], p1: List[float], p2: List[float], color: List[int], thickness: int, size: int, *, tag: str = '') -> None:
 	"""Draws an arrow on a drawing."""
 	...
 
-def draw_bezier_curve(drawing: str, p1: List[float], p2: List[float], p3: List[float], p4: List[float], color: List[int], *, thickness: float = 1.0, segments: int = 0, tag: str = '') -> None:
+def draw_bezier_curve(drawing: Union[int, str], p1: List[float], p2: List[float], p3: List[float], p4: List[float], color: List[int], *, thickness: float = 1.0, segments: int = 0, tag: str = '') -> None:
 	"""Draws a bezier curve on a drawing."""
 	...
 
-def draw_circle(drawing: str, center: List[float], radius: float, color: List[int], *, segments: int = 0, thickness: float = 1.0, fill: List[float] = (0, 0, 0, -1), tag: str = '') -> None:
+def draw_circle(drawing: Union[int, str], center: List[float], radius: float, color: List[int], *, segments: int = 0, thickness: float = 1.0, fill: List[float] = (0, 0, 0, -1), tag: str = '') -> None:
 	"""Draws a circle on a drawing."""
 	...
 
-def draw_image(drawing: str, file: str, pmin: List[float], pmax: List[float], *, uv_min: List[float] = (0.0, 0.0), uv_max: List[float] = (1.0, 1.0), color: List[int] = (255, 255, 255, 255), tag: str = '') -> None:
+def draw_image(drawing: Union[int, str], file: str, pmin: List[float], pmax: List[float], *, uv_min: List[float] = (0.0, 0.0), uv_max: List[float] = (1.0, 1.0), color: List[int] = (255, 255, 255, 255), tag: str = '') -> None:
 	"""Draws an image on a drawing. p_min (bottom-left) and p_max (upper-right) represent corners of the rectangle the image will be drawn to.Setting the p_min equal to the p_max will sraw the image to with 1:1 scale.uv_min and uv_max represent the normalized texture coordinates of the original image that will be shown. Using (0,0)->(1,1) texturecoordinates will generally display the entire texture."""
 	...
 
-def draw_line(drawing: str, p1: List[float], p2: List[float], color: List[int], thickness: int, *, tag: str = '') -> None:
+def draw_line(drawing: Union[int, str], p1: List[float], p2: List[float], color: List[int], thickness: int, *, tag: str = '') -> None:
 	"""Draws a line on a drawing."""
 	...
 
-def draw_polygon(drawing: str, points: List[List[float]], color: List[int], *, fill: List[float] = (0, 0, 0, -1), thickness: float = 1.0, tag: str = '') -> None:
+def draw_polygon(drawing: Union[int, str], points: List[List[float]], color: List[int], *, fill: List[float] = (0, 0, 0, -1), thickness: float = 1.0, tag: str = '') -> None:
 	"""Draws a polygon on a drawing."""
 	...
 
-def draw_polyline(drawing: str, points: List[List[float]], color: List[int], *, closed: bool = False, thickness: float = 1.0, tag: str = '') -> None:
+def draw_polyline(drawing: Union[int, str], points: List[List[float]], color: List[int], *, closed: bool = False, thickness: float = 1.0, tag: str = '') -> None:
 	"""Draws lines on a drawing."""
 	...
 
-def draw_quad(drawing: str, p1: List[float], p2: List[float], p3: List[float], p4: List[float], color: List[int], *, fill: List[float] = (0, 0, 0, -1), thickness: float = 1.0, tag: str = '') -> None:
+def draw_quad(drawing: Union[int, str], p1: List[float], p2: List[float], p3: List[float], p4: List[float], color: List[int], *, fill: List[float] = (0, 0, 0, -1), thickness: float = 1.0, tag: str = '') -> None:
 	"""Draws a quad on a drawing."""
 	...
 
-def draw_rectangle(drawing: str, pmin: List[float], pmax: List[float], color: List[int], *, fill: List[float] = (0, 0, 0, -1), rounding: float = 0.0, thickness: float = 1.0, tag: str = '') -> None:
+def draw_rectangle(drawing: Union[int, str], pmin: List[float], pmax: List[float], color: List[int], *, fill: List[float] = (0, 0, 0, -1), rounding: float = 0.0, thickness: float = 1.0, tag: str = '') -> None:
 	"""Draws a rectangle on a drawing."""
 	...
 
-def draw_text(drawing: str, pos: List[float], text: str, *, color: List[int] = (0, 0, 0, -1), size: int = 10, tag: str = '') -> None:
+def draw_text(drawing: Union[int, str], pos: List[float], text: str, *, color: List[int] = (0, 0, 0, -1), size: int = 10, tag: str = '') -> None:
 	"""Draws text on a drawing."""
 	...
 
-def draw_triangle(drawing: str, p1: List[float], p2: List[float], p3: List[float], color: List[int], *, fill: List[float] = (0, 0, 0, -1), thickness: float = 1.0, tag: str = '') -> None:
+def draw_triangle(drawing: Union[int, str], p1: List[float], p2: List[float], p3: List[float], color: List[int], *, fill: List[float] = (0, 0, 0, -1), thickness: float = 1.0, tag: str = '') -> None:
 	"""Draws a triangle on a drawing."""
 	...
 
@@ -538,6 +562,10 @@ def end() -> None:
 	"""Ends a container."""
 	...
 
+def end_batch() -> dict:
+	"""Adds all items queued since begin_batch and returns the batch timing (ms)."""
+	...
+
 def get_active_window() -> str:
 	"""Returns the active window name."""
 	...
@@ -558,67 +586,79 @@ def get_delta_time() -> float:
 	"""Returns time since last frame."""
 	...
 
-def get_draw_command(drawing: str, tag: str) -> dict:
+def get_draw_command(drawing: Union[int, str], tag: str) -> dict:
 	"""Returns an draw commands information"""
 	...
 
+def get_frame_stats() -> dict:
+	"""Returns frame statistics over the last 120 frames (times in milliseconds) and item counts for the last frame."""
+	...
+
 def get_global_font_scale() -> float:
 	"""Returns the global font scale."""
 	...
 
-def get_item_callback(item: str) -> Callable:
+def get_item_callback(item: Union[int, str]) -> Callable:
 	"""Returns an item' callback"""
 	...
 
-def get_item_callback_data(item: str) -> Any:
+def get_item_callback_data(item: Union[int, str]) -> Any:
 	"""Returns an item' callback data"""
 	...
 
-def get_item_children(item: str) -> List[str]:
+def get_item_children(item: Union[int, str]) -> List[str]:
 	"""Returns a list of an item's children."""
 	...
 
-def get_item_configuration(item: str) -> dict:
+def get_item_configuration(item: Union[int, str], *, keys: List[str] = []) -> dict:
 	"""Returns an items configuration"""
 	...
 
-def get_item_height(item: str) -> float:
+def get_item_height(item: Union[int, str]) -> float:
 	"""Returns an item's height."""
 	...
 
-def get_item_label(item: str) -> str:
+def get_item_label(item: Union[int, str]) -> str:
 	"""Gets an item's label."""
 	...
 
-def get_item_parent(item: str) -> str:
+def get_item_parent(item: Union[int, str]) -> str:
 	"""Returns an item's parent."""
 	...
 
-def get_item_rect_max(item: str) -> [float, float]:
+def get_item_rect_max(item: Union[int, str]) -> [float, float]:
 	"""Returns an item's maximum allowable size. [width, height]"""
 	...
 
-def get_item_rect_min(item: str) -> [float, float]:
+def get_item_rect_min(item: Union[int, str]) -> [float, float]:
 	"""Returns an item's minimum allowable size. [width, height]"""
 	...
 
-def get_item_rect_size(item: str) -> [float, float]:
+def get_item_rect_size(item: Union[int, str]) -> [float, float]:
 	"""Returns an item's current size. [width, height]"""
 	...
 
-def get_item_tip(item: str) -> str:
+def get_item_states(items: Any = [], *, parent: Union[int, str] = '', rects: bool = False) -> dict:
+	"""Returns the state of many items at once as mvItemState_* bitflags."""
+	...
+
+def get_item_tip(item: Union[int, str]) -> str:
 	"""Returns an item's tip."""
 	...
 
-def get_item_type(item: str) -> str:
+def get_item_type(item: Union[int, str]) -> str:
 	"""Returns an item's type"""
 	...
 
-def get_item_width(item: str) -> float:
+def get_item_width(item: Union[int, str]) -> float:
 	"""Returns an item's width."""
 	...
 
-def get_log_level(*, logger: str = '') -> int:
+def get_items_configuration(items: Any, *, keys: List[str] = []) -> List[dict]:
+	"""Returns the configuration of each item (None for items not found)"""
+	...
+
+def get_log_level(*, logger: Union[int, str] = '') -> int:
 	"""Returns the log level."""
 	...
 
@@ -626,7 +666,7 @@ def get_main_window_size() -> [int, int]:
 	"""Returns the size of the main window."""
 	...
 
-def get_managed_column_width(item: str, column: int) -> Float:
+def get_managed_column_width(item: Union[int, str], column: int) -> Float:
 	"""Returns the width of the ith column."""
 	...
 
@@ -642,15 +682,19 @@ def get_plot_mouse_pos() -> (int, int):
 	"""Returns the current mouse position in the currently hovered plot."""
 	...
 
-def get_plot_query_area(plot: str) -> List[float]:
+def get_plot_nearest_points(plot: Union[int, str], x: float, y: float, radius: float) -> List[List[Any]]:
+	"""Returns the closest point of each line, scatter, stair, stem, bar, shade, area and error series within radius pixels of (x, y) as [series, index, x, y], nearest first."""
+	...
+
+def get_plot_query_area(plot: Union[int, str]) -> List[float]:
 	"""Returns the bounding axis limits for the query area [x_min, x_max, y_min, y_max]"""
 	...
 
-def get_plot_xlimits(plot: str) -> List[float]:
+def get_plot_xlimits(plot: Union[int, str]) -> List[float]:
 	"""Returns the plots x limits"""
 	...
 
-def get_plot_ylimits(plot: str) -> List[float]:
+def get_plot_ylimits(plot: Union[int, str]) -> List[float]:
 	"""Returns the plots x limits"""
 	...
 
@@ -778,15 +822,23 @@ def get_style_window_title_align() -> List[float]:
 	"""Gets alignment for title bar text. Defaults to (0.0,0.5) for left-aligned,vertically centered."""
 	...
 
-def get_table_data(name: str) -> List[List[str]]:
+def get_table_data(name: Union[int, str]) -> List[List[str]]:
 	"""Gets table data."""
 	...
 
-def get_table_item(table: str, row: int, column: int) -> str:
+def get_table_item(table: Union[int, str], row: int, column: int) -> str:
 	"""Gets a table's cell value."""
 	...
 
-def get_table_selections(table: str) -> List[List[int]]:
+def get_table_row_order(table: Union[int, str]) -> memoryview:
+	"""Returns the displayed rows in display order as a memoryview of ints."""
+	...
+
+def get_table_selected_rows(table: Union[int, str]) -> memoryview:
+	"""Returns the rows with a selected cell as a memoryview of ints."""
+	...
+
+def get_table_selections(table: Union[int, str]) -> List[List[int]]:
 	"""Retrieves data from storage."""
 	...
 
@@ -798,11 +850,15 @@ def get_theme_item(item: int) -> (float, float, float, float):
 	"""Returns a theme item's color"""
 	...
 
+def get_thread_pool_stats() -> dict:
+	"""Returns the worker pool configuration and utilization (times in seconds)."""
+	...
+
 def get_total_time() -> float:
 	"""Returns total time since app started."""
 	...
 
-def get_value(name: str) -> Any:
+def get_value(name: Union[int, str]) -> Any:
 	"""Returns an item's value or None if there is none."""
 	...
 
@@ -814,11 +870,11 @@ def incref_value(name: str) -> None:
 	"""Increases the reference count of a value."""
 	...
 
-def insert_column(table: str, column_index: int, name: str, column: List[str]) -> None:
+def insert_column(table: Union[int, str], column_index: int, name: str, column: List[str]) -> None:
 	"""Inserts a column into a table."""
 	...
 
-def insert_row(table: str, row_index: int, row: List[str]) -> None:
+def insert_row(table: Union[int, str], row_index: int, row: List[str]) -> None:
 	"""Inserts a row into a table."""
 	...
 
@@ -826,51 +882,51 @@ def is_dearpygui_running() -> bool:
 	"""Checks if dearpygui is still running"""
 	...
 
-def is_item_activated(item: str) -> bool:
+def is_item_activated(item: Union[int, str]) -> bool:
 	"""Checks if an item has been activated."""
 	...
 
-def is_item_active(item: str) -> bool:
+def is_item_active(item: Union[int, str]) -> bool:
 	"""Checks if an item is active."""
 	...
 
-def is_item_clicked(item: str) -> bool:
+def is_item_clicked(item: Union[int, str]) -> bool:
 	"""Checks if an item is clicked."""
 	...
 
-def is_item_container(item: str) -> bool:
+def is_item_container(item: Union[int, str]) -> bool:
 	"""Checks if an item is container."""
 	...
 
-def is_item_deactivated(item: str) -> bool:
+def is_item_deactivated(item: Union[int, str]) -> bool:
 	"""Checks if an item has been deactivated."""
 	...
 
-def is_item_deactivated_after_edit(item: str) -> bool:
+def is_item_deactivated_after_edit(item: Union[int, str]) -> bool:
 	"""Checks if an item has been deactivated after editing."""
 	...
 
-def is_item_edited(item: str) -> bool:
+def is_item_edited(item: Union[int, str]) -> bool:
 	"""Checks if an item has been edited."""
 	...
 
-def is_item_focused(item: str) -> bool:
+def is_item_focused(item: Union[int, str]) -> bool:
 	"""Checks if an item is focused."""
 	...
 
-def is_item_hovered(item: str) -> bool:
+def is_item_hovered(item: Union[int, str]) -> bool:
 	"""Checks if an item is hovered."""
 	...
 
-def is_item_shown(item: str) -> bool:
+def is_item_shown(item: Union[int, str]) -> bool:
 	"""Checks if an item is shown."""
 	...
 
-def is_item_toggled_open(item: str) -> bool:
+def is_item_toggled_open(item: Union[int, str]) -> bool:
 	"""Checks if an item is toggled."""
 	...
 
-def is_item_visible(item: str) -> bool:
+def is_item_visible(item: Union[int, str]) -> bool:
 	"""Checks if an item is visible on screen."""
 	...
 
@@ -906,43 +962,43 @@ def is_mouse_button_released(button: int) -> bool:
 	"""Checks if the mouse button is released."""
 	...
 
-def is_plot_queried(plot: str) -> bool:
+def is_plot_queried(plot: Union[int, str]) -> bool:
 	"""Returns true if plot was queried"""
 	...
 
-def log(message: Any, *, level: str = 'TRACE', logger: str = '') -> None:
+def log(message: Any, *, level: str = 'TRACE', logger: Union[int, str] = '') -> None:
 	"""Logs a trace level log."""
 	...
 
-def log_debug(message: Any, *, logger: str = '') -> None:
+def log_debug(message: Any, *, logger: Union[int, str] = '') -> None:
 	"""Logs a debug level log."""
 	...
 
-def log_error(message: Any, *, logger: str = '') -> None:
+def log_error(message: Any, *, logger: Union[int, str] = '') -> None:
 	"""Logs a error level log."""
 	...
 
-def log_info(message: Any, *, logger: str = '') -> None:
+def log_info(message: Any, *, logger: Union[int, str] = '') -> None:
 	"""Logs a info level log."""
 	...
 
-def log_warning(message: Any, *, logger: str = '') -> None:
+def log_warning(message: Any, *, logger: Union[int, str] = '') -> None:
 	"""Logs a warning level log."""
 	...
 
-def modify_draw_command(drawing: str, tag: str, **Kwargs) -> None:
+def modify_draw_command(drawing: Union[int, str], tag: str, **Kwargs) -> None:
 	"""Configures an drawing command."""
 	...
 
-def move_item(item: str, *, parent: str = '', before: str = '') -> None:
+def move_item(item: Union[int, str], *, parent: Union[int, str] = '', before: Union[int, str] = '') -> None:
 	"""Moves an existing item."""
 	...
 
-def move_item_down(item: str) -> None:
+def move_item_down(item: Union[int, str]) -> None:
 	"""Moves item down if possible and if it exists."""
 	...
 
-def move_item_up(item: str) -> None:
+def move_item_up(item: Union[int, str]) -> None:
 	"""Moves item up if possible and if it exists."""
 	...
 
@@ -954,23 +1010,27 @@ def render_dearpygui_frame() -> None:
 	"""Renders a DearPyGui frame. Should be called within a user's event loop. Must first call setup_dearpygui outside of event loop."""
 	...
 
-def reset_xticks(plot: str) -> None:
+def reset_xticks(plot: Union[int, str]) -> None:
 	"""Sets plots x ticks and labels back to automatic"""
 	...
 
-def reset_yticks(plot: str) -> None:
+def reset_yticks(plot: Union[int, str]) -> None:
 	"""Sets plots y ticks and labels back to automatic"""
 	...
 
+def select_all_table(table: Union[int, str]) -> None:
+	"""Selects every cell of a table."""
+	...
+
 def select_directory_dialog(callback: Callable = None) -> None:
 	"""Opens a select directory dialog."""
 	...
 
-def send_draw_command_back(drawing: str, tag: str) -> None:
+def send_draw_command_back(drawing: Union[int, str], tag: str) -> None:
 	"""Sends draw command back."""
 	...
 
-def send_draw_command_to_back(drawing: str, tag: str) -> None:
+def send_draw_command_to_back(drawing: Union[int, str], tag: str) -> None:
 	"""Sends draw command to the back."""
 	...
 
@@ -978,7 +1038,7 @@ def set_accelerator_callback(callback: Any) -> None:
 	"""Callback similar to keypress but used for accelerator keys."""
 	...
 
-def set_color_map(plot: str, map: int) -> None:
+def set_color_map(plot: Union[int, str], map: int) -> None:
 	"""Sets the color map of the plot's series."""
 	...
 
@@ -994,43 +1054,47 @@ def set_global_font_scale(scale: float) -> None:
 	"""Changes the global font scale."""
 	...
 
-def set_headers(table: str, headers: List[str]) -> None:
+def set_headers(table: Union[int, str], headers: List[str]) -> None:
 	"""Sets a tables headers."""
 	...
 
-def set_individual_color(item: str, id: int, color: List[float]) -> None:
+def set_headless(value: bool) -> None:
+	"""Runs without a window or graphics context (frames are built but not drawn). Must be called before the viewport is created."""
+	...
+
+def set_individual_color(item: Union[int, str], id: int, color: List[float]) -> None:
 	"""Sets an color of a theme item."""
 	...
 
-def set_item_callback(item: str, callback: Callable, *, callback_data: Any = None) -> None:
+def set_item_callback(item: Union[int, str], callback: Callable, *, callback_data: Any = None) -> None:
 	"""Sets an item's callback if applicable."""
 	...
 
-def set_item_callback_data(item: str, callback_data: Any) -> None:
+def set_item_callback_data(item: Union[int, str], callback_data: Any) -> None:
 	"""Sets an item's callback data if applicable."""
 	...
 
-def set_item_color(item: str, style: int, color: List[float]) -> None:
+def set_item_color(item: Union[int, str], style: int, color: List[float]) -> None:
 	"""Sets an color style for a single item."""
 	...
 
-def set_item_height(item: str, height: int) -> None:
+def set_item_height(item: Union[int, str], height: int) -> None:
 	"""Sets an item's height if applicable."""
 	...
 
-def set_item_label(item: str, label: str) -> None:
+def set_item_label(item: Union[int, str], label: str) -> None:
 	"""Sets an item's label."""
 	...
 
-def set_item_style_var(item: str, style: int, value: List[float]) -> None:
+def set_item_style_var(item: Union[int, str], style: int, value: List[float]) -> None:
 	"""Sets an style variable for a single item."""
 	...
 
-def set_item_tip(item: str, tip: str) -> None:
+def set_item_tip(item: Union[int, str], tip: str) -> None:
 	"""Sets a simple tooltip for an item."""
 	...
 
-def set_item_width(item: str, width: int) -> None:
+def set_item_width(item: Union[int, str], width: int) -> None:
 	"""Sets an item's width."""
 	...
 
@@ -1046,7 +1110,11 @@ def set_key_release_callback(callback: Callable) -> None:
 	"""Sets a callback for a key release event."""
 	...
 
-def set_log_level(level: int, *, logger: str = '') -> None:
+def set_lazy_rendering(value: bool, *, timeout: float = 0.5) -> None:
+	"""Only renders frames on input, when items or values change from python or while an item is active. Otherwise waits up to timeout between frames."""
+	...
+
+def set_log_level(level: int, *, logger: Union[int, str] = '') -> None:
 	"""Sets the log level."""
 	...
 
@@ -1070,7 +1138,7 @@ def set_main_window_title(title: str) -> None:
 	"""Sets the title of the main window."""
 	...
 
-def set_managed_column_width(item: str, column: int, width: float) -> None:
+def set_managed_column_width(item: Union[int, str], column: int, width: float) -> None:
 	"""Sets the width of the ith column."""
 	...
 
@@ -1102,23 +1170,23 @@ def set_mouse_wheel_callback(callback: Callable) -> None:
 	"""Sets a callback for a mouse wheel event."""
 	...
 
-def set_plot_xlimits(plot: str, xmin: float, xmax: float) -> None:
+def set_plot_xlimits(plot: Union[int, str], xmin: float, xmax: float) -> None:
 	"""Sets x axis limits of a plot. (can be undone with set_plot_xlimits_auto()"""
 	...
 
-def set_plot_xlimits_auto(plot: str) -> None:
+def set_plot_xlimits_auto(plot: Union[int, str]) -> None:
 	"""Sets plots x limits to be automatic."""
 	...
 
-def set_plot_ylimits(plot: str, ymin: float, ymax: float) -> None:
+def set_plot_ylimits(plot: Union[int, str], ymin: float, ymax: float) -> None:
 	"""Sets y axis limits of a plot. (can be undone with set_plot_ylimits_auto()"""
 	...
 
-def set_plot_ylimits_auto(plot: str) -> None:
+def set_plot_ylimits_auto(plot: Union[int, str]) -> None:
 	"""Sets plots y limits to be automatic."""
 	...
 
-def set_primary_window(window: str, value: bool) -> None:
+def set_primary_window(window: Union[int, str], value: bool) -> None:
 	"""Sets the primary window to fill the viewport."""
 	...
 
@@ -1126,7 +1194,7 @@ def set_render_callback(callback: Callable) -> None:
 	"""Sets the callback to be ran every frame."""
 	...
 
-def set_resize_callback(callback: Callable, *, handler: str = '') -> None:
+def set_resize_callback(callback: Callable, *, handler: Union[int, str] = '') -> None:
 	"""Sets a callback for a window resize event."""
 	...
 
@@ -1258,18 +1326,26 @@ def set_style_window_title_align(x: float, y: float) -> None:
 	"""Sets alignment for title bar text. Defaults to (0.0,0.5) for left-aligned,vertically centered."""
 	...
 
-def set_table_data(name: str, data: List[List[str]]) -> None:
+def set_table_data(name: Union[int, str], data: Any, *, columns: bool = False) -> None:
 	"""Overwrites table data."""
 	...
 
-def set_table_item(table: str, row: int, column: int, value: str) -> None:
+def set_table_item(table: Union[int, str], row: int, column: int, value: str) -> None:
 	"""Sets a table's cell value."""
 	...
 
-def set_table_selection(table: str, row: int, column: int, value: bool) -> None:
+def set_table_selection(table: Union[int, str], row: int, column: int, value: bool) -> None:
 	"""Sets a table's cell selection value."""
 	...
 
+def set_table_selection_range(table: Union[int, str], first_row: int, last_row: int, *, first_column: int = 0, last_column: int = -1, value: bool = True) -> None:
+	"""Sets the selection value of a block of cells."""
+	...
+
+def set_target_fps(fps: float, *, background_fps: float = 0.0) -> None:
+	"""Limits the frame rate independent of vsync."""
+	...
+
 def set_theme(theme: str) -> None:
 	"""Set the application's theme to a built-in theme."""
 	...
@@ -1278,7 +1354,11 @@ def set_theme_item(item: int, r: int, g: int, b: int, a: int) -> None:
 	"""Sets a theme item."""
 	...
 
-def set_value(name: str, value: Any) -> bool:
+def set_thread_pool(threads: int, *, min_chunk: int = 65536) -> None:
+	"""Configures the worker pool used to convert series data, compute bounds and build plot levels of detail."""
+	...
+
+def set_value(name: Union[int, str], value: Any) -> bool:
 	"""Sets an item's value if applicable."""
 	...
 
@@ -1286,11 +1366,11 @@ def set_vsync(value: bool) -> None:
 	"""Sets vsync on or off."""
 	...
 
-def set_xticks(plot: str, label_pairs: Any) -> None:
+def set_xticks(plot: Union[int, str], label_pairs: Any) -> None:
 	"""Sets plots x ticks and labels"""
 	...
 
-def set_yticks(plot: str, label_pairs: Any) -> None:
+def set_yticks(plot: Union[int, str], label_pairs: Any) -> None:
 	"""Sets plots y ticks and labels"""
 	...
 
@@ -1298,7 +1378,7 @@ def setup_dearpygui() -> None:
 	"""Sets up DearPyGui for user controlled rendering. Only call once and you must call cleanup_deapygui when finished."""
 	...
 
-def show_item(name: str) -> None:
+def show_item(name: Union[int, str]) -> None:
 	"""Shows an item if it was hidden."""
 	...
 
@@ -1306,7 +1386,11 @@ def show_logger() -> None:
 	"""Shows the logging window. The Default log level is Trace"""
 	...
 
-def start_dearpygui(*, primary_window: str = '') -> None:
+def sort_table(table: Union[int, str], columns: List[int], *, descending: List[int] = ()) -> None:
+	"""Sorts the displayed rows of a table, the table data keeps its order."""
+	...
+
+def start_dearpygui(*, primary_window: Union[int, str] = '') -> None:
 	"""Starts DearPyGui."""
 	...
 
@@ -1314,7 +1398,11 @@ def stop_dearpygui() -> None:
 	"""Stops DearPyGui."""
 	...
 
-def unindent(*, name: str = 'unindent', offset: float = 0.0, parent: str = '', before: str = '', show: bool = True) -> None:
+def unindent(*, name: str = 'unindent', offset: float = 0.0, parent: Union[int, str] = '', before: Union[int, str] = '', show: bool = True) -> int:
 	"""Unindents following items."""
 	...
 
+def update_heat_series(plot: Union[int, str], series: str, values: List[float], *, row: int = 0, scroll: bool = False) -> None:
+	"""Replaces rows of a heat series without resending the whole series. Texture mode heat series only upload the changed rows."""
+	...
+
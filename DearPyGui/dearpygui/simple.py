@@ -387,6 +387,25 @@ def popup(popupparent: str, name: str, *, mousebutton: int = 1, modal: bool = Fa
     finally:
         internal_dpg.end()
 
+
+@contextmanager
+def batch():
+    """Queues every item created inside the block and adds them all under a single lock when the block exits.
+
+    Items get their handles immediately but can only be found by name once the batch is committed.
+    Batches can be nested, items are committed when the outermost batch exits.
+
+    Returns:
+        A dict that is filled with the batch statistics when the block exits:
+        queued, added, lock_wait (ms) and commit (ms).
+    """
+    stats = {}
+    internal_dpg.begin_batch()
+    try:
+        yield stats
+    finally:
+        stats.update(internal_dpg.end_batch())
+
 ########################################################################################################################
 # Old Commands
 ########################################################################################################################
@@ -526,7 +545,7 @@ def get_item_label(item: str) -> Union[str, None]:
     Returns:
         label as a string or None
     """
-    return internal_dpg.get_item_configuration(item)["label"]
+    return internal_dpg.get_item_configuration(item, keys=["label"])["label"]
 
 def get_item_tip(item: str) -> Union[str, None]:
     """Gets the item's tip.
@@ -534,7 +553,7 @@ def get_item_tip(item: str) -> Union[str, None]:
     Returns:
         tip as a string or None
     """
-    return internal_dpg.get_item_configuration(item)["tip"]
+    return internal_dpg.get_item_configuration(item, keys=["tip"])["tip"]
 
 
 def get_item_width(item: str) -> Union[int, None]:
@@ -543,7 +562,7 @@ def get_item_width(item: str) -> Union[int, None]:
     Returns:
         width as a int or None
     """
-    return internal_dpg.get_item_configuration(item)["width"]
+    return internal_dpg.get_item_configuration(item, keys=["width"])["width"]
 
 
 def get_item_height(item: str) -> Union[int, None]:
@@ -552,7 +571,7 @@ def get_item_height(item: str) -> Union[int, None]:
     Returns:
         height as a int or None
     """
-    return internal_dpg.get_item_configuration(item)["height"]
+    return internal_dpg.get_item_configuration(item, keys=["height"])["height"]
 
 
 def set_drawing_size(drawing: str, width: int, height: int):
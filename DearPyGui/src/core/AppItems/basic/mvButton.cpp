@@ -17,14 +17,14 @@ namespace Marvel {
 			{mvPythonDataType::Callable, "callback", "Registers a callback", "None"},
 			{mvPythonDataType::Object, "callback_data", "Callback data", "None"},
 			{mvPythonDataType::String, "tip", "Adds a simple tooltip", "''"},
-			{mvPythonDataType::String, "parent", "Parent to add this item to. (runtime adding)", "''"},
-			{mvPythonDataType::String, "before", "This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
+			{mvPythonDataType::UUID, "parent", "Parent to add this item to. (runtime adding)", "''"},
+			{mvPythonDataType::UUID, "before", "This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
 			{mvPythonDataType::Integer, "width","", "0"},
 			{mvPythonDataType::Integer, "height", "", "0"},
 			{mvPythonDataType::String, "label", "Overrides 'name' as label", "''"},
 			{mvPythonDataType::Bool, "show", "Attempt to render", "True"},
 			{mvPythonDataType::Bool, "enabled", "", "True"},
-		}, "Adds a button.", "None", "Adding Widgets") });
+		}, "Adds a button.", "int", "Adding Widgets") });
 	}
 
 	mvButton::mvButton(const std::string& name)
@@ -101,8 +101,8 @@ namespace Marvel {
 		const char* tip = "";
 		int width = 0;
 		int height = 0;
-		const char* before = "";
-		const char* parent = "";
+		mvItemArg before;
+		mvItemArg parent;
 		const char* label = "";
 		int show = true;
 		int enabled = true;
@@ -126,7 +126,7 @@ namespace Marvel {
 
 		mvApp::GetApp()->getItemRegistry().addItemWithRuntimeChecks(item, parent, before);
 
-		return GetPyNone();
+		return ToPyUUID(item->getUUID());
 	}
 
 
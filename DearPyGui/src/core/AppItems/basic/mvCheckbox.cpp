@@ -15,13 +15,13 @@ namespace Marvel {
 			{mvPythonDataType::Callable, "callback", "Registers a callback", "None"},
 			{mvPythonDataType::Object, "callback_data", "Callback data", "None"},
 			{mvPythonDataType::String, "tip", "Adds a simple tooltip", "''"},
-			{mvPythonDataType::String, "parent", "Parent to add this item to. (runtime adding)", "''"},
-			{mvPythonDataType::String, "before", "This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
+			{mvPythonDataType::UUID, "parent", "Parent to add this item to. (runtime adding)", "''"},
+			{mvPythonDataType::UUID, "before", "This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
 			{mvPythonDataType::String, "source", "Overrides 'name' as value storage key", "''"},
 			{mvPythonDataType::String, "label", "Overrides 'name' as label", "''"},
 			{mvPythonDataType::Bool, "show", "Attempt to render", "True"},
 			{mvPythonDataType::Bool, "enabled", "", "True"}
-		}, "Adds a checkbox widget.", "None", "Adding Widgets") });
+		}, "Adds a checkbox widget.", "int", "Adding Widgets") });
 	}
 
 	mvCheckbox::mvCheckbox(const std::string& name, bool default_value, const std::string& dataSource)
@@ -59,8 +59,8 @@ namespace Marvel {
 		PyObject* callback = nullptr;
 		PyObject* callback_data = nullptr;
 		const char* tip = "";
-		const char* before = "";
-		const char* parent = "";
+		mvItemArg before;
+		mvItemArg parent;
 		const char* source = "";
 		const char* label = "";
 		int show = true;
@@ -85,6 +85,6 @@ namespace Marvel {
 
 		mvApp::GetApp()->getItemRegistry().addItemWithRuntimeChecks(item, parent, before);
 
-		return GetPyNone();
+		return ToPyUUID(item->getUUID());
 	}
 }
\ No newline at end of file
@@ -14,15 +14,15 @@ namespace Marvel {
 			{mvPythonDataType::Callable, "callback", "Registers a callback", "None"},
 			{mvPythonDataType::Object, "callback_data", "Callback data", "None"},
 			{mvPythonDataType::String, "tip", "Adds a simple tooltip", "''"},
-			{mvPythonDataType::String, "parent", "Parent to add this item to. (runtime adding)", "''"},
-			{mvPythonDataType::String, "before", "This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
+			{mvPythonDataType::UUID, "parent", "Parent to add this item to. (runtime adding)", "''"},
+			{mvPythonDataType::UUID, "before", "This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
 			{mvPythonDataType::Integer, "width","", "0"},
 			{mvPythonDataType::Integer, "height", "", "0"},
 			{mvPythonDataType::Bool, "show", "Attemp to render", "True"},
 			{mvPythonDataType::Bool, "no_alpha", "ignore Alpha component", "False"},
 			{mvPythonDataType::Bool, "no_border", "disable border (which is enforced by default)", "False"},
 			{mvPythonDataType::Bool, "no_drag_drop", "disable display of inline text label", "False"},
-		}, "Adds a color button.", "None", "Adding Widgets") });
+		}, "Adds a color button.", "int", "Adding Widgets") });
 	}
 
 	mvColorButton::mvColorButton(const std::string& name, const mvColor& color)
@@ -81,8 +81,8 @@ namespace Marvel {
 		PyObject* callback = nullptr;
 		PyObject* callback_data = nullptr;
 		const char* tip = "";
-		const char* parent = "";
-		const char* before = "";
+		mvItemArg parent;
+		mvItemArg before;
 		int width = 0;
 		int height = 0;
 		int show = true;
@@ -109,7 +109,7 @@ namespace Marvel {
 
 		mvApp::GetApp()->getItemRegistry().addItemWithRuntimeChecks(item, parent, before);
 
-		return GetPyNone();
+		return ToPyUUID(item->getUUID());
 	}
 
 	void mvColorEdit3::InsertParser(std::map<std::string, mvPythonParser>* parsers)
@@ -122,8 +122,8 @@ namespace Marvel {
 			{mvPythonDataType::Callable, "callback", "Registers a callback", "None"},
 			{mvPythonDataType::Object, "callback_data", "Callback data", "None"},
 			{mvPythonDataType::String, "tip", "Adds a simple tooltip", "''"},
-			{mvPythonDataType::String, "parent", "Parent to add this item to. (runtime adding)", "''"},
-			{mvPythonDataType::String, "before", "This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
+			{mvPythonDataType::UUID, "parent", "Parent to add this item to. (runtime adding)", "''"},
+			{mvPythonDataType::UUID, "before", "This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
 			{mvPythonDataType::String, "source", "", "''"},
 			{mvPythonDataType::Integer, "width","", "0"},
 			{mvPythonDataType::Integer, "height", "", "0"},
@@ -148,7 +148,7 @@ namespace Marvel {
 			{mvPythonDataType::Bool, "input_rgb", "input and output data in RGB format.", "False"},
 			{mvPythonDataType::Bool, "input_hsv", "input and output data in HSV format.", "False"},
 
-		}, "Adds an rgb color editing widget. Click and draging the color square will copy the color to be applied on any other color widget.", "None", "Adding Widgets") });
+		}, "Adds an rgb color editing widget. Click and draging the color square will copy the color to be applied on any other color widget.", "int", "Adding Widgets") });
 	}
 
 	mvColorEdit3::mvColorEdit3(const std::string& name, float* color, const std::string& dataSource)
@@ -265,8 +265,8 @@ namespace Marvel {
 		const char* tip = "";
 		int width = 0;
 		int height = 0;
-		const char* before = "";
-		const char* parent = "";
+		mvItemArg before;
+		mvItemArg parent;
 		const char* source = "";
 		const char* label = "";
 		int show = true;
@@ -313,7 +313,7 @@ namespace Marvel {
 
 		mvApp::GetApp()->getItemRegistry().addItemWithRuntimeChecks(item, parent, before);
 
-		return GetPyNone();
+		return ToPyUUID(item->getUUID());
 	}
 
 	void mvColorEdit4::InsertParser(std::map<std::string, mvPythonParser>* parsers)
@@ -325,8 +325,8 @@ namespace Marvel {
 			{mvPythonDataType::Callable, "callback", "Registers a callback", "None"},
 			{mvPythonDataType::Object, "callback_data", "Callback data", "None"},
 			{mvPythonDataType::String, "tip", "Adds a simple tooltip", "''"},
-			{mvPythonDataType::String, "parent", "Parent to add this item to. (runtime adding)", "''"},
-			{mvPythonDataType::String, "before", "This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
+			{mvPythonDataType::UUID, "parent", "Parent to add this item to. (runtime adding)", "''"},
+			{mvPythonDataType::UUID, "before", "This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
 			{mvPythonDataType::String, "source", "", "''"},
 			{mvPythonDataType::Integer, "width","", "0"},
 			{mvPythonDataType::Integer, "height", "", "0"},
@@ -351,7 +351,7 @@ namespace Marvel {
 			{mvPythonDataType::Bool, "input_rgb", "input and output data in RGB format.", "False"},
 			{mvPythonDataType::Bool, "input_hsv", "input and output data in HSV format.", "False"},
 
-		}, "Adds an rgba color editing widget. Click and draging the color square will copy the color to be applied on any other color widget.", "None", "Adding Widgets") });
+		}, "Adds an rgba color editing widget. Click and draging the color square will copy the color to be applied on any other color widget.", "int", "Adding Widgets") });
 	}
 
 	mvColorEdit4::mvColorEdit4(const std::string& name, float* color, const std::string& dataSource)
@@ -469,8 +469,8 @@ namespace Marvel {
 		const char* tip = "";
 		int width = 0;
 		int height = 0;
-		const char* before = "";
-		const char* parent = "";
+		mvItemArg before;
+		mvItemArg parent;
 		const char* source = "";
 		const char* label = "";
 		int show = true;
@@ -516,7 +516,7 @@ namespace Marvel {
 
 		mvApp::GetApp()->getItemRegistry().addItemWithRuntimeChecks(item, parent, before);
 
-		return GetPyNone();
+		return ToPyUUID(item->getUUID());
 	}
 
 	void mvColorPicker3::InsertParser(std::map<std::string, mvPythonParser>* parsers)
@@ -529,8 +529,8 @@ namespace Marvel {
 			{mvPythonDataType::Callable, "callback", "Registers a callback", "None"},
 			{mvPythonDataType::Object, "callback_data", "Callback data", "None"},
 			{mvPythonDataType::String, "tip", "Adds a simple tooltip", "''"},
-			{mvPythonDataType::String, "parent", "Parent to add this item to. (runtime adding)", "''"},
-			{mvPythonDataType::String, "before", "This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
+			{mvPythonDataType::UUID, "parent", "Parent to add this item to. (runtime adding)", "''"},
+			{mvPythonDataType::UUID, "before", "This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
 			{mvPythonDataType::String, "source", "", "''"},
 			{mvPythonDataType::Integer, "width","", "0"},
 			{mvPythonDataType::Integer, "height", "", "0"},
@@ -554,7 +554,7 @@ namespace Marvel {
 			{mvPythonDataType::Bool, "picker_hue_wheel", "wheel for Hue, triangle for Sat/Value.", "False"},
 			{mvPythonDataType::Bool, "input_rgb", "input and output data in RGB format.", "False"},
 			{mvPythonDataType::Bool, "input_hsv", "input and output data in HSV format.", "False"},
-		}, "Adds an rgb color picking widget. Click and draging the color square will copy the color to be applied on any other color widget. Right Click allows the style of the color picker to be changed.", "None", "Adding Widgets") });
+		}, "Adds an rgb color picking widget. Click and draging the color square will copy the color to be applied on any other color widget. Right Click allows the style of the color picker to be changed.", "int", "Adding Widgets") });
 	}
 
 	mvColorPicker3::mvColorPicker3(const std::string& name, float* color, const std::string& dataSource)
@@ -672,8 +672,8 @@ namespace Marvel {
 		const char* tip = "";
 		int width = 0;
 		int height = 0;
-		const char* before = "";
-		const char* parent = "";
+		mvItemArg before;
+		mvItemArg parent;
 		const char* source = "";
 		const char* label = "";
 		int show = true;
@@ -720,7 +720,7 @@ namespace Marvel {
 
 		mvApp::GetApp()->getItemRegistry().addItemWithRuntimeChecks(item, parent, before);
 
-		return GetPyNone();
+		return ToPyUUID(item->getUUID());
 	}
 
 	void mvColorPicker4::InsertParser(std::map<std::string, mvPythonParser>* parsers)
@@ -733,8 +733,8 @@ namespace Marvel {
 			{mvPythonDataType::Callable, "callback", "Registers a callback", "None"},
 			{mvPythonDataType::Object, "callback_data", "Callback data", "None"},
 			{mvPythonDataType::String, "tip", "Adds a simple tooltip", "''"},
-			{mvPythonDataType::String, "parent", "Parent to add this item to. (runtime adding)", "''"},
-			{mvPythonDataType::String, "before", "This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
+			{mvPythonDataType::UUID, "parent", "Parent to add this item to. (runtime adding)", "''"},
+			{mvPythonDataType::UUID, "before", "This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
 			{mvPythonDataType::String, "source", "", "''"},
 			{mvPythonDataType::Integer, "width", "", "0"},
 			{mvPythonDataType::Integer, "height", "", "0"},
@@ -758,7 +758,7 @@ namespace Marvel {
 			{mvPythonDataType::Bool, "picker_hue_wheel", "wheel for Hue, triangle for Sat/Value.", "False"},
 			{mvPythonDataType::Bool, "input_rgb", "input and output data in RGB format.", "False"},
 			{mvPythonDataType::Bool, "input_hsv", "input and output data in HSV format.", "False"},
-		}, "Adds an rgba color picking widget. Click and draging the color square will copy the color to be applied on any other color widget. Right Click allows the style of the color picker to be changed", "None", "Adding Widgets") });
+		}, "Adds an rgba color picking widget. Click and draging the color square will copy the color to be applied on any other color widget. Right Click allows the style of the color picker to be changed", "int", "Adding Widgets") });
 	}
 
 	mvColorPicker4::mvColorPicker4(const std::string& name, float* color, const std::string& dataSource)
@@ -876,8 +876,8 @@ namespace Marvel {
 		const char* tip = "";
 		int width = 0;
 		int height = 0;
-		const char* before = "";
-		const char* parent = "";
+		mvItemArg before;
+		mvItemArg parent;
 		const char* source = "";
 		const char* label = "";
 		int show = true;
@@ -923,7 +923,7 @@ namespace Marvel {
 
 		mvApp::GetApp()->getItemRegistry().addItemWithRuntimeChecks(item, parent, before);
 
-		return GetPyNone();
+		return ToPyUUID(item->getUUID());
 	}
 
 }
\ No newline at end of file
@@ -17,8 +17,8 @@ namespace Marvel {
 			{mvPythonDataType::Callable, "callback", "Registers a callback", "None"},
 			{mvPythonDataType::Object, "callback_data", "Callback data", "None"},
 			{mvPythonDataType::String, "tip", "Adds a simple tooltip", "''"},
-			{mvPythonDataType::String, "parent", "Parent this item will be added to. (runtime adding)", "''"},
-			{mvPythonDataType::String, "before", "This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
+			{mvPythonDataType::UUID, "parent", "Parent this item will be added to. (runtime adding)", "''"},
+			{mvPythonDataType::UUID, "before", "This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
 			{mvPythonDataType::String, "source", "Overrides 'name' as value storage key", "''"},
 			{mvPythonDataType::Bool, "enabled", "Display grayed out text so selectable cannot be selected", "True"},
 			{mvPythonDataType::Integer, "width","", "0"},
@@ -31,7 +31,7 @@ namespace Marvel {
 			{mvPythonDataType::Bool, "height_largest","As many items visible as possible", "False"},
 			{mvPythonDataType::Bool, "no_arrow_button","Display on the preview box without the square arrow button", "False"},
 			{mvPythonDataType::Bool, "no_preview","Display only a square arrow button", "False"},
-		}, "Adds a combo.", "None", "Adding Widgets") });
+		}, "Adds a combo.", "int", "Adding Widgets") });
 	}
 
 	mvCombo::mvCombo(const std::string& name, const std::string& default_value, const std::string& dataSource)
@@ -165,8 +165,8 @@ namespace Marvel {
 		PyObject* callback_data = nullptr;
 		const char* tip = "";
 		int width = 0;
-		const char* before = "";
-		const char* parent = "";
+		mvItemArg before;
+		mvItemArg parent;
 		const char* source = "";
 		int enabled = true;
 		const char* label = "";
@@ -200,7 +200,7 @@ namespace Marvel {
 
 		mvApp::GetApp()->getItemRegistry().addItemWithRuntimeChecks(item, parent, before);
 
-		return GetPyNone();
+		return ToPyUUID(item->getUUID());
 	}
 
 }
\ No newline at end of file
@@ -15,8 +15,8 @@ namespace Marvel {
 			{mvPythonDataType::FloatList, "tint_color", "", "(255, 255, 255, 255)"},
 			{mvPythonDataType::FloatList, "border_color", "", "(0, 0, 0, 0)"},
 			{mvPythonDataType::String, "tip", "Adds a simple tooltip", "''"},
-			{mvPythonDataType::String, "parent", "Parent this item will be added to. (runtime adding)", "''"},
-			{mvPythonDataType::String, "before", "This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
+			{mvPythonDataType::UUID, "parent", "Parent this item will be added to. (runtime adding)", "''"},
+			{mvPythonDataType::UUID, "before", "This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
 			{mvPythonDataType::String, "source", "data source for shared data", "''"},
 			{mvPythonDataType::Integer, "width","", "0"},
 			{mvPythonDataType::Integer, "height","", "0"},
@@ -25,7 +25,7 @@ namespace Marvel {
 			{mvPythonDataType::Bool, "show", "Attempt to render", "True"},
 		}, "Adds an image."
 		"uv_min and uv_max represent the normalized texture coordinates of the original image that will be shown."
-		"Using(0,0)->(1,1) texture coordinates will generally display the entire texture", "None", "Adding Widgets") });
+		"Using(0,0)->(1,1) texture coordinates will generally display the entire texture", "int", "Adding Widgets") });
 	}
 
 	mvImage::mvImage(const std::string& name, std::string default_value)
@@ -163,8 +163,8 @@ namespace Marvel {
 		PyTuple_SetItem(bordercolor, 2, PyFloat_FromDouble(0.0));
 		PyTuple_SetItem(bordercolor, 3, PyFloat_FromDouble(0.0));
 		const char* tip = "";
-		const char* parent = "";
-		const char* before = "";
+		mvItemArg parent;
+		mvItemArg before;
 		const char* source = "";
 		int width = 0;
 		int height = 0;
@@ -189,7 +189,7 @@ namespace Marvel {
 
 		mvApp::GetApp()->getItemRegistry().addItemWithRuntimeChecks(item, parent, before);
 
-		return GetPyNone();
+		return ToPyUUID(item->getUUID());
 	}
 
 }
\ No newline at end of file
@@ -26,8 +26,8 @@ namespace Marvel {
 			{mvPythonDataType::Callable, "callback", "Registers a callback", "None"},
 			{mvPythonDataType::Object, "callback_data", "Callback data", "None"},
 			{mvPythonDataType::String, "tip", "Adds a simple tooltip", "''"},
-			{mvPythonDataType::String, "parent", "Parent to add this item to. (runtime adding)", "''"},
-			{mvPythonDataType::String, "before", "This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
+			{mvPythonDataType::UUID, "parent", "Parent to add this item to. (runtime adding)", "''"},
+			{mvPythonDataType::UUID, "before", "This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
 			{mvPythonDataType::String, "source", "", "''"},
 			{mvPythonDataType::Bool, "enabled", "Display grayed out text so selectable cannot be selected", "True"},
 			{mvPythonDataType::Integer, "width","", "0"},
@@ -35,7 +35,7 @@ namespace Marvel {
 			{mvPythonDataType::Bool, "on_enter", "Only runs callback on enter", "False"},
 			{mvPythonDataType::String, "label", "", "''"},
 			{mvPythonDataType::Bool, "show", "Attempt to render", "True"},
-		}, "Adds input for text values.", "None", "Adding Widgets") });
+		}, "Adds input for text values.", "int", "Adding Widgets") });
 	}
 
 	mvInputText::mvInputText(const std::string& name, const std::string& default_value, const std::string& dataSource)
@@ -171,8 +171,8 @@ namespace Marvel {
 		const char* tip = "";
 		int width = 0;
 		int height = 0;
-		const char* before = "";
-		const char* parent = "";
+		mvItemArg before;
+		mvItemArg parent;
 		const char* source = "";
 		int enabled = true;
 		int on_enter = false;
@@ -203,7 +203,7 @@ namespace Marvel {
 
 		mvApp::GetApp()->getItemRegistry().addItemWithRuntimeChecks(item, parent, before);
 
-		return GetPyNone();
+		return ToPyUUID(item->getUUID());
 	}
 
 }
\ No newline at end of file
@@ -17,15 +17,15 @@ namespace Marvel {
 			{mvPythonDataType::Callable, "callback", "Registers a callback", "None"},
 			{mvPythonDataType::Object, "callback_data", "Callback data", "None"},
 			{mvPythonDataType::String, "tip", "Adds a simple tooltip", "''"},
-			{mvPythonDataType::String, "parent", "Parent this item will be added to. (runtime adding)", "''"},
-			{mvPythonDataType::String, "before", "This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
+			{mvPythonDataType::UUID, "parent", "Parent this item will be added to. (runtime adding)", "''"},
+			{mvPythonDataType::UUID, "before", "This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
 			{mvPythonDataType::String, "source", "", "''"},
 			{mvPythonDataType::Bool, "enabled", "Display grayed out text so selectable cannot be selected", "True"},
 			{mvPythonDataType::Integer, "width","", "0"},
 			{mvPythonDataType::Integer, "num_items", "number of items to show", "3"},
 			{mvPythonDataType::String, "label","", "''"},
 			{mvPythonDataType::Bool, "show", "Attempt to render", "True"},
-		}, "Adds a listbox.", "None", "Adding Widgets") });
+		}, "Adds a listbox.", "int", "Adding Widgets") });
 	}
 
 	mvListbox::mvListbox(const std::string& name, int default_value, const std::string& dataSource)
@@ -96,8 +96,8 @@ namespace Marvel {
 		const char* tip = "";
 		int width = 0;
 		int num_items = 3;
-		const char* before = "";
-		const char* parent = "";
+		mvItemArg before;
+		mvItemArg parent;
 		const char* source = "";
 		int enabled = true;
 		const char* label = "";
@@ -122,7 +122,7 @@ namespace Marvel {
 
 		mvApp::GetApp()->getItemRegistry().addItemWithRuntimeChecks(item, parent, before);
 
-		return GetPyNone();
+		return ToPyUUID(item->getUUID());
 	}
 
 }
\ No newline at end of file
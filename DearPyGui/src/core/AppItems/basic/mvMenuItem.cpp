@@ -19,9 +19,9 @@ namespace Marvel {
 			{mvPythonDataType::String, "label", "", "''"},
 			{mvPythonDataType::Bool, "show", "Attempt to render", "True"},
 			{mvPythonDataType::Bool, "enabled", "", "True"},
-			{mvPythonDataType::String, "parent", "Parent this item will be added to. (runtime adding)", "''"},
-			{mvPythonDataType::String, "before", "This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
-		}, "Adds a menu item to an existing menu.", "None", "Containers") });
+			{mvPythonDataType::UUID, "parent", "Parent this item will be added to. (runtime adding)", "''"},
+			{mvPythonDataType::UUID, "before", "This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
+		}, "Adds a menu item to an existing menu.", "int", "Containers") });
 	}
 
 	mvMenuItem::mvMenuItem(const std::string& name)
@@ -81,8 +81,8 @@ namespace Marvel {
 		const char* label = "";
 		int show = true;
 		int enabled = true;
-		const char* parent = "";
-		const char* before = "";
+		mvItemArg parent;
+		mvItemArg before;
 
 		if (!(*mvApp::GetApp()->getParsers())["add_menu_item"].parse(args, kwargs, __FUNCTION__, &name,
 			&shortcut, &check, &callback, &callback_data, &label, &show, &enabled, &parent, &before))
@@ -101,6 +101,6 @@ namespace Marvel {
 
 		mvApp::GetApp()->getItemRegistry().addItemWithRuntimeChecks(item, parent, before);
 
-		return GetPyNone();
+		return ToPyUUID(item->getUUID());
 	}
 }
\ No newline at end of file
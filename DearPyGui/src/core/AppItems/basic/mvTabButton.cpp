@@ -20,9 +20,9 @@ namespace Marvel {
 			{mvPythonDataType::String, "tip", "Adds a simple tooltip", "''"},
 			{mvPythonDataType::Callable, "callback", "Registers a callback", "None"},
 			{mvPythonDataType::Object, "callback_data", "Callback data", "None"},
-			{mvPythonDataType::String, "parent", "Parent to add this item to. (runtime adding)", "''"},
-			{mvPythonDataType::String, "before", "This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
-		}, "Adds a tab button to a tab bar", "None", "Containers") });
+			{mvPythonDataType::UUID, "parent", "Parent to add this item to. (runtime adding)", "''"},
+			{mvPythonDataType::UUID, "before", "This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
+		}, "Adds a tab button to a tab bar", "int", "Containers") });
 	}
 
 	mvTabButton::mvTabButton(const std::string& name)
@@ -96,15 +96,15 @@ namespace Marvel {
 		const char* tip = "";
 		PyObject* callback = nullptr;
 		PyObject* callback_data = nullptr;
-		const char* parent = "";
-		const char* before = "";
+		mvItemArg parent;
+		mvItemArg before;
 
 		if (!(*mvApp::GetApp()->getParsers())["add_tab_button"].parse(args, kwargs, __FUNCTION__, &name,
 			&label, &show, &no_reorder, &leading, &trailing, &no_tooltip, &tip, &callback,
 			&callback_data, &parent, &before))
 			return ToPyBool(false);
 
-		if (std::string(parent).empty())
+		if (parent.empty())
 		{
 			auto parentItem = mvApp::GetApp()->getItemRegistry().topParent();
 
@@ -130,7 +130,7 @@ namespace Marvel {
 
 				mvApp::GetApp()->getItemRegistry().addItemWithRuntimeChecks(item, parent, before);
 
-				return GetPyNone();
+				return ToPyUUID(item->getUUID());
 
 			}
 
@@ -163,7 +163,7 @@ namespace Marvel {
 
 				mvApp::GetApp()->getItemRegistry().addItemWithRuntimeChecks(item, parent, before);
 
-				return GetPyNone();
+				return ToPyUUID(item->getUUID());
 			}
 
 			else
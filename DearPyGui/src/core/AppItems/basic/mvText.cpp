@@ -14,12 +14,12 @@ namespace Marvel {
 			{mvPythonDataType::FloatList, "color", "color of the text (rgba)", "(0, 0, 0, -1)"},
 			{mvPythonDataType::Bool, "bullet", "makes the text bulleted", "False"},
 			{mvPythonDataType::String, "tip", "Adds a simple tooltip", "''"},
-			{mvPythonDataType::String, "parent", "Parent this item will be added to. (runtime adding)", "''"},
-			{mvPythonDataType::String, "before", "This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
+			{mvPythonDataType::UUID, "parent", "Parent this item will be added to. (runtime adding)", "''"},
+			{mvPythonDataType::UUID, "before", "This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
 			{mvPythonDataType::String, "source", "", "''"},
 			{mvPythonDataType::String, "default_value", "", "''"},
 			{mvPythonDataType::Bool, "show", "Attempt to render", "True"},
-		}, "Adds text", "None", "Adding Widgets") });
+		}, "Adds text", "int", "Adding Widgets") });
 	}
 
 	void mvLabelText::InsertParser(std::map<std::string, mvPythonParser>* parsers)
@@ -30,12 +30,12 @@ namespace Marvel {
 			{mvPythonDataType::String, "default_value", "", "''"},
 			{mvPythonDataType::FloatList, "color", "", "(0, 0, 0, -1)"},
 			{mvPythonDataType::String, "tip", "Adds a simple tooltip", "''"},
-			{mvPythonDataType::String, "parent", "Parent this item will be added to. (runtime adding)", "''"},
-			{mvPythonDataType::String, "before", "This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
+			{mvPythonDataType::UUID, "parent", "Parent this item will be added to. (runtime adding)", "''"},
+			{mvPythonDataType::UUID, "before", "This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
 			{mvPythonDataType::String, "source", "data source for shared data", "''"},
 			{mvPythonDataType::String, "label", "", "''"},
 			{mvPythonDataType::Bool, "show", "Attempt to render", "True"},
-		}, "Adds text with a label. Useful for output values.", "None", "Adding Widgets") });
+		}, "Adds text with a label. Useful for output values.", "int", "Adding Widgets") });
 	}
 
 	static std::string FindRenderedTextEnd(const char* text, const char* text_end = nullptr)
@@ -168,8 +168,8 @@ namespace Marvel {
 		PyTuple_SetItem(color, 2, PyLong_FromLong(0));
 		PyTuple_SetItem(color, 3, PyLong_FromLong(255));
 		const char* tip = "";
-		const char* before = "";
-		const char* parent = "";
+		mvItemArg before;
+		mvItemArg parent;
 		int show = true;
 		const char* source = "";
 		const char* default_value = "";
@@ -187,7 +187,7 @@ namespace Marvel {
 
 		mvApp::GetApp()->getItemRegistry().addItemWithRuntimeChecks(item, parent, before);
 
-		return GetPyNone();
+		return ToPyUUID(item->getUUID());
 	}
 
 	PyObject* add_label_text(PyObject* self, PyObject* args, PyObject* kwargs)
@@ -200,8 +200,8 @@ namespace Marvel {
 		PyTuple_SetItem(color, 2, PyLong_FromLong(0));
 		PyTuple_SetItem(color, 3, PyLong_FromLong(255));
 		const char* tip = "";
-		const char* before = "";
-		const char* parent = "";
+		mvItemArg before;
+		mvItemArg parent;
 		const char* source = "";
 		const char* label = "";
 		int show = true;
@@ -220,6 +220,6 @@ namespace Marvel {
 
 		mvApp::GetApp()->getItemRegistry().addItemWithRuntimeChecks(item, parent, before);
 
-		return GetPyNone();
+		return ToPyUUID(item->getUUID());
 	}
 }
\ No newline at end of file
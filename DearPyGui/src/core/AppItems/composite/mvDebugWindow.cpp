@@ -33,7 +33,7 @@ namespace Marvel {
 			{mvPythonDataType::String, "label", "", "''"},
 			{mvPythonDataType::Bool, "show", "Attempt to render", "True"},
 		}, "Creates a debug window.",
-			"None", "Containers") });
+			"int", "Containers") });
 	}
 
 	static void DebugItem(const char* label, const char* item)
@@ -240,21 +240,21 @@ namespace Marvel {
                 if (ImGui::ArrowButton("Move Up", ImGuiDir_Up))
 					mvApp::GetApp()->getCallbackRegistry().submit([&]()
 						{
-							mvApp::GetApp()->getItemRegistry().moveItemUp(m_selectedItem);
+							mvApp::GetApp()->getItemRegistry().moveItemUp(mvItemArg(m_selectedItem.c_str()));
 						});
 
                 ImGui::SameLine();
                 if (ImGui::ArrowButton("Move Down", ImGuiDir_Down))
 					mvApp::GetApp()->getCallbackRegistry().submit([&]()
 						{
-							mvApp::GetApp()->getItemRegistry().moveItemDown(m_selectedItem);
+							mvApp::GetApp()->getItemRegistry().moveItemDown(mvItemArg(m_selectedItem.c_str()));
 						});
                 ImGui::SameLine();
                 if (ImGui::Button("Delete"))
                 {
 					mvApp::GetApp()->getCallbackRegistry().submit([&]()
 						{
-							mvApp::GetApp()->getItemRegistry().deleteItem(m_selectedItem, false);
+							mvApp::GetApp()->getItemRegistry().deleteItem(mvItemArg(m_selectedItem.c_str()), false);
 							m_selectedItem = "";
 						});
                 }
@@ -400,7 +400,7 @@ namespace Marvel {
 		item->setConfigDict(kwargs);
 		item->setExtraConfigDict(kwargs);
 
-		if (mvApp::GetApp()->getItemRegistry().addItemWithRuntimeChecks(item, "", ""))
+		if (mvApp::GetApp()->getItemRegistry().addItemWithRuntimeChecks(item, mvItemArg(), mvItemArg()))
 		{
 			mvApp::GetApp()->getItemRegistry().pushParent(item);
 			if (!show)
@@ -408,7 +408,7 @@ namespace Marvel {
 					
 		}
 
-		return GetPyNone();
+		return ToPyUUID(item->getUUID());
 	}
 
 }
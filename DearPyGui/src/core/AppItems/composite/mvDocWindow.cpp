@@ -30,7 +30,7 @@ namespace Marvel {
 			{mvPythonDataType::String, "label", "", "''"},
 			{mvPythonDataType::Bool, "show", "Attempt to render", "True"},
 		}, "Creates a documentation window.",
-			"None", "Containers") });
+			"int", "Containers") });
 	}
 
 	static void ColorText(const char* item)
@@ -59,12 +59,11 @@ namespace Marvel {
 		m_width = 700;
 		m_height = 500;
 		m_description.deleteAllowed = false;
-		setup();
 	}
 
 	void mvDocWindow::setup()
 	{
-		m_docmap = BuildDearPyGuiInterface();
+		m_docmap = GetDearPyGuiInterface();
 		m_constants = GetModuleConstants();
 
 		for (auto& item : m_constants)
@@ -156,6 +155,12 @@ namespace Marvel {
 		if (!prerender())
 			return;
 
+		if (!m_setup)
+		{
+			setup();
+			m_setup = true;
+		}
+
 		if (ImGui::BeginTabBar("Main Tabbar##doc"))
 		{
 			if (ImGui::BeginTabItem("Help##doc"))
@@ -732,14 +737,14 @@ namespace Marvel {
 		item->setConfigDict(kwargs);
 		item->setExtraConfigDict(kwargs);
 
-		if (mvApp::GetApp()->getItemRegistry().addItemWithRuntimeChecks(item, "", ""))
+		if (mvApp::GetApp()->getItemRegistry().addItemWithRuntimeChecks(item, mvItemArg(), mvItemArg()))
 		{
 			mvApp::GetApp()->getItemRegistry().pushParent(item);
 			if (!show)
 				item->hide();
 					
 		}
-		return GetPyNone();
+		return ToPyUUID(item->getUUID());
 	}
 
 }
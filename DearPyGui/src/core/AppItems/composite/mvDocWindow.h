@@ -73,7 +73,8 @@ namespace Marvel {
 		std::vector<std::pair<std::string, std::string>> m_commands;
 		std::vector<std::pair<std::string, long>> m_constants;
 		std::vector<std::string> m_constantsValues;
-		mvRef<std::map<std::string, mvPythonParser>> m_docmap = nullptr;
+		std::map<std::string, mvPythonParser>* m_docmap = nullptr;
+		bool m_setup = false; // deferred to the first time the window is shown
 
 	};
 
@@ -21,13 +21,13 @@ namespace Marvel {
 			{mvPythonDataType::Bool, "filter", "show filter", "True"},
 			{mvPythonDataType::Integer, "width","", "0"},
 			{mvPythonDataType::Integer, "height","", "0"},
-			{mvPythonDataType::String, "parent", "Parent this item will be added to. (runtime adding)", "''"},
-			{mvPythonDataType::String, "before","This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
+			{mvPythonDataType::UUID, "parent", "Parent this item will be added to. (runtime adding)", "''"},
+			{mvPythonDataType::UUID, "before","This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
 			{mvPythonDataType::Bool, "show", "Attempt to render", "True"},
 			{mvPythonDataType::Bool, "autosize_x", "", "False"},
 			{mvPythonDataType::Bool, "autosize_y", "", "False"},
 
-		}, "Adds a logging widget.", "None", "Adding Widgets") });
+		}, "Adds a logging widget.", "int", "Adding Widgets") });
 	}
 
 #if defined (_WIN32)
@@ -278,8 +278,8 @@ namespace Marvel {
 		int filter = true;
 		int width = 0;
 		int height = 0;
-		const char* parent = "";
-		const char* before = "";
+		mvItemArg parent;
+		mvItemArg before;
 		int show = true;
 		int autosize_x = false;
 		int autosize_y = false;
@@ -297,7 +297,7 @@ namespace Marvel {
 
 		mvApp::GetApp()->getItemRegistry().addItemWithRuntimeChecks(item, parent, before);
 
-		return GetPyNone();
+		return ToPyUUID(item->getUUID());
 	}
 
 }
\ No newline at end of file
@@ -137,7 +137,7 @@ namespace Marvel {
             {mvPythonDataType::String, "label", "", "''"},
             {mvPythonDataType::Bool, "show", "Attempt to render", "True"},
         }, "Creates a style window.",
-            "None", "Containers") });
+            "int", "Containers") });
     }
 
     // Demo helper function to select among loaded fonts.
@@ -488,7 +488,7 @@ namespace Marvel {
         item->setConfigDict(kwargs);
         item->setExtraConfigDict(kwargs);
 
-        if (mvApp::GetApp()->getItemRegistry().addItemWithRuntimeChecks(item, "", ""))
+        if (mvApp::GetApp()->getItemRegistry().addItemWithRuntimeChecks(item, mvItemArg(), mvItemArg()))
         {
             mvApp::GetApp()->getItemRegistry().pushParent(item);
             if (!show)
@@ -496,7 +496,7 @@ namespace Marvel {
 
         }
 
-        return GetPyNone();
+        return ToPyUUID(item->getUUID());
     }
 
 }
\ No newline at end of file
@@ -4,6 +4,9 @@
 #include "mvAppLog.h"
 #include "mvDataStorage.h"
 #include "mvPythonExceptions.h"
+#include <algorithm>
+#include <cstdint>
+#include <cstring>
 
 namespace Marvel {
 
@@ -15,12 +18,12 @@ namespace Marvel {
 			{mvPythonDataType::KeywordOnly},
 			{mvPythonDataType::Callable, "callback", "Registers a callback", "None"},
 			{mvPythonDataType::Object, "callback_data", "Callback data", "None"},
-			{mvPythonDataType::String, "parent", "Parent this item will be added to. (runtime adding)", "''"},
-			{mvPythonDataType::String, "before","This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
+			{mvPythonDataType::UUID, "parent", "Parent this item will be added to. (runtime adding)", "''"},
+			{mvPythonDataType::UUID, "before","This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
 			{mvPythonDataType::Integer, "width","", "0"},
 			{mvPythonDataType::Integer, "height","", "200"},
 			{mvPythonDataType::Bool, "show","Attempt to render", "True"}
-		}, "Adds table.", "None", "Tables") });
+		}, "Adds table.", "int", "Tables") });
 	}
 
 	mvTable::mvTable(const std::string& name, const std::vector<std::string>& headers)
@@ -28,7 +31,8 @@ namespace Marvel {
 	{
 		m_height = 200;
 		m_headers = headers;
-		m_columns = headers.size();
+		m_columns.resize(headers.size());
+		m_selection.resize(0, headers.size());
 	}
 
 	bool mvTable::isIndexValid(int row, int column) const
@@ -39,7 +43,7 @@ namespace Marvel {
 			return false;
 		}
 
-		if (static_cast<size_t>(column) > m_columns + 1 || static_cast<size_t>(row) > m_values.size() + 1)
+		if (static_cast<size_t>(column) >= m_columns.size() || static_cast<size_t>(row) >= getRowCount())
 		{
 			ThrowPythonException("Table indices out of range.");
 			return false;
@@ -48,20 +52,137 @@ namespace Marvel {
 		return true;
 	}
 
-	void mvTable::updateHashValues()
+	size_t mvTable::getRowCount() const
 	{
-		m_hashValues.clear();
+		return m_columns.empty() ? 0 : m_columns[0].size();
+	}
+
+	void mvTable::setColumns(std::vector<mvTableColumn> columns)
+	{
+		size_t rows = 0;
+		for (const auto& column : columns)
+			rows = std::max(rows, column.size());
+
+		for (auto& column : columns)
+			column.resize(rows);
+
+		while (columns.size() < m_headers.size())
+		{
+			columns.emplace_back();
+			columns.back().resize(rows);
+		}
+
+		while (m_headers.size() < columns.size())
+			m_headers.emplace_back("Header" + std::to_string(m_headers.size()));
+
+		m_columns = std::move(columns);
+		m_selection = mvTableSelection();
+		m_selection.resize(rows, m_columns.size());
+		m_index.invalidate();
+	}
+
+	// lists of ints or numbers and numeric buffers become typed columns,
+	// anything else is converted to strings
+	static mvTableColumn ToTableColumn(PyObject* value, const std::string& message)
+	{
+		if (PyTuple_Check(value) || PyList_Check(value))
+		{
+			Py_ssize_t count = PySequence_Fast_GET_SIZE(value);
+			PyObject** items = PySequence_Fast_ITEMS(value);
+
+			bool ints = count > 0;
+			bool numbers = count > 0;
+			for (Py_ssize_t i = 0; i < count && numbers; i++)
+			{
+				PyObject* item = items[i];
+				if (PyBool_Check(item) || !(PyLong_Check(item) || PyFloat_Check(item)))
+					numbers = ints = false;
+				else if (!PyLong_Check(item))
+					ints = false;
+			}
+
+			if (ints)
+			{
+				std::vector<long long> values(count);
+				for (Py_ssize_t i = 0; i < count && ints; i++)
+				{
+					int overflow = 0;
+					values[i] = PyLong_AsLongLongAndOverflow(items[i], &overflow);
+					if (overflow != 0)
+						ints = false;
+				}
+
+				if (ints)
+					return mvTableColumn(std::move(values));
+			}
+
+			else if (numbers)
+			{
+				std::vector<double> values(count);
+				for (Py_ssize_t i = 0; i < count; i++)
+					values[i] = PyFloat_AsDouble(items[i]);
+				return mvTableColumn(std::move(values));
+			}
+
+			return mvTableColumn(ToStringVect(value, message));
+		}
+
+		if (!PyObject_CheckBuffer(value))
+		{
+			ThrowPythonException(message);
+			return mvTableColumn();
+		}
+
+		Py_buffer buffer_info;
+		if (PyObject_GetBuffer(value, &buffer_info, PyBUF_CONTIG_RO | PyBUF_FORMAT))
+		{
+			PyErr_Clear();
+			ThrowPythonException(message + " Buffers must be contiguous.");
+			return mvTableColumn();
+		}
 
-		m_hashValues = m_values;
+		size_t count = (size_t)(buffer_info.len / buffer_info.itemsize);
+		const void* buf = buffer_info.buf;
 
-		for (size_t i = 0; i < m_hashValues.size(); i++)
+		auto read = [&](auto sample)
 		{
-			for (size_t j = 0; j < m_hashValues[i].size(); j++)
-				m_hashValues[i][j] = m_hashValues[i][j] + "##" + m_name + "-" + std::to_string(i) + "-" + std::to_string(j);
+			using T = decltype(sample);
+			std::vector<T> items(count);
+			memcpy(items.data(), buf, count * sizeof(T));
+			return items;
+		};
 
-			for (size_t j = m_hashValues[i].size(); j < m_columns; j++)
-				m_hashValues[i].push_back("##" + m_name + "-" + std::to_string(i) + "-" + std::to_string(j));
+		auto readInts = [&](auto sample)
+		{
+			using T = decltype(sample);
+			const T* in = (const T*)buf;
+			return std::vector<long long>(in, in + count);
+		};
+
+		mvTableColumn column;
+		switch (GetBufferType(buffer_info))
+		{
+		case mvBufferType::Double: column = mvTableColumn(read(0.0)); break;
+		case mvBufferType::Float:
+		{
+			auto items = read(0.0f);
+			column = mvTableColumn(std::vector<double>(items.begin(), items.end()), true);
+			break;
 		}
+		case mvBufferType::Int8:   column = mvTableColumn(readInts(int8_t())); break;
+		case mvBufferType::UInt8:  column = mvTableColumn(readInts(uint8_t())); break;
+		case mvBufferType::Int16:  column = mvTableColumn(readInts(int16_t())); break;
+		case mvBufferType::UInt16: column = mvTableColumn(readInts(uint16_t())); break;
+		case mvBufferType::Int32:  column = mvTableColumn(readInts(int32_t())); break;
+		case mvBufferType::UInt32: column = mvTableColumn(readInts(uint32_t())); break;
+		case mvBufferType::Int64:  column = mvTableColumn(readInts(int64_t())); break;
+		case mvBufferType::UInt64: column = mvTableColumn(readInts(uint64_t())); break;
+		default:
+			ThrowPythonException("Unknown buffer type " + std::string(buffer_info.format ? buffer_info.format : "") + ".");
+		}
+
+		PyBuffer_Release(&buffer_info);
+		return column;
 	}
 
 	PyObject* add_table(PyObject* self, PyObject* args, PyObject* kwargs)
@@ -70,8 +191,8 @@ namespace Marvel {
 		PyObject* headers;
 		PyObject* callback = nullptr;
 		PyObject* callback_data = nullptr;
-		const char* parent = "";
-		const char* before = "";
+		mvItemArg parent;
+		mvItemArg before;
 		int width = 0;
 		int height = 0;
 		int show = true;
@@ -95,7 +216,7 @@ namespace Marvel {
 
 		mvApp::GetApp()->getItemRegistry().addItemWithRuntimeChecks(item, parent, before);
 
-		return GetPyNone();
+		return ToPyUUID(item->getUUID());
 	}
 
 	void mvTable::setTableItem(int row, int column, const std::string& value)
@@ -103,9 +224,13 @@ namespace Marvel {
 		if (!isIndexValid(row, column))
 			return;
 
-		m_values[row][column] = value;
-		m_hashValues[row][column] = value + "##" + m_name + "-" + std::to_string(row) + "-" + std::to_string(column);
-
+		// a column turned into strings sorts and filters differently
+		auto type = m_columns[column].getType();
+		m_columns[column].set(row, value);
+		if (type != m_columns[column].getType())
+			m_index.invalidate();
+		else
+			m_index.cellChanged(m_columns, row, column);
 	}
 
 	std::string mvTable::getTableItem(int row, int column) const
@@ -113,7 +238,7 @@ namespace Marvel {
 		if (!isIndexValid(row, column))
 			return "";
 
-		return m_values[row][column];
+		return m_columns[column].get(row);
 	}
 
 	void mvTable::setSelection(int row, int column, bool value)
@@ -121,306 +246,218 @@ namespace Marvel {
 		if (!isIndexValid(row, column))
 			return;
 
-		m_selections[{row, column}] = value;
+		m_selection.set(row, column, value);
 	}
 
-	void mvTable::setPyValue(PyObject* value)
+	void mvTable::setSelectionRange(int firstRow, int lastRow, int firstColumn, int lastColumn, bool value)
 	{
-		auto values = ToVectVectString(value, m_name + " requires a list/tuple or list/tuple of strings.");
-
-		m_values = std::move(values);
+		// -1 stands for the last row or column
+		if (lastRow == -1)
+			lastRow = (int)getRowCount() - 1;
+		if (lastColumn == -1)
+			lastColumn = (int)m_columns.size() - 1;
 
-		if (!m_values.empty()) // just in case value is set to an empty list
-		{
-			while (m_headers.size() > m_columns)
-				m_headers.pop_back();
-		}
+		if (!isIndexValid(firstRow, firstColumn) || !isIndexValid(lastRow, lastColumn))
+			return;
 
-		updateHashValues();
+		if (firstRow > lastRow)
+			std::swap(firstRow, lastRow);
+		if (firstColumn > lastColumn)
+			std::swap(firstColumn, lastColumn);
 
-		m_selections.clear();
+		m_selection.setRange(firstRow, lastRow + 1, firstColumn, lastColumn + 1, value);
 	}
 
-	PyObject* mvTable::getPyValue() const
+	void mvTable::selectAll()
 	{
-		return ToPyList(m_values);
+		m_selection.setRange(0, getRowCount(), 0, m_columns.size(), true);
 	}
 
-	PyObject* mvTable::getSelections() const
+	void mvTable::clearSelections()
 	{
-		int selectionCount = 0;
-
-		for (auto& item : m_selections)
-			if (item.second) selectionCount++;
-
-		std::vector<std::pair<int, int>> selections;
-
-		for (auto& item : m_selections)
-		{
-			if (item.second)
-				selections.emplace_back(item.first.first, item.first.second);
-		}
-		
-		return ToPyList(selections);
+		m_selection.clear();
 	}
 
-	void mvTable::addHeaders(const std::vector<std::string>& headers) 
+	void mvTable::setPyValue(PyObject* value)
 	{
-		m_headers = headers; 
-		m_columns = headers.size(); 
+		auto values = ToVectVectString(value, m_name + " requires a list/tuple or list/tuple of strings.");
 
-		if (m_values.empty())
-			return;
+		size_t width = 0;
+		for (const auto& row : values)
+			width = std::max(width, row.size());
 
-		if (m_columns > m_values[0].size())
-		{
-			for (auto& row : m_values)
-				row.emplace_back("");
-		}
-		else if (m_columns < m_values[0].size())
+		// rows are split into columns, short rows padded with empty cells,
+		// and each column gets the type that holds all of its cells
+		std::vector<mvTableColumn> columns;
+		columns.reserve(width);
+		for (size_t j = 0; j < width; j++)
 		{
-			m_columns = m_values[0].size();
-			while (m_headers.size() < m_columns)
-				m_headers.emplace_back("Header");
+			std::vector<std::string> column(values.size());
+			for (size_t i = 0; i < values.size(); i++)
+			{
+				if (j < values[i].size())
+					column[i] = std::move(values[i][j]);
+			}
+			columns.push_back(mvTableColumn::FromText(std::move(column)));
 		}
-		updateHashValues();
+
+		setColumns(std::move(columns));
 	}
 
-	void mvTable::addRow(const std::vector<std::string>& row)
+	void mvTable::setPyColumns(PyObject* value)
 	{
-		m_values.push_back(row);
-
-		while (m_values.back().size() < m_headers.size())
-			m_values.back().emplace_back("");
+		std::string message = m_name + " requires a list/tuple of lists, tuples or buffers.";
+		if (!PyTuple_Check(value) && !PyList_Check(value))
+		{
+			ThrowPythonException(message);
+			return;
+		}
 
-		while (m_values.back().size() > m_headers.size())
-			m_values.back().pop_back();
+		std::vector<mvTableColumn> columns;
+		Py_ssize_t count = PySequence_Fast_GET_SIZE(value);
+		PyObject** items = PySequence_Fast_ITEMS(value);
+		for (Py_ssize_t i = 0; i < count; i++)
+			columns.push_back(ToTableColumn(items[i], message));
 
-		updateHashValues();
+		setColumns(std::move(columns));
 	}
 
-	void mvTable::addColumn(const std::string& name, const std::vector<std::string>& column)
+	PyObject* mvTable::getPyValue() const
 	{
-		m_headers.push_back(name);
-
-		if (column.size() > m_values.size())
+		std::vector<std::vector<std::string>> values(getRowCount());
+		for (size_t i = 0; i < values.size(); i++)
 		{
-			for (unsigned i = 0; i < column.size(); i++)
-			{
-				// row exists
-				if (i < m_values.size())
-				{
-					m_values[i].emplace_back(column[i]);
-					continue;
-				}
-
-				// row does not exist
-				m_values.push_back({});
-				for (unsigned j = 0; j < m_headers.size() - 1; j++)
-					m_values[i].emplace_back("");
-
-				m_values[i].emplace_back(column[i]);
-			}
+			values[i].reserve(m_columns.size());
+			for (const auto& column : m_columns)
+				values[i].push_back(column.get(i));
 		}
 
-		else
-		{
-			size_t index = 0;
-			for (auto& row : m_values)
-			{
-				if (index >= column.size())
-				{
-					row.emplace_back("");
-					index++;
-					continue;
-
-				}
-
-				row.push_back(column[index]);
-				index++;
-			}
-		}
+		return ToPyList(values);
+	}
 
-		m_columns++;
+	PyObject* mvTable::getSelections() const
+	{
+		return ToPyList(m_selection.getCells());
+	}
 
-		updateHashValues();
+	PyObject* mvTable::getSelectedRows() const
+	{
+		std::vector<int> rows = m_selection.getRows();
+		return ToPyIntBuffer(rows.data(), rows.size());
 	}
 
-	void mvTable::insertColumn(int column_index, const std::string& name, const std::vector<std::string>& column)
+	void mvTable::addHeaders(const std::vector<std::string>& headers) 
 	{
-		if (!isIndexValid(0, column_index))
-			return;
+		m_headers = headers; 
 
-		if (static_cast<size_t>(column_index) == m_headers.size())
+		// without rows the columns just follow the headers
+		size_t rows = getRowCount();
+		if (rows == 0 || m_columns.size() < m_headers.size())
 		{
-			addColumn(name, column);
-			return;
+			m_columns.resize(m_headers.size());
+			for (auto& column : m_columns)
+				column.resize(rows);
 		}
 
-		auto oldValues = m_values;
-		auto oldHeaders = m_headers;
+		while (m_headers.size() < m_columns.size())
+			m_headers.emplace_back("Header");
 
-		m_values.clear();
-		m_headers.clear();
-		m_columns++;
+		m_selection.resize(rows, m_columns.size());
+		m_index.invalidate();
+	}
 
-		for (size_t i = 0; i < m_columns; i++)
+	void mvTable::addRow(const std::vector<std::string>& row)
+	{
+		size_t rows = getRowCount();
+		bool converted = false;
+		for (size_t j = 0; j < m_columns.size(); j++)
 		{
-			if (i < static_cast<size_t>(column_index))
-				m_headers.push_back(oldHeaders[i]);
-			else if (i == static_cast<size_t>(column_index))
-				m_headers.push_back(name);
+			auto type = m_columns[j].getType();
+			if (j < row.size())
+				m_columns[j].insert(rows, row[j]);
 			else
-				m_headers.push_back(oldHeaders[i - 1]);
+				m_columns[j].resize(rows + 1);
+			converted |= type != m_columns[j].getType();
 		}
 
-		if (column.size() > oldValues.size())
-		{
-			for (size_t i = 0; i < column.size(); i++)
-			{
-				if (i < oldValues.size())
-				{
-					std::vector<std::string> row;
-					for (size_t j = 0; j < oldHeaders.size(); j++)
-					{
-						if (j == static_cast<size_t>(column_index))
-						{
-							row.push_back(column[i]);
-							continue;
-						}
-
-						if (j > static_cast<size_t>(column_index))
-							row.push_back(oldValues[i][j - 1]);
-
-						else
-							row.push_back(oldValues[i][j]);
+		m_selection.resize(getRowCount(), m_columns.size());
+		if (converted)
+			m_index.invalidate();
+		else
+			m_index.rowInserted(m_columns, rows);
+	}
 
-					}
-					row.push_back(oldValues[i].back());
+	void mvTable::addColumn(const std::string& name, const std::vector<std::string>& column)
+	{
+		size_t rows = std::max(getRowCount(), column.size());
 
-					m_values.push_back(row);
-				}
+		m_headers.push_back(name);
+		m_columns.push_back(mvTableColumn::FromText(column));
 
-				else
-				{
-					std::vector<std::string> row;
-					for (size_t j = 0; j < oldHeaders.size(); j++)
-					{
-						if (j == static_cast<size_t>(column_index))
-						{
-							row.push_back(column[i]);
-							continue;
-						}
-						row.push_back("");
-					}
-					row.push_back("");
+		for (auto& item : m_columns)
+			item.resize(rows);
 
-					m_values.push_back(row);
-				}
-			}
-		}
+		m_selection.resize(rows, m_columns.size());
+		m_index.invalidate();
+	}
 
-		else
+	void mvTable::insertColumn(int column_index, const std::string& name, const std::vector<std::string>& column)
+	{
+		if (column_index < 0)
 		{
-			for (size_t i = 0; i < oldValues.size(); i++)
-			{
-				std::vector<std::string> row;
-				for (size_t j = 0; j < oldHeaders.size(); j++)
-				{
-					if (j == static_cast<size_t>(column_index))
-					{
-						if (i >= column.size())
-							row.emplace_back("");
-						else
-							row.push_back(column[i]);
-						continue;
-					}
-
-					if (j > static_cast<size_t>(column_index))
-						row.push_back(oldValues[i][j - 1]);
-
-					else
-						row.push_back(oldValues[i][j]);
-
-				}
-				row.push_back(oldValues[i].back());
-
-				m_values.push_back(row);
-			}
+			ThrowPythonException("Table index must be a positive integer.");
+			return;
 		}
 
-		updateHashValues();
-
-		// update selections
-		std::map<std::pair<int, int>, bool> oldSelection = m_selections;
-		m_selections.clear();
-
-		for (auto& item : oldSelection)
+		if (static_cast<size_t>(column_index) >= m_columns.size())
 		{
+			addColumn(name, column);
+			return;
+		}
 
-			if (item.first.second >= column_index)
-				m_selections[{item.first.first, item.first.second + 1}] = item.second;
+		size_t rows = std::max(getRowCount(), column.size());
 
-			else
-				m_selections[item.first] = item.second;
+		m_headers.insert(m_headers.begin() + column_index, name);
+		m_columns.insert(m_columns.begin() + column_index, mvTableColumn::FromText(column));
 
-		}
+		for (auto& item : m_columns)
+			item.resize(rows);
 
+		m_selection.insertColumn(column_index);
+		m_selection.resize(rows, m_columns.size());
+		m_index.columnInserted(column_index);
 	}
 
 	void mvTable::insertRow(int row_index, const std::vector<std::string>& row)
 	{
-		if (!isIndexValid(row_index, 0))
-			return;
-
-		if (static_cast<size_t>(row_index) >= m_values.size())
+		if (row_index < 0)
 		{
-			addRow(row);
+			ThrowPythonException("Table index must be a positive integer.");
 			return;
 		}
 
-		auto oldValues = m_values;
-
-		m_values.clear();
-
-		for (size_t i = 0; i < oldValues.size(); i++)
+		if (static_cast<size_t>(row_index) >= getRowCount())
 		{
-			if (i == static_cast<size_t>(row_index))
-			{
-				m_values.push_back(row);
-				continue;
-			}
-
-			if(i > static_cast<size_t>(row_index))
-				m_values.push_back(oldValues[i-1]);
-			else
-				m_values.push_back(oldValues[i]);
+			addRow(row);
+			return;
 		}
-		m_values.push_back(oldValues.back());
-
-		while (m_values[row_index].size() < m_headers.size())
-			m_values[row_index].emplace_back("");
-
-		while (m_values.back().size() > m_headers.size())
-			m_values.back().pop_back();
-
-		updateHashValues();
-
-		// update selections
-		std::map<std::pair<int, int>, bool> oldSelection = m_selections;
-		m_selections.clear();
 
-		for (auto& item : oldSelection)
+		bool converted = false;
+		for (size_t j = 0; j < m_columns.size(); j++)
 		{
-
-			if (item.first.first >= row_index)
-				m_selections[{item.first.first + 1, item.first.second}] = item.second;
-
+			auto type = m_columns[j].getType();
+			if (j < row.size())
+				m_columns[j].insert(row_index, row[j]);
 			else
-				m_selections[item.first] = item.second;
-			
+				m_columns[j].insert(row_index);
+			converted |= type != m_columns[j].getType();
 		}
 
+		m_selection.insertRow(row_index);
+		if (converted)
+			m_index.invalidate();
+		else
+			m_index.rowInserted(m_columns, row_index);
 	}
 
 	void mvTable::deleteRow(int row)
@@ -428,50 +465,20 @@ namespace Marvel {
 		if (!isIndexValid(row, 0))
 			return ;
 
-		auto oldValues = m_values;
-
-		m_values.clear();
-
-		int index = 0;
-		for (auto& item : oldValues)
-		{
-			
-			if (index == row)
-			{
-				index++;
-				continue;
-			}
-			m_values.push_back(item);
-
-			index++;
-			
-		}
-
-		updateHashValues();
-
-		// update selections
-		std::map<std::pair<int, int>, bool> oldSelection = m_selections;
-		m_selections.clear();
-
-		for (auto& item : oldSelection)
-		{
-			if (item.first.first == row)
-				continue;
-
-			else if (item.first.first < row)
-				m_selections[item.first] = item.second;
-
-
-			else if (item.first.first > row)
-				m_selections[{item.first.first - 1, item.first.second}] = item.second;
-		}
+		for (auto& column : m_columns)
+			column.erase(row);
 
+		m_selection.eraseRow(row);
+		m_index.rowDeleted(row);
 	}
 
 	void mvTable::deleteColumn(int column)
 	{
-		if (!isIndexValid(0, column))
+		if (column < 0)
+		{
+			ThrowPythonException("Table index must be a positive integer.");
 			return;
+		}
 
 		if (static_cast<size_t>(column) >= m_headers.size())
 		{
@@ -479,59 +486,106 @@ namespace Marvel {
 			return;
 		}
 
-		auto oldValues = m_values;
-		auto oldHeaders = m_headers;
+		m_headers.erase(m_headers.begin() + column);
+		m_columns.erase(m_columns.begin() + column);
 
-		m_values.clear();
-		m_headers.clear();
-		m_columns--;
+		m_selection.eraseColumn(column);
+		m_index.columnDeleted(column);
+	}
 
-		for (size_t i = 0; i < oldHeaders.size(); i++)
-		{
-			if (i == static_cast<size_t>(column))
-				continue;
-			m_headers.push_back(oldHeaders[i]);
-		}
+	void mvTable::clearTable()
+	{
+		for (auto& column : m_columns)
+			column.clear();
+		m_selection = mvTableSelection();
+		m_selection.resize(0, m_columns.size());
+		m_index.invalidate();
+	}
 
-		//for (int i = 0; i < oldValues.size(); i++)
-		for (auto& oldvalue : oldValues)
+	void mvTable::sortRows(const std::vector<int>& columns, const std::vector<int>& descending)
+	{
+		std::vector<mvTableSortKey> keys;
+		for (size_t i = 0; i < columns.size(); i++)
 		{
-			std::vector<std::string> row;
-			for (size_t j = 0; j < oldHeaders.size(); j++)
+			if (columns[i] < 0 || static_cast<size_t>(columns[i]) >= m_columns.size())
 			{
-				if (j == static_cast<size_t>(column))
-					continue;
-				row.push_back(oldvalue[j]);
+				ThrowPythonException("Table indices out of range.");
+				return;
 			}
 
-			m_values.push_back(row);
+			keys.push_back({ columns[i], i >= descending.size() || !descending[i] });
 		}
 
-		updateHashValues();
+		m_index.setSortKeys(std::move(keys));
+	}
 
-		// update selections
-		std::map<std::pair<int, int>, bool> oldSelection = m_selections;
-		m_selections.clear();
-		for (auto& item : oldSelection)
+	void mvTable::addFilter(int column, const std::string& comparison, const std::string& value, bool caseSensitive)
+	{
+		static const std::map<std::string, mvTableComparison> comparisons = {
+			{"contains", mvTableComparison::Contains},
+			{"==",       mvTableComparison::Equal},
+			{"!=",       mvTableComparison::NotEqual},
+			{"<",        mvTableComparison::Less},
+			{"<=",       mvTableComparison::LessEqual},
+			{">",        mvTableComparison::Greater},
+			{">=",       mvTableComparison::GreaterEqual}
+		};
+
+		if (column < -1 || column >= (int)m_columns.size())
 		{
-			if (item.first.second == column)
-				continue;
+			ThrowPythonException("Table indices out of range.");
+			return;
+		}
 
-			else if (item.first.second < column)
-				m_selections[item.first] = item.second;
+		auto item = comparisons.find(comparison);
+		if (item == comparisons.end())
+		{
+			ThrowPythonException("Unknown comparison " + comparison + ", use contains, ==, !=, <, <=, > or >=.");
+			return;
+		}
 
+		mvTableFilter filter;
+		filter.column = column;
+		filter.comparison = item->second;
+		filter.value = value;
+		filter.caseSensitive = caseSensitive;
+		m_index.addFilter(std::move(filter));
+	}
+
+	void mvTable::clearFilters()
+	{
+		m_index.clearFilters();
+	}
 
-			else if (item.first.second > column)
-				m_selections[{item.first.first, item.first.second - 1}] = item.second;
+	PyObject* mvTable::getRowOrder()
+	{
+		if (m_index.isActive())
+		{
+			const auto& order = m_index.getOrder(m_columns);
+			return ToPyIntBuffer(order.data(), order.size());
 		}
 
+		std::vector<int> order(getRowCount());
+		for (size_t i = 0; i < order.size(); i++)
+			order[i] = (int)i;
+		return ToPyIntBuffer(order.data(), order.size());
 	}
 
-	void mvTable::clearTable()
+	void mvTable::sortByHeader(int column, bool add)
 	{
-		m_selections.clear();
-		m_hashValues.clear();
-		m_values.clear();
+		// a click sorts by the column alone or flips its direction, a shift
+		// click adds it as the next key or flips it in place
+		auto keys = m_index.getSortKeys();
+		auto key = std::find_if(keys.begin(), keys.end(), [column](const mvTableSortKey& item) { return item.column == column; });
+
+		if (key != keys.end() && (add || keys.size() == 1))
+			key->ascending = !key->ascending;
+		else if (add)
+			keys.push_back({ column, true });
+		else
+			keys = { { column, true } };
+
+		m_index.setSortKeys(std::move(keys));
 	}
 
 	void mvTable::draw()
@@ -540,12 +594,22 @@ namespace Marvel {
 
 		ImGui::BeginChild(m_name.c_str(), ImVec2((float)m_width, (float)m_height));
 		ImGui::Separator();
-		if(m_columns > 0)
-			ImGui::Columns((int)m_columns, nullptr, true);
+		if(!m_columns.empty())
+			ImGui::Columns((int)m_columns.size(), nullptr, true);
 
-		for (auto& header : m_headers)
+		for (size_t j = 0; j < m_headers.size(); j++)
 		{
-			ImGui::Text("%s", header.c_str());
+			std::string label = m_headers[j];
+			for (const auto& key : m_index.getSortKeys())
+			{
+				if (key.column == (int)j)
+					label += key.ascending ? " ^" : " v";
+			}
+
+			ImGui::PushID((int)j);
+			if (ImGui::Selectable(label.c_str()))
+				sortByHeader((int)j, ImGui::GetIO().KeyShift);
+			ImGui::PopID();
 			ImGui::NextColumn();
 		}
 		ImGui::Separator();
@@ -554,30 +618,69 @@ namespace Marvel {
 		alt_color.w = 0.10f;
 		auto ralt_col = IM_COL32(alt_color.x * 255.0f, alt_color.y * 255.0f, alt_color.z * 255.0f, alt_color.w * 255.0f);
 
-		int index = 0;
-		for (size_t i = 0; i < m_hashValues.size(); i++)
-		{
+		// sorted or filtered tables go through the index, i is the display
+		// row and row the storage row
+		const std::vector<int>* order = m_index.isActive() ? &m_index.getOrder(m_columns) : nullptr;
+		size_t visible = order ? order->size() : getRowCount();
 
-			for (size_t j = 0; j < m_columns; j++)
+		// only the rows inside the child window are submitted, the clipper
+		// moves the cursor over the others so scrolling stays the same
+		ImGuiListClipper clipper;
+		clipper.Begin((int)visible);
+		while (clipper.Step())
+		{
+			for (int i = clipper.DisplayStart; i < clipper.DisplayEnd; i++)
 			{
-				if (i % 2 == 0)
-				{
-					ImVec2 p_min = ImGui::GetCursorScreenPos();
-					p_min.x = p_min.x - ImGui::GetStyle().ItemSpacing.x;
-					p_min.y = p_min.y - ImGui::GetStyle().FramePadding.y;
-					ImVec2 p_max = ImVec2(p_min.x + ImGui::GetWindowContentRegionWidth(), p_min.y + ImGui::GetFrameHeight());
-					ImGui::GetWindowDrawList()->AddRectFilled(p_min, p_max, ralt_col);
-				}
+				int row = order ? (*order)[i] : i;
 
-				if (ImGui::Selectable(m_hashValues[i][j].c_str(), m_selections[{i, j}]))
+				// cell ids come from the row and column instead of the labels
+				ImGui::PushID(row);
+				for (size_t j = 0; j < m_columns.size(); j++)
 				{
-					m_selections[{i, j}] = !m_selections[{i, j}];
-					mvApp::GetApp()->getCallbackRegistry().addCallback(m_callback, m_name, m_callbackData);
+					if (i % 2 == 0)
+					{
+						ImVec2 p_min = ImGui::GetCursorScreenPos();
+						p_min.x = p_min.x - ImGui::GetStyle().ItemSpacing.x;
+						p_min.y = p_min.y - ImGui::GetStyle().FramePadding.y;
+						ImVec2 p_max = ImVec2(p_min.x + ImGui::GetWindowContentRegionWidth(), p_min.y + ImGui::GetFrameHeight());
+						ImGui::GetWindowDrawList()->AddRectFilled(p_min, p_max, ralt_col);
+					}
+
+					bool selected = m_selection.get(row, j);
+
+					char buffer[32];
+					ImGui::PushID((int)j);
+					if (ImGui::Selectable(m_columns[j].format(row, buffer, sizeof(buffer)), selected))
+					{
+						// shift click selects the block from the last clicked cell
+						if (ImGui::GetIO().KeyShift && m_anchorRow >= 0 && static_cast<size_t>(m_anchorRow) < visible
+							&& static_cast<size_t>(m_anchorColumn) < m_columns.size())
+						{
+							if (order)
+							{
+								size_t first = std::min(m_anchorRow, i);
+								size_t last = std::max(m_anchorRow, i);
+								size_t firstColumn = std::min(m_anchorColumn, (int)j);
+								size_t lastColumn = std::max(m_anchorColumn, (int)j);
+								for (size_t k = first; k <= last; k++)
+									m_selection.setRange((*order)[k], (*order)[k] + 1, firstColumn, lastColumn + 1, true);
+							}
+							else
+								setSelectionRange(m_anchorRow, i, m_anchorColumn, (int)j, true);
+						}
+						else
+						{
+							m_selection.set(row, j, !selected);
+							m_anchorRow = i;
+							m_anchorColumn = (int)j;
+						}
+						mvApp::GetApp()->getCallbackRegistry().addCallback(m_callback, m_name, m_callbackData);
+					}
+					ImGui::PopID();
+					ImGui::NextColumn();
 				}
-				ImGui::NextColumn();
-				index++;
+				ImGui::PopID();
 			}
-
 		}
 
 		ImGui::Columns(1);
@@ -4,6 +4,9 @@
 #include "mvApp.h"
 #include "mvAppLog.h"
 #include "mvPythonParser.h"
+#include "mvTableColumn.h"
+#include "mvTableSelection.h"
+#include "mvTableIndex.h"
 
 namespace Marvel {
 
@@ -23,37 +26,49 @@ namespace Marvel {
 		mvTable(const std::string& name, const std::vector<std::string>& headers);
 
 		// table operations
-		void setTableItem  (int row, int column, const std::string& value);
-		void setSelection  (int row, int column, bool value);
-		void addHeaders    (const std::vector<std::string>& headers);
-		void addRow        (const std::vector<std::string>& row);
-		void insertRow     (int row_index, const std::vector<std::string>& row);
-		void deleteRow     (int row);
-		void addColumn     (const std::string& name, const std::vector<std::string>& column);
-		void insertColumn  (int column_index, const std::string& name, const std::vector<std::string>& column);
-		void deleteColumn  (int column);
-		void clearTable    ();
-		int  getColumnCount() const { return (int)m_columns; }
-
-		[[nodiscard]] std::string getTableItem (int row, int column) const;
-		[[nodiscard]] PyObject*   getSelections() const;
-
-		void                    setPyValue(PyObject* value);
-		[[nodiscard]] PyObject* getPyValue() const;
-		void                    draw      () override;
+		void setTableItem     (int row, int column, const std::string& value);
+		void setSelection     (int row, int column, bool value);
+		void setSelectionRange(int firstRow, int lastRow, int firstColumn, int lastColumn, bool value); // inclusive, -1 for the last
+		void selectAll        ();
+		void clearSelections  ();
+		void addHeaders       (const std::vector<std::string>& headers);
+		void addRow           (const std::vector<std::string>& row);
+		void insertRow        (int row_index, const std::vector<std::string>& row);
+		void deleteRow        (int row);
+		void addColumn        (const std::string& name, const std::vector<std::string>& column);
+		void insertColumn     (int column_index, const std::string& name, const std::vector<std::string>& column);
+		void deleteColumn     (int column);
+		void clearTable       ();
+		void sortRows         (const std::vector<int>& columns, const std::vector<int>& descending); // no columns for storage order
+		void addFilter        (int column, const std::string& comparison, const std::string& value, bool caseSensitive);
+		void clearFilters     ();
+		int  getColumnCount   () const { return (int)m_columns.size(); }
+
+		[[nodiscard]] std::string getTableItem   (int row, int column) const;
+		[[nodiscard]] PyObject*   getSelections  () const;
+		[[nodiscard]] PyObject*   getSelectedRows() const; // buffer of row indices
+		[[nodiscard]] PyObject*   getRowOrder    ();       // buffer of rows in display order
+
+		void                    setPyValue  (PyObject* value);
+		void                    setPyColumns(PyObject* value); // one list or buffer per column
+		[[nodiscard]] PyObject* getPyValue  () const;
+		void                    draw        () override;
 
 	private:
 
-		[[nodiscard]] bool isIndexValid(int row, int column) const;
-		void               updateHashValues();
+		[[nodiscard]] bool   isIndexValid(int row, int column) const;
+		[[nodiscard]] size_t getRowCount () const;
+		void                 sortByHeader(int column, bool add);
+		void                 setColumns  (std::vector<mvTableColumn> columns);
 
 	private:
 
-		std::map<std::pair<int, int>, bool>   m_selections;
-		std::vector<std::string>              m_headers;
-		std::vector<std::vector<std::string>> m_hashValues;
-		std::vector<std::vector<std::string>> m_values;
-		size_t                                m_columns;
+		mvTableSelection           m_selection;
+		std::vector<std::string>   m_headers;
+		std::vector<mvTableColumn> m_columns; // one per header, all the same length
+		mvTableIndex               m_index;             // display order when sorted or filtered
+		int                        m_anchorRow = -1;    // last clicked cell in display order, start of shift click ranges
+		int                        m_anchorColumn = -1;
 
 	};
 
@@ -0,0 +1,257 @@
+#include "mvTableColumn.h"
+#include <cctype>
+#include <cerrno>
+#include <cmath>
+#include <cstdio>
+#include <cstdlib>
+
+namespace Marvel {
+
+	static bool ParseInt(const std::string& value, long long& result)
+	{
+		if (value.empty() || std::isspace((unsigned char)value[0]))
+			return false;
+
+		char* end = nullptr;
+		errno = 0;
+		result = std::strtoll(value.c_str(), &end, 10);
+		return errno == 0 && end == value.c_str() + value.size();
+	}
+
+	static bool ParseFloat(const std::string& value, double& result)
+	{
+		if (value.empty() || std::isspace((unsigned char)value[0]))
+			return false;
+
+		char* end = nullptr;
+		result = std::strtod(value.c_str(), &end);
+		return end == value.c_str() + value.size();
+	}
+
+	// shortest of the usual precisions that reads back as the same value
+	static void FormatFloat(double value, bool single, char* buffer, size_t size)
+	{
+		if (single)
+		{
+			snprintf(buffer, size, "%.7g", value);
+			if ((float)std::strtod(buffer, nullptr) != (float)value)
+				snprintf(buffer, size, "%.9g", value);
+			return;
+		}
+
+		snprintf(buffer, size, "%.15g", value);
+		if (std::strtod(buffer, nullptr) != value)
+			snprintf(buffer, size, "%.17g", value);
+	}
+
+	mvTableColumn::mvTableColumn(std::vector<std::string> values)
+		: m_type(mvTableColumnType::String), m_strings(std::move(values))
+	{
+	}
+
+	mvTableColumn::mvTableColumn(std::vector<long long> values)
+		: m_type(mvTableColumnType::Int), m_ints(std::move(values))
+	{
+	}
+
+	mvTableColumn::mvTableColumn(std::vector<double> values, bool single)
+		: m_type(mvTableColumnType::Float), m_single(single), m_floats(std::move(values))
+	{
+	}
+
+	mvTableColumn mvTableColumn::FromText(std::vector<std::string> values)
+	{
+		if (values.empty())
+			return mvTableColumn(std::move(values));
+
+		char buffer[64];
+
+		std::vector<long long> ints(values.size());
+		bool isInt = true;
+		for (size_t i = 0; i < values.size() && isInt; i++)
+		{
+			isInt = ParseInt(values[i], ints[i]);
+			if (isInt)
+			{
+				snprintf(buffer, sizeof(buffer), "%lld", ints[i]);
+				isInt = values[i] == buffer;
+			}
+		}
+		if (isInt)
+			return mvTableColumn(std::move(ints));
+
+		std::vector<double> floats(values.size());
+		bool isFloat = true;
+		for (size_t i = 0; i < values.size() && isFloat; i++)
+		{
+			isFloat = ParseFloat(values[i], floats[i]);
+			if (isFloat)
+			{
+				FormatFloat(floats[i], false, buffer, sizeof(buffer));
+				isFloat = values[i] == buffer;
+			}
+		}
+		if (isFloat)
+			return mvTableColumn(std::move(floats));
+
+		return mvTableColumn(std::move(values));
+	}
+
+	size_t mvTableColumn::size() const
+	{
+		switch (m_type)
+		{
+		case mvTableColumnType::Int:   return m_ints.size();
+		case mvTableColumnType::Float: return m_floats.size();
+		default:                       return m_strings.size();
+		}
+	}
+
+	void mvTableColumn::resize(size_t rows)
+	{
+		switch (m_type)
+		{
+		case mvTableColumnType::Int:   m_ints.resize(rows); break;
+		case mvTableColumnType::Float: m_floats.resize(rows); break;
+		default:                       m_strings.resize(rows); break;
+		}
+	}
+
+	void mvTableColumn::clear()
+	{
+		*this = mvTableColumn();
+	}
+
+	void mvTableColumn::insert(size_t row, const std::string& value)
+	{
+		// the first cell decides the type of an empty column
+		if (size() == 0)
+		{
+			*this = FromText({ value });
+			return;
+		}
+
+		long long i = 0;
+		double d = 0.0;
+		if (!parse(value, i, d))
+			toString();
+
+		switch (m_type)
+		{
+		case mvTableColumnType::Int:   m_ints.insert(m_ints.begin() + row, i); break;
+		case mvTableColumnType::Float: m_floats.insert(m_floats.begin() + row, d); break;
+		default:                       m_strings.insert(m_strings.begin() + row, value); break;
+		}
+	}
+
+	void mvTableColumn::insert(size_t row)
+	{
+		switch (m_type)
+		{
+		case mvTableColumnType::Int:   m_ints.insert(m_ints.begin() + row, 0); break;
+		case mvTableColumnType::Float: m_floats.insert(m_floats.begin() + row, 0.0); break;
+		default:                       m_strings.insert(m_strings.begin() + row, std::string()); break;
+		}
+	}
+
+	void mvTableColumn::erase(size_t row)
+	{
+		switch (m_type)
+		{
+		case mvTableColumnType::Int:   m_ints.erase(m_ints.begin() + row); break;
+		case mvTableColumnType::Float: m_floats.erase(m_floats.begin() + row); break;
+		default:                       m_strings.erase(m_strings.begin() + row); break;
+		}
+	}
+
+	void mvTableColumn::set(size_t row, const std::string& value)
+	{
+		long long i = 0;
+		double d = 0.0;
+		if (!parse(value, i, d))
+			toString();
+
+		switch (m_type)
+		{
+		case mvTableColumnType::Int:   m_ints[row] = i; break;
+		case mvTableColumnType::Float: m_floats[row] = d; break;
+		default:                       m_strings[row] = value; break;
+		}
+	}
+
+	std::string mvTableColumn::get(size_t row) const
+	{
+		if (m_type == mvTableColumnType::String)
+			return m_strings[row];
+
+		char buffer[32];
+		return format(row, buffer, sizeof(buffer));
+	}
+
+	double mvTableColumn::getNumber(size_t row) const
+	{
+		return m_type == mvTableColumnType::Int ? (double)m_ints[row] : m_floats[row];
+	}
+
+	int mvTableColumn::compare(size_t a, size_t b) const
+	{
+		switch (m_type)
+		{
+		case mvTableColumnType::Int:
+			return m_ints[a] < m_ints[b] ? -1 : (m_ints[b] < m_ints[a] ? 1 : 0);
+
+		case mvTableColumnType::Float:
+		{
+			double x = m_floats[a];
+			double y = m_floats[b];
+			if (std::isnan(x) || std::isnan(y))
+				return (int)std::isnan(x) - (int)std::isnan(y);
+			return x < y ? -1 : (y < x ? 1 : 0);
+		}
+
+		default:
+			return m_strings[a].compare(m_strings[b]);
+		}
+	}
+
+	const char* mvTableColumn::format(size_t row, char* buffer, size_t size) const
+	{
+		switch (m_type)
+		{
+		case mvTableColumnType::Int:
+			snprintf(buffer, size, "%lld", m_ints[row]);
+			return buffer;
+
+		case mvTableColumnType::Float:
+			FormatFloat(m_floats[row], m_single, buffer, size);
+			return buffer;
+
+		default:
+			return m_strings[row].c_str();
+		}
+	}
+
+	bool mvTableColumn::parse(const std::string& value, long long& i, double& d) const
+	{
+		switch (m_type)
+		{
+		case mvTableColumnType::Int:   return ParseInt(value, i);
+		case mvTableColumnType::Float: return ParseFloat(value, d);
+		default:                       return true;
+		}
+	}
+
+	void mvTableColumn::toString()
+	{
+		if (m_type == mvTableColumnType::String)
+			return;
+
+		std::vector<std::string> strings;
+		strings.reserve(size());
+		for (size_t row = 0; row < size(); row++)
+			strings.push_back(get(row));
+
+		*this = mvTableColumn(std::move(strings));
+	}
+
+}
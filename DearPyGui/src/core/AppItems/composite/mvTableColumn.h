@@ -0,0 +1,77 @@
+#pragma once
+
+#include <string>
+#include <vector>
+
+//-----------------------------------------------------------------------------
+// mvTableColumn
+//
+//     - One column of a table's cells. Columns hold strings, integers or
+//       floats; numeric cells are only formatted to text when they are
+//       drawn or read back. Writing text that does not parse as the
+//       column's type turns the column into a string column.
+//
+//     - Columns filled from text are numeric when every cell parses and
+//       reads back unchanged, an empty column takes the type of the first
+//       cell inserted into it.
+//
+//-----------------------------------------------------------------------------
+
+namespace Marvel {
+
+	enum class mvTableColumnType
+	{
+		String, Int, Float
+	};
+
+	class mvTableColumn
+	{
+
+	public:
+
+		mvTableColumn() = default;
+		explicit mvTableColumn(std::vector<std::string> values);
+		explicit mvTableColumn(std::vector<long long> values);
+		explicit mvTableColumn(std::vector<double> values, bool single = false); // single: values came from 32 bit floats
+
+		// int, float or string column, whichever holds every value unchanged
+		static mvTableColumn FromText(std::vector<std::string> values);
+
+		[[nodiscard]] mvTableColumnType getType() const { return m_type; }
+		[[nodiscard]] size_t            size   () const;
+
+		// rows added by resize are empty strings or zeros
+		void resize(size_t rows);
+		void clear ();
+		void insert(size_t row, const std::string& value);
+		void insert(size_t row); // empty string or zero
+		void erase (size_t row);
+		void set   (size_t row, const std::string& value);
+
+		[[nodiscard]] std::string get      (size_t row) const;
+		[[nodiscard]] double      getNumber(size_t row) const; // numeric columns only
+
+		// negative, zero or positive as row a sorts before, with or after row b,
+		// NaNs sort last
+		[[nodiscard]] int compare(size_t a, size_t b) const;
+
+		// text of a cell, numeric cells are formatted into buffer
+		const char* format(size_t row, char* buffer, size_t size) const;
+
+	private:
+
+		// converts value to the column's type, false if it does not parse
+		bool parse   (const std::string& value, long long& i, double& d) const;
+		void toString();
+
+	private:
+
+		mvTableColumnType        m_type = mvTableColumnType::String;
+		bool                     m_single = false;
+		std::vector<std::string> m_strings;
+		std::vector<long long>   m_ints;
+		std::vector<double>      m_floats;
+
+	};
+
+}
@@ -0,0 +1,281 @@
+#include "mvTableIndex.h"
+#include <algorithm>
+#include <cctype>
+#include <cmath>
+#include <cstdlib>
+#include <cstring>
+
+namespace Marvel {
+
+	static int CompareText(const char* a, const char* b, bool caseSensitive)
+	{
+		if (caseSensitive)
+			return strcmp(a, b);
+
+		for (; *a && std::tolower((unsigned char)*a) == std::tolower((unsigned char)*b); a++, b++);
+		return std::tolower((unsigned char)*a) - std::tolower((unsigned char)*b);
+	}
+
+	static bool ContainsText(const char* text, const std::string& value, bool caseSensitive)
+	{
+		if (caseSensitive)
+			return strstr(text, value.c_str()) != nullptr;
+
+		for (; *text; text++)
+		{
+			size_t i = 0;
+			while (i < value.size() && text[i] && std::tolower((unsigned char)text[i]) == std::tolower((unsigned char)value[i]))
+				i++;
+			if (i == value.size())
+				return true;
+		}
+		return value.empty();
+	}
+
+	static bool Matches(const mvTableColumn& column, size_t row, const mvTableFilter& filter)
+	{
+		char buffer[32];
+		if (filter.comparison == mvTableComparison::Contains)
+			return ContainsText(column.format(row, buffer, sizeof(buffer)), filter.value, filter.caseSensitive);
+
+		// numeric columns compare as numbers, a value that is not a number
+		// (or a NaN cell) only satisfies !=
+		int result = 0;
+		if (column.getType() == mvTableColumnType::String)
+			result = CompareText(column.format(row, buffer, sizeof(buffer)), filter.value.c_str(), filter.caseSensitive);
+		else
+		{
+			double number = column.getNumber(row);
+			if (!filter.numeric || std::isnan(number))
+				return filter.comparison == mvTableComparison::NotEqual;
+			result = number < filter.number ? -1 : (number > filter.number ? 1 : 0);
+		}
+
+		switch (filter.comparison)
+		{
+		case mvTableComparison::Equal:        return result == 0;
+		case mvTableComparison::NotEqual:     return result != 0;
+		case mvTableComparison::Less:         return result < 0;
+		case mvTableComparison::LessEqual:    return result <= 0;
+		case mvTableComparison::Greater:      return result > 0;
+		case mvTableComparison::GreaterEqual: return result >= 0;
+		default:                              return false;
+		}
+	}
+
+	void mvTableIndex::setSortKeys(std::vector<mvTableSortKey> keys)
+	{
+		m_keys = std::move(keys);
+		m_dirty = true;
+	}
+
+	void mvTableIndex::addFilter(mvTableFilter filter)
+	{
+		char* end = nullptr;
+		filter.number = std::strtod(filter.value.c_str(), &end);
+		filter.numeric = !filter.value.empty() && end == filter.value.c_str() + filter.value.size();
+
+		m_filters.push_back(std::move(filter));
+		m_dirty = true;
+	}
+
+	void mvTableIndex::clearFilters()
+	{
+		m_filters.clear();
+		m_dirty = true;
+	}
+
+	void mvTableIndex::invalidate()
+	{
+		m_dirty = true;
+	}
+
+	void mvTableIndex::rowInserted(const std::vector<mvTableColumn>& columns, size_t row)
+	{
+		if (!isActive() || columns.empty())
+			m_dirty = true;
+		if (m_dirty)
+			return;
+
+		// rows after an inserted one move down, appending skips the pass
+		if (row + 1 < columns[0].size())
+		{
+			for (auto& item : m_order)
+			{
+				if (item >= (int)row)
+					item++;
+			}
+		}
+
+		insert(columns, (int)row);
+	}
+
+	void mvTableIndex::rowDeleted(size_t row)
+	{
+		if (!isActive())
+			m_dirty = true;
+		if (m_dirty)
+			return;
+
+		size_t count = 0;
+		for (int item : m_order)
+		{
+			if (item == (int)row)
+				continue;
+			m_order[count++] = item > (int)row ? item - 1 : item;
+		}
+		m_order.resize(count);
+	}
+
+	void mvTableIndex::cellChanged(const std::vector<mvTableColumn>& columns, size_t row, size_t column)
+	{
+		if (!isActive())
+			m_dirty = true;
+		if (m_dirty || !isIndexed(column))
+			return;
+
+		auto item = std::find(m_order.begin(), m_order.end(), (int)row);
+		if (item != m_order.end())
+			m_order.erase(item);
+
+		insert(columns, (int)row);
+	}
+
+	void mvTableIndex::columnInserted(size_t column)
+	{
+		for (auto& key : m_keys)
+		{
+			if (key.column >= (int)column)
+				key.column++;
+		}
+
+		for (auto& filter : m_filters)
+		{
+			if (filter.column >= (int)column)
+				filter.column++;
+		}
+
+		m_dirty = true;
+	}
+
+	void mvTableIndex::columnDeleted(size_t column)
+	{
+		m_keys.erase(std::remove_if(m_keys.begin(), m_keys.end(),
+			[column](const mvTableSortKey& key) { return key.column == (int)column; }), m_keys.end());
+		m_filters.erase(std::remove_if(m_filters.begin(), m_filters.end(),
+			[column](const mvTableFilter& filter) { return filter.column == (int)column; }), m_filters.end());
+
+		for (auto& key : m_keys)
+		{
+			if (key.column > (int)column)
+				key.column--;
+		}
+
+		for (auto& filter : m_filters)
+		{
+			if (filter.column > (int)column)
+				filter.column--;
+		}
+
+		m_dirty = true;
+	}
+
+	const std::vector<int>& mvTableIndex::getOrder(const std::vector<mvTableColumn>& columns)
+	{
+		if (m_dirty)
+			rebuild(columns);
+		return m_order;
+	}
+
+	bool mvTableIndex::passes(const std::vector<mvTableColumn>& columns, size_t row) const
+	{
+		for (const auto& filter : m_filters)
+		{
+			if (filter.column >= 0)
+			{
+				if (!Matches(columns[filter.column], row, filter))
+					return false;
+				continue;
+			}
+
+			bool any = false;
+			for (const auto& column : columns)
+			{
+				if (Matches(column, row, filter))
+				{
+					any = true;
+					break;
+				}
+			}
+
+			if (!any)
+				return false;
+		}
+
+		return true;
+	}
+
+	bool mvTableIndex::before(const std::vector<mvTableColumn>& columns, int a, int b) const
+	{
+		for (const auto& key : m_keys)
+		{
+			int result = columns[key.column].compare(a, b);
+			if (result != 0)
+				return key.ascending ? result < 0 : result > 0;
+		}
+
+		// ties keep storage order, which makes the sort stable
+		return a < b;
+	}
+
+	bool mvTableIndex::isIndexed(size_t column) const
+	{
+		for (const auto& key : m_keys)
+		{
+			if (key.column == (int)column)
+				return true;
+		}
+
+		for (const auto& filter : m_filters)
+		{
+			if (filter.column == -1 || filter.column == (int)column)
+				return true;
+		}
+
+		return false;
+	}
+
+	void mvTableIndex::insert(const std::vector<mvTableColumn>& columns, int row)
+	{
+		if (!passes(columns, row))
+			return;
+
+		auto position = std::lower_bound(m_order.begin(), m_order.end(), row,
+			[&](int a, int b) { return before(columns, a, b); });
+		m_order.insert(position, row);
+	}
+
+	void mvTableIndex::rebuild(const std::vector<mvTableColumn>& columns)
+	{
+		// keys and filters on columns that no longer exist are dropped
+		int count = (int)columns.size();
+		m_keys.erase(std::remove_if(m_keys.begin(), m_keys.end(),
+			[count](const mvTableSortKey& key) { return key.column >= count; }), m_keys.end());
+		m_filters.erase(std::remove_if(m_filters.begin(), m_filters.end(),
+			[count](const mvTableFilter& filter) { return filter.column >= count; }), m_filters.end());
+
+		m_order.clear();
+		size_t rows = columns.empty() ? 0 : columns[0].size();
+		for (size_t row = 0; row < rows; row++)
+		{
+			if (passes(columns, row))
+				m_order.push_back((int)row);
+		}
+
+		if (!m_keys.empty())
+			std::sort(m_order.begin(), m_order.end(), [&](int a, int b) { return before(columns, a, b); });
+
+		m_dirty = false;
+	}
+
+}
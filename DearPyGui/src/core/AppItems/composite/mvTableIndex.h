@@ -0,0 +1,85 @@
+#pragma once
+
+#include <string>
+#include <vector>
+#include "mvTableColumn.h"
+
+//-----------------------------------------------------------------------------
+// mvTableIndex
+//
+//     - Display order of a table's rows: the rows passing every filter,
+//       sorted by the sort keys with ties kept in storage order. The
+//       storage is never reordered, the index only holds row numbers.
+//
+//     - Appending, inserting, deleting or editing a row moves just that
+//       row in the index. Anything else marks it dirty and it is rebuilt
+//       the next time the order is needed.
+//
+//-----------------------------------------------------------------------------
+
+namespace Marvel {
+
+	struct mvTableSortKey
+	{
+		int  column    = 0;
+		bool ascending = true;
+	};
+
+	enum class mvTableComparison
+	{
+		Contains, Equal, NotEqual, Less, LessEqual, Greater, GreaterEqual
+	};
+
+	struct mvTableFilter
+	{
+		int               column = -1;  // -1 passes if any cell matches
+		mvTableComparison comparison = mvTableComparison::Contains;
+		std::string       value;
+		bool              caseSensitive = false;
+		bool              numeric = false; // value parsed as a number, set by addFilter
+		double            number = 0.0;
+	};
+
+	class mvTableIndex
+	{
+
+	public:
+
+		// false while rows are shown in storage order
+		[[nodiscard]] bool isActive() const { return !m_keys.empty() || !m_filters.empty(); }
+
+		void setSortKeys (std::vector<mvTableSortKey> keys);
+		void addFilter   (mvTableFilter filter);
+		void clearFilters();
+		void invalidate  ();
+
+		[[nodiscard]] const std::vector<mvTableSortKey>& getSortKeys() const { return m_keys; }
+
+		// storage changes, columns are the table's columns after the change
+		void rowInserted   (const std::vector<mvTableColumn>& columns, size_t row);
+		void rowDeleted    (size_t row);
+		void cellChanged   (const std::vector<mvTableColumn>& columns, size_t row, size_t column);
+		void columnInserted(size_t column);
+		void columnDeleted (size_t column);
+
+		// storage rows in display order, only valid while active
+		const std::vector<int>& getOrder(const std::vector<mvTableColumn>& columns);
+
+	private:
+
+		[[nodiscard]] bool passes    (const std::vector<mvTableColumn>& columns, size_t row) const;
+		[[nodiscard]] bool before    (const std::vector<mvTableColumn>& columns, int a, int b) const;
+		[[nodiscard]] bool isIndexed (size_t column) const;
+		void               insert    (const std::vector<mvTableColumn>& columns, int row);
+		void               rebuild   (const std::vector<mvTableColumn>& columns);
+
+	private:
+
+		std::vector<mvTableSortKey> m_keys;
+		std::vector<mvTableFilter>  m_filters;
+		std::vector<int>            m_order;
+		bool                        m_dirty = true;
+
+	};
+
+}
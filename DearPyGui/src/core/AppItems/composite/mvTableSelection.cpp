@@ -0,0 +1,188 @@
+#include "mvTableSelection.h"
+
+namespace Marvel {
+
+	static size_t WordCount(size_t bits)
+	{
+		return (bits + 63) / 64;
+	}
+
+	static size_t PopCount(uint64_t word)
+	{
+		word = word - ((word >> 1) & 0x5555555555555555ull);
+		word = (word & 0x3333333333333333ull) + ((word >> 2) & 0x3333333333333333ull);
+		word = (word + (word >> 4)) & 0x0f0f0f0f0f0f0f0full;
+		return (size_t)((word * 0x0101010101010101ull) >> 56);
+	}
+
+	// sets bits [begin, end) of words to value
+	static void SetBits(std::vector<uint64_t>& words, size_t begin, size_t end, bool value)
+	{
+		while (begin < end)
+		{
+			size_t word = begin / 64;
+			size_t bit = begin % 64;
+			size_t count = end - begin < 64 - bit ? end - begin : 64 - bit;
+			uint64_t mask = count == 64 ? ~0ull : ((1ull << count) - 1) << bit;
+
+			if (value)
+				words[word] |= mask;
+			else
+				words[word] &= ~mask;
+
+			begin += count;
+		}
+	}
+
+	void mvTableSelection::resize(size_t rows, size_t columns)
+	{
+		// bits past the last row are kept clear, so shrinking has to clear them
+		if (rows < m_rows)
+		{
+			for (auto& column : m_columns)
+				SetBits(column, rows, m_rows, false);
+		}
+
+		m_rows = rows;
+		m_columns.resize(columns);
+		for (auto& column : m_columns)
+			column.resize(WordCount(rows), 0);
+	}
+
+	void mvTableSelection::clear()
+	{
+		for (auto& column : m_columns)
+			column.assign(column.size(), 0);
+	}
+
+	void mvTableSelection::set(size_t row, size_t column, bool value)
+	{
+		if (value)
+			m_columns[column][row / 64] |= 1ull << (row % 64);
+		else
+			m_columns[column][row / 64] &= ~(1ull << (row % 64));
+	}
+
+	void mvTableSelection::setRange(size_t rowBegin, size_t rowEnd, size_t columnBegin, size_t columnEnd, bool value)
+	{
+		for (size_t column = columnBegin; column < columnEnd; column++)
+			SetBits(m_columns[column], rowBegin, rowEnd, value);
+	}
+
+	void mvTableSelection::insertRow(size_t row)
+	{
+		size_t word = row / 64;
+		size_t bit = row % 64;
+		uint64_t low = bit == 0 ? 0 : (1ull << bit) - 1;
+
+		m_rows++;
+		for (auto& column : m_columns)
+		{
+			column.resize(WordCount(m_rows), 0);
+
+			// every bit from row up moves one place, carrying across words
+			for (size_t i = column.size() - 1; i > word; i--)
+				column[i] = (column[i] << 1) | (column[i - 1] >> 63);
+			column[word] = (column[word] & low) | ((column[word] & ~low) << 1);
+		}
+	}
+
+	void mvTableSelection::eraseRow(size_t row)
+	{
+		size_t word = row / 64;
+		size_t bit = row % 64;
+		uint64_t low = bit == 0 ? 0 : (1ull << bit) - 1;
+
+		m_rows--;
+		for (auto& column : m_columns)
+		{
+			column[word] = (column[word] & low) | ((column[word] >> 1) & ~low);
+			for (size_t i = word + 1; i < column.size(); i++)
+			{
+				column[i - 1] |= (column[i] & 1) << 63;
+				column[i] >>= 1;
+			}
+			column.resize(WordCount(m_rows));
+		}
+	}
+
+	void mvTableSelection::insertColumn(size_t column)
+	{
+		m_columns.insert(m_columns.begin() + column, std::vector<uint64_t>(WordCount(m_rows), 0));
+	}
+
+	void mvTableSelection::eraseColumn(size_t column)
+	{
+		m_columns.erase(m_columns.begin() + column);
+	}
+
+	size_t mvTableSelection::getCount() const
+	{
+		size_t count = 0;
+		for (const auto& column : m_columns)
+		{
+			for (uint64_t word : column)
+				count += PopCount(word);
+		}
+		return count;
+	}
+
+	std::vector<uint64_t> mvTableSelection::getRowBits() const
+	{
+		std::vector<uint64_t> rows(WordCount(m_rows), 0);
+		for (const auto& column : m_columns)
+		{
+			for (size_t i = 0; i < rows.size(); i++)
+				rows[i] |= column[i];
+		}
+		return rows;
+	}
+
+	std::vector<std::pair<int, int>> mvTableSelection::getCells() const
+	{
+		std::vector<std::pair<int, int>> cells;
+		cells.reserve(getCount());
+
+		auto rows = getRowBits();
+		for (size_t i = 0; i < rows.size(); i++)
+		{
+			for (size_t bit = 0; bit < 64 && rows[i] >> bit; bit++)
+			{
+				if (!((rows[i] >> bit) & 1))
+					continue;
+
+				size_t row = i * 64 + bit;
+				for (size_t column = 0; column < m_columns.size(); column++)
+				{
+					if (get(row, column))
+						cells.emplace_back((int)row, (int)column);
+				}
+			}
+		}
+
+		return cells;
+	}
+
+	std::vector<int> mvTableSelection::getRows() const
+	{
+		auto rows = getRowBits();
+
+		size_t count = 0;
+		for (uint64_t word : rows)
+			count += PopCount(word);
+
+		std::vector<int> result;
+		result.reserve(count);
+		for (size_t i = 0; i < rows.size(); i++)
+		{
+			for (size_t bit = 0; bit < 64 && rows[i] >> bit; bit++)
+			{
+				if ((rows[i] >> bit) & 1)
+					result.push_back((int)(i * 64 + bit));
+			}
+		}
+
+		return result;
+	}
+
+}
@@ -0,0 +1,55 @@
+#pragma once
+
+#include <cstddef>
+#include <cstdint>
+#include <utility>
+#include <vector>
+
+//-----------------------------------------------------------------------------
+// mvTableSelection
+//
+//     - Selected cells of a table, one bit per row in a bitset per column.
+//       Ranges are set a word at a time, and inserting or deleting a row
+//       shifts the bits of each column instead of rebuilding the selection.
+//
+//-----------------------------------------------------------------------------
+
+namespace Marvel {
+
+	class mvTableSelection
+	{
+
+	public:
+
+		// new cells are unselected
+		void resize      (size_t rows, size_t columns);
+		void clear       ();
+		void set         (size_t row, size_t column, bool value);
+		void setRange    (size_t rowBegin, size_t rowEnd, size_t columnBegin, size_t columnEnd, bool value); // [begin, end)
+		void insertRow   (size_t row);
+		void eraseRow    (size_t row);
+		void insertColumn(size_t column);
+		void eraseColumn (size_t column);
+
+		[[nodiscard]] bool get(size_t row, size_t column) const
+		{
+			return (m_columns[column][row / 64] >> (row % 64)) & 1;
+		}
+
+		[[nodiscard]] size_t                           getCount() const;
+		[[nodiscard]] std::vector<std::pair<int, int>> getCells() const; // ordered by row, then column
+		[[nodiscard]] std::vector<int>                 getRows () const; // rows with any selected cell
+
+	private:
+
+		// union of all columns
+		std::vector<uint64_t> getRowBits() const;
+
+	private:
+
+		size_t                             m_rows = 0;
+		std::vector<std::vector<uint64_t>> m_columns; // bit i of a column is row i
+
+	};
+
+}
@@ -13,8 +13,8 @@ namespace Marvel {
 			{mvPythonDataType::KeywordOnly},
 			{mvPythonDataType::Bool, "show", "Attempt to render", "True"},
 			{mvPythonDataType::String, "tip", "Adds a simple tooltip", "''"},
-			{mvPythonDataType::String, "parent", "Parent to add this item to. (runtime adding)", "''"},
-			{mvPythonDataType::String, "before", "This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
+			{mvPythonDataType::UUID, "parent", "Parent to add this item to. (runtime adding)", "''"},
+			{mvPythonDataType::UUID, "before", "This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
 			{mvPythonDataType::Integer, "width","", "0"},
 			{mvPythonDataType::Integer, "height", "", "0"},
 			{mvPythonDataType::Bool, "border", "", "True"},
@@ -24,7 +24,7 @@ namespace Marvel {
 			{mvPythonDataType::Bool, "horizontal_scrollbar" ,"Allow horizontal scrollbar to appear (off by default).", "False"},
 			{mvPythonDataType::Bool, "menubar", "", "False"},
 		}, "Adds an embedded child window. Will show scrollbars when items do not fit. Must be followed by a call to end.",
-		"None", "Containers") });
+		"int", "Containers") });
 	}
 
 	mvChild::mvChild(const std::string& name)
@@ -48,25 +48,30 @@ namespace Marvel {
 		auto styleManager = m_styleManager.getScopedStyleManager();
 		ScopedID id;
 
-		ImGui::BeginChild(m_label.c_str(), ImVec2(m_autosize_x ? 0 : (float)m_width, m_autosize_y ? 0 : (float)m_height), m_border, m_windowflags);
+		// false when the region is collapsed or scrolled out of view
+		bool visible = ImGui::BeginChild(m_label.c_str(), ImVec2(m_autosize_x ? 0 : (float)m_width, m_autosize_y ? 0 : (float)m_height), m_border, m_windowflags);
 
-		for (auto item : m_children)
+		// skip the children entirely when none of them can be seen
+		if (visible)
 		{
-			// skip item if it's not shown
-			if (!item->m_show)
-				continue;
+			for (auto& item : m_children)
+			{
+				// skip item if it's not shown
+				if (!item->m_show)
+					continue;
 
-			// set item width
-			if (item->m_width != 0)
-				ImGui::SetNextItemWidth((float)item->m_width);
+				// set item width
+				if (item->m_width != 0)
+					ImGui::SetNextItemWidth((float)item->m_width);
 
-			item->draw();
+				item->draw();
 
-			// Regular Tooltip (simple)
-			if (!item->m_tip.empty() && ImGui::IsItemHovered())
-				ImGui::SetTooltip("%s", item->m_tip.c_str());
+				// Regular Tooltip (simple)
+				if (!item->m_tip.empty() && ImGui::IsItemHovered())
+					ImGui::SetTooltip("%s", item->m_tip.c_str());
 
-			item->getState().update();
+				item->getState().update();
+			}
 		}
 
 		// TODO check if these work for child
@@ -129,8 +134,8 @@ namespace Marvel {
 		const char* name;
 		int show = true;
 		const char* tip = "";
-		const char* parent = "";
-		const char* before = "";
+		mvItemArg parent;
+		mvItemArg before;
 		int width = 0;
 		int height = 0;
 		int border = true;
@@ -158,7 +163,7 @@ namespace Marvel {
 
 		}
 
-		return GetPyNone();
+		return ToPyUUID(item->getUUID());
 
 	}
 
@@ -15,8 +15,8 @@ namespace Marvel {
 			{mvPythonDataType::String, "label", "", "''"},
 			{mvPythonDataType::Bool, "show", "Attempt to render", "True"},
 			{mvPythonDataType::String, "tip", "Adds a simple tooltip", "''"},
-			{mvPythonDataType::String, "parent", "Parent to add this item to. (runtime adding)", "''"},
-			{mvPythonDataType::String, "before", "This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
+			{mvPythonDataType::UUID, "parent", "Parent to add this item to. (runtime adding)", "''"},
+			{mvPythonDataType::UUID, "before", "This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
 			{mvPythonDataType::Bool, "closable", "", "False"},
 			{mvPythonDataType::Bool, "default_open", "", "False"},
 			{mvPythonDataType::Bool, "open_on_double_click", "Need double-click to open node", "False"},
@@ -24,7 +24,7 @@ namespace Marvel {
 			{mvPythonDataType::Bool, "leaf", "No collapsing, no arrow (use as a convenience for leaf nodes).", "False"},
 			{mvPythonDataType::Bool, "bullet", "Display a bullet instead of arrow", "False"},
 		}, "Adds a collapsing header to add items to. Must be closed with the end command.",
-			"None", "Containers") });
+			"int", "Containers") });
 	}
 
 	mvCollapsingHeader::mvCollapsingHeader(const std::string& name)
@@ -128,8 +128,8 @@ namespace Marvel {
 		const char* label = "";
 		int show = true;
 		const char* tip = "";
-		const char* parent = "";
-		const char* before = "";
+		mvItemArg parent;
+		mvItemArg before;
 		int closable = false;
 		int default_open = false;
 		int open_on_double_click = false;
@@ -155,7 +155,7 @@ namespace Marvel {
 
 		}
 
-		return GetPyNone();
+		return ToPyUUID(item->getUUID());
 	}
 
 }
\ No newline at end of file
@@ -13,9 +13,9 @@ namespace Marvel {
 			{mvPythonDataType::KeywordOnly},
 			{mvPythonDataType::Bool, "border", "show border", "True"},
 			{mvPythonDataType::Bool, "show", "Attempt to render", "True"},
-			{mvPythonDataType::String, "parent", "Parent this item will be added to. (runtime adding)", "''"},
-			{mvPythonDataType::String, "before", "This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
-		}, "Adds managed columns.", "None", "Containers") });
+			{mvPythonDataType::UUID, "parent", "Parent this item will be added to. (runtime adding)", "''"},
+			{mvPythonDataType::UUID, "before", "This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
+		}, "Adds managed columns.", "int", "Containers") });
 	}
 
 	void mvColumn::InsertParser(std::map<std::string, mvPythonParser>* parsers)
@@ -26,9 +26,9 @@ namespace Marvel {
 			{mvPythonDataType::KeywordOnly},
 			{mvPythonDataType::Bool, "border", "show border", "True"},
 			{mvPythonDataType::Bool, "show", "Attempt to render", "True"},
-			{mvPythonDataType::String, "parent", "Parent this item will be added to. (runtime adding)", "''"},
-			{mvPythonDataType::String, "before", "This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
-		}, "Sets columns.", "None", "Containers") });
+			{mvPythonDataType::UUID, "parent", "Parent this item will be added to. (runtime adding)", "''"},
+			{mvPythonDataType::UUID, "before", "This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
+		}, "Sets columns.", "int", "Containers") });
 	}
 
 	void mvNextColumn::InsertParser(std::map<std::string, mvPythonParser>* parsers)
@@ -37,9 +37,9 @@ namespace Marvel {
 			{mvPythonDataType::KeywordOnly},
 			{mvPythonDataType::String, "name", "", "'next_collumn'"},
 			{mvPythonDataType::Bool, "show", "Attempt to render", "True"},
-			{mvPythonDataType::String, "parent", "Parent this item will be added to. (runtime adding)", "''"},
-			{mvPythonDataType::String, "before", "This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
-		}, "Changes to next column.", "None", "Containers") });
+			{mvPythonDataType::UUID, "parent", "Parent this item will be added to. (runtime adding)", "''"},
+			{mvPythonDataType::UUID, "before", "This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
+		}, "Changes to next column.", "int", "Containers") });
 	}
 
 	mvManagedColumns::mvManagedColumns(const std::string& name, int columns)
@@ -211,8 +211,8 @@ namespace Marvel {
 		int columns;
 		int border = true;
 		int show = true;
-		const char* parent = "";
-		const char* before = "";
+		mvItemArg parent;
+		mvItemArg before;
 
 
 		if (!(*mvApp::GetApp()->getParsers())["add_managed_columns"].parse(args, kwargs, __FUNCTION__,
@@ -232,7 +232,7 @@ namespace Marvel {
 
 		}
 
-		return GetPyNone();
+		return ToPyUUID(item->getUUID());
 	}
 
 	PyObject* add_next_column(PyObject* self, PyObject* args, PyObject* kwargs)
@@ -240,8 +240,8 @@ namespace Marvel {
 		static int i = 0; i++;
 		std::string sname = std::string("next_column" + std::to_string(i));
 		const char* name = sname.c_str();
-		const char* before = "";
-		const char* parent = "";
+		mvItemArg before;
+		mvItemArg parent;
 		int show = true;
 
 		if (!(*mvApp::GetApp()->getParsers())["add_next_column"].parse(args, kwargs, __FUNCTION__,
@@ -255,7 +255,7 @@ namespace Marvel {
 
 		mvApp::GetApp()->getItemRegistry().addItemWithRuntimeChecks(item, parent, before);
 
-		return GetPyNone();
+		return ToPyUUID(item->getUUID());
 	}
 
 	PyObject* add_columns(PyObject* self, PyObject* args, PyObject* kwargs)
@@ -264,8 +264,8 @@ namespace Marvel {
 		int columns;
 		int border = true;
 		int show = true;
-		const char* parent = "";
-		const char* before = "";
+		mvItemArg parent;
+		mvItemArg before;
 
 
 		if (!(*mvApp::GetApp()->getParsers())["add_columns"].parse(args, kwargs, __FUNCTION__,
@@ -279,6 +279,6 @@ namespace Marvel {
 
 		mvApp::GetApp()->getItemRegistry().addItemWithRuntimeChecks(item, parent, before);
 
-		return GetPyNone();
+		return ToPyUUID(item->getUUID());
 	}
 }
\ No newline at end of file
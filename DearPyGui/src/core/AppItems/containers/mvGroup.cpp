@@ -13,14 +13,14 @@ namespace Marvel {
 			{mvPythonDataType::KeywordOnly},
 			{mvPythonDataType::Bool, "show", "Attempt to render", "True"},
 			{mvPythonDataType::String, "tip", "Adds a simple tooltip", "''"},
-			{mvPythonDataType::String, "parent", "Parent to add this item to. (runtime adding)", "''"},
-			{mvPythonDataType::String, "before", "This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
+			{mvPythonDataType::UUID, "parent", "Parent to add this item to. (runtime adding)", "''"},
+			{mvPythonDataType::UUID, "before", "This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
 			{mvPythonDataType::Integer, "width","", "0"},
 			{mvPythonDataType::Bool, "horizontal", "", "False"},
 			{mvPythonDataType::Float, "horizontal_spacing","", "-1"},
 		}, "Creates a group that other widgets can belong to. The group allows item commands to be issued for all of its members.\
 				Must be closed with the end command."
-		, "None", "Containers") });
+		, "int", "Containers") });
 	}
 
 	mvGroup::mvGroup(const std::string& name)
@@ -96,8 +96,8 @@ namespace Marvel {
 		const char* name;
 		int show = true;
 		const char* tip = "";
-		const char* parent = "";
-		const char* before = "";
+		mvItemArg parent;
+		mvItemArg before;
 		int width = 0;
 		int horizontal = false;
 		float horizontal_spacing = -1.0f;
@@ -120,7 +120,7 @@ namespace Marvel {
 
 		}
 
-		return GetPyNone();
+		return ToPyUUID(item->getUUID());
 	}
 
 }
\ No newline at end of file
@@ -14,10 +14,10 @@ namespace Marvel {
 			{mvPythonDataType::KeywordOnly},
 			{mvPythonDataType::String, "label", "", "''"},
 			{mvPythonDataType::Bool, "show", "Attempt to render", "True"},
-			{mvPythonDataType::String, "parent", "Parent this item will be added to. (runtime adding)", "''"},
-			{mvPythonDataType::String, "before", "This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
+			{mvPythonDataType::UUID, "parent", "Parent this item will be added to. (runtime adding)", "''"},
+			{mvPythonDataType::UUID, "before", "This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
 			{mvPythonDataType::Bool, "enabled", "", "True"},
-		}, "Adds a menu to an existing menu bar. Must be followed by a call to end.", "None", "Containers") });
+		}, "Adds a menu to an existing menu bar. Must be followed by a call to end.", "int", "Containers") });
 	}
 
 	mvMenu::mvMenu(const std::string& name)
@@ -95,8 +95,8 @@ namespace Marvel {
 		const char* name;
 		const char* label = "";
 		int show = true;
-		const char* parent = "";
-		const char* before = "";
+		mvItemArg parent;
+		mvItemArg before;
 		int enabled = true;
 
 		if (!(*mvApp::GetApp()->getParsers())["add_menu"].parse(args, kwargs, __FUNCTION__, &name,
@@ -117,7 +117,7 @@ namespace Marvel {
 
 		}
 
-		return GetPyNone();
+		return ToPyUUID(item->getUUID());
 	}
 
 }
\ No newline at end of file
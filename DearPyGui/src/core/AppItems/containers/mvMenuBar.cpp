@@ -12,9 +12,9 @@ namespace Marvel {
 			{mvPythonDataType::String, "name"},
 			{mvPythonDataType::KeywordOnly},
 			{mvPythonDataType::Bool, "show", "Attempt to render", "True"},
-			{mvPythonDataType::String, "parent", "Parent this item will be added to. (runtime adding)", "''"},
-			{mvPythonDataType::String, "before", "This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
-		}, "Adds a menu bar to a window. Must be followed by a call to end.", "None", "Containers") });
+			{mvPythonDataType::UUID, "parent", "Parent this item will be added to. (runtime adding)", "''"},
+			{mvPythonDataType::UUID, "before", "This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
+		}, "Adds a menu bar to a window. Must be followed by a call to end.", "int", "Containers") });
 	}
 
 	mvMenuBar::mvMenuBar(const std::string& name)
@@ -61,8 +61,8 @@ namespace Marvel {
 	{
 		const char* name;
 		int show = true;
-		const char* parent = "";
-		const char* before = "";
+		mvItemArg parent;
+		mvItemArg before;
 
 		if (!(*mvApp::GetApp()->getParsers())["add_menu_bar"].parse(args, kwargs, __FUNCTION__, &name,
 			&show, &parent, &before))
@@ -96,7 +96,7 @@ namespace Marvel {
 
 			}
 
-			return GetPyNone();
+			return ToPyUUID(item->getUUID());
 		}
 
 		else if (parentItem->getType() == mvAppItemType::Child)
@@ -118,7 +118,7 @@ namespace Marvel {
 
 			}
 
-			return GetPyNone();
+			return ToPyUUID(item->getUUID());
 		}
 
 		return ToPyBool(false);
@@ -19,9 +19,9 @@ namespace Marvel {
 			{mvPythonDataType::Bool, "trailing", "Enforce the tab position to the right of the tab bar (before the scrolling buttons)", "False"},
 			{mvPythonDataType::Bool, "no_tooltip", "Disable tooltip for the given tab", "False"},
 			{mvPythonDataType::String, "tip", "Adds a simple tooltip", "''"},
-			{mvPythonDataType::String, "parent", "Parent to add this item to. (runtime adding)", "''"},
-			{mvPythonDataType::String, "before", "This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
-		}, "Adds a tab to a tab bar. Must be closed with the end command.", "None", "Containers") });
+			{mvPythonDataType::UUID, "parent", "Parent to add this item to. (runtime adding)", "''"},
+			{mvPythonDataType::UUID, "before", "This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
+		}, "Adds a tab to a tab bar. Must be closed with the end command.", "int", "Containers") });
 	}
 	mvTab::mvTab(const std::string& name)
 		: 
@@ -156,14 +156,14 @@ namespace Marvel {
 		int trailing = false;
 		int no_tooltip = false;
 		const char* tip = "";
-		const char* parent = "";
-		const char* before = "";
+		mvItemArg parent;
+		mvItemArg before;
 
 		if (!(*mvApp::GetApp()->getParsers())["add_tab"].parse(args, kwargs, __FUNCTION__, &name, &closeable,
 			&label, &show, &no_reorder, &leading, &trailing, &no_tooltip, &tip, &parent, &before))
 			return ToPyBool(false);
 
-		if (std::string(parent).empty())
+		if (parent.empty())
 		{
 			auto parentItem = mvApp::GetApp()->getItemRegistry().topParent();
 
@@ -188,7 +188,7 @@ namespace Marvel {
 
 				}
 
-				return GetPyNone();
+				return ToPyUUID(item->getUUID());
 			}
 
 			else
@@ -220,7 +220,7 @@ namespace Marvel {
 
 				}
 
-				return GetPyNone();
+				return ToPyUUID(item->getUUID());
 			}
 
 			else
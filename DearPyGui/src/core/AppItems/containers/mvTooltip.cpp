@@ -7,14 +7,14 @@ namespace Marvel {
 	void mvTooltip::InsertParser(std::map<std::string, mvPythonParser>* parsers)
 	{
 		parsers->insert({ "add_tooltip", mvPythonParser({
-			{mvPythonDataType::String, "tipparent", "Sets the item's tool tip to be the same as the named item's tool tip"},
+			{mvPythonDataType::UUID, "tipparent", "Sets the item's tool tip to be the same as the named item's tool tip"},
 			{mvPythonDataType::String, "name"},
 			{mvPythonDataType::KeywordOnly},
-			{mvPythonDataType::String, "parent", "Parent to add this item to. (runtime adding)", "''"},
-			{mvPythonDataType::String, "before", "This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
+			{mvPythonDataType::UUID, "parent", "Parent to add this item to. (runtime adding)", "''"},
+			{mvPythonDataType::UUID, "before", "This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
 			{mvPythonDataType::Bool, "show","Attempt to render", "True"},
 		}, "Adds an advanced tool tip for an item. This command must come immediately after the item the tip is for.",
-			"None", "Containers") });
+			"int", "Containers") });
 	}
 
 	mvTooltip::mvTooltip(const std::string& name)
@@ -61,10 +61,10 @@ namespace Marvel {
 
 	PyObject* add_tooltip(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
-		const char* tipparent;
+		mvItemArg tipparent;
 		const char* name;
-		const char* parent = "";
-		const char* before = "";
+		mvItemArg parent;
+		mvItemArg before;
 		int show = true;
 
 		if (!(*mvApp::GetApp()->getParsers())["add_tooltip"].parse(args, kwargs, __FUNCTION__, &tipparent,
@@ -85,7 +85,7 @@ namespace Marvel {
 
 		}
 
-		return GetPyNone();
+		return ToPyUUID(item->getUUID());
 
 	}
 
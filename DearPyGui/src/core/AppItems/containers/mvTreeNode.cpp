@@ -13,15 +13,15 @@ namespace Marvel {
 			{mvPythonDataType::String, "label", "", "''"},
 			{mvPythonDataType::Bool, "show", "Attempt to render", "True"},
 			{mvPythonDataType::String, "tip", "Adds a simple tooltip", "''"},
-			{mvPythonDataType::String, "parent", "Parent to add this item to. (runtime adding)", "''"},
-			{mvPythonDataType::String, "before", "This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
+			{mvPythonDataType::UUID, "parent", "Parent to add this item to. (runtime adding)", "''"},
+			{mvPythonDataType::UUID, "before", "This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
 			{mvPythonDataType::Bool, "default_open", "", "False"},
 			{mvPythonDataType::Bool, "open_on_double_click", "Need double-click to open node", "False"},
 			{mvPythonDataType::Bool, "open_on_arrow", "Only open when clicking on the arrow part.", "False"},
 			{mvPythonDataType::Bool, "leaf", "No collapsing, no arrow (use as a convenience for leaf nodes).", "False"},
 			{mvPythonDataType::Bool, "bullet", "Display a bullet instead of arrow", "False"},
 		}, "Adds a tree node to add items to. Must be closed with the end command.",
-		"None", "Containers") });
+		"int", "Containers") });
 	}
 	mvTreeNode::mvTreeNode(const std::string& name)
 		: mvBoolPtrBase(name, false, name)
@@ -113,8 +113,8 @@ namespace Marvel {
 		const char* label = "";
 		int show = false;
 		const char* tip = "";
-		const char* parent = "";
-		const char* before = "";
+		mvItemArg parent;
+		mvItemArg before;
 		int default_open = false;
 		int open_on_double_click = false;
 		int open_on_arrow = false;
@@ -138,6 +138,6 @@ namespace Marvel {
 
 		}
 
-		return GetPyNone();
+		return ToPyUUID(item->getUUID());
 	}
 }
\ No newline at end of file
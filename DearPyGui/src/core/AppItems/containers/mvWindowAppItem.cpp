@@ -31,7 +31,7 @@ namespace Marvel {
 			{mvPythonDataType::Bool, "show", "Attempt to render", "True"},
 			{mvPythonDataType::Callable, "on_close", "Callback ran when window is closed", "None"},
 		}, "Creates a new window for following items to be added to.",
-			"None", "Containers") });
+			"int", "Containers") });
 	}
 
 	mvWindowAppItem::mvWindowAppItem(const std::string& name, bool mainWindow, PyObject* closing_callback)
@@ -360,7 +360,7 @@ namespace Marvel {
 		item->setConfigDict(kwargs);
 		item->setExtraConfigDict(kwargs);
 
-		if (mvApp::GetApp()->getItemRegistry().addItemWithRuntimeChecks(item, "", ""))
+		if (mvApp::GetApp()->getItemRegistry().addItemWithRuntimeChecks(item, mvItemArg(), mvItemArg()))
 		{
 			mvApp::GetApp()->getItemRegistry().pushParent(item);
 			if (!show)
@@ -368,7 +368,7 @@ namespace Marvel {
 
 		}
 
-		return GetPyNone();
+		return ToPyUUID(item->getUUID());
 	}
 
 }
\ No newline at end of file
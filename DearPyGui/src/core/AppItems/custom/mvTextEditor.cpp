@@ -3178,7 +3178,7 @@ const mvTextEditor::LanguageDefinition& mvTextEditor::LanguageDefinition::Python
 		for (auto& k : cppKeywords)
 			langDef.mKeywords.insert(k);
 
-		auto docmap = BuildDearPyGuiInterface();
+		auto docmap = GetDearPyGuiInterface();
 		
 		for (auto& k : *docmap)
 		{
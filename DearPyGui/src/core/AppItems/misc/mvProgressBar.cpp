@@ -15,13 +15,13 @@ namespace Marvel {
 			{mvPythonDataType::Float, "default_value", "value from 0 to 1", "0.0"},
 			{mvPythonDataType::String, "overlay", "overlayed text", "''"},
 			{mvPythonDataType::String, "tip", "Adds a simple tooltip", "''"},
-			{mvPythonDataType::String, "parent", "Parent this item will be added to. (runtime adding)", "''"},
-			{mvPythonDataType::String, "before", "This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
+			{mvPythonDataType::UUID, "parent", "Parent this item will be added to. (runtime adding)", "''"},
+			{mvPythonDataType::UUID, "before", "This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
 			{mvPythonDataType::String, "source", "data source for shared data", "''"},
 			{mvPythonDataType::Integer, "width","", "0"},
 			{mvPythonDataType::Integer, "height","", "0"},
 			{mvPythonDataType::Bool, "show", "Attempt to render", "True"},
-		}, "Adds a progress bar.", "None", "Adding Widgets") });
+		}, "Adds a progress bar.", "int", "Adding Widgets") });
 	}
 
 	mvProgressBar::mvProgressBar(const std::string& name, float default_value, const std::string& dataSource)
@@ -60,8 +60,8 @@ namespace Marvel {
 		float default_value = 0.0f;
 		const char* overlay = "";
 		const char* tip = "";
-		const char* parent = "";
-		const char* before = "";
+		mvItemArg parent;
+		mvItemArg before;
 		const char* source = "";
 		int width = 0;
 		int height = 0;
@@ -79,7 +79,7 @@ namespace Marvel {
 
 		mvApp::GetApp()->getItemRegistry().addItemWithRuntimeChecks(item, parent, before);
 
-		return GetPyNone();
+		return ToPyUUID(item->getUUID());
 	}
 
 }
\ No newline at end of file
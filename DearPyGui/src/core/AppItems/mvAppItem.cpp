@@ -50,7 +50,13 @@ namespace Marvel{
 		if (dict == nullptr)
 			return;
 		 
-		if (PyObject* item = PyDict_GetItemString(dict, "name")) m_name = ToString(item);
+		if (PyObject* item = PyDict_GetItemString(dict, "name"))
+		{
+			std::string oldName = m_name;
+			m_name = ToString(item);
+			if (m_name != oldName)
+				mvApp::GetApp()->getItemRegistry().renameItem(this, oldName);
+		}
 		if (PyObject* item = PyDict_GetItemString(dict, "label")) setLabel(ToString(item));
 		if (PyObject* item = PyDict_GetItemString(dict, "tip")) m_tip =ToString(item);
 		if (PyObject* item = PyDict_GetItemString(dict, "width")) setWidth(ToInt(item));
@@ -75,6 +81,51 @@ namespace Marvel{
 		PyDict_SetItemString(dict, "height",  ToPyInt   (m_height));
 	}
 
+	void mvAppItem::getConfigDict(PyObject* dict, const std::vector<std::string>& keys)
+	{
+		if (dict == nullptr)
+			return;
+
+		// the extra configuration is only built if a key needs it
+		PyObject* extra = nullptr;
+
+		for (const auto& key : keys)
+		{
+			if (PyObject* value = getConfigValue(key))
+			{
+				PyDict_SetItemString(dict, key.c_str(), value);
+				Py_DECREF(value);
+				continue;
+			}
+
+			if (extra == nullptr)
+			{
+				extra = PyDict_New();
+				getExtraConfigDict(extra);
+			}
+
+			if (PyObject* value = PyDict_GetItemString(extra, key.c_str()))
+				PyDict_SetItemString(dict, key.c_str(), value);
+			else
+				ThrowPythonException("\"" + key + "\" configuration does not exist in \"" + m_name + "\".");
+		}
+
+		Py_XDECREF(extra);
+	}
+
+	PyObject* mvAppItem::getConfigValue(const std::string& key)
+	{
+		if (key == "name")    return ToPyString(m_name);
+		if (key == "label")   return ToPyString(m_specifiedLabel);
+		if (key == "source")  return ToPyString(m_dataSource);
+		if (key == "tip")     return ToPyString(m_tip);
+		if (key == "show")    return ToPyBool  (m_show);
+		if (key == "enabled") return ToPyBool  (m_enabled);
+		if (key == "width")   return ToPyInt   (m_width);
+		if (key == "height")  return ToPyInt   (m_height);
+		return nullptr;
+	}
+
 	void mvAppItem::registerWindowFocusing()
 	{
 		if (ImGui::IsWindowFocused())
@@ -112,11 +163,22 @@ namespace Marvel{
 		m_callbackData = data;
 	}
 
-	void mvAppItem::resetState()
+	void mvAppItem::resetState(int& visited, int& drawn)
 	{
 		m_state.reset();
+		visited++;
+
+		// children are only drawn (and their states updated) while this item
+		// is drawn, so they have nothing to reset if it wasn't drawn last frame.
+		// Windows set their state directly and are always checked.
+		if (!m_description.root && m_state.getLastFrameUpdated() < ImGui::GetFrameCount() - 1)
+			return;
+
+		if (!m_description.root)
+			drawn++;
+
 		for (auto& item : m_children)
-			item->resetState();
+			item->resetState(visited, drawn);
 
 	}
 
@@ -339,49 +401,6 @@ namespace Marvel{
 		return false;
 	}
 
-	bool mvAppItem::deleteChild(const std::string& name)
-	{
-
-		bool childfound = false;
-		bool itemDeleted = false;
-
-		for (auto& item : m_children)
-		{
-			if (item->m_name == name)
-			{
-				childfound = true;
-				break;
-			}
-
-			if (item->getDescription().container)
-			{
-				itemDeleted = item->deleteChild(name);
-				if (itemDeleted)
-					break;
-			}
-		}
-
-		if (childfound)
-		{
-			std::vector<mvRef<mvAppItem>> oldchildren = m_children;
-
-			m_children.clear();
-
-			for (auto& item : oldchildren)
-			{
-				if (item->m_name == name)
-				{
-					itemDeleted = true;
-					continue;
-				}
-
-				m_children.push_back(item);
-			}
-		}
-
-		return itemDeleted;
-	}
-
 	void mvAppItem::deleteChildren()
 	{
 		m_children.clear();
@@ -393,67 +412,6 @@ namespace Marvel{
 		m_label = value + "###" + m_name;
 	}
 
-	mvRef<mvAppItem> mvAppItem::stealChild(const std::string& name)
-	{
-		mvRef<mvAppItem> stolenChild = nullptr;
-
-		bool childfound = false;
-
-		for (auto& item : m_children)
-		{
-			if (item->m_name == name)
-			{
-				childfound = true;
-				break;
-			}
-
-			if (item->getDescription().container)
-			{
-				stolenChild = item->stealChild(name);
-				if (stolenChild)
-					return stolenChild;
-			}
-		}
-
-		if (childfound)
-		{
-			std::vector<mvRef<mvAppItem>> oldchildren = m_children;
-
-			m_children.clear();
-
-			for (auto& item : oldchildren)
-			{
-				if (item->m_name == name)
-				{
-					stolenChild = item;
-					continue;
-				}
-
-				m_children.push_back(item);
-			}
-		}
-
-		return stolenChild;
-	}
-
-	mvRef<mvAppItem> mvAppItem::getChild(const std::string& name)
-	{
-		for (auto& item : m_children)
-		{
-			if (item->m_name == name)
-				return item;
-
-			if (item->getDescription().container)
-			{
-				auto child = item->getChild(name);
-				if (child)
-					return child;
-			}
-		}
-
-		return nullptr;
-	}
-
 	mvAppItem::~mvAppItem()
 	{
 		deleteChildren();
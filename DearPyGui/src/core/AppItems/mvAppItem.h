@@ -112,6 +112,8 @@ namespace Marvel {
         void                                checkConfigDict   (PyObject* dict);
         void                                setConfigDict     (PyObject* dict);  // python dictionary acts as an out parameter 
         void                                getConfigDict     (PyObject* dict);
+        void                                getConfigDict     (PyObject* dict, const std::vector<std::string>& keys); // only the requested keys
+        [[nodiscard]] PyObject*             getConfigValue    (const std::string& key); // common keys only, nullptr otherwise
         virtual void                        setExtraConfigDict(PyObject* dict) {}
         virtual void                        getExtraConfigDict(PyObject* dict) {}
 
@@ -121,10 +123,13 @@ namespace Marvel {
         void                                setCallbackData(PyObject* data);
 
         [[nodiscard]] bool                  isShown        () const { return m_show; }
+        [[nodiscard]] mvUUID                getUUID        () const { return m_uuid; }
+        [[nodiscard]] const std::string&    getName        () const { return m_name; }
         [[nodiscard]] PyObject*             getCallback    (bool ignore_enabled = true);  // returns the callback. If ignore_enable false and item is disabled then no callback will be returned.
         [[nodiscard]] PyObject*             getCallbackData()       { return m_callbackData; }
         const mvAppItemDescription&         getDescription () const { return m_description; }
         mvAppItemState&                     getState       () { return m_state; } 
+        const std::vector<mvRef<mvAppItem>>& getChildren   () const { return m_children; }
         mvAppItemStyleManager&              getStyleManager() { return m_styleManager; }
         mvAppItemTheme&                     getIndividualTheme() { return m_individualTheme; }
 
@@ -138,18 +143,14 @@ namespace Marvel {
 
     private:
 
-        mvRef<mvAppItem>                    getChild(const std::string& name);      // will return nullptr if not found
-
         // runtime modifications
         bool                                addRuntimeChild(const std::string& parent, const std::string& before, mvRef<mvAppItem> item);
         bool                                addChildAfter(const std::string& prev, mvRef<mvAppItem> item);
-        bool                                deleteChild(const std::string& name);
         void                                deleteChildren();
         bool                                moveChildUp(const std::string& name);
         bool                                moveChildDown(const std::string& name);
-        void                                resetState();
+        void                                resetState(int& visited, int& drawn); // skips children that can't have been drawn last frame
         void                                registerWindowFocusing(); // only useful for imgui window types
-        mvRef<mvAppItem>                    stealChild(const std::string& name); // steals a child (used for moving)
 
        
     protected:
@@ -162,6 +163,7 @@ namespace Marvel {
         std::vector<mvRef<mvAppItem>> m_children;
 
         std::string                   m_dataSource;
+        mvUUID                        m_uuid = 0; // assigned by the item registry
         std::string                   m_name;
         std::string                   m_label; // internal label
         std::string                   m_specifiedLabel;
@@ -33,7 +33,24 @@ namespace Marvel {
         m_rectMin = { ImGui::GetItemRectMin().x, ImGui::GetItemRectMin().y };
         m_rectMax = { ImGui::GetItemRectMax().x, ImGui::GetItemRectMax().y };
         m_rectSize = { ImGui::GetItemRectSize().x, ImGui::GetItemRectSize().y };
+        m_lastFrameUpdated = ImGui::GetFrameCount();
 
     }
 
+    int mvAppItemState::getFlags() const
+    {
+        int flags = mvItemState_None;
+        if (m_hovered)              flags |= mvItemState_Hovered;
+        if (m_active)               flags |= mvItemState_Active;
+        if (m_focused)              flags |= mvItemState_Focused;
+        if (m_clicked)              flags |= mvItemState_Clicked;
+        if (m_visible)              flags |= mvItemState_Visible;
+        if (m_edited)               flags |= mvItemState_Edited;
+        if (m_activated)            flags |= mvItemState_Activated;
+        if (m_deactivated)          flags |= mvItemState_Deactivated;
+        if (m_deactivatedAfterEdit) flags |= mvItemState_DeactivatedAfterEdit;
+        if (m_toggledOpen)          flags |= mvItemState_ToggledOpen;
+        return flags;
+    }
+
 }
\ No newline at end of file
@@ -7,6 +7,26 @@ namespace Marvel {
     // forward declarations
     class mvAppItem;
 
+    //-----------------------------------------------------------------------------
+    // mvItemStateFlags
+    //     - bit per state, used for bulk state queries (get_item_states)
+    //-----------------------------------------------------------------------------
+    enum mvItemStateFlags
+    {
+        mvItemState_None                 = 0,
+        mvItemState_Hovered              = 1 << 0,
+        mvItemState_Active               = 1 << 1,
+        mvItemState_Focused              = 1 << 2,
+        mvItemState_Clicked              = 1 << 3,
+        mvItemState_Visible              = 1 << 4,
+        mvItemState_Edited               = 1 << 5,
+        mvItemState_Activated            = 1 << 6,
+        mvItemState_Deactivated          = 1 << 7,
+        mvItemState_DeactivatedAfterEdit = 1 << 8,
+        mvItemState_ToggledOpen          = 1 << 9,
+        mvItemState_Shown                = 1 << 10  // set from the item, not the state
+    };
+
     class mvAppItemState
     {
 
@@ -29,6 +49,8 @@ namespace Marvel {
         [[nodiscard]] mvVec2 getItemRectMin            () const { return m_rectMin; }
         [[nodiscard]] mvVec2 getItemRectMax            () const { return m_rectMax; }
         [[nodiscard]] mvVec2 getItemRectSize           () const { return m_rectSize; }
+        [[nodiscard]] int    getFlags                  () const; // mvItemStateFlags
+        [[nodiscard]] int    getLastFrameUpdated       () const { return m_lastFrameUpdated; } // imgui frame count
 
         // setters
         void          setHovered             (bool value)        { m_hovered = value; }
@@ -62,6 +84,7 @@ namespace Marvel {
         mvVec2     m_rectMax              = { 0.0f, 0.0f };
         mvVec2     m_rectSize             = { 0.0f, 0.0f };
         mvAppItem* m_parent               = nullptr;
+        int        m_lastFrameUpdated     = -1; // not cleared by reset, used to cull resets
 
     };
 }
\ No newline at end of file
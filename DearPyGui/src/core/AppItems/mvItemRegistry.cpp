@@ -4,6 +4,9 @@
 #include "mvApp.h"
 #include "mvItemRegistry.h"
 #include "mvAppItems.h"
+#include "mvPythonParser.h"
+#include <algorithm>
+#include <chrono>
 
 namespace Marvel {
 
@@ -18,6 +21,7 @@ namespace Marvel {
 			m_backWindows.push_back(item);
 			m_backWindows.back()->setLabel(label);
 			m_backWindows.back()->hide();
+			registerItem(item);
 		};
 
 		add_hidden_window(CreateRef<mvAboutWindow>("about##standard"), "About Dear PyGui");
@@ -33,162 +37,144 @@ namespace Marvel {
 		mvEventBus::UnSubscribe(this);
 	}
 
-	bool mvItemRegistry::deleteItem(const std::string& name, bool childrenOnly)
+	bool mvItemRegistry::deleteItem(const mvItemArg& itemArg, bool childrenOnly)
 	{
 
-		// delete items that are parent only
-		if(childrenOnly)
-		{
-			auto item = getItem(name);
-			if (item)
-			{
-				item->deleteChildren();
-				return true;
-			}
-		}
-
-		bool deletedItem = false;
+		mvRef<mvAppItem> item = getItem(itemArg);
+		std::string name = itemArg.str();
 
-		// try to delete item
-		for (auto window : m_frontWindows)
+		if (item == nullptr)
 		{
-			deletedItem = window->deleteChild(name);
-			if (deletedItem)
-				break;
+			ThrowPythonException(name + " not deleted because it was not found");
+			return false;
 		}
 
-		if (!deletedItem)
+		// delete items that are parent only
+		if (childrenOnly)
 		{
-			for (auto window : m_backWindows)
-			{
-				deletedItem = window->deleteChild(name);
-				if (deletedItem)
-					break;
-			}
+			for (auto& child : item->m_children)
+				unregisterItem(child);
+			item->deleteChildren();
+			return true;
 		}
 
-		bool frontWindowDeleting = false;
-		bool backWindowDeleting = false;
+		// items are owned by their parent, windows
+		// are owned by the registry
+		std::vector<mvRef<mvAppItem>>* owner = &m_backWindows;
+		if (item->m_parent)
+			owner = &item->m_parent->m_children;
+		else if (std::find(m_frontWindows.begin(), m_frontWindows.end(), item) != m_frontWindows.end())
+			owner = &m_frontWindows;
 
-		// check if attempting to delete a window
-		for (auto window : m_frontWindows)
+		auto it = std::find(owner->begin(), owner->end(), item);
+		if (it == owner->end())
 		{
-			if (window->m_name == name)
-			{
-				frontWindowDeleting = true;
-				break;
-			}
+			ThrowPythonException(name + " not deleted because it was not found");
+			return false;
 		}
 
-		for (auto window : m_backWindows)
-		{
-			if (window->m_name == name)
-			{
-				backWindowDeleting = true;
-				break;
-			}
-		}
+		owner->erase(it);
+		unregisterItem(item);
 
-		// delete window and update window vector
-		// this should be changed to a different data
-		// structure
-		if (frontWindowDeleting)
-		{
-			std::vector<mvRef<mvAppItem>> oldwindows = m_frontWindows;
+		return true;
+	}
 
-			m_frontWindows.clear();
+	bool mvItemRegistry::moveItem(const mvItemArg& item, const mvItemArg& parentArg, const mvItemArg& beforeArg)
+	{
 
-			for (auto window : oldwindows)
-			{
-				if (window->m_name == name)
-				{
-					deletedItem = true;
-					continue;
-				}
-				m_frontWindows.push_back(window);
-			}
-		}
+		mvRef<mvAppItem> child = getItem(item);
+		std::string name = item.str();
+		std::string parent = getItemName(parentArg);
+		std::string before = getItemName(beforeArg);
 
-		if (backWindowDeleting)
+		// windows can not be moved
+		if (child == nullptr || child->m_parent == nullptr)
 		{
-			std::vector<mvRef<mvAppItem>> oldwindows = m_backWindows;
+			ThrowPythonException(name + " not moved because it was not found");
+			return false;
+		}
 
-			m_backWindows.clear();
+		// an item can not be moved into its own subtree
+		mvRef<mvAppItem> target = getItem(before.empty() ? parent : before);
+		if (target == nullptr)
+		{
+			ThrowPythonException(name + " not moved because its parent was not found");
+			return false;
+		}
 
-			for (auto window : oldwindows)
+		for (mvAppItem* ancestor = target.get(); ancestor; ancestor = ancestor->m_parent)
+		{
+			if (ancestor == child.get())
 			{
-				if (window->m_name == name)
-				{
-					deletedItem = true;
-					continue;
-				}
-				m_backWindows.push_back(window);
+				ThrowPythonException(name + " not moved because it can not be moved into itself");
+				return false;
 			}
 		}
 
-		if (!deletedItem)
-			ThrowPythonException(name + " not deleted because it was not found");
+		auto& siblings = child->m_parent->m_children;
+		siblings.erase(std::find(siblings.begin(), siblings.end(), child));
+		child->m_parent = nullptr;
+
+		// moved items keep their index entries and handles
+		if (insertItem(parent, before, child))
+			return true;
 
-		return deletedItem;
+		unregisterItem(child);
+		ThrowPythonException(name + " not moved because its parent was not found");
+		return false;
 	}
 
-	bool mvItemRegistry::moveItem(const std::string& name, const std::string& parent, const std::string& before)
+	void mvItemRegistry::renameItem(mvAppItem* item, const std::string& oldName)
 	{
-
-		mvRef<mvAppItem> child = nullptr;
-
-		bool movedItem = false;
-
-		for (auto window : m_frontWindows)
+		auto range = m_itemIndex.equal_range(oldName);
+		for (auto it = range.first; it != range.second; ++it)
 		{
-			child = window->stealChild(name);
-			if (child)
-				break;
+			if (it->second.get() == item)
+			{
+				mvRef<mvAppItem> ref = it->second;
+				m_itemIndex.erase(it);
+				m_itemIndex.emplace(item->m_name, ref);
+				return;
+			}
 		}
-
-		if (child == nullptr)
-			ThrowPythonException(name + " not moved because it was not found");
-
-		if (child)
-			addRuntimeItem(parent, before, child);
-
-		return movedItem;
 	}
 
-	bool mvItemRegistry::moveItemUp(const std::string& name)
+	bool mvItemRegistry::moveItemUp(const mvItemArg& item)
 	{
 
-		bool movedItem = false;
-
-		for (auto window : m_frontWindows)
+		// windows can not be moved
+		mvRef<mvAppItem> child = getItem(item);
+		if (child == nullptr || child->m_parent == nullptr)
 		{
-			movedItem = window->moveChildUp(name);
-			if (movedItem)
-				break;
+			ThrowPythonException(item.str() + " not moved because it was not found");
+			return false;
 		}
 
-		if (!movedItem)
-			ThrowPythonException(name + " not moved because it was not found");
+		auto& siblings = child->m_parent->m_children;
+		auto it = std::find(siblings.begin(), siblings.end(), child);
+		if (it != siblings.begin())
+			std::iter_swap(it, it - 1);
 
-		return movedItem;
+		return true;
 	}
 
-	bool mvItemRegistry::moveItemDown(const std::string& name)
+	bool mvItemRegistry::moveItemDown(const mvItemArg& item)
 	{
 
-		bool movedItem = false;
-
-		for (auto window : m_frontWindows)
+		// windows can not be moved
+		mvRef<mvAppItem> child = getItem(item);
+		if (child == nullptr || child->m_parent == nullptr)
 		{
-			movedItem = window->moveChildDown(name);
-			if (movedItem)
-				break;
+			ThrowPythonException(item.str() + " not moved because it was not found");
+			return false;
 		}
 
-		if (!movedItem)
-			ThrowPythonException(name + " not moved because it was not found");
+		auto& siblings = child->m_parent->m_children;
+		auto it = std::find(siblings.begin(), siblings.end(), child);
+		if (it + 1 != siblings.end())
+			std::iter_swap(it, it + 1);
 
-		return movedItem;
+		return true;
 	}
 
 	bool mvItemRegistry::onEvent(mvEvent& event)
@@ -222,14 +208,23 @@ namespace Marvel {
 		MV_PROFILE_FUNCTION();
 
 		// resets app items states (i.e. hovered)
+		m_cullStats.visited = 0;
+		m_cullStats.drawn = 0;
 		for (auto window : m_frontWindows)
-			window->resetState();
+			window->resetState(m_cullStats.visited, m_cullStats.drawn);
 		for (auto window : m_backWindows)
-			window->resetState();
+			window->resetState(m_cullStats.visited, m_cullStats.drawn);
 
 		return false;
 	}
 
+	mvItemRegistry::mvCullStats mvItemRegistry::getCullStats() const
+	{
+		mvCullStats stats = m_cullStats;
+		stats.total = (int)m_itemIndex.size();
+		return stats;
+	}
+
 	bool mvItemRegistry::onActiveWindow(mvEvent& event)
 	{
 
@@ -241,8 +236,6 @@ namespace Marvel {
 	bool mvItemRegistry::addRuntimeItem(const std::string& parent, const std::string& before, mvRef<mvAppItem> item)
 	{
 		// add runtime items
-		bool addedItem = false;
-
 		if (!item->getDescription().duplicatesAllowed)
 		{
 			if (getItem(item->m_name))
@@ -256,22 +249,37 @@ namespace Marvel {
 		if (item->getDescription().root)
 		{
 			m_frontWindows.push_back(item);
+			registerItem(item);
 			return true;
 		}
 
-		for (auto window : m_frontWindows)
+		bool addedItem = insertItem(parent, before, item);
+
+		if (addedItem)
+			registerItem(item);
+		else
+			ThrowPythonException(item->m_name + " not added because its parent was not found");
+
+		return addedItem;
+	}
+
+	bool mvItemRegistry::insertItem(const std::string& parent, const std::string& before, mvRef<mvAppItem> item)
+	{
+		// the index gives us the container directly
+		if (!before.empty())
 		{
-			addedItem = window->addRuntimeChild(parent, before, item);
-			if (addedItem)
-				break;
+			mvRef<mvAppItem> beforeItem = getItem(before);
+			if (beforeItem && beforeItem->m_parent)
+				return beforeItem->m_parent->addRuntimeChild("", before, item);
 		}
-
-		if (!addedItem)
+		else if (!parent.empty())
 		{
-			ThrowPythonException(item->m_name + " not added because its parent was not found");
+			mvRef<mvAppItem> parentItem = getItem(parent);
+			if (parentItem && parentItem->getDescription().container)
+				return parentItem->addRuntimeChild(parent, before, item);
 		}
 
-		return addedItem;
+		return false;
 	}
 
 	bool mvItemRegistry::addItemAfter(const std::string& prev, mvRef<mvAppItem> item)
@@ -286,18 +294,16 @@ namespace Marvel {
 			return false;
 		}
 
-		for (auto window : m_frontWindows)
-		{
-			addedItem = window->addChildAfter(prev, item);
-			if (addedItem)
-				break;
-		}
+		mvRef<mvAppItem> prevItem = getItem(prev);
+		if (prevItem && prevItem->m_parent)
+			addedItem = prevItem->m_parent->addChildAfter(prev, item);
 
-		if (!addedItem)
-		{
+		if (addedItem)
+			registerItem(item);
+		else
 			ThrowPythonException(item->m_name + " not added because its parent was not found");
-		}
-		return true;
+
+		return addedItem;
 	}
 
 	void mvItemRegistry::pushParent(mvRef<mvAppItem> item)
@@ -333,29 +339,110 @@ namespace Marvel {
 
 	mvRef<mvAppItem> mvItemRegistry::getItem(const std::string& name)
 	{
-		mvRef<mvAppItem> item = nullptr;
+		auto it = m_itemIndex.find(name);
+		if (it != m_itemIndex.end())
+			return it->second;
 
-		for (auto window : m_frontWindows)
-		{
-			if (window->m_name == name)
-				return window;
+		return nullptr;
+	}
+
+	mvRef<mvAppItem> mvItemRegistry::getItem(mvUUID uuid)
+	{
+		std::lock_guard<std::mutex> lk(m_slotMutex);
+
+		// lower half is the slot index (offset by one so 0 is never valid)
+		size_t index = (size_t)(uuid & 0xFFFFFFFF) - 1;
+		if (index >= m_slots.size())
+			return nullptr;
+
+		if (m_slots[index].generation != (unsigned)(uuid >> 32))
+			return nullptr;
+
+		return m_slots[index].item;
+	}
+
+	mvRef<mvAppItem> mvItemRegistry::getItem(const mvItemArg& item)
+	{
+		if (item.uuid)
+			return getItem(item.uuid);
+		return getItem(item.name);
+	}
+
+	std::string mvItemRegistry::getItemName(const mvItemArg& item)
+	{
+		if (item.uuid == 0)
+			return item.name;
+
+		mvRef<mvAppItem> appitem = getItem(item.uuid);
+		if (appitem)
+			return appitem->m_name;
+		return "";
+	}
+
+	void mvItemRegistry::registerItem(mvRef<mvAppItem> item)
+	{
+		m_itemIndex.emplace(item->m_name, item);
+
+		// queued and moved items already own a handle
+		if (item->m_uuid == 0)
+			reserveHandle(item);
 
-			auto child = window->getChild(name);
-			if (child)
-				return child;
+		for (auto& child : item->m_children)
+			registerItem(child);
+	}
+
+	void mvItemRegistry::unregisterItem(mvRef<mvAppItem> item)
+	{
+		auto range = m_itemIndex.equal_range(item->m_name);
+		for (auto it = range.first; it != range.second; ++it)
+		{
+			if (it->second == item)
+			{
+				m_itemIndex.erase(it);
+				break;
+			}
 		}
 
-		for (auto window : m_backWindows)
 		{
-			if (window->m_name == name)
-				return window;
+			std::lock_guard<std::mutex> lk(m_slotMutex);
+			releaseHandle(item.get());
+		}
+
+		for (auto& child : item->m_children)
+			unregisterItem(child);
+	}
+
+	void mvItemRegistry::reserveHandle(mvRef<mvAppItem> item)
+	{
+		std::lock_guard<std::mutex> lk(m_slotMutex);
 
-			auto child = window->getChild(name);
-			if (child)
-				return child;
+		unsigned index;
+		if (m_freeSlots.empty())
+		{
+			index = (unsigned)m_slots.size();
+			m_slots.emplace_back();
+		}
+		else
+		{
+			index = m_freeSlots.back();
+			m_freeSlots.pop_back();
 		}
 
-		return nullptr;
+		m_slots[index].item = item;
+		m_slots[index].generation++;
+		item->m_uuid = ((mvUUID)m_slots[index].generation << 32) | (mvUUID)(index + 1);
+	}
+
+	void mvItemRegistry::releaseHandle(mvAppItem* item)
+	{
+		// caller holds m_slotMutex
+		if (item->m_uuid == 0)
+			return;
+
+		unsigned index = (unsigned)(item->m_uuid & 0xFFFFFFFF) - 1;
+		m_slots[index].item = nullptr;
+		m_freeSlots.push_back(index);
+		item->m_uuid = 0;
 	}
 
 	mvWindowAppItem* mvItemRegistry::getWindow(const std::string& name)
@@ -397,6 +484,7 @@ namespace Marvel {
 
 		item->m_parent = parentitem.get();
 		parentitem->m_children.emplace_back(item);
+		registerItem(item);
 
 		return true;
 	}
@@ -405,6 +493,7 @@ namespace Marvel {
 	{
 
 		m_frontWindows.push_back(item);
+		registerItem(item);
 		return true;
 	}
 
@@ -412,15 +501,45 @@ namespace Marvel {
 	{
 		m_frontWindows.clear();
 		m_backWindows.clear();
+		m_itemIndex.clear();
+		m_batch.clear();
+		m_batchDepth = 0;
+
+		// slots keep their generation so handles from before
+		// the clear never match an item added after it
+		std::lock_guard<std::mutex> lk(m_slotMutex);
+		m_freeSlots.clear();
+		for (size_t i = 0; i < m_slots.size(); i++)
+		{
+			if (m_slots[i].item)
+				m_slots[i].item->m_uuid = 0;
+			m_slots[i].item = nullptr;
+			m_freeSlots.push_back((unsigned)i);
+		}
 	}
 
-	bool mvItemRegistry::addItemWithRuntimeChecks(mvRef<mvAppItem> item, const char* parent, const char* before)
+	bool mvItemRegistry::addItemWithRuntimeChecks(mvRef<mvAppItem> item, const mvItemArg& parentArg, const mvItemArg& beforeArg)
 	{
 
 		if (item == nullptr)
 			return false;
 
-		std::lock_guard<std::mutex> lk(mvApp::GetApp()->GetApp()->getMutex());
+		// the tree is searched by name, handles are resolved to their
+		// item's name (under the lock unless batching)
+		std::unique_lock<std::mutex> lk(mvApp::GetApp()->GetApp()->getMutex(), std::defer_lock);
+		if (!isBatching())
+			lk.lock();
+
+		std::string parent = getItemName(parentArg);
+		std::string before = getItemName(beforeArg);
+		if ((parentArg.uuid && parent.empty()) || (beforeArg.uuid && before.empty()))
+		{
+			ThrowPythonException(item->m_name + " not added because its parent was not found");
+			return false;
+		}
+
+		if (isBatching())
+			return queueItem(item, parent, before);
 
 		// remove bad parent stack item
 		if (item->getDescription().root && topParent() != nullptr)
@@ -430,6 +549,12 @@ namespace Marvel {
 			ThrowPythonException("Parent stack not empty. Adding window will empty the parent stack. Don't forget to end container types.");
 		}
 
+		return addItemChecked(item, parent, before);
+	}
+
+	bool mvItemRegistry::addItemChecked(mvRef<mvAppItem> item, const std::string& parent, const std::string& before)
+	{
+
 		if (item->getType() == mvAppItemType::Popup || item->getType() == mvAppItemType::Tooltip)
 		{
 			addItemAfter(parent, item);
@@ -445,45 +570,134 @@ namespace Marvel {
 			addWindow(item);
 
 		// typical run time adding
-		else if ((!std::string(parent).empty() || !std::string(before).empty()) && mvApp::IsAppStarted())
+		else if ((!parent.empty() || !before.empty()) && mvApp::IsAppStarted())
 			addRuntimeItem(parent, before, item);
 
 		// adding without specifying before or parent, instead using parent stack
-		else if (std::string(parent).empty() && std::string(before).empty() && mvApp::IsAppStarted() && topParent() != nullptr)
+		else if (parent.empty() && before.empty() && mvApp::IsAppStarted() && topParent() != nullptr)
 			addRuntimeItem(topParent()->m_name, before, item);
 
 		// adding without specifying before or parent, but with empty stack (add to main window)
-		else if (std::string(parent).empty() && std::string(before).empty() && mvApp::IsAppStarted())
+		else if (parent.empty() && before.empty() && mvApp::IsAppStarted())
 		{
 			ThrowPythonException("Parent stack is empty. You must specify 'before' or 'parent' widget.");
 			return false;
 		}
 
 		// adding normally but using the runtime style of adding
-		else if (!std::string(parent).empty() && !mvApp::IsAppStarted())
+		else if (!parent.empty() && !mvApp::IsAppStarted())
 			addRuntimeItem(parent, before, item);
 
 		// typical adding before runtime
-		else if (std::string(parent).empty() && !mvApp::IsAppStarted() && std::string(before).empty())
+		else if (parent.empty() && !mvApp::IsAppStarted() && before.empty())
 			addItem(item);
 
 
 		return true;
 	}
 
-	std::string mvItemRegistry::getItemParentName(const std::string& name)
+	bool mvItemRegistry::queueItem(mvRef<mvAppItem> item, const std::string& parent, const std::string& before)
 	{
-		mvRef<mvAppItem> item = getItem(name);
-		if (item)
+		// remove bad parent stack item
+		if (item->getDescription().root && topParent() != nullptr)
+		{
+			emptyParents();
+
+			ThrowPythonException("Parent stack not empty. Adding window will empty the parent stack. Don't forget to end container types.");
+		}
+
+		// the parent stack will have moved on by the time
+		// the batch is committed, so resolve the parent now
+		std::string queuedParent = parent;
+		bool usesStack = !item->getDescription().root && parent.empty() && before.empty()
+			&& item->getType() != mvAppItemType::Popup && item->getType() != mvAppItemType::Tooltip;
+		if (usesStack && topParent() != nullptr)
+			queuedParent = topParent()->m_name;
+
+		// queued items get their handle right away
+		reserveHandle(item);
+		m_batch.push_back({ item, queuedParent, before });
+
+		return true;
+	}
+
+	void mvItemRegistry::beginBatch()
+	{
+		m_batchDepth++;
+	}
+
+	mvItemRegistry::mvBatchStats mvItemRegistry::endBatch()
+	{
+		mvBatchStats stats;
+
+		if (m_batchDepth == 0)
+		{
+			ThrowPythonException("No batch to end.");
+			return stats;
+		}
+
+		// nested batches are committed with the outermost one
+		if (--m_batchDepth > 0)
+			return stats;
+
+		std::vector<mvQueuedItem> batch = std::move(m_batch);
+		m_batch.clear();
+		stats.queued = (int)batch.size();
+
+		if (batch.empty())
+			return stats;
+
+		auto start = std::chrono::steady_clock::now();
+
+		// the render thread holds the lock for the whole frame
+		// so the batch lands between two frames
+		std::lock_guard<std::mutex> lk(mvApp::GetApp()->GetApp()->getMutex());
+		auto locked = std::chrono::steady_clock::now();
+
+		for (auto& queued : batch)
+		{
+			addItemChecked(queued.item, queued.parent, queued.before);
+
+			if (isRegistered(queued.item))
+				stats.added++;
+			else
+			{
+				std::lock_guard<std::mutex> slk(m_slotMutex);
+				releaseHandle(queued.item.get());
+			}
+		}
+
+		auto end = std::chrono::steady_clock::now();
+		stats.lockWait = std::chrono::duration<float, std::milli>(locked - start).count();
+		stats.commit = std::chrono::duration<float, std::milli>(end - locked).count();
+
+		return stats;
+	}
+
+	bool mvItemRegistry::isRegistered(const mvRef<mvAppItem>& item)
+	{
+		auto range = m_itemIndex.equal_range(item->m_name);
+		for (auto it = range.first; it != range.second; ++it)
+		{
+			if (it->second == item)
+				return true;
+		}
+		return false;
+	}
+
+	std::string mvItemRegistry::getItemParentName(const mvItemArg& itemArg)
+	{
+		mvRef<mvAppItem> item = getItem(itemArg);
+		if (item && item->m_parent)
 			return item->m_parent->m_name;
 		
 		return "";
 	}
 
-	std::vector<std::string> mvItemRegistry::getItemChildren(const std::string& name)
+	std::vector<std::string> mvItemRegistry::getItemChildren(const mvItemArg& itemArg)
 	{
 
-		mvRef<mvAppItem> item = getItem(name);
+		mvRef<mvAppItem> item = getItem(itemArg);
 
 		std::vector<std::string> childList;
 
@@ -4,6 +4,7 @@
 #include <vector>
 #include <queue>
 #include <string>
+#include <unordered_map>
 #include <mutex>
 #include "mvEvents.h"
 
@@ -14,6 +15,7 @@ namespace Marvel {
     //-----------------------------------------------------------------------------
     class mvAppItem;
     class mvWindowAppItem;
+    struct mvItemArg;
 
     //-----------------------------------------------------------------------------
     // mvItemRegistry
@@ -28,10 +30,11 @@ namespace Marvel {
         mvItemRegistry();
         ~mvItemRegistry();
 
-        bool deleteItem  (const std::string& name, bool childrenOnly = false);
-        bool moveItem    (const std::string& name, const std::string& parent, const std::string& before);
-        bool moveItemUp  (const std::string& name);
-        bool moveItemDown(const std::string& name);
+        bool deleteItem  (const mvItemArg& item, bool childrenOnly = false);
+        bool moveItem    (const mvItemArg& item, const mvItemArg& parent, const mvItemArg& before);
+        bool moveItemUp  (const mvItemArg& item);
+        bool moveItemDown(const mvItemArg& item);
+        void renameItem  (mvAppItem* item, const std::string& oldName); // called after an item's name changes
 
         //-----------------------------------------------------------------------------
         // Event Handling
@@ -45,17 +48,20 @@ namespace Marvel {
         // AppItem Operations
         //-----------------------------------------------------------------------------
         mvRef<mvAppItem>               getItem           (const std::string& name);
+        mvRef<mvAppItem>               getItem           (mvUUID uuid);
+        mvRef<mvAppItem>               getItem           (const mvItemArg& item); // slot table for handles, name index otherwise
+        std::string                    getItemName       (const mvItemArg& item); // empty if a handle no longer resolves
         mvWindowAppItem*               getWindow         (const std::string& name);
         std::vector<mvRef<mvAppItem>>& getFrontWindows   () { return m_frontWindows; }
         std::vector<mvRef<mvAppItem>>& getBackWindows    () { return m_backWindows; }
         const std::string&             getActiveWindow() const { return m_activeWindow; }
-        bool                           addItemWithRuntimeChecks(mvRef<mvAppItem> item, const char* parent, const char* before);
+        bool                           addItemWithRuntimeChecks(mvRef<mvAppItem> item, const mvItemArg& parent, const mvItemArg& before);
         
         // called by python interface
         std::vector<std::string> getAllItems       ();
         std::vector<std::string> getWindows        ();
-        std::vector<std::string> getItemChildren   (const std::string& name);
-        std::string              getItemParentName (const std::string& name);
+        std::vector<std::string> getItemChildren   (const mvItemArg& item);
+        std::string              getItemParentName (const mvItemArg& item);
         void                     setPrimaryWindow  (const std::string& name, bool value);
 
         //-----------------------------------------------------------------------------
@@ -67,6 +73,37 @@ namespace Marvel {
         mvRef<mvAppItem>         popParent   ();                // pop parent off stack and return it
         mvRef<mvAppItem>         topParent   ();                // returns top parent without popping
 
+        //-----------------------------------------------------------------------------
+        // Batching
+        //     - items created while batching are queued and added under a
+        //       single lock acquisition when the outermost batch ends
+        //-----------------------------------------------------------------------------
+        struct mvBatchStats
+        {
+            int   queued   = 0;    // items queued during the batch
+            int   added    = 0;    // items successfully added
+            float lockWait = 0.0f; // ms spent waiting for the frame to finish
+            float commit   = 0.0f; // ms spent adding items while holding the lock
+        };
+
+        void                     beginBatch();
+        mvBatchStats             endBatch  ();
+        [[nodiscard]] bool       isBatching() const { return m_batchDepth > 0; }
+
+        //-----------------------------------------------------------------------------
+        // Culling statistics
+        //     - visited: items reset at the start of this frame
+        //     - drawn: items drawn last frame (windows excluded)
+        //-----------------------------------------------------------------------------
+        struct mvCullStats
+        {
+            int visited = 0;
+            int drawn   = 0;
+            int total   = 0; // all items in the registry
+        };
+
+        [[nodiscard]] mvCullStats getCullStats() const;
+
     private:
 
         void                     clearRegistry();
@@ -74,6 +111,16 @@ namespace Marvel {
         bool                     addItemAfter(const std::string& prev, mvRef<mvAppItem> item);
         bool                     addWindow(mvRef<mvAppItem> item);
         bool                     addRuntimeItem(const std::string& parent, const std::string& before, mvRef<mvAppItem> item);
+        bool                     insertItem    (const std::string& parent, const std::string& before, mvRef<mvAppItem> item);
+        bool                     addItemChecked(mvRef<mvAppItem> item, const std::string& parent, const std::string& before);
+        bool                     queueItem     (mvRef<mvAppItem> item, const std::string& parent, const std::string& before);
+        bool                     isRegistered  (const mvRef<mvAppItem>& item);
+
+        // name index and handle maintenance (items and their children)
+        void                     registerItem  (mvRef<mvAppItem> item);
+        void                     unregisterItem(mvRef<mvAppItem> item);
+        void                     reserveHandle (mvRef<mvAppItem> item);
+        void                     releaseHandle (mvAppItem* item);
 
 
 	private:
@@ -83,6 +130,31 @@ namespace Marvel {
 		std::vector<mvRef<mvAppItem>> m_backWindows;
         std::string                   m_activeWindow;
 
+        // name -> item index, multimap since some item types allow duplicate names
+        std::unordered_multimap<std::string, mvRef<mvAppItem>> m_itemIndex;
+
+        // handle -> item slot table, handles carry the slot generation
+        // so handles of deleted items never resolve to a reused slot
+        struct mvItemSlot
+        {
+            mvRef<mvAppItem> item;
+            unsigned         generation = 0;
+        };
+        std::vector<mvItemSlot>       m_slots;
+        std::vector<unsigned>         m_freeSlots;
+        std::mutex                    m_slotMutex; // handles are reserved for queued items without the app lock
+
+        struct mvQueuedItem
+        {
+            mvRef<mvAppItem> item;
+            std::string      parent;
+            std::string      before;
+        };
+        std::vector<mvQueuedItem>     m_batch;
+        int                           m_batchDepth = 0;
+
+        mvCullStats                   m_cullStats;
+
 	};
 
 }
\ No newline at end of file
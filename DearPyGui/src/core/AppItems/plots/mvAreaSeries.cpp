@@ -10,11 +10,11 @@ namespace Marvel {
 		std::vector<ImVec2> points;
 		for (unsigned i = 0; i < m_data[0].size(); i++)
 		{
-			float x = m_data[0][i] > limits.X.Max ? (float)limits.X.Max : (float)m_data[0][i];
-			x = m_data[0][i] < limits.X.Min ? (float)limits.X.Min : x;
+			double x = m_data[0][i] > limits.X.Max ? limits.X.Max : m_data[0][i];
+			x = m_data[0][i] < limits.X.Min ? limits.X.Min : x;
 
-			float y = m_data[1][i] > limits.Y.Max ? (float)limits.Y.Max : (float)m_data[1][i];
-			y = m_data[1][i] < limits.Y.Min ? (float)limits.Y.Min : y;
+			double y = m_data[1][i] > limits.Y.Max ? limits.Y.Max : m_data[1][i];
+			y = m_data[1][i] < limits.Y.Min ? limits.Y.Min : y;
 			auto p = ImPlot::PlotToPixels({ x, y });
 			points.push_back(p);
 		}
@@ -9,8 +9,8 @@ namespace Marvel {
 
 	public:
 
-		mvAreaSeries(const std::string& name, const std::vector<float>* x,
-			const std::vector<float>* y, mvColor color, mvColor fill, ImPlotYAxis_ axis)
+		mvAreaSeries(const std::string& name, std::vector<double>* x,
+			std::vector<double>* y, mvColor color, mvColor fill, ImPlotYAxis_ axis)
 			: 
 			mvSeries(name, { x, y }, axis),
 			m_color(color), 
@@ -9,8 +9,8 @@ namespace Marvel {
 
 	public:
 
-		mvBarSeries(const std::string& name, const std::vector<float>* x,
-			const std::vector<float>* y, bool horizontal, ImPlotYAxis_ axis)
+		mvBarSeries(const std::string& name, std::vector<double>* x,
+			std::vector<double>* y, bool horizontal, ImPlotYAxis_ axis)
 			: mvSeries(name, {x, y}, axis), m_horizontal(horizontal)
 		{
 		}
@@ -19,10 +19,20 @@ namespace Marvel {
 
 		void draw() override
 		{
-			if(m_horizontal)
-				ImPlot::PlotBarsH(m_name.c_str(), m_data[0].data(), m_data[1].data(), (int)m_data[0].size(), m_weight);
+			if (m_horizontal)
+			{
+				if (isBound())
+					ImPlot::PlotBarsH(m_name.c_str(), m_sources[0]->data(), m_sources[1]->data(), getBoundCount(), m_weight);
+				else
+					ImPlot::PlotBarsH(m_name.c_str(), m_data[0].data(), m_data[1].data(), (int)m_data[0].size(), m_weight, m_offset);
+			}
 			else
-				ImPlot::PlotBars(m_name.c_str(), m_data[0].data(), m_data[1].data(), (int)m_data[0].size(), m_weight);
+			{
+				if (isBound())
+					ImPlot::PlotBars(m_name.c_str(), m_sources[0]->data(), m_sources[1]->data(), getBoundCount(), m_weight);
+				else
+					ImPlot::PlotBars(m_name.c_str(), m_data[0].data(), m_data[1].data(), (int)m_data[0].size(), m_weight, m_offset);
+			}
 		}
 
 	private:
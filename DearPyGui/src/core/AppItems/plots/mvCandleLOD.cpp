@@ -0,0 +1,117 @@
+#include "mvCandleLOD.h"
+#include "mvApp.h"
+#include <algorithm>
+#include <atomic>
+
+namespace Marvel {
+
+	static constexpr int BucketSize = 4;       // candles merged into one
+	static constexpr int MinLevelSize = 256;   // coarsest level kept
+	static constexpr int MinCandlePixels = 2;  // spacing below which the next level is used
+
+	bool mvCandleLOD::update(const std::vector<std::vector<double>>& data, int version,
+		double xmin, double xmax, int pixels)
+	{
+		if (data.size() < 5 || data[0].empty() || pixels <= 0)
+			return false;
+
+		if (version != m_version)
+		{
+			m_version = version;
+			build(data);
+		}
+
+		if (!m_sorted)
+			return false;
+
+		// finest level with few enough visible candles, one extra on each
+		// side since candles overhang their date
+		int maxCount = std::max(pixels / MinCandlePixels, 1);
+		for (size_t level = 0; level <= m_levels.size(); level++)
+		{
+			const auto& columns = level == 0 ? data : m_levels[level - 1];
+			const auto& dates = columns[0];
+
+			int first = (int)(std::lower_bound(dates.begin(), dates.end(), xmin) - dates.begin());
+			int last = (int)(std::upper_bound(dates.begin(), dates.end(), xmax) - dates.begin());
+			first = std::max(first - 1, 0);
+			last = std::min(last + 1, (int)dates.size());
+
+			if (last - first <= maxCount || level == m_levels.size())
+			{
+				m_current = &columns;
+				m_first = first;
+				m_count = last - first;
+				break;
+			}
+		}
+
+		return true;
+	}
+
+	void mvCandleLOD::build(const std::vector<std::vector<double>>& data)
+	{
+		m_levels.clear();
+		m_current = nullptr;
+
+		const auto& dates = data[0];
+		if (dates.size() < 2)
+		{
+			m_sorted = true;
+			return;
+		}
+
+		// sorting check and levels are chunked across the worker pool
+		auto& parallel = mvApp::GetApp()->getParallel();
+		auto ranges = parallel.split(dates.size() - 1);
+		std::atomic_bool sorted = true;
+		parallel.run(ranges.size(), [&](size_t i)
+			{
+				if (sorted && !std::is_sorted(dates.begin() + ranges[i].first, dates.begin() + ranges[i].second + 1))
+					sorted = false;
+			});
+
+		m_sorted = sorted;
+		if (!m_sorted || (int)dates.size() < MinPoints)
+			return;
+
+		// level 1 is built from the raw candles, every other level from the previous one
+		int size = (int)dates.size();
+		while (size / BucketSize >= MinLevelSize)
+		{
+			const auto& source = m_levels.empty() ? data : m_levels.back();
+
+			int buckets = (size + BucketSize - 1) / BucketSize;
+			std::vector<std::vector<double>> level(5);
+			for (auto& column : level)
+				column.resize(buckets);
+
+			ranges = parallel.split(buckets);
+			parallel.run(ranges.size(), [&](size_t i)
+				{
+					for (size_t bucket = ranges[i].first; bucket < ranges[i].second; bucket++)
+					{
+						int start = (int)bucket * BucketSize;
+						int end = std::min(start + BucketSize, size);
+						double high = source[2][start];
+						double low = source[3][start];
+						for (int j = start + 1; j < end; j++)
+						{
+							high = std::max(high, source[2][j]);
+							low = std::min(low, source[3][j]);
+						}
+
+						level[0][bucket] = source[0][start];
+						level[1][bucket] = source[1][start];
+						level[2][bucket] = high;
+						level[3][bucket] = low;
+						level[4][bucket] = source[4][end - 1];
+					}
+				});
+
+			m_levels.push_back(std::move(level));
+			size = (int)m_levels.back()[0].size();
+		}
+	}
+
+}
@@ -0,0 +1,51 @@
+#pragma once
+
+#include <vector>
+
+//-----------------------------------------------------------------------------
+// mvCandleLOD
+//
+//     - Level of detail for candle series with sorted dates. Each level
+//       merges every 4 candles of the level below into one (first open,
+//       highest high, lowest low, last close), so zooming out shows wider
+//       candles instead of a smear. Drawing picks the finest level that
+//       keeps the visible candles at least 2 pixels apart and only passes
+//       the visible range of it on.
+//
+//-----------------------------------------------------------------------------
+
+namespace Marvel {
+
+	class mvCandleLOD
+	{
+
+	public:
+
+		static constexpr int MinPoints = 4096; // smaller series are never aggregated
+
+		// data holds the dates, opens, highs, lows and closes columns. Returns
+		// false if the series should be drawn as is, otherwise getData() holds
+		// the level to draw and getFirst()/getCount() its visible range
+		bool update(const std::vector<std::vector<double>>& data, int version,
+			double xmin, double xmax, int pixels);
+
+		const std::vector<std::vector<double>>& getData () const { return *m_current; }
+		int                                     getFirst() const { return m_first; }
+		int                                     getCount() const { return m_count; }
+
+	private:
+
+		void build(const std::vector<std::vector<double>>& data);
+
+	private:
+
+		std::vector<std::vector<std::vector<double>>> m_levels;  // aggregated levels, level 1 and up
+		const std::vector<std::vector<double>>*       m_current = nullptr;
+		int                                           m_version = -1;
+		bool                                          m_sorted = false;
+		int                                           m_first = 0;
+		int                                           m_count = 0;
+
+	};
+
+}
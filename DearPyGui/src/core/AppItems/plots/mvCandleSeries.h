@@ -1,6 +1,8 @@
 #pragma once
 
 #include "mvPlot.h"
+#include "mvCandleLOD.h"
+#include <limits>
 
 namespace Marvel {
 
@@ -17,14 +19,14 @@ namespace Marvel {
         return -1;
     }
 
-    static void PlotCandlestick(const char* label_id, const float* xs, const float* opens, 
-        const float* closes, const float* lows, const float* highs, int count, 
+    static void PlotCandlestick(const char* label_id, const double* xs, const double* opens, 
+        const double* closes, const double* lows, const double* highs, int count, 
         bool tooltip, float width_percent, ImVec4 bullCol, ImVec4 bearCol) {
 
         // get ImGui window DrawList
         ImDrawList* draw_list = ImPlot::GetPlotDrawList();
         // calc real value width
-        float half_width = count > 1 ? (xs[1] - xs[0]) * width_percent : width_percent;
+        double half_width = count > 1 ? (xs[1] - xs[0]) * width_percent : width_percent;
 
         // custom tool
         if (ImPlot::IsPlotHovered() && tooltip) {
@@ -38,7 +40,7 @@ namespace Marvel {
             draw_list->AddRectFilled(ImVec2(tool_l, tool_t), ImVec2(tool_r, tool_b), IM_COL32(128, 128, 128, 64));
             ImPlot::PopPlotClipRect();
             // find mouse location index
-            int idx = BinarySearch(xs, 0, count - 1, (float)mouse.x);
+            int idx = BinarySearch(xs, 0, count - 1, mouse.x);
             // render tool tip (won't be affected by plot clip rect)
             if (idx != -1) {
                 ImGui::BeginTooltip();
@@ -86,8 +88,8 @@ namespace Marvel {
 
 	public:
 
-		mvCandleSeries(std::string name, const std::vector<float>* dates, const std::vector<float>* opens,
-			const std::vector<float>* highs, const std::vector<float>* lows, const std::vector<float>* closes,
+		mvCandleSeries(std::string name, std::vector<double>* dates, std::vector<double>* opens,
+			std::vector<double>* highs, std::vector<double>* lows, std::vector<double>* closes,
 			float width, mvColor bull, mvColor bear, ImPlotYAxis_ axis)
             : mvSeries(name, { dates, opens, highs, lows, closes }, axis),
 			m_width(width),
@@ -95,14 +97,15 @@ namespace Marvel {
 			m_bearColor(bear)
 		{
 
-            if (!dates->empty())
+            // the inputs have been moved into m_data by mvSeries
+            if (!m_data[0].empty())
             {
-                auto minmax = minmax_element(dates->begin(), dates->end());
+                auto minmax = minmax_element(m_data[0].begin(), m_data[0].end());
                 m_maxX = *minmax.second;
                 m_minX = *minmax.first;
-                minmax = minmax_element(lows->begin(), lows->end());
+                minmax = minmax_element(m_data[3].begin(), m_data[3].end());
                 m_minY = *minmax.first;
-                minmax = minmax_element(highs->begin(), highs->end());
+                minmax = minmax_element(m_data[2].begin(), m_data[2].end());
                 m_maxY = *minmax.second;
             }
 			
@@ -113,9 +116,28 @@ namespace Marvel {
 		void draw() override
 		{
 
-			PlotCandlestick(m_name.c_str(), m_data[0].data(), m_data[1].data(), m_data[4].data(),
-				m_data[3].data(), m_data[2].data(), (int)m_data[0].size(), m_tooltip, m_width, m_bullColor.toVec4(), 
-				m_bearColor.toVec4());
+			// fitting needs the extremes of the whole series
+			double xmin = std::numeric_limits<double>::lowest();
+			double xmax = std::numeric_limits<double>::max();
+			if (!ImPlot::FitThisFrame())
+			{
+				ImPlotLimits limits = ImPlot::GetPlotLimits();
+				xmin = limits.X.Min;
+				xmax = limits.X.Max;
+			}
+
+			if (m_lod.update(m_data, m_version, xmin, xmax, (int)ImPlot::GetPlotSize().x))
+			{
+				const auto& data = m_lod.getData();
+				int first = m_lod.getFirst();
+				PlotCandlestick(m_name.c_str(), data[0].data() + first, data[1].data() + first, data[4].data() + first,
+					data[3].data() + first, data[2].data() + first, m_lod.getCount(), m_tooltip, m_width, m_bullColor.toVec4(),
+					m_bearColor.toVec4());
+			}
+			else
+				PlotCandlestick(m_name.c_str(), m_data[0].data(), m_data[1].data(), m_data[4].data(),
+					m_data[3].data(), m_data[2].data(), (int)m_data[0].size(), m_tooltip, m_width, m_bullColor.toVec4(), 
+					m_bearColor.toVec4());
 		}
 
 	private:
@@ -124,6 +146,7 @@ namespace Marvel {
 		bool m_tooltip = true;
 		mvColor m_bullColor = { 0, 255, 113, 255};
 		mvColor m_bearColor = { 218, 13, 79, 255 };
+		mvCandleLOD m_lod;
 
 	};
 
@@ -9,8 +9,8 @@ namespace Marvel {
 
 	public:
 
-		mvErrorSeries(const std::string& name, const std::vector<float>* x, const std::vector<float>* y,
-			const std::vector<float>* neg, const std::vector<float>* pos,
+		mvErrorSeries(const std::string& name, std::vector<double>* x, std::vector<double>* y,
+			std::vector<double>* neg, std::vector<double>* pos,
 			bool horizontal, const mvColor& color, ImPlotYAxis_ axis)
 			: 
 			mvSeries(name, {x, y, neg, pos}, axis),
@@ -0,0 +1,149 @@
+#include "mvHeatSeries.h"
+#include "mvCore.h"
+#include "mvEvents.h"
+#include "mvTextureStorage.h"
+#include <algorithm>
+
+namespace Marvel {
+
+	static constexpr size_t MaxDirtyRanges = 32; // more ranges are uploaded as a whole
+
+	mvHeatSeries::~mvHeatSeries()
+	{
+		if (m_texture)
+			mvEventBus::Publish(mvEVT_CATEGORY_TEXTURE, mvEVT_DEC_TEXTURE, { CreateEventArgument("NAME", m_textureName) });
+	}
+
+	void mvHeatSeries::updateRows(const std::vector<double>& values, int row, bool scroll)
+	{
+		auto& data = m_data[0];
+		int count = (int)(values.size() / m_cols);
+
+		if (scroll)
+		{
+			count = std::min(count, m_rows);
+			size_t size = (size_t)count * m_cols;
+			std::move_backward(data.begin(), data.end() - size, data.end());
+			std::copy(values.begin(), values.begin() + size, data.begin());
+
+			// the texture rows rotate, the new top rows take the place of the dropped bottom rows
+			m_textureRow = (m_textureRow - count + m_rows) % m_rows;
+			markRows(m_textureRow, count);
+		}
+		else
+		{
+			std::copy(values.begin(), values.begin() + (size_t)count * m_cols, data.begin() + (size_t)row * m_cols);
+			markRows((m_textureRow + row) % m_rows, count);
+		}
+	}
+
+	void mvHeatSeries::markRows(int textureRow, int count)
+	{
+		if (!m_texture || m_rebuild || count <= 0)
+			return;
+
+		if (textureRow + count > m_rows)
+		{
+			m_dirtyRows.push_back({ textureRow, m_rows - textureRow });
+			m_dirtyRows.push_back({ 0, textureRow + count - m_rows });
+		}
+		else
+			m_dirtyRows.push_back({ textureRow, count });
+
+		if (m_dirtyRows.size() > MaxDirtyRanges)
+		{
+			m_dirtyRows.clear();
+			m_rebuild = true;
+		}
+	}
+
+	void mvHeatSeries::fillRows(int textureRow, int count)
+	{
+		m_pixels.resize((size_t)count * m_cols * 4);
+
+		double range = m_scale_max - m_scale_min;
+		for (int i = 0; i < count; i++)
+		{
+			int row = (textureRow + i - m_textureRow + m_rows) % m_rows;
+			const double* values = &m_data[0][(size_t)row * m_cols];
+			float* pixels = &m_pixels[(size_t)i * m_cols * 4];
+
+			for (int j = 0; j < m_cols; j++)
+			{
+				float t = range != 0.0 ? (float)((values[j] - m_scale_min) / range) : 0.0f;
+				ImVec4 color = ImPlot::LerpColormap(t);
+				pixels[j * 4 + 0] = color.x;
+				pixels[j * 4 + 1] = color.y;
+				pixels[j * 4 + 2] = color.z;
+				pixels[j * 4 + 3] = color.w;
+			}
+		}
+	}
+
+	bool mvHeatSeries::colormapChanged()
+	{
+		int size = ImPlot::GetColormapSize();
+		bool changed = (int)m_colormap.size() != size;
+		m_colormap.resize(size);
+
+		for (int i = 0; i < size; i++)
+		{
+			ImU32 color = ImGui::ColorConvertFloat4ToU32(ImPlot::GetColormapColor(i));
+			changed |= m_colormap[i] != color;
+			m_colormap[i] = color;
+		}
+
+		return changed;
+	}
+
+	void mvHeatSeries::drawTexture()
+	{
+		auto& storage = mvApp::GetApp()->getTextureStorage();
+
+		if (colormapChanged())
+			m_rebuild = true;
+
+		mvTexture* texture = storage.getTexture(m_textureName);
+
+		if (texture == nullptr)
+		{
+			fillRows(0, m_rows);
+			storage.addTexture(m_textureName, m_pixels.data(), m_cols, m_rows, mvTextureFormat::RGBA_FLOAT);
+			texture = storage.getTexture(m_textureName);
+		}
+		else if (m_rebuild)
+		{
+			fillRows(0, m_rows);
+			storage.updateTexture(m_textureName, m_pixels.data(), 0, m_rows);
+		}
+		else
+		{
+			for (const auto& rows : m_dirtyRows)
+			{
+				fillRows(rows.first, rows.second);
+				storage.updateTexture(m_textureName, m_pixels.data(), rows.first, rows.second);
+			}
+		}
+
+		m_rebuild = false;
+		m_dirtyRows.clear();
+
+		if (texture == nullptr)
+			return;
+
+		// texture rows [m_textureRow, m_rows) are the top of the series,
+		// the rows before it wrapped around to the bottom
+		ImVec4 tint = { 1.0f, 1.0f, 1.0f, 1.0f };
+		double height = (m_bounds_max.y - m_bounds_min.y) / m_rows;
+		double split = m_bounds_max.y - (m_rows - m_textureRow) * height;
+		float v = (float)m_textureRow / (float)m_rows;
+
+		ImPlot::PlotImage(m_name.c_str(), texture->texture, { m_bounds_min.x, split }, { m_bounds_max.x, m_bounds_max.y },
+			{ 0.0f, v }, { 1.0f, 1.0f }, tint);
+
+		if (m_textureRow != 0)
+			ImPlot::PlotImage(m_name.c_str(), texture->texture, { m_bounds_min.x, m_bounds_min.y }, { m_bounds_max.x, split },
+				{ 0.0f, 0.0f }, { 1.0f, v }, tint);
+	}
+
+}
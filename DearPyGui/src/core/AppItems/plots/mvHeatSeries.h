@@ -2,6 +2,17 @@
 
 #include "mvPlot.h"
 
+//-----------------------------------------------------------------------------
+// mvHeatSeries
+//
+//     - In texture mode the values are mapped through the plot's colormap
+//       into an RGBA texture which is drawn as a single image instead of a
+//       quad per cell. Updated rows are uploaded on the next frame, and
+//       scrolling (waterfall) rotates the texture rows so only the new
+//       rows are uploaded. Cell labels are not drawn in texture mode.
+//
+//-----------------------------------------------------------------------------
+
 namespace Marvel {
 
 	class mvHeatSeries : public mvSeries
@@ -9,18 +20,20 @@ namespace Marvel {
 
 	public:
 
-		mvHeatSeries(const std::string& name, const std::vector<float>* values, 
+		mvHeatSeries(const std::string& name, std::vector<double>* values,
 			int rows, int cols, double scale_min, double scale_max, const std::string& format,
-			mvVec2 bounds_min, mvVec2 bounds_max, ImPlotYAxis_ axis)
-			: 
+			mvVec2 bounds_min, mvVec2 bounds_max, bool texture, ImPlotYAxis_ axis)
+			:
 			mvSeries(name, {values}, axis),
-			m_rows(rows), 
-			m_cols(cols), 
+			m_rows(rows),
+			m_cols(cols),
 			m_scale_min(scale_min),
-			m_scale_max(scale_max), 
-			m_format(format), 
-			m_bounds_min(bounds_min), 
-			m_bounds_max(bounds_max)
+			m_scale_max(scale_max),
+			m_format(format),
+			m_bounds_min(bounds_min),
+			m_bounds_max(bounds_max),
+			m_texture(texture),
+			m_textureName("##heat" + std::to_string((size_t)this))
 		{
 			m_minX = bounds_min.x;
 			m_maxX = bounds_max.x;
@@ -28,16 +41,35 @@ namespace Marvel {
 			m_maxY = bounds_max.y;
 		}
 
+		~mvHeatSeries();
+
 		mvSeriesType getSeriesType() override { return mvSeriesType::Heat; }
 
 		void draw() override
 		{
 
-			ImPlot::PlotHeatmap(m_name.c_str(), m_data[0].data(), m_rows, m_cols, m_scale_min, m_scale_max,
-				m_format.c_str(), { m_bounds_min.x, m_bounds_min.y }, { m_bounds_max.x, m_bounds_max.y });
-		
+			if (m_texture)
+				drawTexture();
+			else
+				ImPlot::PlotHeatmap(m_name.c_str(), m_data[0].data(), m_rows, m_cols, m_scale_min, m_scale_max,
+					m_format.c_str(), { m_bounds_min.x, m_bounds_min.y }, { m_bounds_max.x, m_bounds_max.y });
+
 		}
 
+		// replaces whole rows starting at row, or with scroll pushes them
+		// in at the top and drops the same number of rows at the bottom
+		void updateRows(const std::vector<double>& values, int row, bool scroll);
+
+		int getRows   () const { return m_rows; }
+		int getColumns() const { return m_cols; }
+
+	private:
+
+		void drawTexture();
+		void markRows  (int textureRow, int count);
+		void fillRows  (int textureRow, int count);
+		bool colormapChanged();
+
 	private:
 
 		int         m_rows;
@@ -48,6 +80,15 @@ namespace Marvel {
 		mvVec2      m_bounds_min;
 		mvVec2      m_bounds_max;
 
+		// texture mode
+		bool                             m_texture = false;
+		std::string                      m_textureName;
+		int                              m_textureRow = 0;     // texture row holding the top row
+		bool                             m_rebuild = true;     // upload every row
+		std::vector<std::pair<int, int>> m_dirtyRows;          // texture rows (first, count)
+		std::vector<ImU32>               m_colormap;           // colormap the texture was built with
+		std::vector<float>               m_pixels;
+
 	};
 
-}
\ No newline at end of file
+}
@@ -9,8 +9,8 @@ namespace Marvel {
 
 	public:
 
-		mvLineSeries(const std::string& name, const std::vector<float>* x,
-			const std::vector<float>* y, mvColor color, ImPlotYAxis_ axis)
+		mvLineSeries(const std::string& name, std::vector<double>* x,
+			std::vector<double>* y, mvColor color, ImPlotYAxis_ axis)
 			: 
 			mvSeries(name, { x, y }, axis),
 			m_color(color)
@@ -24,7 +24,12 @@ namespace Marvel {
 
 			ImPlot::SetNextLineStyle(m_color.toVec4());
 			ImPlot::PushStyleVar(ImPlotStyleVar_LineWeight, m_weight);
-			ImPlot::PlotLine(m_name.c_str(), m_data[0].data(), m_data[1].data(), (int)m_data[0].size());
+			if (isBound())
+				ImPlot::PlotLine(m_name.c_str(), m_sources[0]->data(), m_sources[1]->data(), getBoundCount());
+			else if (auto lod = getLOD())
+				ImPlot::PlotLine(m_name.c_str(), (*lod)[0].data(), (*lod)[1].data(), (int)(*lod)[0].size());
+			else
+				ImPlot::PlotLine(m_name.c_str(), m_data[0].data(), m_data[1].data(), (int)m_data[0].size(), m_offset);
 			ImPlot::PopStyleVar();
 		}
 
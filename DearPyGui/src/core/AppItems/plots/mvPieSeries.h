@@ -9,7 +9,7 @@ namespace Marvel {
 
 	public:
 
-		mvPieSeries(const std::string& name, const std::vector<float>* values, double x,
+		mvPieSeries(const std::string& name, std::vector<double>* values, double x,
 			double y, double radius, bool normalize, double angle, const std::string& format,
 			const std::vector<std::string>& labels, ImPlotYAxis_ axis)
 			: 
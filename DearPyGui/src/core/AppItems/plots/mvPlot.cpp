@@ -1,4 +1,6 @@
 #include <algorithm>
+#include <cmath>
+#include <limits>
 #include "mvPlot.h"
 #include "mvApp.h"
 #include "mvPythonTranslator.h"
@@ -70,8 +72,8 @@ namespace Marvel {
 			{mvPythonDataType::Bool, "y3axis_lock_min", "", "False"},
 			{mvPythonDataType::Bool, "y3axis_lock_max", "", "False"},
 
-			{mvPythonDataType::String, "parent", "Parent to add this item to. (runtime adding)", "''"},
-			{mvPythonDataType::String, "before", "This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
+			{mvPythonDataType::UUID, "parent", "Parent to add this item to. (runtime adding)", "''"},
+			{mvPythonDataType::UUID, "before", "This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
 			{mvPythonDataType::Integer, "width", "", "-1"},
 			{mvPythonDataType::Integer, "height", "", "-1"},
 			{mvPythonDataType::Callable , "query_callback", "Callback ran when plot is queried. Should be of the form 'def Callback(sender, data)'\n Data is (x_min, x_max, y_min, y_max).", "None"},
@@ -86,10 +88,10 @@ namespace Marvel {
 			{mvPythonDataType::Bool, "show_drag_lines", "", "True"},
 			{mvPythonDataType::Bool, "show_drag_points", "", "True"}
 
-		}, "Adds a plot widget.", "None", "Plotting") });
+		}, "Adds a plot widget.", "int", "Plotting") });
 
 		parsers->insert({ "add_drag_line", mvPythonParser({
-			{mvPythonDataType::String, "plot"},
+			{mvPythonDataType::UUID, "plot"},
 			{mvPythonDataType::String, "name"},
 			{mvPythonDataType::KeywordOnly},
 			{mvPythonDataType::String, "source", "", "''"},
@@ -102,12 +104,12 @@ namespace Marvel {
 		}, "Adds a drag line to a plot.", "None", "Plotting") });
 
 		parsers->insert({ "delete_drag_line", mvPythonParser({
-			{mvPythonDataType::String, "plot"},
+			{mvPythonDataType::UUID, "plot"},
 			{mvPythonDataType::String, "name"}
 		}, "Deletes a drag line if it exists.", "None", "Plotting") });
 
 		parsers->insert({ "add_drag_point", mvPythonParser({
-			{mvPythonDataType::String, "plot"},
+			{mvPythonDataType::UUID, "plot"},
 			{mvPythonDataType::String, "name"},
 			{mvPythonDataType::KeywordOnly},
 			{mvPythonDataType::String, "source", "", "''"},
@@ -120,12 +122,12 @@ namespace Marvel {
 		}, "Adds a drag point to a plot.", "None", "Plotting") });
 
 		parsers->insert({ "delete_drag_point", mvPythonParser({
-			{mvPythonDataType::String, "plot"},
+			{mvPythonDataType::UUID, "plot"},
 			{mvPythonDataType::String, "name"}
 		}, "Deletes a drag point if it exists.", "None", "Plotting") });
 
 		parsers->insert({ "add_annotation", mvPythonParser({
-			{mvPythonDataType::String, "plot"},
+			{mvPythonDataType::UUID, "plot"},
 			{mvPythonDataType::String, "text"},
 			{mvPythonDataType::Double, "x"},
 			{mvPythonDataType::Double, "y"},
@@ -138,7 +140,7 @@ namespace Marvel {
 		}, "Adds an annotation to a plot.", "None", "Plotting") });
 
 		parsers->insert({ "delete_annotation", mvPythonParser({
-			{mvPythonDataType::String, "plot"},
+			{mvPythonDataType::UUID, "plot"},
 			{mvPythonDataType::String, "name"},
 		}, "Deletes an annotation", "None", "Plotting") });
 	}
@@ -169,7 +171,7 @@ namespace Marvel {
 		return true;
 	}
 
-	static bool Check2ArraySizes(const char* name, const std::vector<float>* first, const std::vector<float>* second)
+	static bool Check2ArraySizes(const char* name, const std::vector<double>* first, const std::vector<double>* second)
 	{
 		if (second == nullptr)
 			return true;
@@ -177,7 +179,7 @@ namespace Marvel {
 		return first->size() == second->size();
 	}
 
-	static bool CheckArraySizes(const char* name, const std::vector<const std::vector<float>*>& arrays)
+	static bool CheckArraySizes(const char* name, const std::vector<const std::vector<double>*>& arrays)
 	{
 		for (size_t i = 0; i < arrays.size() - 1; i++)
 		{
@@ -190,57 +192,249 @@ namespace Marvel {
 		return true;
 	}
 
-	mvSeries::mvSeries(std::string name, const std::vector<const std::vector<float>*>& data, ImPlotYAxis_ axis)
+	mvSeries::mvSeries(std::string name, const std::vector<std::vector<double>*>& data, ImPlotYAxis_ axis)
 		:
 		m_name(name),
 		m_axis(axis)
 	{
 
-		for (const auto* list : data)
-			m_data.push_back(*list);
+		// the parsed vectors are temporaries of the calling command so they
+		// are moved in rather than copied
+		for (auto* list : data)
+			m_data.push_back(std::move(*list));
 
-		if (!m_data[0].empty())
+		if (!m_data.empty())
+			m_end = (long long)m_data[0].size();
+		updateBounds();
+	}
+
+	static void MinMax(const std::vector<double>& values, double& min, double& max)
+	{
+		if (values.empty())
+			return;
+
+		// chunked across the worker pool for large series
+		auto& parallel = mvApp::GetApp()->getParallel();
+		auto ranges = parallel.split(values.size());
+		std::vector<std::pair<double, double>> results(ranges.size());
+		parallel.run(ranges.size(), [&](size_t i)
+			{
+				double chunkMin = values[ranges[i].first];
+				double chunkMax = chunkMin;
+				for (size_t j = ranges[i].first + 1; j < ranges[i].second; j++)
+				{
+					if (values[j] > chunkMax) chunkMax = values[j];
+					if (values[j] < chunkMin) chunkMin = values[j];
+				}
+				results[i] = { chunkMin, chunkMax };
+			});
+
+		min = results[0].first;
+		max = results[0].second;
+		for (const auto& result : results)
 		{
-			m_maxX = m_data[0][0];
-			m_minX = m_data[0][0];
+			if (result.second > max) max = result.second;
+			if (result.first < min) min = result.first;
 		}
+	}
+
+	void mvSeries::updateBounds()
+	{
+		MinMax(m_data[0], m_minX, m_maxX);
 
 		if (m_data.size() > 1)
+			MinMax(m_data[1], m_minY, m_maxY);
+	}
+
+	mvSeries::mvSeries(std::string name, const ImPlotPoint& boundsMin, const ImPlotPoint& boundsMax, ImPlotYAxis_ axis)
+		:
+		m_name(std::move(name)),
+		m_axis(axis)
+	{
+		m_maxX = boundsMax.x;
+		m_maxY = boundsMax.y;
+		m_minX = boundsMin.x;
+		m_minY = boundsMin.y;
+	}
+
+	mvSeries::~mvSeries()
+	{
+		for (const auto& source : m_sourceNames)
+			mvApp::GetApp()->getValueStorage().DecrementRef(source);
+	}
+
+	void mvSeries::bindSources(const std::vector<std::string>& sources)
+	{
+		for (const auto& source : sources)
+		{
+			m_sourceNames.push_back(source);
+			m_sources.push_back(mvApp::GetApp()->getValueStorage().AddFloatVectorValue(source));
+		}
+
+		m_sourceData.assign(m_sources.size(), nullptr);
+		getBoundCount();
+	}
+
+	int mvSeries::getBoundCount()
+	{
+		refreshBounds();
+		return m_sourceCount;
+	}
+
+	bool mvSeries::refreshBounds()
+	{
+		size_t count = m_sources[0]->size();
+		bool changed = false;
+		for (size_t i = 0; i < m_sources.size(); i++)
 		{
-			if (!m_data[1].empty())
+			count = std::min(count, m_sources[i]->size());
+			if (m_sourceData[i] != m_sources[i]->data())
 			{
-				m_maxY = m_data[1][0];
-				m_minY = m_data[1][0];
+				m_sourceData[i] = m_sources[i]->data();
+				changed = true;
 			}
 		}
 
-		for (const auto& x : m_data[0])
+		if (!changed && (int)count == m_sourceCount)
+			return false;
+
+		changed = (int)count != m_sourceCount;
+		double minX = m_minX;
+		double maxX = m_maxX;
+		double minY = m_minY;
+		double maxY = m_maxY;
+
+		m_sourceCount = (int)count;
+		if (count > 0)
 		{
-			if (x > m_maxX) m_maxX = x;
-			if (x < m_minX) m_minX = x;
+			const auto& xs = *m_sources[0];
+			const auto& ys = *m_sources[1];
+			m_minX = m_maxX = xs[0];
+			m_minY = m_maxY = ys[0];
+			for (size_t i = 1; i < count; i++)
+			{
+				if (xs[i] > m_maxX) m_maxX = xs[i];
+				if (xs[i] < m_minX) m_minX = xs[i];
+				if (ys[i] > m_maxY) m_maxY = ys[i];
+				if (ys[i] < m_minY) m_minY = ys[i];
+			}
+		}
+
+		return changed || minX != m_minX || maxX != m_maxX || minY != m_minY || maxY != m_maxY;
+	}
+
+	void mvSeries::appendData(const std::vector<double>& x, const std::vector<double>& y)
+	{
+		bool recompute = m_data[0].empty();
+
+		for (size_t i = 0; i < x.size(); i++)
+		{
+			if (m_maxPoints == 0 || m_data[0].size() < m_maxPoints)
+			{
+				m_data[0].push_back(x[i]);
+				m_data[1].push_back(y[i]);
+			}
+			else
+			{
+				// a bound leaving the buffer requires a full recompute
+				double oldx = m_data[0][m_offset];
+				double oldy = m_data[1][m_offset];
+				if (oldx <= m_minX || oldx >= m_maxX || oldy <= m_minY || oldy >= m_maxY)
+					recompute = true;
+
+				m_data[0][m_offset] = x[i];
+				m_data[1][m_offset] = y[i];
+				m_offset = (m_offset + 1) % (int)m_maxPoints;
+			}
 
+			if (!recompute)
+			{
+				if (x[i] > m_maxX) m_maxX = x[i];
+				if (x[i] < m_minX) m_minX = x[i];
+				if (y[i] > m_maxY) m_maxY = y[i];
+				if (y[i] < m_minY) m_minY = y[i];
+			}
 		}
 
-		if (m_data.size() > 1)
+		if (recompute)
+			updateBounds();
+
+		m_end += (long long)x.size();
+		m_version++;
+	}
+
+	void mvSeries::setMaxPoints(size_t maxPoints)
+	{
+		// unwrap the ring buffer so the oldest point is first again
+		for (auto& column : m_data)
+		{
+			if (m_offset > 0 && m_offset < (int)column.size())
+				std::rotate(column.begin(), column.begin() + m_offset, column.end());
+
+			if (maxPoints > 0 && column.size() > maxPoints)
+				column.erase(column.begin(), column.begin() + (column.size() - maxPoints));
+		}
+
+		m_offset = 0;
+		m_maxPoints = maxPoints;
+		m_version++;
+		updateBounds();
+	}
+
+	const std::vector<std::vector<double>>* mvSeries::getLOD()
+	{
+		// fitting needs the extremes of the whole series
+		double xmin = std::numeric_limits<double>::lowest();
+		double xmax = std::numeric_limits<double>::max();
+		if (!ImPlot::FitThisFrame())
+		{
+			ImPlotLimits limits = ImPlot::GetPlotLimits();
+			xmin = limits.X.Min;
+			xmax = limits.X.Max;
+		}
+
+		if (!m_lod.update(m_data, m_offset, m_end, xmin, xmax, (int)ImPlot::GetPlotSize().x))
+			return nullptr;
+
+		return &m_lod.getData();
+	}
+
+	int mvSeries::findNearest(double x, double y, double sx, double sy, double radius, double& distance)
+	{
+		if (!isBound())
+			return m_index.nearest(m_data, m_offset, m_version, x, y, sx, sy, radius, distance);
+
+		// bound sources can change in place, so they are scanned
+		int count = getBoundCount();
+		const float* xs = m_sources[0]->data();
+		const float* ys = m_sources[1]->data();
+
+		int best = -1;
+		double bestDistance = radius * radius;
+		for (int i = 0; i < count; i++)
 		{
-			for (const auto& y : m_data[1])
+			double dx = (xs[i] - x) * sx;
+			double dy = (ys[i] - y) * sy;
+			double d = dx * dx + dy * dy;
+			if (d <= bestDistance)
 			{
-				if (y > m_maxY) m_maxY = y;
-				if (y < m_minY) m_minY = y;
+				best = i;
+				bestDistance = d;
 			}
 		}
 
+		if (best != -1)
+			distance = std::sqrt(bestDistance);
+		return best;
 	}
 
-	mvSeries::mvSeries(std::string name, const ImPlotPoint& boundsMin, const ImPlotPoint& boundsMax, ImPlotYAxis_ axis)
-		:
-		m_name(std::move(name)),
-		m_axis(axis)
+	ImPlotPoint mvSeries::getPoint(int index) const
 	{
-		m_maxX = (float)boundsMax.x;
-		m_maxY = (float)boundsMax.y;
-		m_minX = (float)boundsMin.x;
-		m_minY = (float)boundsMin.y;
+		if (isBound())
+			return { (*m_sources[0])[index], (*m_sources[1])[index] };
+
+		size_t i = (index + m_offset) % m_data[0].size();
+		return { m_data[0][i], m_data[1][i] };
 	}
 
 	mvPlot::mvPlot(const std::string& name, PyObject* queryCallback)
@@ -441,92 +635,125 @@ namespace Marvel {
 		}
 	}
 
-	void mvPlot::addSeries(mvRef<mvSeries> series, bool updateBounds)
+	void mvPlot::extendLimits(const mvSeries& series, bool first)
 	{
 
-		if (m_series.empty())
+		if (first)
 		{
 			if (!m_setXLimits)
 			{
-				m_xlimits.x = series->m_minX;
-				m_xlimits.y = series->m_maxX;
+				m_xlimits.x = series.m_minX;
+				m_xlimits.y = series.m_maxX;
 			}
 
-			if (!m_setYLimits && series->m_axis == ImPlotYAxis_1)
+			if (!m_setYLimits && series.m_axis == ImPlotYAxis_1)
 			{
-				m_ylimits.x = series->m_minY;
-				m_ylimits.y = series->m_maxY;
+				m_ylimits.x = series.m_minY;
+				m_ylimits.y = series.m_maxY;
 			}
-			else if (!m_setY2Limits && series->m_axis == ImPlotYAxis_2)
+			else if (!m_setY2Limits && series.m_axis == ImPlotYAxis_2)
 			{
-				m_y2limits.x = series->m_minY;
-				m_y2limits.y = series->m_maxY;
+				m_y2limits.x = series.m_minY;
+				m_y2limits.y = series.m_maxY;
 			}
-			else if (!m_setY3Limits && series->m_axis == ImPlotYAxis_3)
+			else if (!m_setY3Limits && series.m_axis == ImPlotYAxis_3)
 			{
-				m_y3limits.x = series->m_minY;
-				m_y3limits.y = series->m_maxY;
+				m_y3limits.x = series.m_minY;
+				m_y3limits.y = series.m_maxY;
 			}
 		}
 		else
 		{
-			if (series->m_minX < m_xlimits.x && !m_setXLimits) m_xlimits.x = series->m_minX;
-			if (series->m_maxX > m_xlimits.y && !m_setXLimits) m_xlimits.y = series->m_maxX;
+			if (series.m_minX < m_xlimits.x && !m_setXLimits) m_xlimits.x = series.m_minX;
+			if (series.m_maxX > m_xlimits.y && !m_setXLimits) m_xlimits.y = series.m_maxX;
 
-			if (series->m_axis == ImPlotYAxis_1)
+			if (series.m_axis == ImPlotYAxis_1)
 			{
-				if (series->m_minY < m_ylimits.x && !m_setYLimits) m_ylimits.x = series->m_minY;
-				if (series->m_maxY > m_ylimits.y && !m_setYLimits) m_ylimits.y = series->m_maxY;
+				if (series.m_minY < m_ylimits.x && !m_setYLimits) m_ylimits.x = series.m_minY;
+				if (series.m_maxY > m_ylimits.y && !m_setYLimits) m_ylimits.y = series.m_maxY;
 			}
-			else if (series->m_axis == ImPlotYAxis_2)
+			else if (series.m_axis == ImPlotYAxis_2)
 			{
-				if (series->m_minY < m_y2limits.x && !m_setY2Limits) m_y2limits.x = series->m_minY;
-				if (series->m_maxY > m_y2limits.y && !m_setY2Limits) m_y2limits.y = series->m_maxY;
+				if (series.m_minY < m_y2limits.x && !m_setY2Limits) m_y2limits.x = series.m_minY;
+				if (series.m_maxY > m_y2limits.y && !m_setY2Limits) m_y2limits.y = series.m_maxY;
 			}
-			else if (series->m_axis == ImPlotYAxis_3)
+			else if (series.m_axis == ImPlotYAxis_3)
 			{
-				if (series->m_minY < m_y3limits.x && !m_setY3Limits) m_y3limits.x = series->m_minY;
-				if (series->m_maxY > m_y3limits.y && !m_setY3Limits) m_y3limits.y = series->m_maxY;
+				if (series.m_minY < m_y3limits.x && !m_setY3Limits) m_y3limits.x = series.m_minY;
+				if (series.m_maxY > m_y3limits.y && !m_setY3Limits) m_y3limits.y = series.m_maxY;
 			}
 		}
 
-		m_series.push_back(series);
+	}
 
-		if(updateBounds)
-			m_dirty = true;
+	bool mvPlot::touchesLimits(const mvSeries& series) const
+	{
+		const ImVec2& ylimits = series.m_axis == ImPlotYAxis_2 ? m_y2limits :
+			series.m_axis == ImPlotYAxis_3 ? m_y3limits : m_ylimits;
+
+		return (float)series.m_minX <= m_xlimits.x || (float)series.m_maxX >= m_xlimits.y ||
+			(float)series.m_minY <= ylimits.x || (float)series.m_maxY >= ylimits.y;
 	}
 
-	void mvPlot::updateSeries(mvRef<mvSeries> series, bool updateBounds)
+	void mvPlot::recomputeLimits()
 	{
+		// merges the cached bounds of every series, the data itself is not visited
+		bool firstX = true;
+		bool firstY[3] = { true, true, true };
+		ImVec2* ylimits[3] = { &m_ylimits, &m_y2limits, &m_y3limits };
+		bool ylimitsSet[3] = { m_setYLimits, m_setY2Limits, m_setY3Limits };
 
-		// check if series exist
-		bool exists = false;
-		for (auto& item : m_series)
+		for (const auto& series : m_series)
 		{
-			if (item->getName() == series->getName() && series->getSeriesType() == item->getSeriesType())
+			if (!m_setXLimits)
 			{
-				exists = true;
-				break;
+				if (firstX || series->m_minX < m_xlimits.x) m_xlimits.x = (float)series->m_minX;
+				if (firstX || series->m_maxX > m_xlimits.y) m_xlimits.y = (float)series->m_maxX;
 			}
+			firstX = false;
+
+			int axis = series->m_axis == ImPlotYAxis_2 ? 1 : series->m_axis == ImPlotYAxis_3 ? 2 : 0;
+			if (!ylimitsSet[axis])
+			{
+				if (firstY[axis] || series->m_minY < ylimits[axis]->x) ylimits[axis]->x = (float)series->m_minY;
+				if (firstY[axis] || series->m_maxY > ylimits[axis]->y) ylimits[axis]->y = (float)series->m_maxY;
+			}
+			firstY[axis] = false;
 		}
+	}
 
-		if (exists)
-		{
-			auto oldSeries = m_series;
-			m_series.clear();
+	void mvPlot::addSeries(mvRef<mvSeries> series, bool updateBounds)
+	{
+		extendLimits(*series, m_series.empty());
 
-			for (auto& item : oldSeries)
-			{
-				if (item->getName() == series->getName() && series->getSeriesType() == item->getSeriesType())
-				{
-					item = nullptr;
-					addSeries(series, updateBounds);
-					continue;
-				}
+		m_seriesIndex.insert({ series->getName(), m_series.size() });
+		m_series.push_back(series);
 
-				m_series.push_back(item);
-			}
+		if(updateBounds)
+			m_dirty = true;
+	}
+
+	void mvPlot::updateSeries(mvRef<mvSeries> series, bool updateBounds)
+	{
 
+		// replace in place if the series exist
+		auto range = m_seriesIndex.equal_range(series->getName());
+		for (auto it = range.first; it != range.second; ++it)
+		{
+			auto& item = m_series[it->second];
+			if (item->getSeriesType() != series->getSeriesType())
+				continue;
+
+			// limits only need a full merge if the old series was on an edge
+			bool onEdge = touchesLimits(*item);
+			item = series;
+			if (onEdge)
+				recomputeLimits();
+			else
+				extendLimits(*series, false);
+
+			if (updateBounds)
+				m_dirty = true;
 			return;
 		}
 
@@ -536,35 +763,79 @@ namespace Marvel {
 	void mvPlot::deleteSeries(const std::string& name)
 	{
 
-		// check if series exist
-		bool exists = false;
-		for (auto& item : m_series)
+		if (m_seriesIndex.find(name) == m_seriesIndex.end())
+			return;
+
+		m_series.erase(std::remove_if(m_series.begin(), m_series.end(),
+			[&name](const mvRef<mvSeries>& item) { return item->getName() == name; }), m_series.end());
+
+		m_seriesIndex.clear();
+		for (size_t i = 0; i < m_series.size(); i++)
+			m_seriesIndex.insert({ m_series[i]->getName(), i });
+
+		recomputeLimits();
+	}
+
+	void mvPlot::fitSeries(bool updateBounds)
+	{
+		recomputeLimits();
+
+		if (updateBounds)
+			m_dirty = true;
+	}
+
+	mvRef<mvSeries> mvPlot::getSeries(const std::string& name)
+	{
+		// lowest index so the result does not depend on the hash order
+		mvRef<mvSeries> result = nullptr;
+		size_t index = m_series.size();
+		auto range = m_seriesIndex.equal_range(name);
+		for (auto it = range.first; it != range.second; ++it)
 		{
-			if (item->getName() == name)
+			if (it->second < index)
 			{
-				exists = true;
-				break;
+				index = it->second;
+				result = m_series[index];
 			}
 		}
+		return result;
+	}
 
-		if (exists)
-		{
-			auto oldSeries = m_series;
-			m_series.clear();
+	std::vector<mvNearestPoint> mvPlot::getNearestPoints(double x, double y, float radius)
+	{
+		std::vector<mvNearestPoint> result;
 
-			for (auto& item : oldSeries)
+		for (const auto& series : m_series)
+		{
+			switch (series->getSeriesType())
 			{
-				if (item->getName() == name)
-				{
-					item = nullptr;
-					continue;
-				}
-
-				m_series.push_back(item);
+			case mvSeries::mvSeriesType::Line:
+			case mvSeries::mvSeriesType::Scatter:
+			case mvSeries::mvSeriesType::Stair:
+			case mvSeries::mvSeriesType::Stem:
+			case mvSeries::mvSeriesType::Bar:
+			case mvSeries::mvSeriesType::Shade:
+			case mvSeries::mvSeriesType::Area:
+			case mvSeries::mvSeriesType::Error:
+				break;
+			default:
+				continue;
 			}
 
+			double sy = m_pixelsPerUnit[1 + (int)series->getAxis()];
+			double distance = 0.0;
+			int index = series->findNearest(x, y, m_pixelsPerUnit[0], sy, radius, distance);
+			if (index == -1)
+				continue;
+
+			ImPlotPoint point = series->getPoint(index);
+			result.push_back({ series->getName(), index, point.x, point.y, distance });
 		}
 
+		std::stable_sort(result.begin(), result.end(),
+			[](const mvNearestPoint& a, const mvNearestPoint& b) { return a.distance < b.distance; });
+
+		return result;
 	}
 
 	void mvPlot::SetColorMap(ImPlotColormap colormap)
@@ -615,6 +886,7 @@ namespace Marvel {
 			mvApp::GetApp()->getValueStorage().DecrementRef(point.source);
 
 		m_series.clear();
+		m_seriesIndex.clear();
 		m_annotations.clear();
 		m_dragLines.clear();
 		m_dragPoints.clear();
@@ -631,6 +903,17 @@ namespace Marvel {
 
 		ImGui::PushID(m_colormap);
 
+		// bound sources change through the value storage, the limits are
+		// refit here since the series only see it once they are drawn
+		bool refit = false;
+		for (auto& series : m_series)
+		{
+			if (series->isBound() && series->refreshBounds())
+				refit = true;
+		}
+		if (refit)
+			fitSeries(true);
+
 		if (m_setXLimits || m_dirty)
 			ImPlot::SetNextPlotLimitsX(m_xlimits.x, m_xlimits.y, ImGuiCond_Always);
 
@@ -762,6 +1045,10 @@ namespace Marvel {
 			if (ImPlot::IsPlotHovered())
 				mvInput::setPlotMousePosition((float)ImPlot::GetPlotMousePos().x, (float)ImPlot::GetPlotMousePos().y);
 
+			// lazy rendering: tooltips, crosshairs and queries follow the mouse
+			if (m_queried || ImPlot::IsPlotHovered())
+				mvApp::RequestRedraw(1);
+
 			m_xlimits_actual.x = ImPlot::GetPlotLimits().X.Min;
 			m_xlimits_actual.y = ImPlot::GetPlotLimits().X.Max;
 			m_ylimits_actual.x = ImPlot::GetPlotLimits().Y.Min;
@@ -771,6 +1058,16 @@ namespace Marvel {
 			m_y3limits_actual.x = ImPlot::GetPlotLimits(ImPlotYAxis_3).Y.Min;
 			m_y3limits_actual.y = ImPlot::GetPlotLimits(ImPlotYAxis_3).Y.Max;
 
+			// nearest point queries measure in pixels
+			ImVec2 plotSize = ImPlot::GetPlotSize();
+			double xsize = ImPlot::GetPlotLimits().X.Size();
+			m_pixelsPerUnit[0] = xsize > 0.0 ? plotSize.x / xsize : 0.0;
+			for (int i = 0; i < 3; i++)
+			{
+				double ysize = ImPlot::GetPlotLimits(i).Y.Size();
+				m_pixelsPerUnit[1 + i] = ysize > 0.0 ? plotSize.y / ysize : 0.0;
+			}
+
 			ImPlot::EndPlot();
 		}
 
@@ -1039,8 +1336,8 @@ namespace Marvel {
 		int y3axis_lock_min = false;
 		int y3axis_lock_max = false;
 
-		const char* parent = "";
-		const char* before = "";
+		mvItemArg parent;
+		mvItemArg before;
 		int width = -1;
 		int height = -1;
 		PyObject* query_callback = nullptr;
@@ -1104,12 +1401,12 @@ namespace Marvel {
 
 		mvApp::GetApp()->getItemRegistry().addItemWithRuntimeChecks(item, parent, before);
 		
-		return GetPyNone();
+		return ToPyUUID(item->getUUID());
 	}
 
 	PyObject* add_drag_line(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
-		const char* plot;
+		mvItemArg plot;
 		const char* name;
 		const char* source = "";
 		PyObject* color = PyTuple_New(4);
@@ -1131,14 +1428,14 @@ namespace Marvel {
 
 		if (aplot == nullptr)
 		{
-			std::string message = plot;
+			std::string message = plot.str();
 			ThrowPythonException(message + " plot does not exist.");
 			return GetPyNone();
 		}
 
 		if (aplot->getType() != mvAppItemType::Plot)
 		{
-			std::string message = plot;
+			std::string message = plot.str();
 			ThrowPythonException(message + " is not a plot.");
 			return GetPyNone();
 		}
@@ -1155,7 +1452,7 @@ namespace Marvel {
 
 	PyObject* delete_drag_line(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
-		const char* plot;
+		mvItemArg plot;
 		const char* name;
 
 		if (!(*mvApp::GetApp()->getParsers())["delete_drag_line"].parse(args, kwargs, __FUNCTION__,
@@ -1166,14 +1463,14 @@ namespace Marvel {
 
 		if (aplot == nullptr)
 		{
-			std::string message = plot;
+			std::string message = plot.str();
 			ThrowPythonException(message + " plot does not exist.");
 			return GetPyNone();
 		}
 
 		if (aplot->getType() != mvAppItemType::Plot)
 		{
-			std::string message = plot;
+			std::string message = plot.str();
 			ThrowPythonException(message + " is not a plot.");
 			return GetPyNone();
 		}
@@ -1187,7 +1484,7 @@ namespace Marvel {
 
 	PyObject* add_drag_point(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
-		const char* plot;
+		mvItemArg plot;
 		const char* name;
 		const char* source = "";
 		PyObject* color = PyTuple_New(4);
@@ -1209,14 +1506,14 @@ namespace Marvel {
 
 		if (aplot == nullptr)
 		{
-			std::string message = plot;
+			std::string message = plot.str();
 			ThrowPythonException(message + " plot does not exist.");
 			return GetPyNone();
 		}
 
 		if (aplot->getType() != mvAppItemType::Plot)
 		{
-			std::string message = plot;
+			std::string message = plot.str();
 			ThrowPythonException(message + " is not a plot.");
 			return GetPyNone();
 		}
@@ -1234,7 +1531,7 @@ namespace Marvel {
 
 	PyObject* delete_drag_point(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
-		const char* plot;
+		mvItemArg plot;
 		const char* name;
 
 		if (!(*mvApp::GetApp()->getParsers())["delete_drag_point"].parse(args, kwargs, __FUNCTION__,
@@ -1245,14 +1542,14 @@ namespace Marvel {
 
 		if (aplot == nullptr)
 		{
-			std::string message = plot;
+			std::string message = plot.str();
 			ThrowPythonException(message + " plot does not exist.");
 			return GetPyNone();
 		}
 
 		if (aplot->getType() != mvAppItemType::Plot)
 		{
-			std::string message = plot;
+			std::string message = plot.str();
 			ThrowPythonException(message + " is not a plot.");
 			return GetPyNone();
 		}
@@ -1266,7 +1563,7 @@ namespace Marvel {
 
 	PyObject* add_annotation(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
-		const char* plot;
+		mvItemArg plot;
 		const char* text;
 		double x;
 		double y;
@@ -1288,14 +1585,14 @@ namespace Marvel {
 
 		if (aplot == nullptr)
 		{
-			std::string message = plot;
+			std::string message = plot.str();
 			ThrowPythonException(message + " plot does not exist.");
 			return GetPyNone();
 		}
 
 		if (aplot->getType() != mvAppItemType::Plot)
 		{
-			std::string message = plot;
+			std::string message = plot.str();
 			ThrowPythonException(message + " is not a plot.");
 			return GetPyNone();
 		}
@@ -1309,7 +1606,7 @@ namespace Marvel {
 
 	PyObject* delete_annotation(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
-		const char* plot;
+		mvItemArg plot;
 		const char* name;
 
 		if (!(*mvApp::GetApp()->getParsers())["delete_annotation"].parse(args, kwargs, __FUNCTION__,
@@ -1320,14 +1617,14 @@ namespace Marvel {
 
 		if (aplot == nullptr)
 		{
-			std::string message = plot;
+			std::string message = plot.str();
 			ThrowPythonException(message + " plot does not exist.");
 			return GetPyNone();
 		}
 
 		if (aplot->getType() != mvAppItemType::Plot)
 		{
-			std::string message = plot;
+			std::string message = plot.str();
 			ThrowPythonException(message + " is not a plot.");
 			return GetPyNone();
 		}
@@ -4,11 +4,14 @@
 #include <implot.h>
 #include <implot_internal.h>
 #include <map>
+#include <unordered_map>
 #include <utility>
 #include "mvCore.h"
 #define PY_SSIZE_T_CLEAN
 #include <Python.h>
 #include "mvPythonParser.h"
+#include "mvSeriesLOD.h"
+#include "mvSeriesIndex.h"
 
 //-----------------------------------------------------------------------------
 // Widget Index
@@ -36,6 +39,7 @@ namespace Marvel {
 	struct mvPlotAnnotation;
 	struct mvDragLine;
 	struct mvDragPoint;
+	struct mvNearestPoint;
 
 	//-----------------------------------------------------------------------------
 	// mvPlot
@@ -73,6 +77,12 @@ namespace Marvel {
 		void addSeries      (mvRef<mvSeries> series, bool updateBounds);
 		void updateSeries   (mvRef<mvSeries> series, bool updateBounds);
 		void deleteSeries   (const std::string& name);
+		void fitSeries      (bool updateBounds); // recomputes limits after streamed data
+		mvRef<mvSeries> getSeries(const std::string& name);
+
+		// closest point of each x/y series within radius pixels of (x, y),
+		// using the axes as of the last frame, nearest first
+		std::vector<mvNearestPoint> getNearestPoints(double x, double y, float radius);
 
 		// settings
 		void SetColorMap    (ImPlotColormap colormap);
@@ -116,6 +126,10 @@ namespace Marvel {
 
 	private:
 
+		void extendLimits   (const mvSeries& series, bool first);
+		void recomputeLimits();
+		bool touchesLimits  (const mvSeries& series) const;
+
 		// new
 		std::string                   m_xaxisName;
 		std::string                   m_yaxisName;
@@ -154,7 +168,8 @@ namespace Marvel {
 		std::vector<double>           m_xlabelLocations;
 		std::vector<double>           m_ylabelLocations;
 
-		std::vector<mvRef<mvSeries>>  m_series;
+		std::vector<mvRef<mvSeries>>  m_series; // draw order
+		std::unordered_multimap<std::string, size_t> m_seriesIndex; // name -> position in m_series
 		std::vector<mvPlotAnnotation> m_annotations;
 		std::vector<mvDragLine>       m_dragLines;
 		std::vector<mvDragPoint>      m_dragPoints;
@@ -168,6 +183,8 @@ namespace Marvel {
 		bool                          m_setY3Limits = false;
 		ImVec2                        m_y3limits;
 		ImVec2                        m_y3limits_actual;
+
+		double                        m_pixelsPerUnit[4] = {}; // x, y, y2, y3 as of the last frame
 	};
 
 	//-----------------------------------------------------------------------------
@@ -216,6 +233,18 @@ namespace Marvel {
 		std::string source;
 	};
 
+	//-----------------------------------------------------------------------------
+	// mvNearestPoint
+	//-----------------------------------------------------------------------------
+	struct mvNearestPoint
+	{
+		std::string series;
+		int         index;
+		double      x;
+		double      y;
+		double      distance; // pixels
+	};
+
 	//-----------------------------------------------------------------------------
 	// mvSeries
 	//-----------------------------------------------------------------------------
@@ -233,11 +262,11 @@ namespace Marvel {
 			Stair, Candle
 		};
 
-		mvSeries(std::string name, const std::vector<const std::vector<float>*>& data, ImPlotYAxis_ axis = ImPlotYAxis_1);
+		mvSeries(std::string name, const std::vector<std::vector<double>*>& data, ImPlotYAxis_ axis = ImPlotYAxis_1);
 
 		mvSeries(std::string name, const ImPlotPoint& boundsMin, const ImPlotPoint& boundsMax, ImPlotYAxis_ axis = ImPlotYAxis_1);
 
-		virtual ~mvSeries() = default;
+		virtual ~mvSeries();
 
 		virtual void draw() = 0;
 		virtual mvSeriesType getSeriesType() = 0;
@@ -246,17 +275,60 @@ namespace Marvel {
 
 		void setWeight(float weight) { m_weight = weight; }
 
+		// streaming (x/y series only), the oldest points are overwritten
+		// once max points is reached (0 means unbounded)
+		void   appendData  (const std::vector<double>& x, const std::vector<double>& y);
+		void   setMaxPoints(size_t maxPoints);
+		size_t getMaxPoints() const { return m_maxPoints; }
+
+		// columns shared through float vectors in the value storage instead
+		// of owned data (x/y series only)
+		void   bindSources (const std::vector<std::string>& sources);
+		bool   isBound     () const { return !m_sources.empty(); }
+
+		// logical index of the point closest to (x, y) within radius once
+		// the axes are scaled by sx and sy (pixels per unit), or -1
+		int    findNearest (double x, double y, double sx, double sy, double radius, double& distance);
+		ImPlotYAxis_ getAxis() const { return m_axis; }
+		ImPlotPoint  getPoint(int index) const;
+
 	protected:
 
-		std::string                     m_name;
-		ImPlotYAxis_                    m_axis = ImPlotYAxis_1;
-		std::vector<std::vector<float>> m_data;
+		void updateBounds();
+
+		// decimated data for the visible range or nullptr if
+		// the full data should be drawn (only valid inside draw)
+		const std::vector<std::vector<double>>* getLOD();
+
+		// points available in every bound source, refreshes the bounds
+		// if a source was reassigned
+		int getBoundCount();
+
+		// recomputes the bounds if a bound source was reassigned or resized,
+		// true if the point count or the bounds changed
+		bool refreshBounds();
+
+	protected:
 
-		float                           m_maxX;
-		float                           m_maxY;
-		float                           m_minX;
-		float                           m_minY;
-		float                           m_weight = 1.0f;
+		std::string                      m_name;
+		ImPlotYAxis_                     m_axis = ImPlotYAxis_1;
+		std::vector<std::vector<double>> m_data;
+
+		double                           m_maxX = 0.0;
+		double                           m_maxY = 0.0;
+		double                           m_minX = 0.0;
+		double                           m_minY = 0.0;
+		float                            m_weight = 1.0f;
+		size_t                           m_maxPoints = 0;
+		int                              m_offset = 0; // oldest point once the ring buffer is full
+		int                              m_version = 0; // bumped when data changes in place
+		long long                        m_end = 0; // points appended since creation, including the initial ones
+		mvSeriesLOD                      m_lod;
+		mvSeriesIndex                    m_index;
+		std::vector<std::string>         m_sourceNames;
+		std::vector<std::vector<float>*> m_sources;
+		std::vector<const float*>        m_sourceData; // detects reassigned sources
+		int                              m_sourceCount = 0;
 		
 	};
 }
@@ -9,8 +9,8 @@ namespace Marvel {
 
 	public:
 
-		mvScatterSeries(const std::string& name, const std::vector<float>* x, 
-			const std::vector<float>* y, int marker, float markerSize, float markerWeight,
+		mvScatterSeries(const std::string& name, std::vector<double>* x, 
+			std::vector<double>* y, int marker, float markerSize, float markerWeight,
 			mvColor markerOutlineColor, mvColor markerFillColor, ImPlotYAxis_ axis)
 			: 
 			mvSeries(name, {x, y}, axis),
@@ -33,7 +33,10 @@ namespace Marvel {
 			ImPlot::PushStyleVar(ImPlotStyleVar_MarkerSize, m_markerSize);
 			ImPlot::PushStyleVar(ImPlotStyleVar_MarkerWeight, m_markerWeight);
 
-			ImPlot::PlotScatter(m_name.c_str(), m_data[0].data(), m_data[1].data(), (int)m_data[0].size());
+			if (isBound())
+				ImPlot::PlotScatter(m_name.c_str(), m_sources[0]->data(), m_sources[1]->data(), getBoundCount());
+			else
+				ImPlot::PlotScatter(m_name.c_str(), m_data[0].data(), m_data[1].data(), (int)m_data[0].size(), m_offset);
 
 			ImPlot::PopStyleColor();
 			ImPlot::PopStyleColor();
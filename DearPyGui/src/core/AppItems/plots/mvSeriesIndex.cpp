@@ -0,0 +1,199 @@
+#include "mvSeriesIndex.h"
+#include "mvApp.h"
+#include <algorithm>
+#include <atomic>
+#include <cmath>
+
+namespace Marvel {
+
+	static constexpr int PointsPerCell = 8;  // average occupancy of the grid
+	static constexpr int MaxGrid = 1024;     // cells per side
+
+	int mvSeriesIndex::nearest(const std::vector<std::vector<double>>& data, int offset, int version,
+		double x, double y, double sx, double sy, double radius, double& distance)
+	{
+		if (data.size() < 2 || data[0].empty() || sx <= 0.0 || sy <= 0.0)
+			return -1;
+
+		int count = (int)data[0].size();
+		auto px = [&](int i) { return data[0][(i + offset) % count]; };
+		auto py = [&](int i) { return data[1][(i + offset) % count]; };
+
+		int best = -1;
+		double bestDistance = radius * radius;
+		auto test = [&](int i)
+		{
+			double dx = (px(i) - x) * sx;
+			double dy = (py(i) - y) * sy;
+			double d = dx * dx + dy * dy;
+			if (d <= bestDistance)
+			{
+				best = i;
+				bestDistance = d;
+			}
+		};
+
+		double rx = radius / sx;
+		double ry = radius / sy;
+
+		if (count < MinPoints)
+		{
+			for (int i = 0; i < count; i++)
+				test(i);
+		}
+		else
+		{
+			if (version != m_version)
+			{
+				m_version = version;
+				build(data, offset);
+			}
+
+			if (m_sorted)
+			{
+				int lo = 0;
+				int hi = count;
+				while (lo < hi)
+				{
+					int mid = lo + (hi - lo) / 2;
+					if (px(mid) < x - rx) lo = mid + 1;
+					else hi = mid;
+				}
+
+				for (int i = lo; i < count && px(i) <= x + rx; i++)
+					test(i);
+			}
+			else
+			{
+				if (x + rx < m_minX || x - rx > m_maxX || y + ry < m_minY || y - ry > m_maxY)
+					return -1;
+
+				auto cell = [&](double value, double min, double max)
+				{
+					if (max <= min) return 0;
+					return (int)std::clamp((value - min) / (max - min) * m_grid, 0.0, (double)(m_grid - 1));
+				};
+
+				int cx0 = cell(x - rx, m_minX, m_maxX);
+				int cx1 = cell(x + rx, m_minX, m_maxX);
+				int cy0 = cell(y - ry, m_minY, m_maxY);
+				int cy1 = cell(y + ry, m_minY, m_maxY);
+
+				for (int cy = cy0; cy <= cy1; cy++)
+				{
+					for (int cx = cx0; cx <= cx1; cx++)
+					{
+						int c = cy * m_grid + cx;
+						for (int j = m_cellStart[c]; j < m_cellStart[c + 1]; j++)
+							test(m_points[j]);
+					}
+				}
+			}
+		}
+
+		if (best != -1)
+			distance = std::sqrt(bestDistance);
+		return best;
+	}
+
+	void mvSeriesIndex::build(const std::vector<std::vector<double>>& data, int offset)
+	{
+		m_cellStart.clear();
+		m_points.clear();
+
+		int count = (int)data[0].size();
+		auto px = [&](int i) { return data[0][(i + offset) % count]; };
+		auto py = [&](int i) { return data[1][(i + offset) % count]; };
+
+		// sorting check, bounds and cells are chunked across the worker pool
+		auto& parallel = mvApp::GetApp()->getParallel();
+		auto ranges = parallel.split(count);
+
+		std::atomic_bool sorted = true;
+		parallel.run(ranges.size(), [&](size_t i)
+			{
+				for (int j = std::max((int)ranges[i].first, 1); j < (int)ranges[i].second && sorted; j++)
+				{
+					if (px(j) < px(j - 1))
+						sorted = false;
+				}
+			});
+
+		m_sorted = sorted;
+		if (m_sorted)
+			return;
+
+		// grid over the finite points, others are never found
+		struct Bounds { bool empty = true; double minX, maxX, minY, maxY; };
+		std::vector<Bounds> bounds(ranges.size());
+		parallel.run(ranges.size(), [&](size_t i)
+			{
+				auto& b = bounds[i];
+				for (int j = (int)ranges[i].first; j < (int)ranges[i].second; j++)
+				{
+					double x = px(j);
+					double y = py(j);
+					if (!std::isfinite(x) || !std::isfinite(y))
+						continue;
+
+					if (b.empty || x < b.minX) b.minX = x;
+					if (b.empty || x > b.maxX) b.maxX = x;
+					if (b.empty || y < b.minY) b.minY = y;
+					if (b.empty || y > b.maxY) b.maxY = y;
+					b.empty = false;
+				}
+			});
+
+		bool first = true;
+		for (const auto& b : bounds)
+		{
+			if (b.empty)
+				continue;
+
+			if (first || b.minX < m_minX) m_minX = b.minX;
+			if (first || b.maxX > m_maxX) m_maxX = b.maxX;
+			if (first || b.minY < m_minY) m_minY = b.minY;
+			if (first || b.maxY > m_maxY) m_maxY = b.maxY;
+			first = false;
+		}
+
+		m_grid = std::clamp((int)std::sqrt((double)count / PointsPerCell), 1, MaxGrid);
+
+		auto cellOf = [&](int i)
+		{
+			int cx = m_maxX > m_minX ? std::min((int)((px(i) - m_minX) / (m_maxX - m_minX) * m_grid), m_grid - 1) : 0;
+			int cy = m_maxY > m_minY ? std::min((int)((py(i) - m_minY) / (m_maxY - m_minY) * m_grid), m_grid - 1) : 0;
+			return cy * m_grid + cx;
+		};
+
+		std::vector<int> cells(count, -1);
+		parallel.run(ranges.size(), [&](size_t i)
+			{
+				for (int j = (int)ranges[i].first; j < (int)ranges[i].second; j++)
+				{
+					if (std::isfinite(px(j)) && std::isfinite(py(j)))
+						cells[j] = cellOf(j);
+				}
+			});
+
+		// counting sort of the point indices by cell
+		m_cellStart.assign((size_t)m_grid * m_grid + 1, 0);
+		for (int i = 0; i < count; i++)
+		{
+			if (cells[i] != -1)
+				m_cellStart[cells[i] + 1]++;
+		}
+
+		for (size_t c = 1; c < m_cellStart.size(); c++)
+			m_cellStart[c] += m_cellStart[c - 1];
+
+		m_points.resize(m_cellStart.back());
+		std::vector<int> fill(m_cellStart.begin(), m_cellStart.end() - 1);
+		for (int i = 0; i < count; i++)
+		{
+			if (cells[i] != -1)
+				m_points[fill[cells[i]]++] = i;
+		}
+	}
+
+}
@@ -0,0 +1,48 @@
+#pragma once
+
+#include <vector>
+
+//-----------------------------------------------------------------------------
+// mvSeriesIndex
+//
+//     - Nearest point lookups on x/y series. Series with sorted x values
+//       are searched with a binary search on x, any other series through
+//       a uniform grid of point indices. The index is rebuilt on the first
+//       query after the data changed.
+//
+//-----------------------------------------------------------------------------
+
+namespace Marvel {
+
+	class mvSeriesIndex
+	{
+
+	public:
+
+		static constexpr int MinPoints = 1024; // smaller series are scanned
+
+		// returns the logical index of the point closest to (x, y) once the
+		// axes are scaled by sx and sy (pixels per unit), or -1 if no point is
+		// within radius. distance is set to the scaled distance of the point.
+		int nearest(const std::vector<std::vector<double>>& data, int offset, int version,
+			double x, double y, double sx, double sy, double radius, double& distance);
+
+	private:
+
+		void build(const std::vector<std::vector<double>>& data, int offset);
+
+	private:
+
+		int              m_version = -1;
+		bool             m_sorted = false;
+		int              m_grid = 0;     // cells per side
+		double           m_minX = 0.0;
+		double           m_maxX = 0.0;
+		double           m_minY = 0.0;
+		double           m_maxY = 0.0;
+		std::vector<int> m_cellStart;    // offsets into m_points, one per cell plus one
+		std::vector<int> m_points;       // logical indices ordered by cell
+
+	};
+
+}
@@ -0,0 +1,308 @@
+#include "mvSeriesLOD.h"
+#include "mvApp.h"
+#include <algorithm>
+#include <atomic>
+
+namespace Marvel {
+
+	static constexpr int BucketSize = 8;      // points per level 1 bucket
+	static constexpr int LevelFactor = 4;     // buckets of a level merged by the next one
+	static constexpr int MinLevelSize = 512;  // coarsest level kept
+
+	// absolute points covered by a bucket of the level
+	static long long Span(int level)
+	{
+		long long span = BucketSize;
+		for (int i = 1; i < level; i++)
+			span *= LevelFactor;
+		return span;
+	}
+
+	// levels kept for a series of count points, each holds ~2 points per bucket
+	static int LevelCount(long long count)
+	{
+		int levels = 0;
+		while (count * 2 / Span(levels + 1) >= MinLevelSize)
+			levels++;
+		return levels;
+	}
+
+	bool mvSeriesLOD::update(const std::vector<std::vector<double>>& data, int offset, long long end,
+		double xmin, double xmax, int pixels)
+	{
+		if (data.size() < 2 || (int)data[0].size() < MinPoints || pixels <= 0)
+			return false;
+
+		int count = (int)data[0].size();
+		long long start = end - count;
+
+		if (start != m_start || end != m_end)
+		{
+			// appends and dropped old points only touch the ends
+			if (m_end >= 0 && start >= m_start && end >= m_end && start < m_end)
+				extend(data, offset, start, end);
+			else
+				build(data, offset, start, end);
+			m_level = -1;
+		}
+
+		// ranges can only be found on sorted x values
+		if (m_unsorted > m_start)
+			return false;
+
+		auto x = [&](int i) { return data[0][(i + offset) % count]; };
+
+		// visible range plus one point on each side
+		int lo = 0;
+		int hi = count;
+		while (lo < hi)
+		{
+			int mid = lo + (hi - lo) / 2;
+			if (x(mid) < xmin) lo = mid + 1;
+			else hi = mid;
+		}
+		int first = std::max(lo - 1, 0);
+
+		hi = count;
+		while (lo < hi)
+		{
+			int mid = lo + (hi - lo) / 2;
+			if (x(mid) <= xmax) lo = mid + 1;
+			else hi = mid;
+		}
+		int last = std::min(lo, count - 1);
+
+		// coarsest level with ~2 points per pixel column
+		int level = 0;
+		for (int i = (int)m_levels.size(); i > 0; i--)
+		{
+			const auto& entries = m_levels[i - 1];
+			auto begin = std::lower_bound(entries.begin(), entries.end(), m_start + first);
+			auto end = std::upper_bound(entries.begin(), entries.end(), m_start + last);
+			if (end - begin >= 2 * pixels)
+			{
+				level = i;
+				break;
+			}
+		}
+
+		if (level != m_level || first != m_first || last != m_last)
+		{
+			gather(data, offset, level, first, last);
+			m_level = level;
+			m_first = first;
+			m_last = last;
+		}
+
+		return true;
+	}
+
+	void mvSeriesLOD::build(const std::vector<std::vector<double>>& data, int offset, long long start, long long end)
+	{
+		m_levels.clear();
+		m_start = start;
+		m_end = end;
+		m_unsorted = -1;
+
+		checkSorted(data, offset, start, start + 1, end - 1);
+
+		// level 1 is built from the raw points, every other level from the previous one
+		int levels = LevelCount(end - start);
+		for (int level = 1; level <= levels; level++)
+		{
+			long long span = Span(level);
+			auto entries = bucketize(data, offset, start, end, level, start / span, (end - 1) / span);
+			m_levels.emplace_back(entries.begin(), entries.end());
+		}
+	}
+
+	void mvSeriesLOD::extend(const std::vector<std::vector<double>>& data, int offset, long long start, long long end)
+	{
+		long long oldStart = m_start;
+		long long oldEnd = m_end;
+		m_start = start;
+		m_end = end;
+
+		checkSorted(data, offset, start, std::max(oldEnd, start + 1), end - 1);
+
+		int levels = LevelCount(end - start);
+		if ((int)m_levels.size() > levels)
+			m_levels.resize(levels);
+
+		for (int level = 1; level <= levels; level++)
+		{
+			long long span = Span(level);
+
+			// a level the series just grew into is built from the one below
+			if (level > (int)m_levels.size())
+			{
+				auto entries = bucketize(data, offset, start, end, level, start / span, (end - 1) / span);
+				m_levels.emplace_back(entries.begin(), entries.end());
+				continue;
+			}
+
+			auto& entries = m_levels[level - 1];
+
+			// dropped points leave the front, a partly dropped bucket is redone
+			if (start > oldStart)
+			{
+				long long bucket = start / span;
+				bool partial = start % span != 0;
+				long long keep = partial ? (bucket + 1) * span : start;
+				entries.erase(entries.begin(), std::lower_bound(entries.begin(), entries.end(), keep));
+				if (partial)
+				{
+					auto front = bucketize(data, offset, start, end, level, bucket, bucket);
+					entries.insert(entries.begin(), front.begin(), front.end());
+				}
+			}
+
+			// the last bucket may have been partial, it is redone with the new points
+			if (end > oldEnd)
+			{
+				long long bucket = oldEnd / span;
+				entries.erase(std::lower_bound(entries.begin(), entries.end(), bucket * span), entries.end());
+				auto back = bucketize(data, offset, start, end, level, bucket, (end - 1) / span);
+				entries.insert(entries.end(), back.begin(), back.end());
+			}
+		}
+	}
+
+	void mvSeriesLOD::checkSorted(const std::vector<std::vector<double>>& data, int offset, long long start,
+		long long first, long long last)
+	{
+		if (first > last)
+			return;
+
+		int count = (int)data[0].size();
+		auto x = [&](long long index) { return data[0][(int)(index - start + offset) % count]; };
+
+		// chunks check their own points and the step into them
+		auto& parallel = mvApp::GetApp()->getParallel();
+		auto ranges = parallel.split((size_t)(last - first + 1));
+		std::vector<long long> results(ranges.size(), -1);
+		parallel.run(ranges.size(), [&](size_t i)
+			{
+				for (long long j = first + (long long)ranges[i].second - 1; j >= first + (long long)ranges[i].first; j--)
+				{
+					if (x(j) < x(j - 1))
+					{
+						results[i] = j;
+						break;
+					}
+				}
+			});
+
+		for (long long result : results)
+			m_unsorted = std::max(m_unsorted, result);
+	}
+
+	std::vector<long long> mvSeriesLOD::bucketize(const std::vector<std::vector<double>>& data, int offset,
+		long long start, long long end, int level, long long firstBucket, long long lastBucket)
+	{
+		int count = (int)data[0].size();
+		int columns = (int)data.size();
+		long long span = Span(level);
+		const std::deque<long long>* source = level > 1 ? &m_levels[level - 2] : nullptr;
+		auto at = [&](int column, long long index) { return data[column][(int)(index - start + offset) % count]; };
+
+		// chunks hold whole buckets and are joined in order, a bucket keeps
+		// the min and max point of every y column (shade series draw y2 too)
+		auto& parallel = mvApp::GetApp()->getParallel();
+		auto ranges = parallel.split((size_t)((lastBucket - firstBucket + 1) * span), (size_t)span);
+		std::vector<std::vector<long long>> parts(ranges.size());
+		parallel.run(ranges.size(), [&](size_t i)
+			{
+				auto& part = parts[i];
+				std::vector<long long> picks;
+				picks.reserve(2 * (columns - 1));
+				long long last = firstBucket + (long long)(ranges[i].second - 1) / span;
+				for (long long bucket = firstBucket + (long long)ranges[i].first / span; bucket <= last; bucket++)
+				{
+					long long lo = std::max(bucket * span, start);
+					long long hi = std::min((bucket + 1) * span, end);
+					std::deque<long long>::const_iterator begin;
+					if (source)
+						begin = std::lower_bound(source->begin(), source->end(), lo);
+
+					picks.clear();
+					for (int column = 1; column < columns; column++)
+					{
+						long long minIndex = -1;
+						long long maxIndex = -1;
+						auto visit = [&](long long index)
+						{
+							if (minIndex == -1 || at(column, index) < at(column, minIndex)) minIndex = index;
+							if (maxIndex == -1 || at(column, index) > at(column, maxIndex)) maxIndex = index;
+						};
+
+						if (source == nullptr)
+						{
+							for (long long index = lo; index < hi; index++)
+								visit(index);
+						}
+						else
+						{
+							for (auto it = begin; it != source->end() && *it < hi; ++it)
+								visit(*it);
+						}
+
+						if (minIndex == -1)
+							break;
+						picks.push_back(minIndex);
+						picks.push_back(maxIndex);
+					}
+
+					std::sort(picks.begin(), picks.end());
+					part.insert(part.end(), picks.begin(), std::unique(picks.begin(), picks.end()));
+				}
+			});
+
+		if (parts.size() == 1)
+			return std::move(parts[0]);
+
+		std::vector<long long> entries;
+		size_t total = 0;
+		for (const auto& part : parts)
+			total += part.size();
+		entries.reserve(total);
+		for (const auto& part : parts)
+			entries.insert(entries.end(), part.begin(), part.end());
+		return entries;
+	}
+
+	void mvSeriesLOD::gather(const std::vector<std::vector<double>>& data, int offset, int level, int first, int last)
+	{
+		int count = (int)data[0].size();
+
+		m_data.resize(data.size());
+		for (auto& column : m_data)
+			column.clear();
+
+		auto push = [&](int index)
+		{
+			for (size_t i = 0; i < data.size(); i++)
+				m_data[i].push_back(data[i][(index + offset) % count]);
+		};
+
+		if (level == 0)
+		{
+			for (int i = first; i <= last; i++)
+				push(i);
+			return;
+		}
+
+		const auto& entries = m_levels[level - 1];
+		auto begin = std::lower_bound(entries.begin(), entries.end(), m_start + first);
+		auto end = std::upper_bound(entries.begin(), entries.end(), m_start + last);
+
+		// keep the raw end points so lines reach the plot edges
+		if (begin == end || *begin != m_start + first)
+			push(first);
+		for (auto it = begin; it != end; ++it)
+			push((int)(*it - m_start));
+		if (begin == end || *(end - 1) != m_start + last)
+			push(last);
+	}
+
+}
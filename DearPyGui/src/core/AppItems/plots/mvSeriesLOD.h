@@ -0,0 +1,70 @@
+#pragma once
+
+#include <deque>
+#include <vector>
+
+//-----------------------------------------------------------------------------
+// mvSeriesLOD
+//
+//     - Level of detail for series with sorted x values. Level 1 keeps the
+//       min and max point of every y column for every 8 points and each
+//       level above covers 4 times as many points per bucket, so the
+//       extremes survive at any zoom. Drawing picks the coarsest level that
+//       still gives ~2 points per pixel column of the visible range and
+//       gathers those points, which is cached until the limits or data change.
+//
+//     - Buckets are aligned to absolute point indices (counted since the
+//       series was created), so appending points and dropping the oldest
+//       ones only re-buckets the ends of each level. Streaming series are
+//       not rebuilt every frame.
+//
+//-----------------------------------------------------------------------------
+
+namespace Marvel {
+
+	class mvSeriesLOD
+	{
+
+	public:
+
+		static constexpr int MinPoints = 16384; // smaller series are drawn directly
+
+		// end is the absolute index past the newest point, points are only
+		// added after it or dropped from the front. Returns false if the
+		// series should be drawn without decimation, otherwise getData()
+		// holds the points to draw (all columns)
+		bool update(const std::vector<std::vector<double>>& data, int offset, long long end,
+			double xmin, double xmax, int pixels);
+
+		const std::vector<std::vector<double>>& getData() const { return m_data; }
+		int                                     getCount() const { return m_data.empty() ? 0 : (int)m_data[0].size(); }
+
+	private:
+
+		void build      (const std::vector<std::vector<double>>& data, int offset, long long start, long long end);
+		void extend     (const std::vector<std::vector<double>>& data, int offset, long long start, long long end);
+		void gather     (const std::vector<std::vector<double>>& data, int offset, int level, int first, int last);
+
+		// records x steps going down in the absolute range [first, last]
+		void checkSorted(const std::vector<std::vector<double>>& data, int offset, long long start,
+			long long first, long long last);
+
+		// entries of the level's buckets [firstBucket, lastBucket], built from
+		// the raw points for level 1 and from the level below otherwise
+		std::vector<long long> bucketize(const std::vector<std::vector<double>>& data, int offset,
+			long long start, long long end, int level, long long firstBucket, long long lastBucket);
+
+	private:
+
+		std::vector<std::deque<long long>> m_levels;        // absolute indices, level 1 and up
+		std::vector<std::vector<double>>   m_data;          // gathered points for the current view
+		long long                          m_start = 0;     // absolute range the levels cover
+		long long                          m_end = -1;
+		long long                          m_unsorted = -1; // newest absolute index with x below the previous x
+		int                                m_level = -1;
+		int                                m_first = -1;
+		int                                m_last = -1;
+
+	};
+
+}
@@ -9,8 +9,8 @@ namespace Marvel {
 
 	public:
 
-		mvShadeSeries(const std::string& name, mvColor color, mvColor fill, const std::vector<float>* x,
-			const std::vector<float>* y1, const std::vector<float>* y2, ImPlotYAxis_ axis)
+		mvShadeSeries(const std::string& name, mvColor color, mvColor fill, std::vector<double>* x,
+			std::vector<double>* y1, std::vector<double>* y2, ImPlotYAxis_ axis)
 			: 
 			mvSeries(name, {x, y1, y2}, axis),
 			m_color(color), 
@@ -26,8 +26,12 @@ namespace Marvel {
 	
 			ImPlot::SetNextFillStyle(m_fill.toVec4());
 			ImPlot::PushStyleVar(ImPlotStyleVar_LineWeight, m_weight);
-			ImPlot::PlotShaded(m_name.c_str(), m_data[0].data(), m_data[1].data(), 
-				m_data[2].data(), (int)m_data[0].size());
+			if (auto lod = getLOD())
+				ImPlot::PlotShaded(m_name.c_str(), (*lod)[0].data(), (*lod)[1].data(),
+					(*lod)[2].data(), (int)(*lod)[0].size());
+			else
+				ImPlot::PlotShaded(m_name.c_str(), m_data[0].data(), m_data[1].data(), 
+					m_data[2].data(), (int)m_data[0].size());
 			ImPlot::PopStyleVar();
 		}
 
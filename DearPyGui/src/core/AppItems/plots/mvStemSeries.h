@@ -9,8 +9,8 @@ namespace Marvel {
 
 	public:
 
-		mvStemSeries(const std::string& name, const std::vector<float>* x, 
-			const std::vector<float>* y, int marker,
+		mvStemSeries(const std::string& name, std::vector<double>* x, 
+			std::vector<double>* y, int marker,
 			float markerSize, float markerWeight,
 			mvColor markerOutlineColor, mvColor markerFillColor, ImPlotYAxis_ axis)
 			: 
@@ -35,7 +35,10 @@ namespace Marvel {
 			ImPlot::PushStyleVar(ImPlotStyleVar_MarkerSize, m_markerSize);
 			ImPlot::PushStyleVar(ImPlotStyleVar_MarkerWeight, m_markerWeight);
 
-			ImPlot::PlotStems(m_name.c_str(), m_data[0].data(), m_data[1].data(), (int)m_data[0].size());
+			if (isBound())
+				ImPlot::PlotStems(m_name.c_str(), m_sources[0]->data(), m_sources[1]->data(), getBoundCount());
+			else
+				ImPlot::PlotStems(m_name.c_str(), m_data[0].data(), m_data[1].data(), (int)m_data[0].size(), 0.0, m_offset);
 
 			ImPlot::PopStyleColor();
 			ImPlot::PopStyleColor();
@@ -93,16 +93,17 @@ namespace Marvel {
 		PyDict_SetItemString(dict, "size", ToPyFloat(m_size));
 	}
 
-	PyObject* draw_arrow(PyObject* self, PyObject* args, PyObject* kwargs)
+	PyObject* draw_arrow(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
 	{
-		const char* drawing;
+		mvItemArg drawing;
 		int thickness;
 		int size;
 		PyObject* p1, * p2;
 		PyObject* color;
 		const char* tag = "";
 
-		if (!(*mvApp::GetApp()->getParsers())["draw_arrow"].parse(args, kwargs, __FUNCTION__, &drawing, &p1, &p2, &color, &thickness, &size, &tag))
+		static mvPythonParser& parser = (*mvApp::GetApp()->getParsers())["draw_arrow"];
+		if (!parser.parse(args, nargs, kwnames, __FUNCTION__, &drawing, &p1, &p2, &color, &thickness, &size, &tag))
 			return GetPyNone();
 
 		mvVec2 mp1 = ToVec2(p1);
@@ -6,7 +6,7 @@
 
 namespace Marvel {
 
-	PyObject* draw_arrow(PyObject* self, PyObject* args, PyObject* kwargs);
+	PyObject* draw_arrow(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames);
 
 	class mvDrawArrowCmd : public mvDrawCmd
 	{
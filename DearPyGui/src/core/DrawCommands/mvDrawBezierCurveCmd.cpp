@@ -53,16 +53,17 @@ namespace Marvel {
 		PyDict_SetItemString(dict, "segments", ToPyInt(m_segments));
 	}
 
-	PyObject* draw_bezier_curve(PyObject* self, PyObject* args, PyObject* kwargs)
+	PyObject* draw_bezier_curve(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
 	{
-		const char* drawing;
+		mvItemArg drawing;
 		float thickness = 1.0f;
 		PyObject* p1, * p2, * p3, * p4;
 		PyObject* color;
 		int segments = 0;
 		const char* tag = "";
 
-		if (!(*mvApp::GetApp()->getParsers())["draw_bezier_curve"].parse(args, kwargs, __FUNCTION__, &drawing, &p1, &p2, &p3, &p4, &color, &thickness, &segments, &tag))
+		static mvPythonParser& parser = (*mvApp::GetApp()->getParsers())["draw_bezier_curve"];
+		if (!parser.parse(args, nargs, kwnames, __FUNCTION__, &drawing, &p1, &p2, &p3, &p4, &color, &thickness, &segments, &tag))
 			return GetPyNone();
 
 		mvVec2 mp1 = ToVec2(p1);
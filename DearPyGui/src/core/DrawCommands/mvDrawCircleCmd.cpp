@@ -54,9 +54,9 @@ namespace Marvel {
 		PyDict_SetItemString(dict, "segments", ToPyInt(m_segments));
 	}
 
-	PyObject* draw_circle(PyObject* self, PyObject* args, PyObject* kwargs)
+	PyObject* draw_circle(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
 	{
-		const char* drawing;
+		mvItemArg drawing;
 		PyObject* center;
 		float radius;
 		PyObject* color;
@@ -65,7 +65,8 @@ namespace Marvel {
 		PyObject* fill = nullptr;
 		const char* tag = "";
 
-		if (!(*mvApp::GetApp()->getParsers())["draw_circle"].parse(args, kwargs, __FUNCTION__, &drawing, &center, &radius, &color, &segments, &thickness, &fill, &tag))
+		static mvPythonParser& parser = (*mvApp::GetApp()->getParsers())["draw_circle"];
+		if (!parser.parse(args, nargs, kwnames, __FUNCTION__, &drawing, &center, &radius, &color, &segments, &thickness, &fill, &tag))
 			return GetPyNone();
 
 		mvVec2 mcenter = ToVec2(center);
@@ -45,31 +45,31 @@ namespace Marvel {
 
 	};
 
-	static mvRef<mvDrawList> GetDrawListFromTarget(const char* name)
+	static mvRef<mvDrawList> GetDrawListFromTarget(const mvItemArg& target)
 	{
-		if (name == DrawForeground)
+		if (target.name == DrawForeground)
 		{
 			auto viewport = mvApp::GetApp()->getViewport();
 			if (viewport == nullptr)
 			{
-				ThrowPythonException(std::string(name) + " viewport can't be accessed until the application is running");
+				ThrowPythonException(target.name + " viewport can't be accessed until the application is running");
 				return nullptr;
 			}
 			return mvApp::GetApp()->getViewport()->getFrontDrawList();
 		}
 
-		if (name == DrawBackground)
+		if (target.name == DrawBackground)
 		{
 			auto viewport = mvApp::GetApp()->getViewport();
 			if (viewport == nullptr)
 			{
-				ThrowPythonException(std::string(name) + " viewport can't be accessed until the application is running");
+				ThrowPythonException(target.name + " viewport can't be accessed until the application is running");
 				return nullptr;
 			}
 			return mvApp::GetApp()->getViewport()->getBackDrawList();
 		}
 
-		auto item = mvApp::GetApp()->getItemRegistry().getItem(name);
+		auto item = mvApp::GetApp()->getItemRegistry().getItem(target);
 
 		if (item == nullptr)
 			return nullptr;
@@ -79,7 +79,7 @@ namespace Marvel {
 		if (item->getType() == mvAppItemType::Window)
 			return static_cast<mvWindowAppItem*>(item.get())->getDrawList();
 
-		ThrowPythonException(std::string(name) + " draw target does not exist or is not a valid target.");
+		ThrowPythonException(target.str() + " draw target does not exist or is not a valid target.");
 		return nullptr;
 	}
 }
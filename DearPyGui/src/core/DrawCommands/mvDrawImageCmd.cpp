@@ -115,9 +115,9 @@ namespace Marvel {
 		PyDict_SetItemString(dict, "file", ToPyString(m_file));
 	}
 
-	PyObject* draw_image(PyObject* self, PyObject* args, PyObject* kwargs)
+	PyObject* draw_image(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
 	{
-		const char* drawing;
+		mvItemArg drawing;
 		const char* file;
 		PyObject* pmin;
 		PyObject* pmax = PyTuple_New(2);
@@ -136,7 +136,8 @@ namespace Marvel {
 		PyTuple_SetItem(color, 3, PyFloat_FromDouble(255));
 		const char* tag = "";
 
-		if (!(*mvApp::GetApp()->getParsers())["draw_image"].parse(args, kwargs, __FUNCTION__, &drawing, &file,
+		static mvPythonParser& parser = (*mvApp::GetApp()->getParsers())["draw_image"];
+		if (!parser.parse(args, nargs, kwnames, __FUNCTION__, &drawing, &file,
 			&pmin, &pmax, &uv_min, &uv_max, &color, &tag))
 			return GetPyNone();
 
@@ -44,15 +44,16 @@ namespace Marvel {
 		PyDict_SetItemString(dict, "thickness", ToPyFloat(m_thickness));
 	}
 
-	PyObject* draw_line(PyObject* self, PyObject* args, PyObject* kwargs)
+	PyObject* draw_line(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
 	{
-		const char* drawing;
+		mvItemArg drawing;
 		int thickness;
 		PyObject* p1, * p2;
 		PyObject* color;
 		const char* tag = "";
 
-		if (!(*mvApp::GetApp()->getParsers())["draw_line"].parse(args, kwargs, __FUNCTION__, &drawing, &p1, &p2, &color, &thickness, &tag))
+		static mvPythonParser& parser = (*mvApp::GetApp()->getParsers())["draw_line"];
+		if (!parser.parse(args, nargs, kwnames, __FUNCTION__, &drawing, &p1, &p2, &color, &thickness, &tag))
 			return GetPyNone();
 
 		mvVec2 mp1 = ToVec2(p1);
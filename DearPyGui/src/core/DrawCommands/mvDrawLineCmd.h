@@ -4,7 +4,7 @@
 
 namespace Marvel {
 
-	PyObject* draw_line(PyObject* self, PyObject* args, PyObject* kwargs);
+	PyObject* draw_line(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames);
 
 	class mvDrawLineCmd : public mvDrawCmd
 	{
@@ -8,43 +8,43 @@ namespace Marvel {
 	void mvDrawList::InsertParser(std::map<std::string, mvPythonParser>* parsers)
 	{
 		parsers->insert({ "modify_draw_command", mvPythonParser({
-			{mvPythonDataType::String, "drawing"},
+			{mvPythonDataType::UUID, "drawing"},
 			{mvPythonDataType::String, "tag"},
 			{mvPythonDataType::Kwargs, "**Kwargs"},
 		}, "Configures an drawing command.", "None", "Drawing") });
 
 		parsers->insert({ "bring_draw_command_forward", mvPythonParser({
-			{mvPythonDataType::String, "drawing"},
+			{mvPythonDataType::UUID, "drawing"},
 			{mvPythonDataType::String, "tag"},
 		}, "Brings draw command forward.", "None", "Drawing") });
 
 		parsers->insert({ "bring_draw_command_to_front", mvPythonParser({
-			{mvPythonDataType::String, "drawing"},
+			{mvPythonDataType::UUID, "drawing"},
 			{mvPythonDataType::String, "tag"},
 		}, "Brings draw command to front.", "None", "Drawing") });
 
 		parsers->insert({ "send_draw_command_back", mvPythonParser({
-			{mvPythonDataType::String, "drawing"},
+			{mvPythonDataType::UUID, "drawing"},
 			{mvPythonDataType::String, "tag"},
 		}, "Sends draw command back.", "None", "Drawing") });
 
 		parsers->insert({ "send_draw_command_to_back", mvPythonParser({
-			{mvPythonDataType::String, "drawing"},
+			{mvPythonDataType::UUID, "drawing"},
 			{mvPythonDataType::String, "tag"},
 		}, "Sends draw command to the back.", "None", "Drawing") });
 
 		parsers->insert({ "get_draw_command", mvPythonParser({
-			{mvPythonDataType::String, "drawing"},
+			{mvPythonDataType::UUID, "drawing"},
 			{mvPythonDataType::String, "tag"},
 		}, "Returns an draw commands information", "dict", "Drawing") });
 
 		parsers->insert({ "delete_draw_command", mvPythonParser({
-			{mvPythonDataType::String, "drawing"},
+			{mvPythonDataType::UUID, "drawing"},
 			{mvPythonDataType::String, "tag"},
 		}, "Deletes a drawing item.", "None", "Drawing") });
 
 		parsers->insert({ "draw_image", mvPythonParser({
-			{mvPythonDataType::String, "drawing"},
+			{mvPythonDataType::UUID, "drawing"},
 			{mvPythonDataType::String, "file"},
 			{mvPythonDataType::FloatList, "pmin"},
 			{mvPythonDataType::FloatList, "pmax", ""},
@@ -59,7 +59,7 @@ namespace Marvel {
 			"coordinates will generally display the entire texture."), "None", "Drawing") });
 
 		parsers->insert({ "draw_line", mvPythonParser({
-			{mvPythonDataType::String, "drawing"},
+			{mvPythonDataType::UUID, "drawing"},
 			{mvPythonDataType::FloatList, "p1"},
 			{mvPythonDataType::FloatList, "p2"},
 			{mvPythonDataType::IntList, "color"},
@@ -69,7 +69,7 @@ namespace Marvel {
 		}, "Draws a line on a drawing.", "None", "Drawing") });
 
 		parsers->insert({ "draw_arrow", mvPythonParser({
-			{mvPythonDataType::String, "drawing"},
+			{mvPythonDataType::UUID, "drawing"},
 			{mvPythonDataType::FloatList, "p1"},
 			{mvPythonDataType::FloatList, "p2"},
 			{mvPythonDataType::IntList, "color"},
@@ -80,7 +80,7 @@ namespace Marvel {
 		}, "Draws an arrow on a drawing.", "None", "Drawing") });
 
 		parsers->insert({ "draw_triangle", mvPythonParser({
-			{mvPythonDataType::String, "drawing"},
+			{mvPythonDataType::UUID, "drawing"},
 			{mvPythonDataType::FloatList, "p1"},
 			{mvPythonDataType::FloatList, "p2"},
 			{mvPythonDataType::FloatList, "p3"},
@@ -92,7 +92,7 @@ namespace Marvel {
 		}, "Draws a triangle on a drawing.", "None", "Drawing") });
 
 		parsers->insert({ "draw_rectangle", mvPythonParser({
-			{mvPythonDataType::String, "drawing"},
+			{mvPythonDataType::UUID, "drawing"},
 			{mvPythonDataType::FloatList, "pmin"},
 			{mvPythonDataType::FloatList, "pmax"},
 			{mvPythonDataType::IntList, "color"},
@@ -104,7 +104,7 @@ namespace Marvel {
 		}, "Draws a rectangle on a drawing.", "None", "Drawing") });
 
 		parsers->insert({ "draw_quad", mvPythonParser({
-			{mvPythonDataType::String, "drawing"},
+			{mvPythonDataType::UUID, "drawing"},
 			{mvPythonDataType::FloatList, "p1"},
 			{mvPythonDataType::FloatList, "p2"},
 			{mvPythonDataType::FloatList, "p3"},
@@ -117,7 +117,7 @@ namespace Marvel {
 		}, "Draws a quad on a drawing.", "None", "Drawing") });
 
 		parsers->insert({ "draw_text", mvPythonParser({
-			{mvPythonDataType::String, "drawing"},
+			{mvPythonDataType::UUID, "drawing"},
 			{mvPythonDataType::FloatList, "pos"},
 			{mvPythonDataType::String, "text"},
 			{mvPythonDataType::KeywordOnly},
@@ -127,7 +127,7 @@ namespace Marvel {
 		}, "Draws text on a drawing.", "None", "Drawing") });
 
 		parsers->insert({ "draw_circle", mvPythonParser({
-			{mvPythonDataType::String, "drawing"},
+			{mvPythonDataType::UUID, "drawing"},
 			{mvPythonDataType::FloatList, "center"},
 			{mvPythonDataType::Float, "radius"},
 			{mvPythonDataType::IntList, "color"},
@@ -139,7 +139,7 @@ namespace Marvel {
 		}, "Draws a circle on a drawing.", "None", "Drawing") });
 
 		parsers->insert({ "draw_polyline", mvPythonParser({
-			{mvPythonDataType::String, "drawing"},
+			{mvPythonDataType::UUID, "drawing"},
 			{mvPythonDataType::ListFloatList, "points"},
 			{mvPythonDataType::IntList, "color"},
 			{mvPythonDataType::KeywordOnly},
@@ -149,7 +149,7 @@ namespace Marvel {
 		}, "Draws lines on a drawing.", "None", "Drawing") });
 
 		parsers->insert({ "draw_polygon", mvPythonParser({
-			{mvPythonDataType::String, "drawing"},
+			{mvPythonDataType::UUID, "drawing"},
 			{mvPythonDataType::ListFloatList, "points"},
 			{mvPythonDataType::IntList, "color"},
 			{mvPythonDataType::KeywordOnly},
@@ -159,7 +159,7 @@ namespace Marvel {
 		}, "Draws a polygon on a drawing.", "None", "Drawing") });
 
 		parsers->insert({ "draw_bezier_curve", mvPythonParser({
-			{mvPythonDataType::String, "drawing"},
+			{mvPythonDataType::UUID, "drawing"},
 			{mvPythonDataType::FloatList, "p1"},
 			{mvPythonDataType::FloatList, "p2"},
 			{mvPythonDataType::FloatList, "p3"},
@@ -172,7 +172,7 @@ namespace Marvel {
 		}, "Draws a bezier curve on a drawing.", "None", "Drawing") });
 
 		parsers->insert({ "clear_drawing", mvPythonParser({
-			{mvPythonDataType::String, "draw"}
+			{mvPythonDataType::UUID, "draw"}
 		}, "Clears a drawing.", "None", "Drawing") });
 	}
 
@@ -316,11 +316,18 @@ namespace Marvel {
 	PyObject* modify_draw_command(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
 		 
-		std::string drawing = ToString(PyTuple_GetItem(args, 0));
+		mvItemArg drawing;
+		drawing.object = PyTuple_GetItem(args, 0);
+		if (!ResolveItemArg(&drawing))
+		{
+			PyErr_Print();
+			return GetPyNone();
+		}
+
 		std::string tag = ToString(PyTuple_GetItem(args, 1));
 
 		std::lock_guard<std::mutex> lk(mvApp::GetApp()->GetApp()->getMutex());
-		mvRef<mvDrawList> drawlist = GetDrawListFromTarget(drawing.c_str());
+		mvRef<mvDrawList> drawlist = GetDrawListFromTarget(drawing);
 
 		if (drawlist)
 			drawlist->getCommand(tag)->setConfigDict(kwargs);
@@ -332,7 +339,7 @@ namespace Marvel {
 
 	PyObject* get_draw_command(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
-		const char* drawing;
+		mvItemArg drawing;
 		const char* tag;
 
 		if (!(*mvApp::GetApp()->getParsers())["get_draw_command"].parse(args, kwargs, __FUNCTION__,
@@ -359,7 +366,7 @@ namespace Marvel {
 
 	PyObject* bring_draw_command_forward(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
-		const char* drawing;
+		mvItemArg drawing;
 		const char* tag;
 
 		if (!(*mvApp::GetApp()->getParsers())["bring_draw_command_forward"].parse(args, kwargs, __FUNCTION__,
@@ -377,7 +384,7 @@ namespace Marvel {
 
 	PyObject* bring_draw_command_to_front(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
-		const char* drawing;
+		mvItemArg drawing;
 		const char* tag;
 
 		if (!(*mvApp::GetApp()->getParsers())["bring_draw_command_to_front"].parse(args, kwargs, __FUNCTION__,
@@ -394,7 +401,7 @@ namespace Marvel {
 
 	PyObject* send_draw_command_back(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
-		const char* drawing;
+		mvItemArg drawing;
 		const char* tag;
 
 		if (!(*mvApp::GetApp()->getParsers())["send_draw_command_back"].parse(args, kwargs, __FUNCTION__,
@@ -411,7 +418,7 @@ namespace Marvel {
 
 	PyObject* send_draw_command_to_back(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
-		const char* drawing;
+		mvItemArg drawing;
 		const char* tag;
 
 		if (!(*mvApp::GetApp()->getParsers())["send_draw_command_to_back"].parse(args, kwargs, __FUNCTION__,
@@ -428,7 +435,7 @@ namespace Marvel {
 
 	PyObject* delete_draw_command(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
-		const char* drawing;
+		mvItemArg drawing;
 		const char* tag;
 
 		if (!(*mvApp::GetApp()->getParsers())["delete_draw_command"].parse(args, kwargs, __FUNCTION__, &drawing, &tag))
@@ -445,7 +452,7 @@ namespace Marvel {
 
 	PyObject* clear_drawing(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
-		const char* drawing;
+		mvItemArg drawing;
 
 		if (!(*mvApp::GetApp()->getParsers())["clear_drawing"].parse(args, kwargs, __FUNCTION__, &drawing))
 			return GetPyNone();
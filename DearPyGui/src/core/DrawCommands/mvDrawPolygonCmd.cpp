@@ -121,16 +121,17 @@ namespace Marvel {
 		PyDict_SetItemString(dict, "thickness", ToPyFloat(m_thickness));
 	}
 
-	PyObject* draw_polygon(PyObject* self, PyObject* args, PyObject* kwargs)
+	PyObject* draw_polygon(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
 	{
-		const char* drawing;
+		mvItemArg drawing;
 		PyObject* points;
 		PyObject* color;
 		PyObject* fill = nullptr;
 		float thickness = 1.0f;
 		const char* tag = "";
 
-		if (!(*mvApp::GetApp()->getParsers())["draw_polygon"].parse(args, kwargs, __FUNCTION__, &drawing, &points, &color, &fill, &thickness, &tag))
+		static mvPythonParser& parser = (*mvApp::GetApp()->getParsers())["draw_polygon"];
+		if (!parser.parse(args, nargs, kwnames, __FUNCTION__, &drawing, &points, &color, &fill, &thickness, &tag))
 			return GetPyNone();
 
 		auto mpoints = ToVectVec2(points);
@@ -5,7 +5,7 @@
 
 namespace Marvel {
 
-	PyObject* draw_polygon(PyObject* self, PyObject* args, PyObject* kwargs);
+	PyObject* draw_polygon(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames);
 
 	class mvDrawPolygonCmd : public mvDrawCmd
 	{
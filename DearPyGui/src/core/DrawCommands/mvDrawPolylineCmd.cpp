@@ -49,16 +49,17 @@ namespace Marvel {
 		PyDict_SetItemString(dict, "thickness", ToPyFloat(m_thickness));
 	}
 
-	PyObject* draw_polyline(PyObject* self, PyObject* args, PyObject* kwargs)
+	PyObject* draw_polyline(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
 	{
-		const char* drawing;
+		mvItemArg drawing;
 		PyObject* points;
 		PyObject* color;
 		int closed = false;
 		float thickness = 1.0f;
 		const char* tag = "";
 
-		if (!(*mvApp::GetApp()->getParsers())["draw_polyline"].parse(args, kwargs, __FUNCTION__, &drawing, &points, &color, &closed, &thickness, &tag))
+		static mvPythonParser& parser = (*mvApp::GetApp()->getParsers())["draw_polyline"];
+		if (!parser.parse(args, nargs, kwnames, __FUNCTION__, &drawing, &points, &color, &closed, &thickness, &tag))
 			return GetPyNone();
 
 		auto mpoints = ToVectVec2(points);
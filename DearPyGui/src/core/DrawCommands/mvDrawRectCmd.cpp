@@ -52,16 +52,17 @@ namespace Marvel {
 		PyDict_SetItemString(dict, "thickness", ToPyFloat(m_thickness));
 	}
 
-	PyObject* draw_rectangle(PyObject* self, PyObject* args, PyObject* kwargs)
+	PyObject* draw_rectangle(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
 	{
-		const char* drawing;
+		mvItemArg drawing;
 		float thickness = 1.0f, rounding = 0.0f;
 		PyObject* pmin, * pmax;
 		PyObject* color;
 		PyObject* fill = nullptr;
 		const char* tag = "";
 
-		if (!(*mvApp::GetApp()->getParsers())["draw_rectangle"].parse(args, kwargs, __FUNCTION__, &drawing, &pmin, &pmax, &color, &fill, &rounding, &thickness, &tag))
+		static mvPythonParser& parser = (*mvApp::GetApp()->getParsers())["draw_rectangle"];
+		if (!parser.parse(args, nargs, kwnames, __FUNCTION__, &drawing, &pmin, &pmax, &color, &fill, &rounding, &thickness, &tag))
 			return GetPyNone();
 
 
@@ -44,16 +44,17 @@ namespace Marvel {
 		PyDict_SetItemString(dict, "size", ToPyInt(m_size));
 	}
 
-	PyObject* draw_text(PyObject* self, PyObject* args, PyObject* kwargs)
+	PyObject* draw_text(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
 	{
-		const char* drawing;
+		mvItemArg drawing;
 		const char* text;
 		PyObject* pos;
 		int size = 10;
 		PyObject* color = nullptr;
 		const char* tag = "";
 
-		if (!(*mvApp::GetApp()->getParsers())["draw_text"].parse(args, kwargs, __FUNCTION__, &drawing, &pos, &text, &color, &size, &tag))
+		static mvPythonParser& parser = (*mvApp::GetApp()->getParsers())["draw_text"];
+		if (!parser.parse(args, nargs, kwnames, __FUNCTION__, &drawing, &pos, &text, &color, &size, &tag))
 			return GetPyNone();
 
 		mvVec2 mpos = ToVec2(pos);
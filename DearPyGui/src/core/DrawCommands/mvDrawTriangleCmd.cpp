@@ -54,16 +54,17 @@ namespace Marvel {
 		PyDict_SetItemString(dict, "thickness", ToPyFloat(m_thickness));
 	}
 
-	PyObject* draw_triangle(PyObject* self, PyObject* args, PyObject* kwargs)
+	PyObject* draw_triangle(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
 	{
-		const char* drawing;
+		mvItemArg drawing;
 		float thickness = 1.0f;
 		PyObject* p1, * p2, * p3;
 		PyObject* color;
 		PyObject* fill = nullptr;
 		const char* tag = "";
 
-		if (!(*mvApp::GetApp()->getParsers())["draw_triangle"].parse(args, kwargs, __FUNCTION__, &drawing, &p1, &p2, &p3, &color, &fill, &thickness, &tag))
+		static mvPythonParser& parser = (*mvApp::GetApp()->getParsers())["draw_triangle"];
+		if (!parser.parse(args, nargs, kwnames, __FUNCTION__, &drawing, &p1, &p2, &p3, &color, &fill, &thickness, &tag))
 			return GetPyNone();
 
 
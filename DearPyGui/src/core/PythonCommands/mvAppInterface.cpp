@@ -45,6 +45,16 @@ namespace Marvel {
 			{mvPythonDataType::Bool, "value"},
 		}, "Sets vsync on or off.") });
 
+		parsers->insert({ "set_headless", mvPythonParser({
+			{mvPythonDataType::Bool, "value"},
+		}, "Runs without a window or graphics context (frames are built but not drawn). Must be called before the viewport is created.") });
+
+		parsers->insert({ "set_lazy_rendering", mvPythonParser({
+			{mvPythonDataType::Bool, "value"},
+			{mvPythonDataType::KeywordOnly},
+			{mvPythonDataType::Float, "timeout", "Seconds between frames while idle", "0.5"},
+		}, "Only renders frames on input, when items or values change from python or while an item is active. Otherwise waits up to timeout between frames.") });
+
 		parsers->insert({ "is_dearpygui_running", mvPythonParser({
 		}, "Checks if dearpygui is still running", "bool") });
 
@@ -81,7 +91,7 @@ namespace Marvel {
 
 		parsers->insert({ "start_dearpygui", mvPythonParser({
 			{mvPythonDataType::KeywordOnly},
-			{mvPythonDataType::String, "primary_window", "Window that will expand into viewport.", "''"},
+			{mvPythonDataType::UUID, "primary_window", "Window that will expand into viewport.", "''"},
 		}, "Starts DearPyGui.") });
 
 		parsers->insert({ "stop_dearpygui", mvPythonParser({
@@ -124,6 +134,24 @@ namespace Marvel {
 		parsers->insert({ "get_delta_time", mvPythonParser({
 		}, "Returns time since last frame.", "float") });
 
+		parsers->insert({ "set_target_fps", mvPythonParser({
+			{mvPythonDataType::Float, "fps", "0 for uncapped"},
+			{mvPythonDataType::KeywordOnly},
+			{mvPythonDataType::Float, "background_fps", "Rate while the viewport is not focused (0 uses fps)", "0.0"},
+		}, "Limits the frame rate independent of vsync.") });
+
+		parsers->insert({ "get_frame_stats", mvPythonParser({
+		}, "Returns frame statistics over the last 120 frames (times in milliseconds) and item counts for the last frame.", "dict") });
+
+		parsers->insert({ "set_thread_pool", mvPythonParser({
+			{mvPythonDataType::Integer, "threads", "worker threads (-1 uses one per core less the calling thread, 0 runs everything on the calling thread)"},
+			{mvPythonDataType::KeywordOnly},
+			{mvPythonDataType::Integer, "min_chunk", "smallest number of elements handed to a thread", "65536"},
+		}, "Configures the worker pool used to convert series data, compute bounds and build plot levels of detail.") });
+
+		parsers->insert({ "get_thread_pool_stats", mvPythonParser({
+		}, "Returns the worker pool configuration and utilization (times in seconds).", "dict") });
+
 		parsers->insert({ "get_main_window_size", mvPythonParser({
 		}, "Returns the size of the main window.", "[int, int]") });
 
@@ -139,7 +167,7 @@ namespace Marvel {
 		}, "Sets the main window size.") });
 
 		parsers->insert({ "set_primary_window", mvPythonParser({
-			{mvPythonDataType::String, "window"},
+			{mvPythonDataType::UUID, "window"},
 			{mvPythonDataType::Bool, "value"},
 		}, "Sets the primary window to fill the viewport.") });
 	}
@@ -148,49 +176,49 @@ namespace Marvel {
 	{
 		parsers->insert({ "get_log_level", mvPythonParser({
 			{mvPythonDataType::KeywordOnly},
-			{mvPythonDataType::String, "logger", "logger widget", "''"},
+			{mvPythonDataType::UUID, "logger", "logger widget", "''"},
 		}, "Returns the log level.", "int", "Logging") });
 
 		parsers->insert({ "clear_log", mvPythonParser({
 			{mvPythonDataType::KeywordOnly},
-			{mvPythonDataType::String, "logger", "logger widget", "''"},
+			{mvPythonDataType::UUID, "logger", "logger widget", "''"},
 		}, "Clears the logger.", "None", "Logging") });
 
 		parsers->insert({ "set_log_level", mvPythonParser({
 			{mvPythonDataType::Integer, "level"},
 			{mvPythonDataType::KeywordOnly},
-			{mvPythonDataType::String, "logger", "logger widget", "''"},
+			{mvPythonDataType::UUID, "logger", "logger widget", "''"},
 		}, "Sets the log level.", "None", "Logging") });
 
 		parsers->insert({ "log", mvPythonParser({
 			{mvPythonDataType::Object, "message"},
 			{mvPythonDataType::KeywordOnly},
 			{mvPythonDataType::String, "level", "logger widget", "'TRACE'"},
-			{mvPythonDataType::String, "logger", "logger widget", "''"}
+			{mvPythonDataType::UUID, "logger", "logger widget", "''"}
 		}, "Logs a trace level log.", "None", "Logging") });
 
 		parsers->insert({ "log_debug", mvPythonParser({
 			{mvPythonDataType::Object, "message"},
 			{mvPythonDataType::KeywordOnly},
-			{mvPythonDataType::String, "logger", "logger widget", "''"},
+			{mvPythonDataType::UUID, "logger", "logger widget", "''"},
 		}, "Logs a debug level log.", "None", "Logging") });
 
 		parsers->insert({ "log_info", mvPythonParser({
 			{mvPythonDataType::Object, "message"},
 			{mvPythonDataType::KeywordOnly},
-			{mvPythonDataType::String, "logger", "logger widget", "''"},
+			{mvPythonDataType::UUID, "logger", "logger widget", "''"},
 		}, "Logs a info level log.", "None", "Logging") });
 
 		parsers->insert({ "log_warning", mvPythonParser({
 			{mvPythonDataType::Object, "message"},
 			{mvPythonDataType::KeywordOnly},
-			{mvPythonDataType::String, "logger", "logger widget", "''"},
+			{mvPythonDataType::UUID, "logger", "logger widget", "''"},
 		}, "Logs a warning level log.", "None", "Logging") });
 
 		parsers->insert({ "log_error", mvPythonParser({
 			{mvPythonDataType::Object, "message"},
 			{mvPythonDataType::KeywordOnly},
-			{mvPythonDataType::String, "logger", "logger widget", "''"},
+			{mvPythonDataType::UUID, "logger", "logger widget", "''"},
 		}, "Logs a error level log.", "None", "Logging") });
 	}
 
@@ -200,7 +228,7 @@ namespace Marvel {
 		}, "Shows the logging window. The Default log level is Trace", "None", "Standard Windows") });
 
 		parsers->insert({ "close_popup", mvPythonParser({
-			{mvPythonDataType::String, "item"},
+			{mvPythonDataType::UUID, "item"},
 		}, "Closes a popup.") });
 
 	}
@@ -390,13 +418,51 @@ namespace Marvel {
 		return GetPyNone();
 	}
 
+	PyObject* set_headless(PyObject* self, PyObject* args, PyObject* kwargs)
+	{
+		int value;
+
+		if (!(*mvApp::GetApp()->getParsers())["set_headless"].parse(args, kwargs, __FUNCTION__,
+			&value))
+			return GetPyNone();
+
+		if (mvApp::GetApp()->getViewport())
+		{
+			ThrowPythonException("\"set_headless\" must be called before the viewport is created.");
+			return GetPyNone();
+		}
+
+		std::lock_guard<std::mutex> lk(mvApp::GetApp()->GetApp()->getMutex());
+		mvApp::GetApp()->setHeadless(value);
+
+		return GetPyNone();
+	}
+
+	PyObject* set_lazy_rendering(PyObject* self, PyObject* args, PyObject* kwargs)
+	{
+		int value;
+		float timeout = 0.5f;
+
+		if (!(*mvApp::GetApp()->getParsers())["set_lazy_rendering"].parse(args, kwargs, __FUNCTION__,
+			&value, &timeout))
+			return GetPyNone();
+
+		std::lock_guard<std::mutex> lk(mvApp::GetApp()->GetApp()->getMutex());
+		mvApp::GetApp()->setLazyRendering(value, timeout > 0.0f ? timeout : 0.5f);
+
+		// interrupt a wait that is in progress
+		mvApp::GetApp()->wakeViewport();
+
+		return GetPyNone();
+	}
+
 	PyObject* setup_dearpygui(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
 		Py_BEGIN_ALLOW_THREADS;
 		mvApp::SetAppStarted();
 
 		// create window
-		auto window = mvWindow::CreatemvWindow(mvApp::GetApp()->getActualWidth(), mvApp::GetApp()->getActualHeight(), false);
+		auto window = mvWindow::CreateViewport(mvApp::GetApp()->getActualWidth(), mvApp::GetApp()->getActualHeight(), false);
 		window->show();
 		mvApp::GetApp()->setViewport(window);
 		window->setup();
@@ -419,8 +485,8 @@ namespace Marvel {
 	PyObject* cleanup_dearpygui(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
 		auto window = mvApp::GetApp()->getViewport();
-		delete window;
 		mvApp::GetApp()->setViewport(nullptr);
+		delete window;
 		Py_BEGIN_ALLOW_THREADS;
 		mvApp::SetAppStopped();
 		mvApp::DeleteApp();
@@ -431,7 +497,7 @@ namespace Marvel {
 
 	PyObject* start_dearpygui(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
-		const char* primary_window = "";
+		mvItemArg primary_window;
 
 		if (!(*mvApp::GetApp()->getParsers())["start_dearpygui"].parse(args, kwargs, __FUNCTION__, &primary_window))
 			return GetPyNone();
@@ -441,8 +507,10 @@ namespace Marvel {
 			return GetPyNone();
 		}
 
+		std::string primaryWindow = mvApp::GetApp()->getItemRegistry().getItemName(primary_window);
+
 		Py_BEGIN_ALLOW_THREADS;
-		mvApp::GetApp()->start(primary_window);
+		mvApp::GetApp()->start(primaryWindow);
 		Py_END_ALLOW_THREADS;
 		
 		mvApp::DeleteApp();
@@ -567,6 +635,80 @@ namespace Marvel {
 
 	}
 
+	PyObject* set_target_fps(PyObject* self, PyObject* args, PyObject* kwargs)
+	{
+		float fps;
+		float background_fps = 0.0f;
+
+		if (!(*mvApp::GetApp()->getParsers())["set_target_fps"].parse(args, kwargs, __FUNCTION__,
+			&fps, &background_fps))
+			return GetPyNone();
+
+		mvApp::GetApp()->getFrameScheduler().setTargetFps(fps, background_fps);
+
+		return GetPyNone();
+	}
+
+	PyObject* get_frame_stats(PyObject* self, PyObject* args, PyObject* kwargs)
+	{
+		mvFrameStats stats = mvApp::GetApp()->getFrameScheduler().getStats();
+
+		mvItemRegistry::mvCullStats cullStats;
+		{
+			std::lock_guard<std::mutex> lk(mvApp::GetApp()->GetApp()->getMutex());
+			cullStats = mvApp::GetApp()->getItemRegistry().getCullStats();
+		}
+
+		PyObject* pdict = PyDict_New();
+		PyDict_SetItemString(pdict, "frames", PyLong_FromLongLong(stats.frames));
+		PyDict_SetItemString(pdict, "fps", ToPyFloat(stats.fps));
+		PyDict_SetItemString(pdict, "frame_time", ToPyFloat(stats.frameTime));
+		PyDict_SetItemString(pdict, "frame_time_min", ToPyFloat(stats.frameTimeMin));
+		PyDict_SetItemString(pdict, "frame_time_max", ToPyFloat(stats.frameTimeMax));
+		PyDict_SetItemString(pdict, "work_time", ToPyFloat(stats.workTime));
+		PyDict_SetItemString(pdict, "target_fps", ToPyFloat(stats.targetFps));
+		PyDict_SetItemString(pdict, "items_visited", ToPyInt(cullStats.visited));
+		PyDict_SetItemString(pdict, "items_drawn", ToPyInt(cullStats.drawn));
+		PyDict_SetItemString(pdict, "items_total", ToPyInt(cullStats.total));
+
+		return pdict;
+	}
+
+	PyObject* set_thread_pool(PyObject* self, PyObject* args, PyObject* kwargs)
+	{
+		int threads;
+		int min_chunk = (int)mvParallel::DefaultMinChunk;
+
+		if (!(*mvApp::GetApp()->getParsers())["set_thread_pool"].parse(args, kwargs, __FUNCTION__,
+			&threads, &min_chunk))
+			return GetPyNone();
+
+		// waits for running work to finish
+		Py_BEGIN_ALLOW_THREADS
+		mvApp::GetApp()->getParallel().configure(threads, (size_t)std::max(min_chunk, 1));
+		Py_END_ALLOW_THREADS
+
+		return GetPyNone();
+	}
+
+	PyObject* get_thread_pool_stats(PyObject* self, PyObject* args, PyObject* kwargs)
+	{
+		mvParallelStats stats = mvApp::GetApp()->getParallel().getStats();
+
+		PyObject* pdict = PyDict_New();
+		PyDict_SetItemString(pdict, "threads", ToPyInt(stats.threads));
+		PyDict_SetItemString(pdict, "started", ToPyBool(stats.started));
+		PyDict_SetItemString(pdict, "min_chunk", PyLong_FromSize_t(stats.minChunk));
+		PyDict_SetItemString(pdict, "runs", PyLong_FromLongLong(stats.runs));
+		PyDict_SetItemString(pdict, "inline_runs", PyLong_FromLongLong(stats.inlineRuns));
+		PyDict_SetItemString(pdict, "chunks", PyLong_FromLongLong(stats.chunks));
+		PyDict_SetItemString(pdict, "busy_time", PyFloat_FromDouble(stats.busyTime));
+		PyDict_SetItemString(pdict, "wall_time", PyFloat_FromDouble(stats.wallTime));
+		PyDict_SetItemString(pdict, "utilization", ToPyFloat(stats.utilization));
+
+		return pdict;
+	}
+
 	PyObject* get_main_window_size(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
 		std::lock_guard<std::mutex> lk(mvApp::GetApp()->GetApp()->getMutex());
@@ -647,24 +789,24 @@ namespace Marvel {
 
 	PyObject* get_log_level(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
-		const char* logger = "";
+		mvItemArg logger;
 
 		if (!(*mvApp::GetApp()->getParsers())["get_log_level"].parse(args, kwargs, __FUNCTION__, &logger))
 			return GetPyNone();
 
 
-		if (!std::string(logger).empty())
+		if (!logger.empty())
 		{
 			auto loggeritem = mvApp::GetApp()->getItemRegistry().getItem(logger);
 			if (loggeritem == nullptr)
 			{
-				ThrowPythonException(std::string(logger) + " logger does not exist.");
+				ThrowPythonException(logger.str() + " logger does not exist.");
 				return ToPyInt(-1);
 			}
 
 			if (loggeritem->getType() != mvAppItemType::Logger)
 			{
-				ThrowPythonException(std::string(logger) + " is not a logger.");
+				ThrowPythonException(logger.str() + " is not a logger.");
 				return ToPyInt(-1);
 			}
 
@@ -680,24 +822,24 @@ namespace Marvel {
 	PyObject* set_log_level(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
 		int level;
-		const char* logger = "";
+		mvItemArg logger;
 		if (!(*mvApp::GetApp()->getParsers())["set_log_level"].parse(args, kwargs, __FUNCTION__, 
 			&level, &logger))
 			return GetPyNone();
 
 
-		if (!std::string(logger).empty())
+		if (!logger.empty())
 		{
 			auto loggeritem = mvApp::GetApp()->getItemRegistry().getItem(logger);
 			if (loggeritem == nullptr)
 			{
-				ThrowPythonException(std::string(logger) + " logger does not exist.");
+				ThrowPythonException(logger.str() + " logger does not exist.");
 				return GetPyNone();
 			}
 
 			if (loggeritem->getType() != mvAppItemType::Logger)
 			{
-				ThrowPythonException(std::string(logger) + " is not a logger.");
+				ThrowPythonException(logger.str() + " is not a logger.");
 				return GetPyNone();
 			}
 
@@ -715,24 +857,24 @@ namespace Marvel {
 	{
 		PyObject* message;
 		const char* level = "TRACE";
-		const char* logger = "";
+		mvItemArg logger;
 		if (!(*mvApp::GetApp()->getParsers())["log"].parse(args, kwargs, __FUNCTION__, &message, &level, &logger))
 			return GetPyNone();
 
 		std::string cmessage = ToString(message);
 
-		if (!std::string(logger).empty())
+		if (!logger.empty())
 		{
 			auto loggeritem = mvApp::GetApp()->getItemRegistry().getItem(logger);
 			if (loggeritem == nullptr)
 			{
-				ThrowPythonException(std::string(logger) + " logger does not exist.");
+				ThrowPythonException(logger.str() + " logger does not exist.");
 				return GetPyNone();
 			}
 
 			if (loggeritem->getType() != mvAppItemType::Logger)
 			{
-				ThrowPythonException(std::string(logger) + " is not a logger.");
+				ThrowPythonException(logger.str() + " is not a logger.");
 				return GetPyNone();
 			}
 
@@ -749,25 +891,25 @@ namespace Marvel {
 	PyObject* log_debug(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
 		PyObject* message;
-		const char* logger = "";
+		mvItemArg logger;
 
 		if (!(*mvApp::GetApp()->getParsers())["log_debug"].parse(args, kwargs, __FUNCTION__, &message, &logger))
 			return GetPyNone();
 
 		std::string cmessage = ToString(message);
 
-		if (!std::string(logger).empty())
+		if (!logger.empty())
 		{
 			auto loggeritem = mvApp::GetApp()->getItemRegistry().getItem(logger);
 			if (loggeritem == nullptr)
 			{
-				ThrowPythonException(std::string(logger) + " logger does not exist.");
+				ThrowPythonException(logger.str() + " logger does not exist.");
 				return GetPyNone();
 			}
 
 			if (loggeritem->getType() != mvAppItemType::Logger)
 			{
-				ThrowPythonException(std::string(logger) + " is not a logger.");
+				ThrowPythonException(logger.str() + " is not a logger.");
 				return GetPyNone();
 			}
 
@@ -784,25 +926,25 @@ namespace Marvel {
 	PyObject* log_info(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
 		PyObject* message;
-		const char* logger = "";
+		mvItemArg logger;
 
 		if (!(*mvApp::GetApp()->getParsers())["log_info"].parse(args, kwargs, __FUNCTION__, &message, &logger))
 			return GetPyNone();
 
 		std::string cmessage = ToString(message);
 
-		if (!std::string(logger).empty())
+		if (!logger.empty())
 		{
 			auto loggeritem = mvApp::GetApp()->getItemRegistry().getItem(logger);
 			if (loggeritem == nullptr)
 			{
-				ThrowPythonException(std::string(logger) + " logger does not exist.");
+				ThrowPythonException(logger.str() + " logger does not exist.");
 				return GetPyNone();
 			}
 
 			if (loggeritem->getType() != mvAppItemType::Logger)
 			{
-				ThrowPythonException(std::string(logger) + " is not a logger.");
+				ThrowPythonException(logger.str() + " is not a logger.");
 				return GetPyNone();
 			}
 
@@ -819,25 +961,25 @@ namespace Marvel {
 	PyObject* log_warning(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
 		PyObject* message;
-		const char* logger = "";
+		mvItemArg logger;
 
 		if (!(*mvApp::GetApp()->getParsers())["log_warning"].parse(args, kwargs, __FUNCTION__, &message, &logger))
 			return GetPyNone();
 
 		std::string cmessage = ToString(message);
 
-		if (!std::string(logger).empty())
+		if (!logger.empty())
 		{
 			auto loggeritem = mvApp::GetApp()->getItemRegistry().getItem(logger);
 			if (loggeritem == nullptr)
 			{
-				ThrowPythonException(std::string(logger) + " logger does not exist.");
+				ThrowPythonException(logger.str() + " logger does not exist.");
 				return GetPyNone();
 			}
 
 			if (loggeritem->getType() != mvAppItemType::Logger)
 			{
-				ThrowPythonException(std::string(logger) + " is not a logger.");
+				ThrowPythonException(logger.str() + " is not a logger.");
 				return GetPyNone();
 			}
 
@@ -853,24 +995,24 @@ namespace Marvel {
 	PyObject* log_error(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
 		PyObject* message;
-		const char* logger = "";
+		mvItemArg logger;
 
 		if (!(*mvApp::GetApp()->getParsers())["log_error"].parse(args, kwargs, __FUNCTION__, &message, &logger))
 			return GetPyNone();
 
 		std::string cmessage = ToString(message);
-		if (!std::string(logger).empty())
+		if (!logger.empty())
 		{
 			auto loggeritem = mvApp::GetApp()->getItemRegistry().getItem(logger);
 			if (loggeritem == nullptr)
 			{
-				ThrowPythonException(std::string(logger) + " logger does not exist.");
+				ThrowPythonException(logger.str() + " logger does not exist.");
 				return GetPyNone();
 			}
 
 			if (loggeritem->getType() != mvAppItemType::Logger)
 			{
-				ThrowPythonException(std::string(logger) + " is not a logger.");
+				ThrowPythonException(logger.str() + " is not a logger.");
 				return GetPyNone();
 			}
 
@@ -885,23 +1027,23 @@ namespace Marvel {
 
 	PyObject* clear_log(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
-		const char* logger = "";
+		mvItemArg logger;
 
 		if (!(*mvApp::GetApp()->getParsers())["clear_log"].parse(args, kwargs, __FUNCTION__, &logger))
 			return GetPyNone();
 
-		if (!std::string(logger).empty())
+		if (!logger.empty())
 		{
 			auto loggeritem = mvApp::GetApp()->getItemRegistry().getItem(logger);
 			if (loggeritem == nullptr)
 			{
-				ThrowPythonException(std::string(logger) + " logger does not exist.");
+				ThrowPythonException(logger.str() + " logger does not exist.");
 				return GetPyNone();
 			}
 
 			if (loggeritem->getType() != mvAppItemType::Logger)
 			{
-				ThrowPythonException(std::string(logger) + " is not a logger.");
+				ThrowPythonException(logger.str() + " is not a logger.");
 				return GetPyNone();
 			}
 
@@ -938,7 +1080,7 @@ namespace Marvel {
 
 	PyObject* close_popup(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
-		const char* popup;
+		mvItemArg popup;
 
 		if (!(*mvApp::GetApp()->getParsers())["close_popup"].parse(args, kwargs, __FUNCTION__, &popup))
 			return GetPyNone();
@@ -949,7 +1091,7 @@ namespace Marvel {
 
 		if (item == nullptr)
 		{
-			std::string message = popup;
+			std::string message = popup.str();
 			ThrowPythonException(message + " popup does not exist.");
 			return GetPyNone();
 		}
@@ -959,7 +1101,7 @@ namespace Marvel {
 			pop = static_cast<mvPopup*>(item.get());
 		else
 		{
-			ThrowPythonException(std::string(popup) + " is not a popup.");
+			ThrowPythonException(popup.str() + " is not a popup.");
 			return GetPyNone();
 		}
 
@@ -970,14 +1112,14 @@ namespace Marvel {
 
 	PyObject* set_primary_window(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
-		const char* item;
+		mvItemArg item;
 		int value;
 
 		if (!(*mvApp::GetApp()->getParsers())["set_primary_window"].parse(args, kwargs, __FUNCTION__, &item, &value))
 			return GetPyNone();
 
 		std::lock_guard<std::mutex> lk(mvApp::GetApp()->GetApp()->getMutex());
-		mvApp::GetApp()->getItemRegistry().setPrimaryWindow(item, value);
+		mvApp::GetApp()->getItemRegistry().setPrimaryWindow(mvApp::GetApp()->getItemRegistry().getItemName(item), value);
 		
 		return GetPyNone();
 	}
@@ -21,6 +21,8 @@ namespace Marvel {
 	PyObject* render_dearpygui_frame         (PyObject* self, PyObject* args, PyObject* kwargs);
 	PyObject* cleanup_dearpygui              (PyObject* self, PyObject* args, PyObject* kwargs);
 	PyObject* set_vsync                      (PyObject* self, PyObject* args, PyObject* kwargs);
+	PyObject* set_headless                   (PyObject* self, PyObject* args, PyObject* kwargs);
+	PyObject* set_lazy_rendering             (PyObject* self, PyObject* args, PyObject* kwargs);
 	PyObject* get_dearpygui_version          (PyObject* self, PyObject* args, PyObject* kwargs);
 	PyObject* get_active_window              (PyObject* self, PyObject* args, PyObject* kwargs);
 	PyObject* add_character_remap            (PyObject* self, PyObject* args, PyObject* kwargs);
@@ -39,6 +41,10 @@ namespace Marvel {
 	// timing
 	PyObject* get_total_time                 (PyObject* self, PyObject* args, PyObject* kwargs);
 	PyObject* get_delta_time                 (PyObject* self, PyObject* args, PyObject* kwargs);
+	PyObject* set_target_fps                 (PyObject* self, PyObject* args, PyObject* kwargs);
+	PyObject* get_frame_stats                (PyObject* self, PyObject* args, PyObject* kwargs);
+	PyObject* set_thread_pool                (PyObject* self, PyObject* args, PyObject* kwargs);
+	PyObject* get_thread_pool_stats          (PyObject* self, PyObject* args, PyObject* kwargs);
 	
 	// data storage
 	PyObject* add_data                       (PyObject* self, PyObject* args, PyObject* kwargs);
@@ -8,42 +8,54 @@ namespace Marvel {
 	void AddItemCommands(std::map<std::string, mvPythonParser>* parsers)
 	{
 		parsers->insert({ "get_managed_column_width", mvPythonParser({
-			{mvPythonDataType::String, "item"},
+			{mvPythonDataType::UUID, "item"},
 			{mvPythonDataType::Integer, "column"},
 		}, "Returns the width of the ith column.", "Float", "Widget Commands") });
 
 		parsers->insert({ "set_managed_column_width", mvPythonParser({
-			{mvPythonDataType::String, "item"},
+			{mvPythonDataType::UUID, "item"},
 			{mvPythonDataType::Integer, "column"},
 			{mvPythonDataType::Float, "width"},
 		}, "Sets the width of the ith column.", "None", "Widget Commands") });
 
 		parsers->insert({ "get_item_callback_data", mvPythonParser({
-			{mvPythonDataType::String, "item"}
+			{mvPythonDataType::UUID, "item"}
 		}, "Returns an item' callback data", "Any", "Widget Commands") });
 
 		parsers->insert({ "set_item_callback_data", mvPythonParser({
-			{mvPythonDataType::String, "item"},
+			{mvPythonDataType::UUID, "item"},
 			{mvPythonDataType::Object, "callback_data", "Callback data", "None"},
 		}, "Sets an item's callback data if applicable.", "None", "Widget Commands") });
 
 		parsers->insert({ "move_item", mvPythonParser({
-			{mvPythonDataType::String, "item"},
+			{mvPythonDataType::UUID, "item"},
 			{mvPythonDataType::KeywordOnly},
-			{mvPythonDataType::String, "parent", "", "''"},
-			{mvPythonDataType::String, "before", "", "''"}
+			{mvPythonDataType::UUID, "parent", "", "''"},
+			{mvPythonDataType::UUID, "before", "", "''"}
 		}, "Moves an existing item.", "None", "Widget Commands") });
 
 		parsers->insert({ "get_item_type", mvPythonParser({
-			{mvPythonDataType::String, "item"}
+			{mvPythonDataType::UUID, "item"}
 		}, "Returns an item's type", "str", "Widget Commands") });
 
 		parsers->insert({ "get_item_configuration", mvPythonParser({
-			{mvPythonDataType::String, "item"}
+			{mvPythonDataType::UUID, "item"},
+			{mvPythonDataType::KeywordOnly},
+			{mvPythonDataType::StringList, "keys", "Only return these keys", "[]"}
 		}, "Returns an items configuration", "dict", "Widget Commands") });
 
+		parsers->insert({ "get_items_configuration", mvPythonParser({
+			{mvPythonDataType::Object, "items", "List of item names or handles"},
+			{mvPythonDataType::KeywordOnly},
+			{mvPythonDataType::StringList, "keys", "Only return these keys", "[]"}
+		}, "Returns the configuration of each item (None for items not found)", "List[dict]", "Widget Commands") });
+
+		parsers->insert({ "configure_items", mvPythonParser({
+			{mvPythonDataType::Dict, "items", "Maps item names or handles to their configuration"},
+		}, "Configures many items at once", "None", "Widget Commands") });
+
 		parsers->insert({ "configure_item", mvPythonParser({
-			{mvPythonDataType::String, "item"},
+			{mvPythonDataType::UUID, "item"},
 			{mvPythonDataType::Kwargs, "**Kwargs"},
 		}, "Configures an item", "None", "Widget Commands") });
 
@@ -54,122 +66,136 @@ namespace Marvel {
 		}, "Returns a list of all items.", "List[str]", "Widget Commands") });
 
 		parsers->insert({ "get_item_children", mvPythonParser({
-			{mvPythonDataType::String, "item"}
+			{mvPythonDataType::UUID, "item"}
 		}, "Returns a list of an item's children.", "List[str]", "Widget Commands") });
 		
 		parsers->insert({ "set_item_label", mvPythonParser({
-			{mvPythonDataType::String, "item"},
+			{mvPythonDataType::UUID, "item"},
 			{mvPythonDataType::String, "label"},
 		}, "Sets an item's label.", "None", "Widget Commands") });
 
 		parsers->insert({ "get_item_label", mvPythonParser({
-			{mvPythonDataType::String, "item"}
+			{mvPythonDataType::UUID, "item"}
 		}, "Gets an item's label.", "str", "Widget Commands") });
 
+		parsers->insert({ "begin_batch", mvPythonParser({
+		}, "Starts queuing item creation. Queued items are added under a single lock when the batch ends.", "None", "Widget Commands") });
+
+		parsers->insert({ "end_batch", mvPythonParser({
+		}, "Adds all items queued since begin_batch and returns the batch timing (ms).", "dict", "Widget Commands") });
+
 		parsers->insert({ "delete_item", mvPythonParser({
-			{mvPythonDataType::String, "item"},
+			{mvPythonDataType::UUID, "item"},
 			{mvPythonDataType::KeywordOnly},
 			{mvPythonDataType::Bool, "children_only", "delete children only", "False"}
 		}, "Deletes an item if it exists.", "None", "Widget Commands") });
 
 		parsers->insert({ "does_item_exist", mvPythonParser({
-		{mvPythonDataType::String, "item"},
+		{mvPythonDataType::UUID, "item"},
 		}, "Checks if item exists.", "bool", "Widget Commands") });
 
 		parsers->insert({ "move_item_up", mvPythonParser({
-			{mvPythonDataType::String, "item"}
+			{mvPythonDataType::UUID, "item"}
 		}, "Moves item up if possible and if it exists.", "None", "Widget Commands") });
 
 		parsers->insert({ "move_item_down", mvPythonParser({
-			{mvPythonDataType::String, "item"}
+			{mvPythonDataType::UUID, "item"}
 		}, "Moves item down if possible and if it exists.", "None", "Widget Commands") });
 
 		parsers->insert({ "get_item_callback", mvPythonParser({
-			{mvPythonDataType::String, "item"}
+			{mvPythonDataType::UUID, "item"}
 		}, "Returns an item' callback", "Callable", "Widget Commands") });
 
 		parsers->insert({ "get_item_height", mvPythonParser({
-			{mvPythonDataType::String, "item"}
+			{mvPythonDataType::UUID, "item"}
 		}, "Returns an item's height.", "float", "Widget Commands") });
 
 		parsers->insert({ "get_item_width", mvPythonParser({
-			{mvPythonDataType::String, "item"}
+			{mvPythonDataType::UUID, "item"}
 		}, "Returns an item's width.", "float", "Widget Commands") });
 
 		parsers->insert({ "get_item_parent", mvPythonParser({
-		{mvPythonDataType::String, "item"}
+		{mvPythonDataType::UUID, "item"}
 		}, "Returns an item's parent.", "str", "Widget Commands") });
 
 		parsers->insert({ "get_item_tip", mvPythonParser({
-			{mvPythonDataType::String, "item"}
+			{mvPythonDataType::UUID, "item"}
 		}, "Returns an item's tip.", "str", "Widget Commands") });
 
+		parsers->insert({ "get_item_states", mvPythonParser({
+			{mvPythonDataType::Optional},
+			{mvPythonDataType::Object, "items", "List of item names or handles", "[]"},
+			{mvPythonDataType::KeywordOnly},
+			{mvPythonDataType::UUID, "parent", "Also include this item and every item below it (keyed by handle)", "''"},
+			{mvPythonDataType::Bool, "rects", "Return (flags, min_x, min_y, max_x, max_y) instead of flags", "False"},
+		}, "Returns the state of many items at once as mvItemState_* bitflags.", "dict", "Widget Commands") });
+
 		parsers->insert({ "is_item_hovered", mvPythonParser({
-			{mvPythonDataType::String, "item"},
+			{mvPythonDataType::UUID, "item"},
 		}, "Checks if an item is hovered.", "bool", "Widget Commands") });
 
 		parsers->insert({ "is_item_shown", mvPythonParser({
-		{mvPythonDataType::String, "item"},
+		{mvPythonDataType::UUID, "item"},
 		}, "Checks if an item is shown.", "bool", "Widget Commands") });
 
 		parsers->insert({ "is_item_active", mvPythonParser({
-			{mvPythonDataType::String, "item"},
+			{mvPythonDataType::UUID, "item"},
 		}, "Checks if an item is active.", "bool", "Widget Commands") });
 
 		parsers->insert({ "is_item_focused", mvPythonParser({
-			{mvPythonDataType::String, "item"},
+			{mvPythonDataType::UUID, "item"},
 		}, "Checks if an item is focused.", "bool", "Widget Commands") });
 
 		parsers->insert({ "is_item_clicked", mvPythonParser({
-			{mvPythonDataType::String, "item"},
+			{mvPythonDataType::UUID, "item"},
 		}, "Checks if an item is clicked.", "bool", "Widget Commands") });
 
 		parsers->insert({ "is_item_container", mvPythonParser({
-		{mvPythonDataType::String, "item"},
+		{mvPythonDataType::UUID, "item"},
 		}, "Checks if an item is container.", "bool", "Widget Commands") });
 
 		parsers->insert({ "is_item_visible", mvPythonParser({
-			{mvPythonDataType::String, "item"},
+			{mvPythonDataType::UUID, "item"},
 		}, "Checks if an item is visible on screen.", "bool", "Widget Commands") });
 
 		parsers->insert({ "is_item_edited", mvPythonParser({
-			{mvPythonDataType::String, "item"},
+			{mvPythonDataType::UUID, "item"},
 		}, "Checks if an item has been edited.", "bool", "Widget Commands") });
 
 		parsers->insert({ "is_item_activated", mvPythonParser({
-			{mvPythonDataType::String, "item"},
+			{mvPythonDataType::UUID, "item"},
 		}, "Checks if an item has been activated.", "bool", "Widget Commands") });
 
 		parsers->insert({ "is_item_deactivated", mvPythonParser({
-			{mvPythonDataType::String, "item"},
+			{mvPythonDataType::UUID, "item"},
 		}, "Checks if an item has been deactivated.", "bool", "Widget Commands") });
 
 		parsers->insert({ "is_item_deactivated_after_edit", mvPythonParser({
-			{mvPythonDataType::String, "item"},
+			{mvPythonDataType::UUID, "item"},
 		}, "Checks if an item has been deactivated after editing.", "bool", "Widget Commands") });
 
 		parsers->insert({ "is_item_toggled_open", mvPythonParser({
-			{mvPythonDataType::String, "item"},
+			{mvPythonDataType::UUID, "item"},
 		}, "Checks if an item is toggled.", "bool", "Widget Commands") });
 
 		parsers->insert({ "get_item_rect_min", mvPythonParser({
-			{mvPythonDataType::String, "item"},
+			{mvPythonDataType::UUID, "item"},
 		}, "Returns an item's minimum allowable size. [width, height]", "[float, float]", "Widget Commands") });
 
 		parsers->insert({ "get_item_rect_max", mvPythonParser({
-			{mvPythonDataType::String, "item"},
+			{mvPythonDataType::UUID, "item"},
 		}, "Returns an item's maximum allowable size. [width, height]", "[float, float]", "Widget Commands") });
 
 		parsers->insert({ "get_item_rect_size", mvPythonParser({
-			{mvPythonDataType::String, "item"},
+			{mvPythonDataType::UUID, "item"},
 		}, "Returns an item's current size. [width, height]", "[float, float]", "Widget Commands") });
 
 		parsers->insert({ "get_value", mvPythonParser({
-			{mvPythonDataType::String, "name"}
+			{mvPythonDataType::UUID, "name"}
 		}, "Returns an item's value or None if there is none.", "Any", "Widget Commands") });
 
 		parsers->insert({ "set_value", mvPythonParser({
-			{mvPythonDataType::String, "name"},
+			{mvPythonDataType::UUID, "name"},
 			{mvPythonDataType::Object, "value"}
 		}, "Sets an item's value if applicable.", "bool", "Widget Commands") });
 
@@ -187,28 +213,28 @@ namespace Marvel {
 		}, "Decreases the reference count of a value.", "None", "Widget Commands") });
 
 		parsers->insert({ "show_item", mvPythonParser({
-			{mvPythonDataType::String, "name"}
+			{mvPythonDataType::UUID, "name"}
 		}, "Shows an item if it was hidden.", "None", "Widget Commands") });
 
 		parsers->insert({ "set_item_callback", mvPythonParser({
-			{mvPythonDataType::String, "item"},
+			{mvPythonDataType::UUID, "item"},
 			{mvPythonDataType::Callable, "callback", "Registers a callback"},
 			{mvPythonDataType::KeywordOnly},
 			{mvPythonDataType::Object, "callback_data", "Callback data", "None"},
 		}, "Sets an item's callback if applicable.", "None", "Widget Commands") });
 
 		parsers->insert({ "set_item_tip", mvPythonParser({
-			{mvPythonDataType::String, "item"},
+			{mvPythonDataType::UUID, "item"},
 			{mvPythonDataType::String, "tip"}
 		}, "Sets a simple tooltip for an item.", "None", "Widget Commands") });
 
 		parsers->insert({ "set_item_width", mvPythonParser({
-			{mvPythonDataType::String, "item"},
+			{mvPythonDataType::UUID, "item"},
 			{mvPythonDataType::Integer, "width"}
 		}, "Sets an item's width.", "None", "Widget Commands") });
 
 		parsers->insert({ "set_item_height", mvPythonParser({
-			{mvPythonDataType::String, "item"},
+			{mvPythonDataType::UUID, "item"},
 			{mvPythonDataType::Integer, "height"}
 		}, "Sets an item's height if applicable.", "None", "Widget Commands") });
 	}
@@ -216,7 +242,7 @@ namespace Marvel {
 	PyObject* get_managed_column_width(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
 
-		const char* managed_columns;
+		mvItemArg managed_columns;
 		int column;
 
 		if (!(*mvApp::GetApp()->getParsers())["get_managed_column_width"].parse(args, kwargs, __FUNCTION__,
@@ -231,7 +257,7 @@ namespace Marvel {
 
 		if (appitem == nullptr)
 		{
-			ThrowPythonException(managed_columns + std::string(" managed_columns does not exist."));
+			ThrowPythonException(managed_columns.str() + std::string(" managed_columns does not exist."));
 			return ToPyFloat(0.0f);
 		}
 
@@ -240,7 +266,7 @@ namespace Marvel {
 			columns = static_cast<mvManagedColumns*>(appitem.get());
 		else
 		{
-			ThrowPythonException(std::string(managed_columns) + " is not a managed columns.");
+			ThrowPythonException(managed_columns.str() + " is not a managed columns.");
 			return ToPyFloat(0.0f);
 		}
 
@@ -250,7 +276,7 @@ namespace Marvel {
 	PyObject* set_managed_column_width(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
 
-		const char* managed_columns;
+		mvItemArg managed_columns;
 		int column;
 		float width;
 
@@ -263,7 +289,7 @@ namespace Marvel {
 
 		if (appitem == nullptr)
 		{
-			std::string message = managed_columns;
+			std::string message = managed_columns.str();
 			ThrowPythonException(message + " managed_columns does not exist.");
 			return GetPyNone();
 		}
@@ -276,7 +302,7 @@ namespace Marvel {
 		}
 		else
 		{
-			ThrowPythonException(std::string(managed_columns) + " is not a managed columns.");
+			ThrowPythonException(managed_columns.str() + " is not a managed columns.");
 			return GetPyNone();
 		}
 
@@ -286,9 +312,9 @@ namespace Marvel {
 	PyObject* move_item(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
 
-		const char* item;
-		const char* parent = "";
-		const char* before = "";
+		mvItemArg item;
+		mvItemArg parent;
+		mvItemArg before;
 
 		if (!(*mvApp::GetApp()->getParsers())["move_item"].parse(args, kwargs, __FUNCTION__, 
 			&item, &parent, &before))
@@ -300,42 +326,162 @@ namespace Marvel {
 		return GetPyNone();
 	}
 
+	static mvRef<mvAppItem> GetItemFromObject(PyObject* item)
+	{
+		// bool is an int subclass, True/False are neither handles nor names
+		if (PyBool_Check(item))
+			return nullptr;
+		if (PyLong_Check(item))
+			return mvApp::GetApp()->getItemRegistry().getItem(ToUUID(item));
+		return mvApp::GetApp()->getItemRegistry().getItem(ToString(item));
+	}
+
+	static void GetItemConfigDict(mvAppItem* appitem, PyObject* pdict, const std::vector<std::string>& keys)
+	{
+		if (keys.empty())
+		{
+			appitem->getConfigDict(pdict);
+			appitem->getExtraConfigDict(pdict);
+		}
+		else
+			appitem->getConfigDict(pdict, keys);
+	}
+
 	PyObject* get_item_configuration(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
-		const char* item;
+		mvItemArg item;
+		PyObject* keys = nullptr;
 
-		if (!(*mvApp::GetApp()->getParsers())["get_item_configuration"].parse(args, kwargs, __FUNCTION__, &item))
+		if (!(*mvApp::GetApp()->getParsers())["get_item_configuration"].parse(args, kwargs, __FUNCTION__, &item, &keys))
 			return GetPyNone();
 
+		auto keyList = ToStringVect(keys);
 
 		std::lock_guard<std::mutex> lk(mvApp::GetApp()->GetApp()->getMutex());
 		auto appitem = mvApp::GetApp()->getItemRegistry().getItem(item);
 
 		PyObject* pdict = PyDict_New();
 
-		if (std::string(item) == "logger##standard")
+		if (item.name == "logger##standard")
 			mvAppLog::GetConfigDict(pdict);
 
 		if (appitem)
-		{
-			appitem->getConfigDict(pdict);
-			appitem->getExtraConfigDict(pdict);
-		}
+			GetItemConfigDict(appitem.get(), pdict, keyList);
 		else
-			ThrowPythonException(item + std::string(" item was not found"));
+			ThrowPythonException(item.str() + std::string(" item was not found"));
 
 		return pdict;	
 	}
 
-	PyObject* configure_item(PyObject* self, PyObject* args, PyObject* kwargs)
+	PyObject* get_items_configuration(PyObject* self, PyObject* args, PyObject* kwargs)
+	{
+		PyObject* items;
+		PyObject* keys = nullptr;
+
+		if (!(*mvApp::GetApp()->getParsers())["get_items_configuration"].parse(args, kwargs, __FUNCTION__, &items, &keys))
+			return GetPyNone();
+
+		PyObject* sequence = PySequence_Fast(items, "items must be a list or tuple");
+		if (sequence == nullptr)
+		{
+			PyErr_Print();
+			return GetPyNone();
+		}
+
+		auto keyList = ToStringVect(keys);
+		Py_ssize_t count = PySequence_Fast_GET_SIZE(sequence);
+		PyObject* result = PyList_New(count);
+
+		std::lock_guard<std::mutex> lk(mvApp::GetApp()->GetApp()->getMutex());
+
+		for (Py_ssize_t i = 0; i < count; i++)
+		{
+			auto appitem = GetItemFromObject(PySequence_Fast_GET_ITEM(sequence, i));
+			if (appitem == nullptr)
+			{
+				PyList_SET_ITEM(result, i, GetPyNone());
+				continue;
+			}
+
+			PyObject* pdict = PyDict_New();
+			GetItemConfigDict(appitem.get(), pdict, keyList);
+			PyList_SET_ITEM(result, i, pdict);
+		}
+
+		Py_DECREF(sequence);
+
+		return result;
+	}
+
+	PyObject* configure_items(PyObject* self, PyObject* args, PyObject* kwargs)
+	{
+		PyObject* items;
+
+		if (!(*mvApp::GetApp()->getParsers())["configure_items"].parse(args, kwargs, __FUNCTION__, &items))
+			return GetPyNone();
+
+		if (!PyDict_Check(items))
+		{
+			ThrowPythonException("configure_items requires a dict of item configurations.");
+			return GetPyNone();
+		}
+
+		std::lock_guard<std::mutex> lk(mvApp::GetApp()->GetApp()->getMutex());
+
+		PyObject* key;
+		PyObject* config;
+		Py_ssize_t pos = 0;
+		while (PyDict_Next(items, &pos, &key, &config))
+		{
+			auto appitem = GetItemFromObject(key);
+			if (appitem == nullptr)
+			{
+				PyObject* repr = PyObject_Str(key);
+				ThrowPythonException(ToString(repr) + std::string(" item was not found"));
+				Py_XDECREF(repr);
+				continue;
+			}
+
+			if (!PyDict_Check(config))
+			{
+				ThrowPythonException(appitem->getName() + " configuration must be a dict.");
+				continue;
+			}
+
+			appitem->checkConfigDict(config);
+			appitem->setConfigDict(config);
+			appitem->setExtraConfigDict(config);
+		}
+
+		return GetPyNone();
+	}
+
+	static void ConfigureItem(PyObject* itemObj, PyObject* kwargs)
 	{
-		 
-		std::string item = ToString(PyTuple_GetItem(args, 0));
+		if (PyLong_Check(itemObj))
+		{
+			mvUUID uuid = ToUUID(itemObj);
+			std::lock_guard<std::mutex> lk(mvApp::GetApp()->GetApp()->getMutex());
+			auto appitem = mvApp::GetApp()->getItemRegistry().getItem(uuid);
+
+			if (appitem)
+			{
+				appitem->checkConfigDict(kwargs);
+				appitem->setConfigDict(kwargs);
+				appitem->setExtraConfigDict(kwargs);
+			}
+			else
+				ThrowPythonException(std::to_string(uuid) + std::string(" item was not found"));
+
+			return;
+		}
+
+		std::string item = ToString(itemObj);
 
 		if (std::string(item) == "logger##standard")
 		{
 			mvAppLog::SetConfigDict(kwargs);
-			return GetPyNone();
+			return;
 		}
 
 		std::lock_guard<std::mutex> lk(mvApp::GetApp()->GetApp()->getMutex());
@@ -349,14 +495,52 @@ namespace Marvel {
 		}
 		else
 			ThrowPythonException(item + std::string(" item was not found"));
+	}
+
+	PyObject* configure_item(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+	{
+		if (nargs < 1)
+		{
+			ThrowPythonException("configure_item requires an item.");
+			return GetPyNone();
+		}
+
+		// keyword values follow the positional ones on the stack
+		PyObject* kwargs = PyDict_New();
+		Py_ssize_t kwCount = kwnames ? PyTuple_GET_SIZE(kwnames) : 0;
+		for (Py_ssize_t i = 0; i < kwCount; i++)
+			PyDict_SetItem(kwargs, PyTuple_GET_ITEM(kwnames, i), args[nargs + i]);
+
+		ConfigureItem(args[0], kwargs);
+		Py_DECREF(kwargs);
+
+		return GetPyNone();
+	}
+
+	PyObject* begin_batch(PyObject* self, PyObject* args, PyObject* kwargs)
+	{
+		mvApp::GetApp()->getItemRegistry().beginBatch();
 
 		return GetPyNone();
 	}
 
+	PyObject* end_batch(PyObject* self, PyObject* args, PyObject* kwargs)
+	{
+		auto stats = mvApp::GetApp()->getItemRegistry().endBatch();
+
+		PyObject* pdict = PyDict_New();
+		PyDict_SetItemString(pdict, "queued", ToPyInt(stats.queued));
+		PyDict_SetItemString(pdict, "added", ToPyInt(stats.added));
+		PyDict_SetItemString(pdict, "lock_wait", ToPyFloat(stats.lockWait));
+		PyDict_SetItemString(pdict, "commit", ToPyFloat(stats.commit));
+
+		return pdict;
+	}
+
 	PyObject* delete_item(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
 
-		const char* item;
+		mvItemArg item;
 		int childrenOnly = false;
 
 		if (!(*mvApp::GetApp()->getParsers())["delete_item"].parse(args, kwargs, __FUNCTION__, &item, &childrenOnly))
@@ -372,7 +556,7 @@ namespace Marvel {
 	PyObject* does_item_exist(PyObject * self, PyObject * args, PyObject * kwargs)
 	{
 
-		const char* item;
+		mvItemArg item;
 
 		if (!(*mvApp::GetApp()->getParsers())["does_item_exist"].parse(args, kwargs, __FUNCTION__, &item))
 			return GetPyNone();
@@ -386,7 +570,7 @@ namespace Marvel {
 	PyObject* move_item_up(PyObject * self, PyObject * args, PyObject * kwargs)
 	{
 
-		const char* item;
+		mvItemArg item;
 
 		if (!(*mvApp::GetApp()->getParsers())["move_item_up"].parse(args, kwargs, __FUNCTION__, &item))
 			return GetPyNone();
@@ -401,7 +585,7 @@ namespace Marvel {
 	PyObject* move_item_down(PyObject * self, PyObject * args, PyObject * kwargs)
 	{
 
-		const char* item;
+		mvItemArg item;
 
 		if (!(*mvApp::GetApp()->getParsers())["move_item_down"].parse(args, kwargs, __FUNCTION__, &item))
 			return GetPyNone();
@@ -414,7 +598,7 @@ namespace Marvel {
 
 	PyObject* get_item_callback(PyObject * self, PyObject * args, PyObject * kwargs)
 	{
-		const char* item;
+		mvItemArg item;
 
 		if (!(*mvApp::GetApp()->getParsers())["get_item_callback"].parse(args, kwargs, __FUNCTION__, &item))
 			return GetPyNone();
@@ -438,7 +622,7 @@ namespace Marvel {
 
 	PyObject* get_item_children(PyObject * self, PyObject * args, PyObject * kwargs)
 	{
-		const char* item;
+		mvItemArg item;
 
 		if (!(*mvApp::GetApp()->getParsers())["get_item_children"].parse(args, kwargs, __FUNCTION__, &item))
 			return GetPyNone();
@@ -468,14 +652,12 @@ namespace Marvel {
 
 	PyObject* get_item_parent(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
-		const char* item;
+		mvItemArg item;
 
 		if (!(*mvApp::GetApp()->getParsers())["get_item_parent"].parse(args, kwargs, __FUNCTION__, &item))
 			return GetPyNone();
 
 		std::lock_guard<std::mutex> lk(mvApp::GetApp()->GetApp()->getMutex());
-		auto appitem = mvApp::GetApp()->getItemRegistry().getItem(item);
-
 		std::string parent = mvApp::GetApp()->getItemRegistry().getItemParentName(item);
 
 		if (!parent.empty())
@@ -484,9 +666,91 @@ namespace Marvel {
 		return GetPyNone();
 	}
 
+	static void AddItemState(PyObject* result, PyObject* key, mvAppItem* appitem, bool rects)
+	{
+		int flags = appitem->getState().getFlags();
+		if (appitem->isShown())
+			flags |= mvItemState_Shown;
+
+		PyObject* value;
+		if (rects)
+		{
+			mvVec2 rectMin = appitem->getState().getItemRectMin();
+			mvVec2 rectMax = appitem->getState().getItemRectMax();
+			value = Py_BuildValue("(iffff)", flags, rectMin.x, rectMin.y, rectMax.x, rectMax.y);
+		}
+		else
+			value = ToPyInt(flags);
+
+		PyDict_SetItem(result, key, value);
+		Py_DECREF(value);
+	}
+
+	static void AddSubtreeStates(PyObject* result, mvAppItem* appitem, bool rects)
+	{
+		// keyed by handle since names are not unique (spacing, same_line, etc.)
+		PyObject* key = ToPyUUID(appitem->getUUID());
+		AddItemState(result, key, appitem, rects);
+		Py_DECREF(key);
+
+		for (auto& child : appitem->getChildren())
+			AddSubtreeStates(result, child.get(), rects);
+	}
+
+	PyObject* get_item_states(PyObject* self, PyObject* args, PyObject* kwargs)
+	{
+		PyObject* items = nullptr;
+		mvItemArg parent;
+		int rects = false;
+
+		if (!(*mvApp::GetApp()->getParsers())["get_item_states"].parse(args, kwargs, __FUNCTION__, &items, &parent, &rects))
+			return GetPyNone();
+
+		PyObject* sequence = nullptr;
+		if (items)
+		{
+			sequence = PySequence_Fast(items, "items must be a list or tuple");
+			if (sequence == nullptr)
+			{
+				PyErr_Print();
+				return GetPyNone();
+			}
+		}
+
+		PyObject* result = PyDict_New();
+
+		std::lock_guard<std::mutex> lk(mvApp::GetApp()->GetApp()->getMutex());
+
+		if (sequence)
+		{
+			Py_ssize_t count = PySequence_Fast_GET_SIZE(sequence);
+			for (Py_ssize_t i = 0; i < count; i++)
+			{
+				PyObject* key = PySequence_Fast_GET_ITEM(sequence, i);
+				auto appitem = GetItemFromObject(key);
+				if (appitem)
+					AddItemState(result, key, appitem.get(), rects);
+				else
+					PyDict_SetItem(result, key, Py_None);
+			}
+			Py_DECREF(sequence);
+		}
+
+		if (!parent.empty())
+		{
+			auto appitem = mvApp::GetApp()->getItemRegistry().getItem(parent);
+			if (appitem)
+				AddSubtreeStates(result, appitem.get(), rects);
+			else
+				ThrowPythonException(parent.str() + std::string(" item was not found"));
+		}
+
+		return result;
+	}
+
 	PyObject* is_item_hovered(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
-		const char* item;
+		mvItemArg item;
 
 		if (!(*mvApp::GetApp()->getParsers())["is_item_hovered"].parse(args, kwargs, __FUNCTION__, &item))
 			return GetPyNone();
@@ -500,7 +764,7 @@ namespace Marvel {
 
 	PyObject* is_item_shown(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
-		const char* item;
+		mvItemArg item;
 
 		if (!(*mvApp::GetApp()->getParsers())["is_item_shown"].parse(args, kwargs, __FUNCTION__, &item))
 			return GetPyNone();
@@ -514,7 +778,7 @@ namespace Marvel {
 
 	PyObject* is_item_active(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
-		const char* item;
+		mvItemArg item;
 
 		if (!(*mvApp::GetApp()->getParsers())["is_item_active"].parse(args, kwargs, __FUNCTION__, &item))
 			return GetPyNone();
@@ -528,7 +792,7 @@ namespace Marvel {
 
 	PyObject* is_item_focused(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
-		const char* item;
+		mvItemArg item;
 
 		if (!(*mvApp::GetApp()->getParsers())["is_item_focused"].parse(args, kwargs, __FUNCTION__, &item))
 			return GetPyNone();
@@ -542,7 +806,7 @@ namespace Marvel {
 
 	PyObject* is_item_clicked(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
-		const char* item;
+		mvItemArg item;
 
 		if (!(*mvApp::GetApp()->getParsers())["is_item_clicked"].parse(args, kwargs, __FUNCTION__, &item))
 			return GetPyNone();
@@ -556,7 +820,7 @@ namespace Marvel {
 
 	PyObject* is_item_container(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
-		const char* item;
+		mvItemArg item;
 
 		if (!(*mvApp::GetApp()->getParsers())["is_item_container"].parse(args, kwargs, __FUNCTION__, &item))
 			return GetPyNone();
@@ -571,7 +835,7 @@ namespace Marvel {
 
 	PyObject* is_item_visible(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
-		const char* item;
+		mvItemArg item;
 
 		if (!(*mvApp::GetApp()->getParsers())["is_item_visible"].parse(args, kwargs, __FUNCTION__, &item))
 			return GetPyNone();
@@ -585,7 +849,7 @@ namespace Marvel {
 
 	PyObject* is_item_edited(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
-		const char* item;
+		mvItemArg item;
 
 		if (!(*mvApp::GetApp()->getParsers())["is_item_edited"].parse(args, kwargs, __FUNCTION__, &item))
 			return GetPyNone();
@@ -599,7 +863,7 @@ namespace Marvel {
 
 	PyObject* is_item_activated(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
-		const char* item;
+		mvItemArg item;
 
 		if (!(*mvApp::GetApp()->getParsers())["is_item_activated"].parse(args, kwargs, __FUNCTION__, &item))
 			return GetPyNone();
@@ -613,7 +877,7 @@ namespace Marvel {
 
 	PyObject* is_item_deactivated(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
-		const char* item;
+		mvItemArg item;
 
 		if (!(*mvApp::GetApp()->getParsers())["is_item_deactivated"].parse(args, kwargs, __FUNCTION__, &item))
 			return GetPyNone();
@@ -627,7 +891,7 @@ namespace Marvel {
 
 	PyObject* is_item_deactivated_after_edit(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
-		const char* item;
+		mvItemArg item;
 
 		if (!(*mvApp::GetApp()->getParsers())["is_item_deactivated_after_edit"].parse(args, kwargs, __FUNCTION__, &item))
 			return GetPyNone();
@@ -641,7 +905,7 @@ namespace Marvel {
 
 	PyObject* is_item_toggled_open(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
-		const char* item;
+		mvItemArg item;
 
 		if (!(*mvApp::GetApp()->getParsers())["is_item_toggled_open"].parse(args, kwargs, __FUNCTION__, &item))
 			return GetPyNone();
@@ -658,7 +922,7 @@ namespace Marvel {
 
 	PyObject* get_item_rect_min(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
-		const char* item;
+		mvItemArg item;
 
 		if (!(*mvApp::GetApp()->getParsers())["get_item_rect_min"].parse(args, kwargs, __FUNCTION__, &item))
 			return GetPyNone();
@@ -675,7 +939,7 @@ namespace Marvel {
 
 	PyObject* get_item_rect_max(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
-		const char* item;
+		mvItemArg item;
 
 		if (!(*mvApp::GetApp()->getParsers())["get_item_rect_max"].parse(args, kwargs, __FUNCTION__, &item))
 			return GetPyNone();
@@ -693,7 +957,7 @@ namespace Marvel {
 
 	PyObject* get_item_rect_size(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
-		const char* item;
+		mvItemArg item;
 
 		if (!(*mvApp::GetApp()->getParsers())["get_item_rect_size"].parse(args, kwargs, __FUNCTION__, &item))
 			return GetPyNone();
@@ -709,37 +973,36 @@ namespace Marvel {
 		return ToPyPair(0.0f, 0.0f);
 	}
 
-	PyObject* get_value(PyObject* self, PyObject* args, PyObject* kwargs)
+	PyObject* get_value(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
 	{
-		const char* name;
+		mvItemArg name;
 
-		if (!(*mvApp::GetApp()->getParsers())["get_value"].parse(args, kwargs, __FUNCTION__, &name))
+		static mvPythonParser& parser = (*mvApp::GetApp()->getParsers())["get_value"];
+		if (!parser.parse(args, nargs, kwnames, __FUNCTION__, &name))
 			return GetPyNone();
 
-		auto fut = mvApp::GetApp()->getCallbackRegistry().submit([=]()
-			{
-				return &mvApp::GetApp()->getValueStorage();
-			});
-
 		std::lock_guard<std::mutex> lk(mvApp::GetApp()->GetApp()->getMutex());
-		PyObject* result = mvApp::GetApp()->getValueStorage().GetPyValue(name);
+		PyObject* result = mvApp::GetApp()->getValueStorage().GetPyValue(
+			mvApp::GetApp()->getItemRegistry().getItemName(name));
 
 		return result;
 	}
 
-	PyObject* set_value(PyObject* self, PyObject* args, PyObject* kwargs)
+	PyObject* set_value(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
 	{
-		const char* name;
+		mvItemArg name;
 		PyObject* value;
 
-		if (!(*mvApp::GetApp()->getParsers())["set_value"].parse(args, kwargs, __FUNCTION__, &name, &value))
+		static mvPythonParser& parser = (*mvApp::GetApp()->getParsers())["set_value"];
+		if (!parser.parse(args, nargs, kwnames, __FUNCTION__, &name, &value))
 			return GetPyNone();
 
 		if (value)
 			Py_XINCREF(value);
 
 		std::lock_guard<std::mutex> lk(mvApp::GetApp()->GetApp()->getMutex());
-		mvApp::GetApp()->getValueStorage().SetPyValue(name, value);
+		mvApp::GetApp()->getValueStorage().SetPyValue(
+			mvApp::GetApp()->getItemRegistry().getItemName(name), value);
 
 		Py_XDECREF(value);
 
@@ -793,7 +1056,7 @@ namespace Marvel {
 	{
 		PyObject* callback;
 		PyObject* callback_data = nullptr;
-		const char* item;
+		mvItemArg item;
 
 		if (!(*mvApp::GetApp()->getParsers())["set_item_callback"].parse(args, kwargs, __FUNCTION__, &item, &callback, &callback_data))
 			return GetPyNone();
@@ -820,7 +1083,7 @@ namespace Marvel {
 
 	PyObject* get_item_type(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
-		const char* name;
+		mvItemArg name;
 
 		if (!(*mvApp::GetApp()->getParsers())["get_item_type"].parse(args, kwargs, __FUNCTION__, &name))
 			return GetPyNone();
@@ -833,7 +1096,7 @@ namespace Marvel {
 
 	PyObject* get_item_callback_data(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
-		const char* item;
+		mvItemArg item;
 
 		if (!(*mvApp::GetApp()->getParsers())["get_item_callback_data"].parse(args, kwargs, __FUNCTION__, &item))
 			return GetPyNone();
@@ -858,7 +1121,7 @@ namespace Marvel {
 	PyObject* set_item_callback_data(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
 		PyObject* data;
-		const char* item;
+		mvItemArg item;
 
 		if (!(*mvApp::GetApp()->getParsers())["set_item_callback_data"].parse(args, kwargs, __FUNCTION__, &item, &data))
 			return GetPyNone();
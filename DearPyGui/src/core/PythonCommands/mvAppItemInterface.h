@@ -7,7 +7,13 @@ namespace Marvel {
 
 	PyObject* get_item_type                 (PyObject* self, PyObject* args, PyObject* kwargs);
 	PyObject* get_item_configuration        (PyObject* self, PyObject* args, PyObject* kwargs);
-	PyObject* configure_item                (PyObject* self, PyObject* args, PyObject* kwargs);
+	PyObject* configure_item                (PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames);
+	PyObject* get_items_configuration       (PyObject* self, PyObject* args, PyObject* kwargs);
+	PyObject* configure_items               (PyObject* self, PyObject* args, PyObject* kwargs);
+
+	// batching
+	PyObject* begin_batch                   (PyObject* self, PyObject* args, PyObject* kwargs);
+	PyObject* end_batch                     (PyObject* self, PyObject* args, PyObject* kwargs);
 
 	// replacing
 	PyObject* set_item_callback             (PyObject* self, PyObject* args, PyObject* kwargs);
@@ -30,6 +36,7 @@ namespace Marvel {
 	PyObject* set_managed_column_width      (PyObject* self, PyObject* args, PyObject* kwargs);
 	PyObject* get_managed_column_width      (PyObject* self, PyObject* args, PyObject* kwargs);
 
+	PyObject* get_item_states               (PyObject* self, PyObject* args, PyObject* kwargs);
 	PyObject* is_item_hovered               (PyObject* self, PyObject* args, PyObject* kwargs);
 	PyObject* is_item_shown                 (PyObject* self, PyObject* args, PyObject* kwargs);
 	PyObject* is_item_active                (PyObject* self, PyObject* args, PyObject* kwargs);
@@ -45,8 +52,8 @@ namespace Marvel {
 	PyObject* get_item_rect_min             (PyObject* self, PyObject* args, PyObject* kwargs);
 	PyObject* get_item_rect_max             (PyObject* self, PyObject* args, PyObject* kwargs);
 	PyObject* get_item_rect_size            (PyObject* self, PyObject* args, PyObject* kwargs);
-	PyObject* get_value                     (PyObject* self, PyObject* args, PyObject* kwargs);
-	PyObject* set_value                     (PyObject* self, PyObject* args, PyObject* kwargs);
+	PyObject* get_value                     (PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames);
+	PyObject* set_value                     (PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames);
 	PyObject* add_value                     (PyObject* self, PyObject* args, PyObject* kwargs);
 	PyObject* incref_value                  (PyObject* self, PyObject* args, PyObject* kwargs);
 	PyObject* decref_value                  (PyObject* self, PyObject* args, PyObject* kwargs);
@@ -9,9 +9,9 @@ namespace Marvel {
 			{mvPythonDataType::KeywordOnly},
 			{mvPythonDataType::String, "name", "", "'separator'"},
 			{mvPythonDataType::String, "tip", "Adds a simple tooltip", "''"},
-			{mvPythonDataType::String, "parent", "Parent this item will be added to. (runtime adding)", "''"},
-			{mvPythonDataType::String, "before","This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
-		}, "Adds a horizontal line.", "None", "Adding Widgets") });
+			{mvPythonDataType::UUID, "parent", "Parent this item will be added to. (runtime adding)", "''"},
+			{mvPythonDataType::UUID, "before","This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
+		}, "Adds a horizontal line.", "int", "Adding Widgets") });
 
 		parsers->insert({ "add_simple_plot", mvPythonParser({
 			{mvPythonDataType::String, "name"},
@@ -22,62 +22,62 @@ namespace Marvel {
 			{mvPythonDataType::Float, "maxscale", "used if autoscale is false", "0.0"},
 			{mvPythonDataType::Bool, "histogram", "create a histogram", "False"},
 			{mvPythonDataType::String, "tip", "Adds a simple tooltip", "''"},
-			{mvPythonDataType::String, "parent", "Parent this item will be added to. (runtime adding)", "''"},
-			{mvPythonDataType::String, "before","This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
+			{mvPythonDataType::UUID, "parent", "Parent this item will be added to. (runtime adding)", "''"},
+			{mvPythonDataType::UUID, "before","This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
 			{mvPythonDataType::Integer, "width","", "0"},
 			{mvPythonDataType::Integer, "height","", "0"},
 			{mvPythonDataType::String, "source","", "''"},
 			{mvPythonDataType::String, "label", "", "''"},
 			{mvPythonDataType::Bool, "show", "Attempt to render", "True"},
-		}, "A simple plot for visualization of a set of values", "None", "Adding Widgets") });
+		}, "A simple plot for visualization of a set of values", "int", "Adding Widgets") });
 
 		parsers->insert({ "add_indent", mvPythonParser({
 			{mvPythonDataType::KeywordOnly},
 			{mvPythonDataType::String, "name", "", "'indent'"},
 			{mvPythonDataType::Float, "offset", "", "0.0"},
-			{mvPythonDataType::String, "parent", "Parent to add this item to. (runtime adding)", "''"},
-			{mvPythonDataType::String, "before", "This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
+			{mvPythonDataType::UUID, "parent", "Parent to add this item to. (runtime adding)", "''"},
+			{mvPythonDataType::UUID, "before", "This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
 			{mvPythonDataType::Bool, "show", "Attempt to render", "True"},
-		}, "Adds an indent to following items. Must be closed with the unindent command.", "None", "Adding Widgets") });
+		}, "Adds an indent to following items. Must be closed with the unindent command.", "int", "Adding Widgets") });
 
 		parsers->insert({ "unindent", mvPythonParser({
 			{mvPythonDataType::KeywordOnly},
 			{mvPythonDataType::String, "name", "", "'unindent'"},
 			{mvPythonDataType::Float, "offset", "", "0.0"},
-			{mvPythonDataType::String, "parent", "Parent to add this item to. (runtime adding)", "''"},
-			{mvPythonDataType::String, "before", "This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
+			{mvPythonDataType::UUID, "parent", "Parent to add this item to. (runtime adding)", "''"},
+			{mvPythonDataType::UUID, "before", "This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
 			{mvPythonDataType::Bool, "show", "Attempt to render", "True"},
-		}, "Unindents following items.", "None", "Adding Widgets") });
+		}, "Unindents following items.", "int", "Adding Widgets") });
 
 		parsers->insert({ "add_spacing", mvPythonParser({
 			{mvPythonDataType::KeywordOnly},
 			{mvPythonDataType::String, "name", "", "'spacing'"},
 			{mvPythonDataType::Integer, "count", "", "1"},
-			{mvPythonDataType::String, "parent", "Parent to add this item to. (runtime adding)", "''"},
-			{mvPythonDataType::String, "before", "This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
+			{mvPythonDataType::UUID, "parent", "Parent to add this item to. (runtime adding)", "''"},
+			{mvPythonDataType::UUID, "before", "This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
 			{mvPythonDataType::Bool, "show", "Attempt to render", "True"},
-		}, "Adds vertical spacing.", "None", "Adding Widgets") });
+		}, "Adds vertical spacing.", "int", "Adding Widgets") });
 
 		parsers->insert({ "add_same_line", mvPythonParser({
 			{mvPythonDataType::KeywordOnly},
 			{mvPythonDataType::String, "name", "", "'sameline'"},
 			{mvPythonDataType::Float, "xoffset", "offset from containing window", "0.0"},
 			{mvPythonDataType::Float, "spacing", "offset from previous widget", "-1.0"},
-			{mvPythonDataType::String, "parent", "Parent to add this item to. (runtime adding)", "''"},
-			{mvPythonDataType::String, "before", "This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
+			{mvPythonDataType::UUID, "parent", "Parent to add this item to. (runtime adding)", "''"},
+			{mvPythonDataType::UUID, "before", "This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
 			{mvPythonDataType::Bool, "show", "Attempt to render", "True"},
 		}, "Places a widget on the same line as the previous widget. Can also be used for horizontal spacing.",
-		"None", "Adding Widgets") });
+		"int", "Adding Widgets") });
 
 		parsers->insert({ "add_dummy", mvPythonParser({
 			{mvPythonDataType::KeywordOnly},
 			{mvPythonDataType::Integer, "width", "", "0"},
 			{mvPythonDataType::Integer, "height", "", "0"},
 			{mvPythonDataType::String, "name", "", "'dummy'"},
-			{mvPythonDataType::String, "parent", "Parent to add this item to. (runtime adding)", "''"},
-			{mvPythonDataType::String, "before", "This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
+			{mvPythonDataType::UUID, "parent", "Parent to add this item to. (runtime adding)", "''"},
+			{mvPythonDataType::UUID, "before", "This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
 			{mvPythonDataType::Bool, "show", "Attempt to render", "True"}
-		}, "Adds a spacer or 'dummy' object.", "None", "Adding Widgets") });
+		}, "Adds a spacer or 'dummy' object.", "int", "Adding Widgets") });
 	}
 
 	PyObject* add_simple_plot(PyObject* self, PyObject* args, PyObject* kwargs)
@@ -89,8 +89,8 @@ namespace Marvel {
 		int histogram = false;
 		PyObject* value = nullptr;
 		const char* tip = "";
-		const char* parent = "";
-		const char* before = "";
+		mvItemArg parent;
+		mvItemArg before;
 		int width = 0;
 		int height = 0;
 		const char* source = "";
@@ -111,7 +111,7 @@ namespace Marvel {
 
 		mvApp::GetApp()->getItemRegistry().addItemWithRuntimeChecks(item, parent, before);
 
-		return GetPyNone();
+		return ToPyUUID(item->getUUID());
 	}
 
 	PyObject* add_indent(PyObject* self, PyObject* args, PyObject* kwargs)
@@ -120,8 +120,8 @@ namespace Marvel {
 		std::string sname = std::string("indent" + std::to_string(i));
 		const char* name = sname.c_str();
 		float offset = 0.0f;
-		const char* before = "";
-		const char* parent = "";
+		mvItemArg before;
+		mvItemArg parent;
 		int show = true;
 
 		if (!(*mvApp::GetApp()->getParsers())["add_indent"].parse(args, kwargs, __FUNCTION__, &name, &offset,
@@ -136,7 +136,7 @@ namespace Marvel {
 
 		mvApp::GetApp()->getItemRegistry().addItemWithRuntimeChecks(item, parent, before);
 
-		return GetPyNone();
+		return ToPyUUID(item->getUUID());
 	}
 
 	PyObject* unindent(PyObject* self, PyObject* args, PyObject* kwargs)
@@ -145,8 +145,8 @@ namespace Marvel {
 		std::string sname = std::string("unindent" + std::to_string(i));
 		const char* name = sname.c_str();
 		float offset = 0.0f;
-		const char* before = "";
-		const char* parent = "";
+		mvItemArg before;
+		mvItemArg parent;
 		int show = true;
 
 		if (!(*mvApp::GetApp()->getParsers())["unindent"].parse(args, kwargs, __FUNCTION__, 
@@ -161,7 +161,7 @@ namespace Marvel {
 
 		mvApp::GetApp()->getItemRegistry().addItemWithRuntimeChecks(item, parent, before);
 
-		return GetPyNone();
+		return ToPyUUID(item->getUUID());
 	}
 
 	PyObject* add_spacing(PyObject* self, PyObject* args, PyObject* kwargs)
@@ -170,8 +170,8 @@ namespace Marvel {
 		std::string sname = std::string("spacing" + std::to_string(i));
 		const char* name = sname.c_str();
 		int count = 1;
-		const char* before = "";
-		const char* parent = "";
+		mvItemArg before;
+		mvItemArg parent;
 		int show = true;
 
 		if (!(*mvApp::GetApp()->getParsers())["add_spacing"].parse(args, kwargs, __FUNCTION__, &name, &count,
@@ -186,7 +186,7 @@ namespace Marvel {
 
 		mvApp::GetApp()->getItemRegistry().addItemWithRuntimeChecks(item, parent, before);
 
-		return GetPyNone();
+		return ToPyUUID(item->getUUID());
 	}
 
 	PyObject* add_dummy(PyObject* self, PyObject* args, PyObject* kwargs)
@@ -196,8 +196,8 @@ namespace Marvel {
 		const char* name = sname.c_str();
 		int width;
 		int height;
-		const char* before = "";
-		const char* parent = "";
+		mvItemArg before;
+		mvItemArg parent;
 		int show = true;
 
 		if (!(*mvApp::GetApp()->getParsers())["add_dummy"].parse(args, kwargs, __FUNCTION__, &width, &height, &name,
@@ -212,7 +212,7 @@ namespace Marvel {
 
 		mvApp::GetApp()->getItemRegistry().addItemWithRuntimeChecks(item, parent, before);
 
-		return GetPyNone();
+		return ToPyUUID(item->getUUID());
 	}
 
 	PyObject* add_same_line(PyObject* self, PyObject* args, PyObject* kwargs)
@@ -222,8 +222,8 @@ namespace Marvel {
 		const char* name = sname.c_str();
 		float xoffset = 0.0f;
 		float spacing = -1.0f;
-		const char* before = "";
-		const char* parent = "";
+		mvItemArg before;
+		mvItemArg parent;
 		int show = true;
 
 		if (!(*mvApp::GetApp()->getParsers())["add_same_line"].parse(args, kwargs, __FUNCTION__, &name,
@@ -238,7 +238,7 @@ namespace Marvel {
 
 		mvApp::GetApp()->getItemRegistry().addItemWithRuntimeChecks(item, parent, before);
 
-		return GetPyNone();
+		return ToPyUUID(item->getUUID());
 	}
 
 	PyObject* add_separator(PyObject* self, PyObject* args, PyObject* kwargs)
@@ -247,8 +247,8 @@ namespace Marvel {
 		std::string sname = std::string("separator" + std::to_string(i));
 		const char* name = sname.c_str();
 		const char* tip = "";
-		const char* parent = "";
-		const char* before = "";
+		mvItemArg parent;
+		mvItemArg before;
 
 		if (!(*mvApp::GetApp()->getParsers())["add_separator"].parse(args, kwargs, __FUNCTION__, &name, &tip, &parent, &before))
 			return ToPyBool(false);
@@ -260,6 +260,6 @@ namespace Marvel {
 
 		mvApp::GetApp()->getItemRegistry().addItemWithRuntimeChecks(item, parent, before);
 
-		return GetPyNone();
+		return ToPyUUID(item->getUUID());
 	}
 }
@@ -6,18 +6,18 @@ namespace Marvel {
 	{
 
 		parsers->insert({ "add_popup", mvPythonParser({
-			{mvPythonDataType::String, "popupparent", "Parent that the popup will be assigned to."},
+			{mvPythonDataType::UUID, "popupparent", "Parent that the popup will be assigned to."},
 			{mvPythonDataType::String, "name"},
 			{mvPythonDataType::KeywordOnly},
 			{mvPythonDataType::Integer, "mousebutton", "The mouse code that will trigger the popup.", "1"},
 			{mvPythonDataType::Bool, "modal", "", "False"},
-			{mvPythonDataType::String, "parent", "Parent to add this item to. (runtime adding)", "''"},
-			{mvPythonDataType::String, "before", "This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
+			{mvPythonDataType::UUID, "parent", "Parent to add this item to. (runtime adding)", "''"},
+			{mvPythonDataType::UUID, "before", "This item will be displayed before the specified item in the parent. (runtime adding)", "''"},
 			{mvPythonDataType::Integer, "width", "", "0"},
 			{mvPythonDataType::Integer, "height", "", "0"},
 			{mvPythonDataType::Bool, "show", "Attempt to render", "True"},
 		}, "Adds a popup window for an item. This command must come immediately after the item the popup is for. Must be followed by a call to end.",
-		"None", "Containers") });
+		"int", "Containers") });
 
 		parsers->insert({ "end", mvPythonParser({
 		}, "Ends a container.", "None", "Containers") });
@@ -43,7 +43,7 @@ namespace Marvel {
 			{mvPythonDataType::String, "label", "", "''"},
 			{mvPythonDataType::Bool, "show", "Attempt to render", "True"},
 		}, "Creates an about window.",
-			"None", "Containers") });
+			"int", "Containers") });
 
 		parsers->insert({ "add_metrics_window", mvPythonParser({
 			{mvPythonDataType::String, "name"},
@@ -66,7 +66,7 @@ namespace Marvel {
 			{mvPythonDataType::String, "label", "", "''"},
 			{mvPythonDataType::Bool, "show", "Attempt to render", "True"},
 		}, "Creates a metrics window.",
-	"None", "Containers") });
+	"int", "Containers") });
 
 	}
 
@@ -104,7 +104,7 @@ namespace Marvel {
 		item->setConfigDict(kwargs);
 		item->setExtraConfigDict(kwargs);
 
-		if (mvApp::GetApp()->getItemRegistry().addItemWithRuntimeChecks(item, "", ""))
+		if (mvApp::GetApp()->getItemRegistry().addItemWithRuntimeChecks(item, mvItemArg(), mvItemArg()))
 		{
 			mvApp::GetApp()->getItemRegistry().pushParent(item);
 			if (!show)
@@ -112,7 +112,7 @@ namespace Marvel {
 
 		}
 
-		return GetPyNone();
+		return ToPyUUID(item->getUUID());
 	}
 
 	PyObject* add_metrics_window(PyObject* self, PyObject* args, PyObject* kwargs)
@@ -149,7 +149,7 @@ namespace Marvel {
 		item->setConfigDict(kwargs);
 		item->setExtraConfigDict(kwargs);
 
-		if (mvApp::GetApp()->getItemRegistry().addItemWithRuntimeChecks(item, "", ""))
+		if (mvApp::GetApp()->getItemRegistry().addItemWithRuntimeChecks(item, mvItemArg(), mvItemArg()))
 		{
 			mvApp::GetApp()->getItemRegistry().pushParent(item);
 			if (!show)
@@ -157,17 +157,17 @@ namespace Marvel {
 
 		}
 
-		return GetPyNone();
+		return ToPyUUID(item->getUUID());
 	}
 
 	PyObject* add_popup(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
-		const char* popupparent;
+		mvItemArg popupparent;
 		const char* name;
 		int mousebutton = 1;
 		int modal = false;
-		const char* parent = "";
-		const char* before = "";
+		mvItemArg parent;
+		mvItemArg before;
 		int width = 0;
 		int height = 0;
 		int show = true;
@@ -192,7 +192,7 @@ namespace Marvel {
 
 		}
 
-		return GetPyNone();
+		return ToPyUUID(item->getUUID());
 	}
 
 	PyObject* end(PyObject* self, PyObject* args, PyObject* kwargs)
@@ -62,7 +62,7 @@ namespace Marvel {
 		parsers->insert({ "set_resize_callback", mvPythonParser({
 			{mvPythonDataType::Callable, "callback", "Registers a callback"},
 			{mvPythonDataType::KeywordOnly},
-			{mvPythonDataType::String, "handler", "Callback will be run when window is resized (default is viewport)", "''"},
+			{mvPythonDataType::UUID, "handler", "Callback will be run when window is resized (default is viewport)", "''"},
 		}, "Sets a callback for a window resize event.", "None", "Input Polling") });
 
 		parsers->insert({ "set_mouse_release_callback", mvPythonParser({
@@ -412,7 +412,7 @@ namespace Marvel {
 	PyObject* set_resize_callback(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
 		PyObject* callback = nullptr;
-		const char* handler = "";
+		mvItemArg handler;
 
 		if (!(*mvApp::GetApp()->getParsers())["set_resize_callback"].parse(args, kwargs, __FUNCTION__, 
 			&callback, &handler))
@@ -424,7 +424,7 @@ namespace Marvel {
 		auto fut = mvApp::GetApp()->getCallbackRegistry().submit([=]()
 			{
 
-				if (std::string(handler).empty())
+				if (handler.empty())
 				{
 					mvApp::GetApp()->getCallbackRegistry().setResizeCallback(callback);
 					return std::string("");
@@ -5,57 +5,65 @@ namespace Marvel {
 	void AddPlotCommands(std::map<std::string, mvPythonParser>* parsers)
 	{
 		parsers->insert({ "clear_plot", mvPythonParser({
-			{mvPythonDataType::String, "plot"},
+			{mvPythonDataType::UUID, "plot"},
 		}, "Clears a plot.", "None", "Plotting") });
 
 		parsers->insert({ "is_plot_queried", mvPythonParser({
-			{mvPythonDataType::String, "plot"},
+			{mvPythonDataType::UUID, "plot"},
 		}, "Returns true if plot was queried", "bool", "Plotting") });
 
 		parsers->insert({ "get_plot_query_area", mvPythonParser({
-			{mvPythonDataType::String, "plot"},
+			{mvPythonDataType::UUID, "plot"},
 		}, "Returns the bounding axis limits for the query area [x_min, x_max, y_min, y_max]", "List[float]", "Plotting") });
 
+		parsers->insert({ "get_plot_nearest_points", mvPythonParser({
+			{mvPythonDataType::UUID, "plot"},
+			{mvPythonDataType::Double, "x"},
+			{mvPythonDataType::Double, "y"},
+			{mvPythonDataType::Float, "radius", "search radius in pixels"},
+		}, "Returns the closest point of each line, scatter, stair, stem, bar, shade, area and error series "
+			"within radius pixels of (x, y) as [series, index, x, y], nearest first.", "List[List[Any]]", "Plotting") });
+
 		parsers->insert({ "set_color_map", mvPythonParser({
-			{mvPythonDataType::String, "plot"},
+			{mvPythonDataType::UUID, "plot"},
 			{mvPythonDataType::Integer, "map"}
 		}, "Sets the color map of the plot's series.", "None", "Plotting") });
 
 		parsers->insert({ "delete_series", mvPythonParser({
-			{mvPythonDataType::String, "plot"},
+			{mvPythonDataType::UUID, "plot"},
 			{mvPythonDataType::String, "series"}
 		}, "Deletes a series if it exists.", "None", "Plotting") });
 
 		parsers->insert({ "get_plot_xlimits", mvPythonParser({
-			{mvPythonDataType::String, "plot"},
+			{mvPythonDataType::UUID, "plot"},
 		}, "Returns the plots x limits", "List[float]", "Plotting") });
 
 		parsers->insert({ "get_plot_ylimits", mvPythonParser({
-			{mvPythonDataType::String, "plot"},
+			{mvPythonDataType::UUID, "plot"},
 		}, "Returns the plots x limits", "List[float]", "Plotting") });
 
 		parsers->insert({ "set_plot_xlimits", mvPythonParser({
-			{mvPythonDataType::String, "plot"},
+			{mvPythonDataType::UUID, "plot"},
 			{mvPythonDataType::Float, "xmin"},
 			{mvPythonDataType::Float, "xmax"},
 		}, "Sets x axis limits of a plot. (can be undone with set_plot_xlimits_auto()", "None", "Plotting") });
 
 		parsers->insert({ "set_plot_ylimits", mvPythonParser({
-			{mvPythonDataType::String, "plot"},
+			{mvPythonDataType::UUID, "plot"},
 			{mvPythonDataType::Float, "ymin"},
 			{mvPythonDataType::Float, "ymax"},
 		}, "Sets y axis limits of a plot. (can be undone with set_plot_ylimits_auto()", "None", "Plotting") });
 
 		parsers->insert({ "set_plot_xlimits_auto", mvPythonParser({
-			{mvPythonDataType::String, "plot"},
+			{mvPythonDataType::UUID, "plot"},
 		}, "Sets plots x limits to be automatic.", "None", "Plotting") });
 
 		parsers->insert({ "set_plot_ylimits_auto", mvPythonParser({
-			{mvPythonDataType::String, "plot"},
+			{mvPythonDataType::UUID, "plot"},
 		}, "Sets plots y limits to be automatic.", "None", "Plotting") });
 
 		parsers->insert({ "add_image_series", mvPythonParser({
-			{mvPythonDataType::String, "plot"},
+			{mvPythonDataType::UUID, "plot"},
 			{mvPythonDataType::String, "name"},
 			{mvPythonDataType::String, "value"},
 			{mvPythonDataType::FloatList, "bounds_min", "bottom left coordinate"},
@@ -69,7 +77,7 @@ namespace Marvel {
 		}, "Adds a image series to a plot.", "None", "Plotting") });
 
 		parsers->insert({ "add_pie_series", mvPythonParser({
-			{mvPythonDataType::String, "plot"},
+			{mvPythonDataType::UUID, "plot"},
 			{mvPythonDataType::String, "name"},
 			{mvPythonDataType::FloatList, "values"},
 			{mvPythonDataType::StringList, "labels"},
@@ -85,7 +93,7 @@ namespace Marvel {
 		}, "Adds a pie series to a plot.", "None", "Plotting") });
 
 		parsers->insert({ "add_line_series", mvPythonParser({
-			{mvPythonDataType::String, "plot"},
+			{mvPythonDataType::UUID, "plot"},
 			{mvPythonDataType::String, "name"},
 			{mvPythonDataType::FloatList, "x"},
 			{mvPythonDataType::FloatList, "y"},
@@ -94,10 +102,12 @@ namespace Marvel {
 			{mvPythonDataType::Float, "weight", "", "1.0"},
 			{mvPythonDataType::Bool, "update_bounds", "update plot bounds", "True"},
 			{mvPythonDataType::Integer, "axis", "", "0"},
+			{mvPythonDataType::String, "x_source", "float vector in the value storage used instead of x", "''"},
+			{mvPythonDataType::String, "y_source", "float vector in the value storage used instead of y", "''"},
 		}, "Adds a line series to a plot.", "None", "Plotting") });
 
 		parsers->insert({ "add_stair_series", mvPythonParser({
-			{mvPythonDataType::String, "plot"},
+			{mvPythonDataType::UUID, "plot"},
 			{mvPythonDataType::String, "name"},
 			{mvPythonDataType::FloatList, "x"},
 			{mvPythonDataType::FloatList, "y"},
@@ -106,10 +116,12 @@ namespace Marvel {
 			{mvPythonDataType::Float, "weight", "", "1.0"},
 			{mvPythonDataType::Bool, "update_bounds", "update plot bounds", "True"},
 			{mvPythonDataType::Integer, "axis", "", "0"},
+			{mvPythonDataType::String, "x_source", "float vector in the value storage used instead of x", "''"},
+			{mvPythonDataType::String, "y_source", "float vector in the value storage used instead of y", "''"},
 		}, "Adds a stair series to a plot.", "None", "Plotting") });
 
 		parsers->insert({ "add_error_series", mvPythonParser({
-			{mvPythonDataType::String, "plot"},
+			{mvPythonDataType::UUID, "plot"},
 			{mvPythonDataType::String, "name"},
 			{mvPythonDataType::FloatList, "x"},
 			{mvPythonDataType::FloatList, "y"},
@@ -123,7 +135,7 @@ namespace Marvel {
 		}, "Adds an error series to a plot.", "None", "Plotting") });
 
 		parsers->insert({ "add_bar_series", mvPythonParser({
-			{mvPythonDataType::String, "plot"},
+			{mvPythonDataType::UUID, "plot"},
 			{mvPythonDataType::String, "name"},
 			{mvPythonDataType::FloatList, "x"},
 			{mvPythonDataType::FloatList, "y"},
@@ -132,10 +144,12 @@ namespace Marvel {
 			{mvPythonDataType::Bool, "horizontal", "", "False"},
 			{mvPythonDataType::Bool, "update_bounds", "update plot bounds", "True"},
 			{mvPythonDataType::Integer, "axis", "", "0"},
+			{mvPythonDataType::String, "x_source", "float vector in the value storage used instead of x", "''"},
+			{mvPythonDataType::String, "y_source", "float vector in the value storage used instead of y", "''"},
 		}, "Adds a bar series to a plot.", "None", "Plotting") });
 
 		parsers->insert({ "add_shade_series", mvPythonParser({
-			{mvPythonDataType::String, "plot"},
+			{mvPythonDataType::UUID, "plot"},
 			{mvPythonDataType::String, "name"},
 			{mvPythonDataType::FloatList, "x"},
 			{mvPythonDataType::FloatList, "y1"},
@@ -149,7 +163,7 @@ namespace Marvel {
 		}, "Adds a shade series to a plot.", "None", "Plotting") });
 
 		parsers->insert({ "add_candle_series", mvPythonParser({
-			{mvPythonDataType::String, "plot"},
+			{mvPythonDataType::UUID, "plot"},
 			{mvPythonDataType::String, "name"},
 			{mvPythonDataType::FloatList, "date"},
 			{mvPythonDataType::FloatList, "opens"},
@@ -165,8 +179,19 @@ namespace Marvel {
 			{mvPythonDataType::Integer, "axis", "", "0"},
 		}, "Adds a candle series to a plot.", "None", "Plotting") });
 
+		parsers->insert({ "append_series_data", mvPythonParser({
+			{mvPythonDataType::UUID, "plot"},
+			{mvPythonDataType::String, "series"},
+			{mvPythonDataType::FloatList, "x"},
+			{mvPythonDataType::FloatList, "y"},
+			{mvPythonDataType::KeywordOnly},
+			{mvPythonDataType::Integer, "max_points", "ring buffer capacity (0 keeps the current capacity, negative removes it)", "0"},
+			{mvPythonDataType::Bool, "update_bounds", "update plot bounds", "True"},
+		}, "Appends points to a line, scatter, stair, stem or bar series without resending the existing data. "
+			"Creates a line series if it does not exist. Once max_points is reached the oldest points are overwritten.", "None", "Plotting") });
+
 		parsers->insert({ "add_scatter_series", mvPythonParser({
-			{mvPythonDataType::String, "plot"},
+			{mvPythonDataType::UUID, "plot"},
 			{mvPythonDataType::String, "name"},
 			{mvPythonDataType::FloatList, "x"},
 			{mvPythonDataType::FloatList, "y"},
@@ -179,10 +204,12 @@ namespace Marvel {
 			{mvPythonDataType::Bool, "update_bounds", "update plot bounds", "True"},
 			{mvPythonDataType::Bool, "xy_data_format", "split x and y", "False"},
 			{mvPythonDataType::Integer, "axis", "", "0"},
+			{mvPythonDataType::String, "x_source", "float vector in the value storage used instead of x", "''"},
+			{mvPythonDataType::String, "y_source", "float vector in the value storage used instead of y", "''"},
 		}, "Adds a scatter series to a plot.", "None", "Plotting") });
 
 		parsers->insert({ "add_stem_series", mvPythonParser({
-			{mvPythonDataType::String, "plot"},
+			{mvPythonDataType::UUID, "plot"},
 			{mvPythonDataType::String, "name"},
 			{mvPythonDataType::FloatList, "x"},
 			{mvPythonDataType::FloatList, "y"},
@@ -194,10 +221,12 @@ namespace Marvel {
 			{mvPythonDataType::FloatList, "fill", "", "(0, 0, 0, -1)"},
 			{mvPythonDataType::Bool, "update_bounds", "update plot bounds", "True"},
 			{mvPythonDataType::Integer, "axis", "", "0"},
+			{mvPythonDataType::String, "x_source", "float vector in the value storage used instead of x", "''"},
+			{mvPythonDataType::String, "y_source", "float vector in the value storage used instead of y", "''"},
 		}, "Adds a stem series to a plot.", "None", "Plotting") });
 
 		parsers->insert({ "add_text_point", mvPythonParser({
-			{mvPythonDataType::String, "plot"},
+			{mvPythonDataType::UUID, "plot"},
 			{mvPythonDataType::String, "name"},
 			{mvPythonDataType::Float, "x"},
 			{mvPythonDataType::Float, "y"},
@@ -210,7 +239,7 @@ namespace Marvel {
 		}, "Adds a point with text to a plot.", "None", "Plotting") });
 
 		parsers->insert({ "add_area_series", mvPythonParser({
-			{mvPythonDataType::String, "plot"},
+			{mvPythonDataType::UUID, "plot"},
 			{mvPythonDataType::String, "name"},
 			{mvPythonDataType::FloatList, "x"},
 			{mvPythonDataType::FloatList, "y"},
@@ -223,7 +252,7 @@ namespace Marvel {
 		}, "Adds an area series to a plot.", "None", "Plotting") });
 
 		parsers->insert({ "add_heat_series", mvPythonParser({
-			{mvPythonDataType::String, "plot"},
+			{mvPythonDataType::UUID, "plot"},
 			{mvPythonDataType::String, "name"},
 			{mvPythonDataType::FloatList, "values"},
 			{mvPythonDataType::Integer, "rows"},
@@ -236,54 +265,83 @@ namespace Marvel {
 			{mvPythonDataType::FloatList, "bounds_max", "", "(1.0, 1.0)"},
 			{mvPythonDataType::Bool, "update_bounds", "update plot bounds", "True"},
 			{mvPythonDataType::Integer, "axis", "", "0"},
+			{mvPythonDataType::Bool, "texture", "draws the values as a single colormapped texture (no cell labels)", "False"},
 		}, "Adds a heat series to a plot.", "None", "Plotting") });
 
+		parsers->insert({ "update_heat_series", mvPythonParser({
+			{mvPythonDataType::UUID, "plot"},
+			{mvPythonDataType::String, "series"},
+			{mvPythonDataType::FloatList, "values", "whole rows of values"},
+			{mvPythonDataType::KeywordOnly},
+			{mvPythonDataType::Integer, "row", "first row replaced", "0"},
+			{mvPythonDataType::Bool, "scroll", "push the rows in at the top and drop the bottom rows (waterfall)", "False"},
+		}, "Replaces rows of a heat series without resending the whole series. "
+			"Texture mode heat series only upload the changed rows.", "None", "Plotting") });
+
 		parsers->insert({ "set_xticks", mvPythonParser({
-			{mvPythonDataType::String, "plot"},
+			{mvPythonDataType::UUID, "plot"},
 			{mvPythonDataType::Object, "label_pairs", "list of [str,float]"},
 		}, "Sets plots x ticks and labels", "None", "Plotting") });
 
 		parsers->insert({ "set_yticks", mvPythonParser({
-			{mvPythonDataType::String, "plot"},
+			{mvPythonDataType::UUID, "plot"},
 			{mvPythonDataType::Object, "label_pairs", "list of [str,float]"},
 		}, "Sets plots y ticks and labels", "None", "Plotting") });
 
 		parsers->insert({ "reset_xticks", mvPythonParser({
-			{mvPythonDataType::String, "plot"},
+			{mvPythonDataType::UUID, "plot"},
 		}, "Sets plots x ticks and labels back to automatic", "None", "Plotting") });
 
 		parsers->insert({ "reset_yticks", mvPythonParser({
-			{mvPythonDataType::String, "plot"},
+			{mvPythonDataType::UUID, "plot"},
 		}, "Sets plots y ticks and labels back to automatic", "None", "Plotting") });
 	}
 
-	static bool CheckList(const char* plot, PyObject* list)
+	static bool CheckList(const mvItemArg& plot, PyObject* list)
 	{
-		if (!PyList_Check(list))
+		// buffers (numpy arrays, array.array, memoryview) are accepted as well
+		if (!PyList_Check(list) && !PyTuple_Check(list) && !PyObject_CheckBuffer(list))
 		{
-			ThrowPythonException(std::string(plot) + " add area series requires a list of floats.");
+			ThrowPythonException(plot.str() + " series data must be a list, tuple or buffer of numbers.");
 			return false;
 		}
 		return true;
 	}
 
-	static bool CheckIfPlotOk(const char* name, mvAppItem* plot)
+	// large series are built with the GIL released so their bounds are
+	// computed on the worker pool without blocking other Python threads.
+	// The name is copied while the GIL is still held, args must not
+	// point into Python objects.
+	template<typename T, typename... Args>
+	static mvRef<T> CreateSeries(size_t points, std::string name, Args&&... args)
+	{
+		if (points < mvParallel::DefaultMinChunk)
+			return CreateRef<T>(name, std::forward<Args>(args)...);
+
+		mvRef<T> series;
+		Py_BEGIN_ALLOW_THREADS
+		series = CreateRef<T>(name, std::forward<Args>(args)...);
+		Py_END_ALLOW_THREADS
+		return series;
+	}
+
+	static bool CheckIfPlotOk(const mvItemArg& name, mvAppItem* plot)
 	{
 		if (plot == nullptr)
 		{
-			ThrowPythonException(std::string(name) + " plot does not exist.");
+			ThrowPythonException(name.str() + " plot does not exist.");
 			return false;
 		}
 
 		if (plot->getType() != mvAppItemType::Plot)
 		{
-			ThrowPythonException(std::string(name) + " is not a plot.");
+			ThrowPythonException(name.str() + " is not a plot.");
 			return false;
 		}
 		return true;
 	}
 
-	static bool Check2ArraySizes(const char* name, const std::vector<float>* first, const std::vector<float>* second)
+	static bool Check2ArraySizes(const mvItemArg& name, const std::vector<double>* first, const std::vector<double>* second)
 	{
 		if (second == nullptr)
 			return true;
@@ -291,22 +349,37 @@ namespace Marvel {
 		return first->size() == second->size();
 	}
 
-	static bool CheckArraySizes(const char* name, const std::vector<const std::vector<float>*>& arrays)
+	static bool CheckArraySizes(const mvItemArg& name, const std::vector<std::vector<double>*>& arrays)
 	{
 		for (size_t i = 0; i < arrays.size() - 1; i++)
 		{
 			if (!Check2ArraySizes(name, arrays[i], arrays[i + 1]))
 			{
-				ThrowPythonException(std::string(name) + " data list must be the same size.");
+				ThrowPythonException(name.str() + " data list must be the same size.");
 				return false;
 			}
 		}
 		return true;
 	}
 
+	static bool BindSources(const mvItemArg& plot, mvSeries* series, const std::string& x_source, const std::string& y_source)
+	{
+		if (x_source.empty() && y_source.empty())
+			return true;
+
+		if (x_source.empty() || y_source.empty())
+		{
+			ThrowPythonException(plot.str() + " series sources require both x_source and y_source.");
+			return false;
+		}
+
+		series->bindSources({ x_source, y_source });
+		return true;
+	}
+
 	PyObject* clear_plot(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
-		const char* plot;
+		mvItemArg plot;
 
 		if (!(*mvApp::GetApp()->getParsers())["clear_plot"].parse(args, kwargs, __FUNCTION__, &plot))
 			return GetPyNone();
@@ -315,14 +388,14 @@ namespace Marvel {
 		auto aplot = mvApp::GetApp()->getItemRegistry().getItem(plot);
 		if (aplot == nullptr)
 		{
-			std::string message = plot;
+			std::string message = plot.str();
 			ThrowPythonException(message + " plot does not exist.");
 			return GetPyNone();
 		}
 
 		if (aplot->getType() != mvAppItemType::Plot)
 		{
-			std::string message = plot;
+			std::string message = plot.str();
 			ThrowPythonException(message + " is not a plot.");
 			return GetPyNone();
 		}
@@ -336,7 +409,7 @@ namespace Marvel {
 
 	PyObject* reset_xticks(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
-		const char* plot;
+		mvItemArg plot;
 
 		if (!(*mvApp::GetApp()->getParsers())["reset_xticks"].parse(args, kwargs, __FUNCTION__, &plot))
 			return GetPyNone();
@@ -345,14 +418,14 @@ namespace Marvel {
 		auto aplot = mvApp::GetApp()->getItemRegistry().getItem(plot);
 		if (aplot == nullptr)
 		{
-			std::string message = plot;
+			std::string message = plot.str();
 			ThrowPythonException(message + " plot does not exist.");
 			return GetPyNone();
 		}
 
 		if (aplot->getType() != mvAppItemType::Plot)
 		{
-			std::string message = plot;
+			std::string message = plot.str();
 			ThrowPythonException(message + " is not a plot.");
 			return GetPyNone();
 		}
@@ -366,7 +439,7 @@ namespace Marvel {
 
 	PyObject* reset_yticks(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
-		const char* plot;
+		mvItemArg plot;
 
 		if (!(*mvApp::GetApp()->getParsers())["reset_yticks"].parse(args, kwargs, __FUNCTION__, &plot))
 			return GetPyNone();
@@ -375,14 +448,14 @@ namespace Marvel {
 		auto aplot = mvApp::GetApp()->getItemRegistry().getItem(plot);
 		if (aplot == nullptr)
 		{
-			std::string message = plot;
+			std::string message = plot.str();
 			ThrowPythonException(message + " plot does not exist.");
 			return GetPyNone();
 		}
 
 		if (aplot->getType() != mvAppItemType::Plot)
 		{
-			std::string message = plot;
+			std::string message = plot.str();
 			ThrowPythonException(message + " is not a plot.");
 			return GetPyNone();
 		}
@@ -396,7 +469,7 @@ namespace Marvel {
 
 	PyObject* set_xticks(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
-		const char* plot;
+		mvItemArg plot;
 		PyObject* label_pairs;
 
 		if (!(*mvApp::GetApp()->getParsers())["set_xticks"].parse(args, kwargs, __FUNCTION__, &plot, &label_pairs))
@@ -408,14 +481,14 @@ namespace Marvel {
 		auto aplot = mvApp::GetApp()->getItemRegistry().getItem(plot);
 		if (aplot == nullptr)
 		{
-			std::string message = plot;
+			std::string message = plot.str();
 			ThrowPythonException(message + " plot does not exist.");
 			return GetPyNone();
 		}
 
 		if (aplot->getType() != mvAppItemType::Plot)
 		{
-			std::string message = plot;
+			std::string message = plot.str();
 			ThrowPythonException(message + " is not a plot.");
 			return GetPyNone();
 		}
@@ -438,7 +511,7 @@ namespace Marvel {
 
 	PyObject* set_yticks(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
-		const char* plot;
+		mvItemArg plot;
 		PyObject* label_pairs;
 
 		if (!(*mvApp::GetApp()->getParsers())["set_yticks"].parse(args, kwargs, __FUNCTION__, &plot, &label_pairs))
@@ -450,14 +523,14 @@ namespace Marvel {
 		auto aplot = mvApp::GetApp()->getItemRegistry().getItem(plot);
 		if (aplot == nullptr)
 		{
-			std::string message = plot;
+			std::string message = plot.str();
 			ThrowPythonException(message + " plot does not exist.");
 			return GetPyNone();
 		}
 
 		if (aplot->getType() != mvAppItemType::Plot)
 		{
-			std::string message = plot;
+			std::string message = plot.str();
 			ThrowPythonException(message + " is not a plot.");
 			return GetPyNone();
 		}
@@ -479,7 +552,7 @@ namespace Marvel {
 
 	PyObject* set_plot_xlimits_auto(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
-		const char* plot;
+		mvItemArg plot;
 
 		if (!(*mvApp::GetApp()->getParsers())["set_plot_xlimits_auto"].parse(args, kwargs, __FUNCTION__, &plot))
 			return GetPyNone();
@@ -488,14 +561,14 @@ namespace Marvel {
 		auto aplot = mvApp::GetApp()->getItemRegistry().getItem(plot);
 		if (aplot == nullptr)
 		{
-			std::string message = plot;
+			std::string message = plot.str();
 			ThrowPythonException(message + " plot does not exist.");
 			return GetPyNone();
 		}
 
 		if (aplot->getType() != mvAppItemType::Plot)
 		{
-			std::string message = plot;
+			std::string message = plot.str();
 			ThrowPythonException(message + " is not a plot.");
 			return GetPyNone();
 		}
@@ -509,7 +582,7 @@ namespace Marvel {
 
 	PyObject* set_plot_ylimits_auto(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
-		const char* plot;
+		mvItemArg plot;
 
 		if (!(*mvApp::GetApp()->getParsers())["set_plot_ylimits_auto"].parse(args, kwargs, __FUNCTION__, &plot))
 			return GetPyNone();
@@ -518,14 +591,14 @@ namespace Marvel {
 		auto aplot = mvApp::GetApp()->getItemRegistry().getItem(plot);
 		if (aplot == nullptr)
 		{
-			std::string message = plot;
+			std::string message = plot.str();
 			ThrowPythonException(message + " plot does not exist.");
 			return GetPyNone();
 		}
 
 		if (aplot->getType() != mvAppItemType::Plot)
 		{
-			std::string message = plot;
+			std::string message = plot.str();
 			ThrowPythonException(message + " is not a plot.");
 			return GetPyNone();
 		}
@@ -539,7 +612,7 @@ namespace Marvel {
 
 	PyObject* set_plot_xlimits(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
-		const char* plot;
+		mvItemArg plot;
 		float xmin;
 		float xmax;
 
@@ -550,14 +623,14 @@ namespace Marvel {
 		auto aplot = mvApp::GetApp()->getItemRegistry().getItem(plot);
 		if (aplot == nullptr)
 		{
-			std::string message = plot;
+			std::string message = plot.str();
 			ThrowPythonException(message + " plot does not exist.");
 			return GetPyNone();
 		}
 
 		if (aplot->getType() != mvAppItemType::Plot)
 		{
-			std::string message = plot;
+			std::string message = plot.str();
 			ThrowPythonException(message + " is not a plot.");
 			return GetPyNone();
 		}
@@ -571,7 +644,7 @@ namespace Marvel {
 
 	PyObject* set_plot_ylimits(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
-		const char* plot;
+		mvItemArg plot;
 		float ymin;
 		float ymax;
 
@@ -582,14 +655,14 @@ namespace Marvel {
 		auto aplot = mvApp::GetApp()->getItemRegistry().getItem(plot);
 		if (aplot == nullptr)
 		{
-			std::string message = plot;
+			std::string message = plot.str();
 			ThrowPythonException(message + " plot does not exist.");
 			return GetPyNone();
 		}
 
 		if (aplot->getType() != mvAppItemType::Plot)
 		{
-			std::string message = plot;
+			std::string message = plot.str();
 			ThrowPythonException(message + " is not a plot.");
 			return GetPyNone();
 		}
@@ -603,7 +676,7 @@ namespace Marvel {
 
 	PyObject* is_plot_queried(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
-		const char* plot;
+		mvItemArg plot;
 
 		if (!(*mvApp::GetApp()->getParsers())["is_plot_queried"].parse(args, kwargs, __FUNCTION__, &plot))
 			return GetPyNone();
@@ -612,14 +685,14 @@ namespace Marvel {
 		auto aplot = mvApp::GetApp()->getItemRegistry().getItem(plot);
 		if (aplot == nullptr)
 		{
-			std::string message = plot;
+			std::string message = plot.str();
 			ThrowPythonException(message + " plot does not exist.");
 			return GetPyNone();
 		}
 
 		if (aplot->getType() != mvAppItemType::Plot)
 		{
-			std::string message = plot;
+			std::string message = plot.str();
 			ThrowPythonException(message + " is not a plot.");
 			return GetPyNone();
 		}
@@ -631,7 +704,7 @@ namespace Marvel {
 
 	PyObject* get_plot_xlimits(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
-		const char* plot;
+		mvItemArg plot;
 
 		if (!(*mvApp::GetApp()->getParsers())["get_plot_xlimits"].parse(args, kwargs, __FUNCTION__, &plot))
 			return GetPyNone();
@@ -640,14 +713,14 @@ namespace Marvel {
 		auto aplot = mvApp::GetApp()->getItemRegistry().getItem(plot);
 		if (aplot == nullptr)
 		{
-			std::string message = plot;
+			std::string message = plot.str();
 			ThrowPythonException(message + " plot does not exist.");
 			return GetPyNone();
 		}
 
 		if (aplot->getType() != mvAppItemType::Plot)
 		{
-			std::string message = plot;
+			std::string message = plot.str();
 			ThrowPythonException(message + " is not a plot.");
 			return GetPyNone();
 		}
@@ -660,7 +733,7 @@ namespace Marvel {
 
 	PyObject* get_plot_ylimits(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
-		const char* plot;
+		mvItemArg plot;
 
 		if (!(*mvApp::GetApp()->getParsers())["get_plot_ylimits"].parse(args, kwargs, __FUNCTION__, &plot))
 			return GetPyNone();
@@ -669,14 +742,14 @@ namespace Marvel {
 		auto aplot = mvApp::GetApp()->getItemRegistry().getItem(plot);
 		if (aplot == nullptr)
 		{
-			std::string message = plot;
+			std::string message = plot.str();
 			ThrowPythonException(message + " plot does not exist.");
 			return GetPyNone();
 		}
 
 		if (aplot->getType() != mvAppItemType::Plot)
 		{
-			std::string message = plot;
+			std::string message = plot.str();
 			ThrowPythonException(message + " is not a plot.");
 			return GetPyNone();
 		}
@@ -689,7 +762,7 @@ namespace Marvel {
 
 	PyObject* get_plot_query_area(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
-		const char* plot;
+		mvItemArg plot;
 
 		if (!(*mvApp::GetApp()->getParsers())["get_plot_query_area"].parse(args, kwargs, __FUNCTION__, &plot))
 			return GetPyNone();
@@ -698,14 +771,14 @@ namespace Marvel {
 		auto aplot = mvApp::GetApp()->getItemRegistry().getItem(plot);
 		if (aplot == nullptr)
 		{
-			std::string message = plot;
+			std::string message = plot.str();
 			ThrowPythonException(message + " plot does not exist.");
 			return GetPyNone();
 		}
 
 		if (aplot->getType() != mvAppItemType::Plot)
 		{
-			std::string message = plot;
+			std::string message = plot.str();
 			ThrowPythonException(message + " is not a plot.");
 			return GetPyNone();
 		}
@@ -716,9 +789,41 @@ namespace Marvel {
 		return Py_BuildValue("(ffff)", result[0], result[1], result[2], result[3]);
 	}
 
+	PyObject* get_plot_nearest_points(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+	{
+		mvItemArg plot;
+		double x;
+		double y;
+		float radius;
+
+		static mvPythonParser& parser = (*mvApp::GetApp()->getParsers())["get_plot_nearest_points"];
+		if (!parser.parse(args, nargs, kwnames, __FUNCTION__, &plot, &x, &y, &radius))
+			return GetPyNone();
+
+		std::vector<mvNearestPoint> points;
+		{
+			std::lock_guard<std::mutex> lk(mvApp::GetApp()->GetApp()->getMutex());
+			auto aplot = mvApp::GetApp()->getItemRegistry().getItem(plot);
+			if (!CheckIfPlotOk(plot, aplot.get()))
+				return GetPyNone();
+
+			mvPlot* graph = static_cast<mvPlot*>(aplot.get());
+			points = graph->getNearestPoints(x, y, radius);
+		}
+
+		PyObject* result = PyList_New(points.size());
+		for (size_t i = 0; i < points.size(); i++)
+		{
+			const auto& point = points[i];
+			PyList_SetItem(result, i, Py_BuildValue("[sidd]", point.series.c_str(), point.index, point.x, point.y));
+		}
+
+		return result;
+	}
+
 	PyObject* set_color_map(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
-		const char* plot;
+		mvItemArg plot;
 		int map;
 
 		if (!(*mvApp::GetApp()->getParsers())["set_color_map"].parse(args, kwargs, __FUNCTION__, &plot, &map))
@@ -728,14 +833,14 @@ namespace Marvel {
 		auto aplot = mvApp::GetApp()->getItemRegistry().getItem(plot);
 		if (aplot == nullptr)
 		{
-			std::string message = plot;
+			std::string message = plot.str();
 			ThrowPythonException(message + " plot does not exist.");
 			return GetPyNone();
 		}
 
 		if (aplot->getType() != mvAppItemType::Plot)
 		{
-			std::string message = plot;
+			std::string message = plot.str();
 			ThrowPythonException(message + " is not a plot.");
 			return GetPyNone();
 		}
@@ -749,7 +854,7 @@ namespace Marvel {
 
 	PyObject* delete_series(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
-		const char* plot;
+		mvItemArg plot;
 		const char* series;
 
 		if (!(*mvApp::GetApp()->getParsers())["delete_series"].parse(args, kwargs, __FUNCTION__, &plot, &series))
@@ -759,14 +864,14 @@ namespace Marvel {
 		auto aplot = mvApp::GetApp()->getItemRegistry().getItem(plot);
 		if (aplot == nullptr)
 		{
-			std::string message = plot;
+			std::string message = plot.str();
 			ThrowPythonException(message + " plot does not exist.");
 			return GetPyNone();
 		}
 
 		if (aplot->getType() != mvAppItemType::Plot)
 		{
-			std::string message = plot;
+			std::string message = plot.str();
 			ThrowPythonException(message + " is not a plot.");
 			return GetPyNone();
 		}
@@ -778,9 +883,9 @@ namespace Marvel {
 		return GetPyNone();
 	}
 
-	PyObject* add_image_series(PyObject* self, PyObject* args, PyObject* kwargs)
+	PyObject* add_image_series(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
 	{
-		const char* plot;
+		mvItemArg plot;
 		const char* name;
 		const char* value;
 		PyObject* bounds_min;
@@ -802,7 +907,8 @@ namespace Marvel {
 		int update_bounds = true;
 		int axis = 0;
 
-		if (!(*mvApp::GetApp()->getParsers())["add_image_series"].parse(args, kwargs, __FUNCTION__, 
+		static mvPythonParser& parser = (*mvApp::GetApp()->getParsers())["add_image_series"];
+		if (!parser.parse(args, nargs, kwnames, __FUNCTION__, 
 			&plot, &name, &value, &bounds_min, &bounds_max, &uv_min, &uv_max, &tintcolor, &update_bounds, &axis))
 			return GetPyNone();
 
@@ -822,14 +928,14 @@ namespace Marvel {
 		auto aplot = mvApp::GetApp()->getItemRegistry().getItem(plot);
 		if (aplot == nullptr)
 		{
-			std::string message = plot;
+			std::string message = plot.str();
 			ThrowPythonException(message + " plot does not exist.");
 			return GetPyNone();
 		}
 
 		if (aplot->getType() != mvAppItemType::Plot)
 		{
-			std::string message = plot;
+			std::string message = plot.str();
 			ThrowPythonException(message + " is not a plot.");
 			return GetPyNone();
 		}
@@ -841,9 +947,9 @@ namespace Marvel {
 		return GetPyNone();
 	}
 
-	PyObject* add_pie_series(PyObject* self, PyObject* args, PyObject* kwargs)
+	PyObject* add_pie_series(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
 	{
-		const char* plot;
+		mvItemArg plot;
 		const char* name;
 		PyObject* values;
 		PyObject* labels;
@@ -856,7 +962,8 @@ namespace Marvel {
 		int update_bounds = true;
 		int axis = 0;
 
-		if (!(*mvApp::GetApp()->getParsers())["add_pie_series"].parse(args, kwargs, __FUNCTION__, &plot, &name, 
+		static mvPythonParser& parser = (*mvApp::GetApp()->getParsers())["add_pie_series"];
+		if (!parser.parse(args, nargs, kwnames, __FUNCTION__, &plot, &name, 
 			&values, &labels, &x,
 			&y, &radius, &normalize, &angle, &format, &update_bounds, &axis))
 			return GetPyNone();
@@ -864,7 +971,7 @@ namespace Marvel {
 		if (!CheckList(plot, values)) return GetPyNone();
 		if (!CheckList(plot, labels)) return GetPyNone();
 
-		auto avalues = ToFloatVect(values);
+		auto avalues = ToDoubleVect(values);
 		auto alabels = ToStringVect(labels);
 
 		if (avalues.size() != alabels.size())
@@ -879,14 +986,14 @@ namespace Marvel {
 		auto aplot = mvApp::GetApp()->getItemRegistry().getItem(plot);
 		if (aplot == nullptr)
 		{
-			std::string message = plot;
+			std::string message = plot.str();
 			ThrowPythonException(message + " plot does not exist.");
 			return GetPyNone();
 		}
 
 		if (aplot->getType() != mvAppItemType::Plot)
 		{
-			std::string message = plot;
+			std::string message = plot.str();
 			ThrowPythonException(message + " is not a plot.");
 			return GetPyNone();
 		}
@@ -898,9 +1005,9 @@ namespace Marvel {
 		return GetPyNone();
 	}
 
-	PyObject* add_line_series(PyObject* self, PyObject* args, PyObject* kwargs)
+	PyObject* add_line_series(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
 	{
-		const char* plot;
+		mvItemArg plot;
 		const char* name;
 		PyObject* x;
 		PyObject* y;
@@ -912,39 +1019,45 @@ namespace Marvel {
 		PyTuple_SetItem(color, 3, PyLong_FromLong(255));
 		int update_bounds = true;
 		int axis = 0;
+		const char* x_source = "";
+		const char* y_source = "";
 
-		if (!(*mvApp::GetApp()->getParsers())["add_line_series"].parse(args, kwargs, __FUNCTION__, 
-			&plot, &name, &x, &y, &color, &weight, &update_bounds, &axis))
+		static mvPythonParser& parser = (*mvApp::GetApp()->getParsers())["add_line_series"];
+		if (!parser.parse(args, nargs, kwnames, __FUNCTION__, 
+			&plot, &name, &x, &y, &color, &weight, &update_bounds, &axis, &x_source, &y_source))
 			return GetPyNone();
 
 		if (!CheckList(plot, x)) return GetPyNone();
 		if (!CheckList(plot, y)) return GetPyNone();
 
 		auto mcolor = ToColor(color);
-		auto xs = ToFloatVect(x);
-		auto ys = ToFloatVect(y);
+		auto xs = ToDoubleVect(x);
+		auto ys = ToDoubleVect(y);
 
 		if (!CheckArraySizes(plot, { &xs, &ys })) return GetPyNone();
 
-		auto series = CreateRef<mvLineSeries>(name, &xs, &ys, mcolor, (ImPlotYAxis_)axis);
+		auto series = CreateSeries<mvLineSeries>(xs.size(), name, &xs, &ys, mcolor, (ImPlotYAxis_)axis);
 		series->setWeight(weight);
 
 		std::lock_guard<std::mutex> lk(mvApp::GetApp()->GetApp()->getMutex());
 		auto aplot = mvApp::GetApp()->getItemRegistry().getItem(plot);
 		if (aplot == nullptr)
 		{
-			std::string message = plot;
+			std::string message = plot.str();
 			ThrowPythonException(message + " plot does not exist.");
 			return GetPyNone();
 		}
 
 		if (aplot->getType() != mvAppItemType::Plot)
 		{
-			std::string message = plot;
+			std::string message = plot.str();
 			ThrowPythonException(message + " is not a plot.");
 			return GetPyNone();
 		}
 
+		if (!BindSources(plot, series.get(), x_source, y_source))
+			return GetPyNone();
+
 		mvPlot* graph = static_cast<mvPlot*>(aplot.get());
 
 		graph->updateSeries(series, update_bounds);
@@ -952,9 +1065,9 @@ namespace Marvel {
 		return GetPyNone();
 	}
 
-	PyObject* add_stair_series(PyObject* self, PyObject* args, PyObject* kwargs)
+	PyObject* add_stair_series(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
 	{
-		const char* plot;
+		mvItemArg plot;
 		const char* name;
 		PyObject* x;
 		PyObject* y;
@@ -966,21 +1079,24 @@ namespace Marvel {
 		PyTuple_SetItem(color, 3, PyLong_FromLong(255));
 		int update_bounds = true;
 		int axis = 0;
+		const char* x_source = "";
+		const char* y_source = "";
 
-		if (!(*mvApp::GetApp()->getParsers())["add_stair_series"].parse(args, kwargs, __FUNCTION__,
-			&plot, &name, &x, &y, &color, &weight, &update_bounds))
+		static mvPythonParser& parser = (*mvApp::GetApp()->getParsers())["add_stair_series"];
+		if (!parser.parse(args, nargs, kwnames, __FUNCTION__,
+			&plot, &name, &x, &y, &color, &weight, &update_bounds, &axis, &x_source, &y_source))
 			return GetPyNone();
 
 		if (!CheckList(plot, x)) return GetPyNone();
 		if (!CheckList(plot, y)) return GetPyNone();
 
 		auto mcolor = ToColor(color);
-		auto xs = ToFloatVect(x);
-		auto ys = ToFloatVect(y);
+		auto xs = ToDoubleVect(x);
+		auto ys = ToDoubleVect(y);
 
 		if (!CheckArraySizes(plot, { &xs, &ys })) return GetPyNone();
 
-		auto series = CreateRef<mvStairSeries>(name, &xs, &ys, mcolor, (ImPlotYAxis_)axis);
+		auto series = CreateSeries<mvStairSeries>(xs.size(), name, &xs, &ys, mcolor, (ImPlotYAxis_)axis);
 
 		series->setWeight(weight);
 
@@ -988,18 +1104,21 @@ namespace Marvel {
 		auto aplot = mvApp::GetApp()->getItemRegistry().getItem(plot);
 		if (aplot == nullptr)
 		{
-			std::string message = plot;
+			std::string message = plot.str();
 			ThrowPythonException(message + " plot does not exist.");
 			return GetPyNone();
 		}
 
 		if (aplot->getType() != mvAppItemType::Plot)
 		{
-			std::string message = plot;
+			std::string message = plot.str();
 			ThrowPythonException(message + " is not a plot.");
 			return GetPyNone();
 		}
 
+		if (!BindSources(plot, series.get(), x_source, y_source))
+			return GetPyNone();
+
 		mvPlot* graph = static_cast<mvPlot*>(aplot.get());
 
 		graph->updateSeries(series, update_bounds);
@@ -1007,9 +1126,9 @@ namespace Marvel {
 		return GetPyNone();
 	}
 
-	PyObject* add_bar_series(PyObject* self, PyObject* args, PyObject* kwargs)
+	PyObject* add_bar_series(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
 	{
-		const char* plot;
+		mvItemArg plot;
 		const char* name;
 		PyObject* x;
 		PyObject* y;
@@ -1017,41 +1136,47 @@ namespace Marvel {
 		int horizontal = false;
 		int update_bounds = true;
 		int axis = 0;
+		const char* x_source = "";
+		const char* y_source = "";
 
-		if (!(*mvApp::GetApp()->getParsers())["add_bar_series"].parse(args, kwargs, __FUNCTION__, 
-			&plot, &name, &x, &y, &weight, &horizontal, &update_bounds, &axis))
+		static mvPythonParser& parser = (*mvApp::GetApp()->getParsers())["add_bar_series"];
+		if (!parser.parse(args, nargs, kwnames, __FUNCTION__, 
+			&plot, &name, &x, &y, &weight, &horizontal, &update_bounds, &axis, &x_source, &y_source))
 			return GetPyNone();
 
 		if (!CheckList(plot, x)) return GetPyNone();
 		if (!CheckList(plot, y)) return GetPyNone();
 
-		auto xs = ToFloatVect(x);
-		auto ys = ToFloatVect(y);
+		auto xs = ToDoubleVect(x);
+		auto ys = ToDoubleVect(y);
 
 		if (!CheckArraySizes(plot, { &xs, &ys })) return GetPyNone();
 
-		if (xs.size() == 0)
+		if (xs.size() == 0 && !*x_source)
 			return GetPyNone();
 
-		auto series = CreateRef<mvBarSeries>(name, &xs, &ys, horizontal, (ImPlotYAxis_)axis);
+		auto series = CreateSeries<mvBarSeries>(xs.size(), name, &xs, &ys, horizontal, (ImPlotYAxis_)axis);
 		series->setWeight(weight);
 
 		std::lock_guard<std::mutex> lk(mvApp::GetApp()->GetApp()->getMutex());
 		auto aplot = mvApp::GetApp()->getItemRegistry().getItem(plot);
 		if (aplot == nullptr)
 		{
-			std::string message = plot;
+			std::string message = plot.str();
 			ThrowPythonException(message + " plot does not exist.");
 			return GetPyNone();
 		}
 
 		if (aplot->getType() != mvAppItemType::Plot)
 		{
-			std::string message = plot;
+			std::string message = plot.str();
 			ThrowPythonException(message + " is not a plot.");
 			return GetPyNone();
 		}
 
+		if (!BindSources(plot, series.get(), x_source, y_source))
+			return GetPyNone();
+
 		mvPlot* graph = static_cast<mvPlot*>(aplot.get());
 
 		graph->updateSeries(series, update_bounds);
@@ -1059,9 +1184,9 @@ namespace Marvel {
 		return GetPyNone();
 	}
 
-	PyObject* add_shade_series(PyObject* self, PyObject* args, PyObject* kwargs)
+	PyObject* add_shade_series(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
 	{
-		const char* plot;
+		mvItemArg plot;
 		const char* name;
 		PyObject* x;
 		PyObject* y1;
@@ -1081,7 +1206,8 @@ namespace Marvel {
 		int update_bounds = true;
 		int axis = 0;
 
-		if (!(*mvApp::GetApp()->getParsers())["add_shade_series"].parse(args, kwargs, __FUNCTION__, 
+		static mvPythonParser& parser = (*mvApp::GetApp()->getParsers())["add_shade_series"];
+		if (!parser.parse(args, nargs, kwnames, __FUNCTION__, 
 			&plot, &name, &x, &y1, &y2, &color, &fill, &weight, &update_bounds, &axis))
 			return GetPyNone();
 
@@ -1090,16 +1216,16 @@ namespace Marvel {
 
 		auto mcolor = ToColor(color);
 		auto mfill = ToColor(fill);
-		auto xs = ToFloatVect(x);
-		auto y1s = ToFloatVect(y1);
+		auto xs = ToDoubleVect(x);
+		auto y1s = ToDoubleVect(y1);
 
-		std::vector<float> y2s;
+		std::vector<double> y2s;
 		if(y2)
-			y2s = ToFloatVect(y2);
+			y2s = ToDoubleVect(y2);
 		else
 		{
 			for (auto item : y1s)
-				y2s.push_back(0.0f);
+				y2s.push_back(0.0);
 		}
 
 		if (!CheckArraySizes(plot, { &xs, &y1s, &y2s })) return GetPyNone();
@@ -1107,21 +1233,21 @@ namespace Marvel {
 		if(xs.size() == 0)
 			return GetPyNone();
 
-		auto series = CreateRef<mvShadeSeries>(name, mcolor, mfill , &xs, &y1s, &y2s, (ImPlotYAxis_)axis);
+		auto series = CreateSeries<mvShadeSeries>(xs.size(), name, mcolor, mfill , &xs, &y1s, &y2s, (ImPlotYAxis_)axis);
 		series->setWeight(weight);
 
 		std::lock_guard<std::mutex> lk(mvApp::GetApp()->GetApp()->getMutex());
 		auto aplot = mvApp::GetApp()->getItemRegistry().getItem(plot);
 		if (aplot == nullptr)
 		{
-			std::string message = plot;
+			std::string message = plot.str();
 			ThrowPythonException(message + " plot does not exist.");
 			return GetPyNone();
 		}
 
 		if (aplot->getType() != mvAppItemType::Plot)
 		{
-			std::string message = plot;
+			std::string message = plot.str();
 			ThrowPythonException(message + " is not a plot.");
 			return GetPyNone();
 		}
@@ -1133,9 +1259,9 @@ namespace Marvel {
 		return GetPyNone();
 	}
 
-	PyObject* add_candle_series(PyObject* self, PyObject* args, PyObject* kwargs)
+	PyObject* add_candle_series(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
 	{
-		const char* plot;
+		mvItemArg plot;
 		const char* name;
 		PyObject* dates;
 		PyObject* opens;
@@ -1159,7 +1285,8 @@ namespace Marvel {
 		int update_bounds = true;
 		int axis = 0;
 
-		if (!(*mvApp::GetApp()->getParsers())["add_candle_series"].parse(args, kwargs, __FUNCTION__,
+		static mvPythonParser& parser = (*mvApp::GetApp()->getParsers())["add_candle_series"];
+		if (!parser.parse(args, nargs, kwnames, __FUNCTION__,
 			&plot, &name, &dates, &opens, &highs, &lows, &closes, &tooltip, 
 			&bull_color, &bear_color, &weight, &update_bounds, &axis))
 			return GetPyNone();
@@ -1170,11 +1297,11 @@ namespace Marvel {
 		if (!CheckList(plot, closes)) return GetPyNone();
 		if (!CheckList(plot, lows)) return GetPyNone();
 
-		auto mdates = ToFloatVect(dates);
-		auto mopens = ToFloatVect(opens);
-		auto mhighs = ToFloatVect(highs);
-		auto mlows = ToFloatVect(lows);
-		auto mcloses = ToFloatVect(closes);
+		auto mdates = ToDoubleVect(dates);
+		auto mopens = ToDoubleVect(opens);
+		auto mhighs = ToDoubleVect(highs);
+		auto mlows = ToDoubleVect(lows);
+		auto mcloses = ToDoubleVect(closes);
 		auto mbull = ToColor(bull_color);
 		auto mbear = ToColor(bear_color);
 
@@ -1183,7 +1310,7 @@ namespace Marvel {
 		if (mdates.size() == 0)
 			return GetPyNone();
 
-		auto series = CreateRef<mvCandleSeries>(name, &mdates, &mopens, &mhighs, &mlows, &mcloses,
+		auto series = CreateSeries<mvCandleSeries>(mdates.size(), name, &mdates, &mopens, &mhighs, &mlows, &mcloses,
 			weight, mbull, mbear, (ImPlotYAxis_)axis);
 		series->setWeight(weight);
 		std::string errorMessage;
@@ -1192,14 +1319,14 @@ namespace Marvel {
 		auto aplot = mvApp::GetApp()->getItemRegistry().getItem(plot);
 		if (aplot == nullptr)
 		{
-			std::string message = plot;
+			std::string message = plot.str();
 			ThrowPythonException(message + " plot does not exist.");
 			return GetPyNone();
 		}
 
 		if (aplot->getType() != mvAppItemType::Plot)
 		{
-			std::string message = plot;
+			std::string message = plot.str();
 			ThrowPythonException(message + " is not a plot.");
 			return GetPyNone();
 		}
@@ -1211,9 +1338,9 @@ namespace Marvel {
 		return GetPyNone();
 	}
 
-	PyObject* add_scatter_series(PyObject* self, PyObject* args, PyObject* kwargs)
+	PyObject* add_scatter_series(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
 	{
-		const char* plot;
+		mvItemArg plot;
 		const char* name;
 		PyObject* x;
 		PyObject* y;
@@ -1233,40 +1360,46 @@ namespace Marvel {
 		int update_bounds = true;
 		int xy_data_format = false;
 		int axis = 0;
+		const char* x_source = "";
+		const char* y_source = "";
 
-		if (!(*mvApp::GetApp()->getParsers())["add_scatter_series"].parse(args, kwargs, __FUNCTION__, &plot, 
+		static mvPythonParser& parser = (*mvApp::GetApp()->getParsers())["add_scatter_series"];
+		if (!parser.parse(args, nargs, kwnames, __FUNCTION__, &plot, 
 			&name, &x, &y, &marker,
-			&size, &weight, &outline, &fill, &update_bounds, &xy_data_format, &axis))
+			&size, &weight, &outline, &fill, &update_bounds, &xy_data_format, &axis, &x_source, &y_source))
 			return GetPyNone();
 
 		if (!CheckList(plot, x)) return GetPyNone();
 		if (!CheckList(plot, y)) return GetPyNone();
 
-		auto xs = ToFloatVect(x);
-		auto ys = ToFloatVect(y);
+		auto xs = ToDoubleVect(x);
+		auto ys = ToDoubleVect(y);
 		auto mmarkerOutlineColor = ToColor(outline);
 		auto mmarkerFillColor = ToColor(fill);
 
 		if (!CheckArraySizes(plot, { &xs, &ys })) return GetPyNone();
 
-		auto series = CreateRef<mvScatterSeries>(name, &xs, &ys, marker, size, weight, mmarkerOutlineColor, mmarkerFillColor, (ImPlotYAxis_)axis);
+		auto series = CreateSeries<mvScatterSeries>(xs.size(), name, &xs, &ys, marker, size, weight, mmarkerOutlineColor, mmarkerFillColor, (ImPlotYAxis_)axis);
 		
 		std::lock_guard<std::mutex> lk(mvApp::GetApp()->GetApp()->getMutex());
 		auto aplot = mvApp::GetApp()->getItemRegistry().getItem(plot);
 		if (aplot == nullptr)
 		{
-			std::string message = plot;
+			std::string message = plot.str();
 			ThrowPythonException(message + " plot does not exist.");
 			return GetPyNone();
 		}
 
 		if (aplot->getType() != mvAppItemType::Plot)
 		{
-			std::string message = plot;
+			std::string message = plot.str();
 			ThrowPythonException(message + " is not a plot.");
 			return GetPyNone();
 		}
 
+		if (!BindSources(plot, series.get(), x_source, y_source))
+			return GetPyNone();
+
 		mvPlot* graph = static_cast<mvPlot*>(aplot.get());
 
 		graph->updateSeries(series, update_bounds);
@@ -1274,9 +1407,9 @@ namespace Marvel {
 		return GetPyNone();
 	}
 
-	PyObject* add_stem_series(PyObject* self, PyObject* args, PyObject* kwargs)
+	PyObject* add_stem_series(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
 	{
-		const char* plot;
+		mvItemArg plot;
 		const char* name;
 		PyObject* x;
 		PyObject* y;
@@ -1295,52 +1428,60 @@ namespace Marvel {
 		PyTuple_SetItem(fill, 3, PyLong_FromLong(255));
 		int update_bounds = true;
 		int axis = 0;
+		const char* x_source = "";
+		const char* y_source = "";
 
-		if (!(*mvApp::GetApp()->getParsers())["add_stem_series"].parse(args, kwargs, __FUNCTION__, &plot, &name, 
+		static mvPythonParser& parser = (*mvApp::GetApp()->getParsers())["add_stem_series"];
+		if (!parser.parse(args, nargs, kwnames, __FUNCTION__, &plot, &name, 
 			&x, &y, &marker,
-			&size, &weight, &outline, &fill, &update_bounds, (ImPlotYAxis_)axis))
+			&size, &weight, &outline, &fill, &update_bounds, &axis, &x_source, &y_source))
 			return GetPyNone();
 
 		if (!CheckList(plot, x)) return GetPyNone();
 		if (!CheckList(plot, y)) return GetPyNone();
 
-		auto xs = ToFloatVect(x);
-		auto ys = ToFloatVect(y);
+		auto xs = ToDoubleVect(x);
+		auto ys = ToDoubleVect(y);
 		auto mmarkerOutlineColor = ToColor(outline);
 		auto mmarkerFillColor = ToColor(fill);
 
 		if (!CheckArraySizes(plot, { &xs, &ys })) return GetPyNone();
 
-		if (xs.size() == 0)
+		if (xs.size() == 0 && !*x_source)
 			return GetPyNone();
 
+		auto series = CreateSeries<mvStemSeries>(xs.size(), name, &xs, &ys, marker, size, weight, mmarkerOutlineColor,
+			mmarkerFillColor, (ImPlotYAxis_)axis);
+
 		std::lock_guard<std::mutex> lk(mvApp::GetApp()->GetApp()->getMutex());
 		auto aplot = mvApp::GetApp()->getItemRegistry().getItem(plot);
 		if (aplot == nullptr)
 		{
-			std::string message = plot;
+			std::string message = plot.str();
 			ThrowPythonException(message + " plot does not exist.");
 			return GetPyNone();
 		}
 
 		if (aplot->getType() != mvAppItemType::Plot)
 		{
-			std::string message = plot;
+			std::string message = plot.str();
 			ThrowPythonException(message + " is not a plot.");
 			return GetPyNone();
 		}
 
+		if (!BindSources(plot, series.get(), x_source, y_source))
+			return GetPyNone();
+
 		mvPlot* graph = static_cast<mvPlot*>(aplot.get());
 
-		graph->updateSeries(CreateRef<mvStemSeries>(name, &xs, &ys, marker, size, weight, mmarkerOutlineColor,
-			mmarkerFillColor, (ImPlotYAxis_)axis), update_bounds);
+		graph->updateSeries(series, update_bounds);
 
 		return GetPyNone();
 	}
 
 	PyObject* add_text_point(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
-		const char* plot;
+		mvItemArg plot;
 		const char* name;
 		float x;
 		float y;
@@ -1354,21 +1495,21 @@ namespace Marvel {
 			&plot, &name, &x, &y, &vertical, &xoffset, &yoffset, &update_bounds, &axis))
 			return GetPyNone();
 
-		std::vector<float> ax = { x };
-		std::vector<float> ay = { y };
+		std::vector<double> ax = { x };
+		std::vector<double> ay = { y };
 
 		std::lock_guard<std::mutex> lk(mvApp::GetApp()->GetApp()->getMutex());
 		auto aplot = mvApp::GetApp()->getItemRegistry().getItem(plot);
 		if (aplot == nullptr)
 		{
-			std::string message = plot;
+			std::string message = plot.str();
 			ThrowPythonException(message + " plot does not exist.");
 			return GetPyNone();
 		}
 
 		if (aplot->getType() != mvAppItemType::Plot)
 		{
-			std::string message = plot;
+			std::string message = plot.str();
 			ThrowPythonException(message + " is not a plot.");
 			return GetPyNone();
 		}
@@ -1380,9 +1521,9 @@ namespace Marvel {
 		return GetPyNone();
 	}
 
-	PyObject* add_area_series(PyObject* self, PyObject* args, PyObject* kwargs)
+	PyObject* add_area_series(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
 	{
-		const char* plot;
+		mvItemArg plot;
 		const char* name;
 		PyObject* x;
 		PyObject* y;
@@ -1392,15 +1533,16 @@ namespace Marvel {
 		int update_bounds = true;
 		int axis = 0;
 
-		if (!(*mvApp::GetApp()->getParsers())["add_area_series"].parse(args, kwargs, __FUNCTION__, 
+		static mvPythonParser& parser = (*mvApp::GetApp()->getParsers())["add_area_series"];
+		if (!parser.parse(args, nargs, kwnames, __FUNCTION__, 
 			&plot, &name, &x, &y, &color, &fill, &weight, &update_bounds, &axis))
 			return GetPyNone();
 
 		if (!CheckList(plot, x)) return GetPyNone();
 		if (!CheckList(plot, y)) return GetPyNone();
 
-		auto xs = ToFloatVect(x);
-		auto ys = ToFloatVect(y);
+		auto xs = ToDoubleVect(x);
+		auto ys = ToDoubleVect(y);
 
 		if (!CheckArraySizes(plot, { &xs, &ys })) return GetPyNone();
 
@@ -1414,14 +1556,14 @@ namespace Marvel {
 		auto aplot = mvApp::GetApp()->getItemRegistry().getItem(plot);
 		if (aplot == nullptr)
 		{
-			std::string message = plot;
+			std::string message = plot.str();
 			ThrowPythonException(message + " plot does not exist.");
 			return GetPyNone();
 		}
 
 		if (aplot->getType() != mvAppItemType::Plot)
 		{
-			std::string message = plot;
+			std::string message = plot.str();
 			ThrowPythonException(message + " is not a plot.");
 			return GetPyNone();
 		}
@@ -1429,8 +1571,11 @@ namespace Marvel {
 		mvPlot* graph = static_cast<mvPlot*>(aplot.get());
 
 		graph->deleteSeries(name);
-		auto aseries = CreateRef<mvAreaSeries>(name, &xs, &ys, mcolor, mfill, (ImPlotYAxis_)axis);
-		auto lseries = CreateRef<mvLineSeries>(name, &xs, &ys, mcolor, (ImPlotYAxis_)axis);
+		// series take ownership of their data so the outline gets its own copy
+		std::vector<double> lxs = xs;
+		std::vector<double> lys = ys;
+		auto aseries = CreateSeries<mvAreaSeries>(xs.size(), name, &xs, &ys, mcolor, mfill, (ImPlotYAxis_)axis);
+		auto lseries = CreateSeries<mvLineSeries>(lxs.size(), name, &lxs, &lys, mcolor, (ImPlotYAxis_)axis);
 		aseries->setWeight(weight);
 		lseries->setWeight(weight);
 		graph->addSeries(aseries, update_bounds);
@@ -1439,9 +1584,9 @@ namespace Marvel {
 		return GetPyNone();
 	}
 
-	PyObject* add_error_series(PyObject* self, PyObject* args, PyObject* kwargs)
+	PyObject* add_error_series(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
 	{
-		const char* plot;
+		mvItemArg plot;
 		const char* name;
 		PyObject* x;
 		PyObject* y;
@@ -1456,7 +1601,8 @@ namespace Marvel {
 		PyTuple_SetItem(color, 3, PyLong_FromLong(255));
 		int axis = 0;
 
-		if (!(*mvApp::GetApp()->getParsers())["add_error_series"].parse(args, kwargs, __FUNCTION__, 
+		static mvPythonParser& parser = (*mvApp::GetApp()->getParsers())["add_error_series"];
+		if (!parser.parse(args, nargs, kwnames, __FUNCTION__, 
 			&plot, &name, &x, &y, &negative, &positive, &horizontal, &update_bounds, &color, &axis))
 			return GetPyNone();
 
@@ -1465,10 +1611,10 @@ namespace Marvel {
 		if (!CheckList(plot, negative)) return GetPyNone();
 		if (!CheckList(plot, positive)) return GetPyNone();
 
-		auto xs = ToFloatVect(x);
-		auto ys = ToFloatVect(y);
-		auto negatives = ToFloatVect(negative);
-		auto positives = ToFloatVect(positive);
+		auto xs = ToDoubleVect(x);
+		auto ys = ToDoubleVect(y);
+		auto negatives = ToDoubleVect(negative);
+		auto positives = ToDoubleVect(positive);
 
 		if (!CheckArraySizes(plot, { &xs, &ys, &negatives, &positives })) return GetPyNone();
 
@@ -1476,20 +1622,20 @@ namespace Marvel {
 			return GetPyNone();
 
 		auto mcolor = ToColor(color);
-		auto series = CreateRef<mvErrorSeries>(name, &xs, &ys, &negatives, &positives, horizontal, mcolor, (ImPlotYAxis_)axis);
+		auto series = CreateSeries<mvErrorSeries>(xs.size(), name, &xs, &ys, &negatives, &positives, horizontal, mcolor, (ImPlotYAxis_)axis);
 		
 		std::lock_guard<std::mutex> lk(mvApp::GetApp()->GetApp()->getMutex());
 		auto aplot = mvApp::GetApp()->getItemRegistry().getItem(plot);
 		if (aplot == nullptr)
 		{
-			std::string message = plot;
+			std::string message = plot.str();
 			ThrowPythonException(message + " plot does not exist.");
 			return GetPyNone();
 		}
 
 		if (aplot->getType() != mvAppItemType::Plot)
 		{
-			std::string message = plot;
+			std::string message = plot.str();
 			ThrowPythonException(message + " is not a plot.");
 			return GetPyNone();
 		}
@@ -1501,9 +1647,9 @@ namespace Marvel {
 		return GetPyNone();
 	}
 
-	PyObject* add_heat_series(PyObject* self, PyObject* args, PyObject* kwargs)
+	PyObject* add_heat_series(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
 	{
-		const char* plot;
+		mvItemArg plot;
 		const char* name;
 		PyObject* values;
 		int rows;
@@ -1519,36 +1665,44 @@ namespace Marvel {
 		PyTuple_SetItem(bounds_max, 1, PyLong_FromLong(1));
 		int update_bounds = true;
 		int axis = 0;
+		int texture = false;
 
-		if (!(*mvApp::GetApp()->getParsers())["add_heat_series"].parse(args, kwargs, __FUNCTION__, 
+		static mvPythonParser& parser = (*mvApp::GetApp()->getParsers())["add_heat_series"];
+		if (!parser.parse(args, nargs, kwnames, __FUNCTION__, 
 			&plot, &name, &values, &rows, &columns, &scale_min, &scale_max, &format, 
-			&bounds_min, &bounds_max, &update_bounds, &axis))
+			&bounds_min, &bounds_max, &update_bounds, &axis, &texture))
 			return GetPyNone();
 
 		if (!CheckList(plot, values)) return GetPyNone();
 
-		auto mvalues = ToFloatVect(values);
+		auto mvalues = ToDoubleVect(values);
 		auto mbounds_min = ToVec2(bounds_min);
 		auto mbounds_max = ToVec2(bounds_max);
 
 		if (mvalues.size() == 0)
 			return GetPyNone();
 
-		auto series = CreateRef<mvHeatSeries>(name, &mvalues, rows, columns, scale_min,
-			scale_max, format, mbounds_min, mbounds_max, (ImPlotYAxis_)axis);
+		if (rows <= 0 || columns <= 0 || mvalues.size() != (size_t)rows * columns)
+		{
+			ThrowPythonException(std::string(name) + " values must hold rows * columns entries.");
+			return GetPyNone();
+		}
+
+		auto series = CreateSeries<mvHeatSeries>(mvalues.size(), name, &mvalues, rows, columns, scale_min,
+			scale_max, format, mbounds_min, mbounds_max, texture, (ImPlotYAxis_)axis);
 
 		std::lock_guard<std::mutex> lk(mvApp::GetApp()->GetApp()->getMutex());
 		auto aplot = mvApp::GetApp()->getItemRegistry().getItem(plot);
 		if (aplot == nullptr)
 		{
-			std::string message = plot;
+			std::string message = plot.str();
 			ThrowPythonException(message + " plot does not exist.");
 			return GetPyNone();
 		}
 
 		if (aplot->getType() != mvAppItemType::Plot)
 		{
-			std::string message = plot;
+			std::string message = plot.str();
 			ThrowPythonException(message + " is not a plot.");
 			return GetPyNone();
 		}
@@ -1560,4 +1714,130 @@ namespace Marvel {
 		return GetPyNone();
 	}
 
+	PyObject* append_series_data(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+	{
+		mvItemArg plot;
+		const char* name;
+		PyObject* x;
+		PyObject* y;
+		int max_points = 0;
+		int update_bounds = true;
+
+		static mvPythonParser& parser = (*mvApp::GetApp()->getParsers())["append_series_data"];
+		if (!parser.parse(args, nargs, kwnames, __FUNCTION__,
+			&plot, &name, &x, &y, &max_points, &update_bounds))
+			return GetPyNone();
+
+		if (!CheckList(plot, x)) return GetPyNone();
+		if (!CheckList(plot, y)) return GetPyNone();
+
+		auto xs = ToDoubleVect(x);
+		auto ys = ToDoubleVect(y);
+
+		if (!CheckArraySizes(plot, { &xs, &ys })) return GetPyNone();
+
+		std::lock_guard<std::mutex> lk(mvApp::GetApp()->GetApp()->getMutex());
+		auto aplot = mvApp::GetApp()->getItemRegistry().getItem(plot);
+		if (!CheckIfPlotOk(plot, aplot.get()))
+			return GetPyNone();
+
+		mvPlot* graph = static_cast<mvPlot*>(aplot.get());
+
+		auto series = graph->getSeries(name);
+		if (series == nullptr)
+		{
+			series = CreateRef<mvLineSeries>(name, &xs, &ys, mvColor(0, 0, 0, -1), ImPlotYAxis_1);
+			if (max_points > 0)
+				series->setMaxPoints(max_points);
+			graph->addSeries(series, update_bounds);
+			return GetPyNone();
+		}
+
+		if (series->isBound())
+		{
+			ThrowPythonException(std::string(name) + " series data is bound to the value storage, update the sources instead.");
+			return GetPyNone();
+		}
+
+		switch (series->getSeriesType())
+		{
+		case mvSeries::mvSeriesType::Line:
+		case mvSeries::mvSeriesType::Scatter:
+		case mvSeries::mvSeriesType::Stair:
+		case mvSeries::mvSeriesType::Stem:
+		case mvSeries::mvSeriesType::Bar:
+			break;
+		default:
+			ThrowPythonException(std::string(name) + " series type does not support appending data.");
+			return GetPyNone();
+		}
+
+		if (max_points < 0 && series->getMaxPoints() != 0)
+			series->setMaxPoints(0);
+		else if (max_points > 0 && (size_t)max_points != series->getMaxPoints())
+			series->setMaxPoints(max_points);
+
+		series->appendData(xs, ys);
+		graph->fitSeries(update_bounds);
+
+		return GetPyNone();
+	}
+
+	PyObject* update_heat_series(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+	{
+		mvItemArg plot;
+		const char* name;
+		PyObject* values;
+		int row = 0;
+		int scroll = false;
+
+		static mvPythonParser& parser = (*mvApp::GetApp()->getParsers())["update_heat_series"];
+		if (!parser.parse(args, nargs, kwnames, __FUNCTION__,
+			&plot, &name, &values, &row, &scroll))
+			return GetPyNone();
+
+		if (!CheckList(plot, values)) return GetPyNone();
+
+		auto mvalues = ToDoubleVect(values);
+
+		std::lock_guard<std::mutex> lk(mvApp::GetApp()->GetApp()->getMutex());
+		auto aplot = mvApp::GetApp()->getItemRegistry().getItem(plot);
+		if (!CheckIfPlotOk(plot, aplot.get()))
+			return GetPyNone();
+
+		mvPlot* graph = static_cast<mvPlot*>(aplot.get());
+
+		auto series = graph->getSeries(name);
+		if (series == nullptr)
+		{
+			ThrowPythonException(std::string(name) + " series does not exist.");
+			return GetPyNone();
+		}
+
+		if (series->getSeriesType() != mvSeries::mvSeriesType::Heat)
+		{
+			ThrowPythonException(std::string(name) + " is not a heat series.");
+			return GetPyNone();
+		}
+
+		auto heat = static_cast<mvHeatSeries*>(series.get());
+
+		size_t columns = (size_t)heat->getColumns();
+		if (mvalues.empty() || mvalues.size() % columns != 0)
+		{
+			ThrowPythonException(std::string(name) + " values must hold whole rows of " + std::to_string(columns) + " entries.");
+			return GetPyNone();
+		}
+
+		if (!scroll && (row < 0 || row + mvalues.size() / columns > (size_t)heat->getRows()))
+		{
+			ThrowPythonException(std::string(name) + " rows are out of range.");
+			return GetPyNone();
+		}
+
+		heat->updateRows(mvalues, row, scroll);
+
+		return GetPyNone();
+	}
+
 }
@@ -21,6 +21,7 @@ namespace Marvel {
 	// query
 	PyObject* is_plot_queried      (PyObject* self, PyObject* args, PyObject* kwargs);
 	PyObject* get_plot_query_area  (PyObject* self, PyObject* args, PyObject* kwargs);
+	PyObject* get_plot_nearest_points(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames);
 	
 	// limits
 	PyObject* set_plot_xlimits_auto(PyObject* self, PyObject* args, PyObject* kwargs);
@@ -31,17 +32,19 @@ namespace Marvel {
 	PyObject* get_plot_ylimits     (PyObject* self, PyObject* args, PyObject* kwargs);
 
 	// series
-	PyObject* add_image_series     (PyObject* self, PyObject* args, PyObject* kwargs);
-	PyObject* add_pie_series       (PyObject* self, PyObject* args, PyObject* kwargs);
-	PyObject* add_line_series      (PyObject* self, PyObject* args, PyObject* kwargs);
-	PyObject* add_bar_series       (PyObject* self, PyObject* args, PyObject* kwargs);
-	PyObject* add_shade_series     (PyObject* self, PyObject* args, PyObject* kwargs);
-	PyObject* add_scatter_series   (PyObject* self, PyObject* args, PyObject* kwargs);
-	PyObject* add_stem_series      (PyObject* self, PyObject* args, PyObject* kwargs);
+	PyObject* add_image_series     (PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames);
+	PyObject* add_pie_series       (PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames);
+	PyObject* add_line_series      (PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames);
+	PyObject* add_bar_series       (PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames);
+	PyObject* add_shade_series     (PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames);
+	PyObject* add_scatter_series   (PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames);
+	PyObject* add_stem_series      (PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames);
 	PyObject* add_text_point       (PyObject* self, PyObject* args, PyObject* kwargs);
-	PyObject* add_area_series      (PyObject* self, PyObject* args, PyObject* kwargs);
-	PyObject* add_error_series     (PyObject* self, PyObject* args, PyObject* kwargs);
-	PyObject* add_heat_series      (PyObject* self, PyObject* args, PyObject* kwargs);
-	PyObject* add_stair_series     (PyObject* self, PyObject* args, PyObject* kwargs);
-	PyObject* add_candle_series     (PyObject* self, PyObject* args, PyObject* kwargs);
+	PyObject* add_area_series      (PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames);
+	PyObject* add_error_series     (PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames);
+	PyObject* add_heat_series      (PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames);
+	PyObject* add_stair_series     (PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames);
+	PyObject* add_candle_series     (PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames);
+	PyObject* append_series_data   (PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames);
+	PyObject* update_heat_series   (PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames);
 }
\ No newline at end of file
@@ -5,103 +5,151 @@ namespace Marvel{
 	void AddTableCommands(std::map<std::string, mvPythonParser>* parsers)
 	{
 		parsers->insert({ "set_table_data", mvPythonParser({
-			{mvPythonDataType::String, "name"},
-			{mvPythonDataType::ListStrList, "data"}
+			{mvPythonDataType::UUID, "name"},
+			{mvPythonDataType::Object, "data", "List of rows of strings, or one list or buffer per column if columns is set"},
+			{mvPythonDataType::KeywordOnly},
+			{mvPythonDataType::Bool, "columns", "data holds columns, numeric ones are kept as int or float columns", "False"}
 		}, "Overwrites table data.", "None", "Tables") });
 
 		parsers->insert({ "get_table_data", mvPythonParser({
-			{mvPythonDataType::String, "name"},
+			{mvPythonDataType::UUID, "name"},
 		}, "Gets table data.", "List[List[str]]", "Tables") });
 
 		parsers->insert({ "set_headers", mvPythonParser({
-			{mvPythonDataType::String, "table"},
+			{mvPythonDataType::UUID, "table"},
 			{mvPythonDataType::StringList, "headers"},
 		}, "Sets a tables headers.", "None", "Tables") });
 
 		parsers->insert({ "clear_table", mvPythonParser({
-			{mvPythonDataType::String, "table"}
+			{mvPythonDataType::UUID, "table"}
 		}, "Clears data in a table", "None", "Tables") });
 
 		parsers->insert({ "add_column", mvPythonParser({
-			{mvPythonDataType::String, "table"},
+			{mvPythonDataType::UUID, "table"},
 			{mvPythonDataType::String, "name"},
 			{mvPythonDataType::StringList, "column"},
 		}, "Adds a column to the end of a table.", "None", "Tables") });
 
 		parsers->insert({ "insert_column", mvPythonParser({
-			{mvPythonDataType::String, "table"},
+			{mvPythonDataType::UUID, "table"},
 			{mvPythonDataType::Integer, "column_index"},
 			{mvPythonDataType::String, "name"},
 			{mvPythonDataType::StringList, "column"},
 		}, "Inserts a column into a table.", "None", "Tables") });
 
 		parsers->insert({ "delete_column", mvPythonParser({
-			{mvPythonDataType::String, "table"},
+			{mvPythonDataType::UUID, "table"},
 			{mvPythonDataType::Integer, "column"}
 		}, "Delete a column in a table.", "None", "Tables") });
 
 		parsers->insert({ "add_row", mvPythonParser({
-			{mvPythonDataType::String, "table"},
+			{mvPythonDataType::UUID, "table"},
 			{mvPythonDataType::StringList, "row"},
 		}, "Adds a row to the end of a table.", "None", "Tables") });
 
 		parsers->insert({ "insert_row", mvPythonParser({
-			{mvPythonDataType::String, "table"},
+			{mvPythonDataType::UUID, "table"},
 			{mvPythonDataType::Integer, "row_index"},
 			{mvPythonDataType::StringList, "row"},
 		}, "Inserts a row into a table.", "None", "Tables") });
 
 		parsers->insert({ "delete_row", mvPythonParser({
-			{mvPythonDataType::String, "table"},
+			{mvPythonDataType::UUID, "table"},
 			{mvPythonDataType::Integer, "row"}
 		}, "Delete a row in a table.", "None", "Tables") });
 
 		parsers->insert({ "get_table_item", mvPythonParser({
-			{mvPythonDataType::String, "table"},
+			{mvPythonDataType::UUID, "table"},
 			{mvPythonDataType::Integer, "row"},
 			{mvPythonDataType::Integer, "column"}
 		}, "Gets a table's cell value.", "str", "Tables") });
 
 		parsers->insert({ "set_table_item", mvPythonParser({
-			{mvPythonDataType::String, "table"},
+			{mvPythonDataType::UUID, "table"},
 			{mvPythonDataType::Integer, "row"},
 			{mvPythonDataType::Integer, "column"},
 			{mvPythonDataType::String, "value"},
 		}, "Sets a table's cell value.", "None", "Tables") });
 
 		parsers->insert({ "get_table_selections", mvPythonParser({
-			{mvPythonDataType::String, "table"}
+			{mvPythonDataType::UUID, "table"}
 		}, "Retrieves data from storage.", "List[List[int]]", "Tables") });
 
 		parsers->insert({ "set_table_selection", mvPythonParser({
-			{mvPythonDataType::String, "table"},
+			{mvPythonDataType::UUID, "table"},
 			{mvPythonDataType::Integer, "row"},
 			{mvPythonDataType::Integer, "column"},
 			{mvPythonDataType::Bool, "value"},
 		}, "Sets a table's cell selection value.", "None", "Tables") });
 
+		parsers->insert({ "set_table_selection_range", mvPythonParser({
+			{mvPythonDataType::UUID, "table"},
+			{mvPythonDataType::Integer, "first_row"},
+			{mvPythonDataType::Integer, "last_row", "Inclusive, -1 for the last row"},
+			{mvPythonDataType::KeywordOnly},
+			{mvPythonDataType::Integer, "first_column", "", "0"},
+			{mvPythonDataType::Integer, "last_column", "Inclusive, -1 for the last column", "-1"},
+			{mvPythonDataType::Bool, "value", "", "True"},
+		}, "Sets the selection value of a block of cells.", "None", "Tables") });
+
+		parsers->insert({ "select_all_table", mvPythonParser({
+			{mvPythonDataType::UUID, "table"}
+		}, "Selects every cell of a table.", "None", "Tables") });
+
+		parsers->insert({ "clear_table_selections", mvPythonParser({
+			{mvPythonDataType::UUID, "table"}
+		}, "Unselects every cell of a table.", "None", "Tables") });
+
+		parsers->insert({ "get_table_selected_rows", mvPythonParser({
+			{mvPythonDataType::UUID, "table"}
+		}, "Returns the rows with a selected cell as a memoryview of ints.", "memoryview", "Tables") });
+
+		parsers->insert({ "sort_table", mvPythonParser({
+			{mvPythonDataType::UUID, "table"},
+			{mvPythonDataType::IntList, "columns", "Sort keys in priority order, empty for storage order"},
+			{mvPythonDataType::KeywordOnly},
+			{mvPythonDataType::IntList, "descending", "Direction of each key, missing ones are ascending", "()"},
+		}, "Sorts the displayed rows of a table, the table data keeps its order.", "None", "Tables") });
+
+		parsers->insert({ "add_table_filter", mvPythonParser({
+			{mvPythonDataType::UUID, "table"},
+			{mvPythonDataType::String, "value"},
+			{mvPythonDataType::KeywordOnly},
+			{mvPythonDataType::Integer, "column", "-1 matches any column", "-1"},
+			{mvPythonDataType::String, "comparison", "contains, ==, !=, <, <=, > or >=", "'contains'"},
+			{mvPythonDataType::Bool, "case_sensitive", "", "False"},
+		}, "Hides rows whose cells do not match, rows have to match every filter.", "None", "Tables") });
+
+		parsers->insert({ "clear_table_filters", mvPythonParser({
+			{mvPythonDataType::UUID, "table"}
+		}, "Removes all filters of a table.", "None", "Tables") });
+
+		parsers->insert({ "get_table_row_order", mvPythonParser({
+			{mvPythonDataType::UUID, "table"}
+		}, "Returns the displayed rows in display order as a memoryview of ints.", "memoryview", "Tables") });
+
 	}
 
 	PyObject* get_table_data(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
-		const char* name;
+		mvItemArg name;
 
 		if (!(*mvApp::GetApp()->getParsers())["get_table_data"].parse(args, kwargs, __FUNCTION__, &name))
 			return GetPyNone();
 
 		std::lock_guard<std::mutex> lk(mvApp::GetApp()->GetApp()->getMutex());
-		auto item = mvApp::GetApp()->getItemRegistry().getItem(std::string(name));
+		auto item = mvApp::GetApp()->getItemRegistry().getItem(name);
 
 		if (item == nullptr)
 		{
-			std::string message = name;
+			std::string message = name.str();
 			ThrowPythonException(message + " table does not exist.");
 			return GetPyNone();
 		}
 
 		if (item->getType() != mvAppItemType::Table)
 		{
-			std::string message = name;
+			std::string message = name.str();
 			ThrowPythonException(message + " is not a table.");
 			return GetPyNone();
 		}
@@ -111,37 +159,41 @@ namespace Marvel{
 
 	PyObject* set_table_data(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
-		const char* name;
+		mvItemArg name;
 		PyObject* value;
+		int columns = false;
 
-		if (!(*mvApp::GetApp()->getParsers())["set_table_data"].parse(args, kwargs, __FUNCTION__, &name, &value))
+		if (!(*mvApp::GetApp()->getParsers())["set_table_data"].parse(args, kwargs, __FUNCTION__, &name, &value, &columns))
 			return GetPyNone();
 
 		std::lock_guard<std::mutex> lk(mvApp::GetApp()->GetApp()->getMutex());
-		auto item = mvApp::GetApp()->getItemRegistry().getItem(std::string(name));
+		auto item = mvApp::GetApp()->getItemRegistry().getItem(name);
 
 		if (item == nullptr)
 		{
-			std::string message = name;
+			std::string message = name.str();
 			ThrowPythonException(message + " table does not exist.");
 			return GetPyNone();
 		}
 
 		if (item->getType() != mvAppItemType::Table)
 		{
-			std::string message = name;
+			std::string message = name.str();
 			ThrowPythonException(message + " is not a table.");
 			return GetPyNone();
 		}
 
-		static_cast<mvTable*>(item.get())->setPyValue(value);
+		if (columns)
+			static_cast<mvTable*>(item.get())->setPyColumns(value);
+		else
+			static_cast<mvTable*>(item.get())->setPyValue(value);
 
 		return GetPyNone();
 	}
 
 	PyObject* set_headers(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
-		const char* table;
+		mvItemArg table;
 		PyObject* headers;
 
 		if (!(*mvApp::GetApp()->getParsers())["set_headers"].parse(args, kwargs, __FUNCTION__, &table, &headers))
@@ -151,7 +203,7 @@ namespace Marvel{
 		auto item = mvApp::GetApp()->getItemRegistry().getItem(table);
 		if (item == nullptr)
 		{
-			std::string message = table;
+			std::string message = table.str();
 			ThrowPythonException(message + " table does not exist.");
 			return GetPyNone();
 		}
@@ -166,7 +218,7 @@ namespace Marvel{
 
 	PyObject* clear_table(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
-		const char* table;
+		mvItemArg table;
 
 		if (!(*mvApp::GetApp()->getParsers())["clear_table"].parse(args, kwargs, __FUNCTION__, &table))
 			return GetPyNone();
@@ -175,14 +227,14 @@ namespace Marvel{
 		auto item = mvApp::GetApp()->getItemRegistry().getItem(table);
 		if (item == nullptr)
 		{
-			std::string message = table;
+			std::string message = table.str();
 			ThrowPythonException(message + " table does not exist.");
 			return GetPyNone();
 		}
 
 		if (item->getType() != mvAppItemType::Table)
 		{
-			std::string message = table;
+			std::string message = table.str();
 			ThrowPythonException(message + " is not a table.");
 			return GetPyNone();
 		}
@@ -194,7 +246,7 @@ namespace Marvel{
 
 	PyObject* get_table_item(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
-		const char* table;
+		mvItemArg table;
 		int row;
 		int column;
 
@@ -206,14 +258,14 @@ namespace Marvel{
 		auto item = mvApp::GetApp()->getItemRegistry().getItem(table);
 		if (item == nullptr)
 		{
-			std::string message = table;
+			std::string message = table.str();
 			ThrowPythonException(message + " table does not exist.");
 			return GetPyNone();
 		}
 
 		if (item->getType() != mvAppItemType::Table)
 		{
-			std::string message = table;
+			std::string message = table.str();
 			ThrowPythonException(message + " is not a table.");
 			return GetPyNone();
 		}
@@ -223,14 +275,15 @@ namespace Marvel{
 
 	}
 
-	PyObject* set_table_item(PyObject* self, PyObject* args, PyObject* kwargs)
+	PyObject* set_table_item(PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
 	{
-		const char* table;
+		mvItemArg table;
 		int row;
 		int column;
 		const char* value;
 
-		if (!(*mvApp::GetApp()->getParsers())["set_table_item"].parse(args, kwargs, __FUNCTION__, &table, &row,
+		static mvPythonParser& parser = (*mvApp::GetApp()->getParsers())["set_table_item"];
+		if (!parser.parse(args, nargs, kwnames, __FUNCTION__, &table, &row,
 			&column, &value))
 			return GetPyNone();
 
@@ -238,14 +291,14 @@ namespace Marvel{
 		auto item = mvApp::GetApp()->getItemRegistry().getItem(table);
 		if (item == nullptr)
 		{
-			std::string message = table;
+			std::string message = table.str();
 			ThrowPythonException(message + " table does not exist.");
 			return GetPyNone();
 		}
 
 		if (item->getType() != mvAppItemType::Table)
 		{
-			std::string message = table;
+			std::string message = table.str();
 			ThrowPythonException(message + " is not a table.");
 			return GetPyNone();
 		}
@@ -258,7 +311,7 @@ namespace Marvel{
 
 	PyObject* get_table_selections(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
-		const char* table;
+		mvItemArg table;
 
 		if (!(*mvApp::GetApp()->getParsers())["get_table_selections"].parse(args, kwargs, __FUNCTION__, &table))
 			return GetPyNone();
@@ -267,14 +320,14 @@ namespace Marvel{
 		auto item = mvApp::GetApp()->getItemRegistry().getItem(table);
 		if (item == nullptr)
 		{
-			std::string message = table;
+			std::string message = table.str();
 			ThrowPythonException(message + " table does not exist.");
 			return GetPyNone();
 		}
 
 		if (item->getType() != mvAppItemType::Table)
 		{
-			std::string message = table;
+			std::string message = table.str();
 			ThrowPythonException(message + " is not a table.");
 			return GetPyNone();
 		}
@@ -285,7 +338,7 @@ namespace Marvel{
 
 	PyObject* set_table_selection(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
-		const char* table;
+		mvItemArg table;
 		int row;
 		int column;
 		int value;
@@ -298,14 +351,14 @@ namespace Marvel{
 		auto item = mvApp::GetApp()->getItemRegistry().getItem(table);
 		if (item == nullptr)
 		{
-			std::string message = table;
+			std::string message = table.str();
 			ThrowPythonException(message + " table does not exist.");
 			return GetPyNone();
 		}
 
 		if (item->getType() != mvAppItemType::Table)
 		{
-			std::string message = table;
+			std::string message = table.str();
 			ThrowPythonException(message + " is not a table.");
 			return GetPyNone();
 		}
@@ -316,9 +369,250 @@ namespace Marvel{
 		return GetPyNone();
 	}
 
+	PyObject* set_table_selection_range(PyObject* self, PyObject* args, PyObject* kwargs)
+	{
+		mvItemArg table;
+		int first_row;
+		int last_row;
+		int first_column = 0;
+		int last_column = -1;
+		int value = true;
+
+		if (!(*mvApp::GetApp()->getParsers())["set_table_selection_range"].parse(args, kwargs, __FUNCTION__, &table, &first_row,
+			&last_row, &first_column, &last_column, &value))
+			return GetPyNone();
+
+		std::lock_guard<std::mutex> lk(mvApp::GetApp()->GetApp()->getMutex());
+		auto item = mvApp::GetApp()->getItemRegistry().getItem(table);
+		if (item == nullptr)
+		{
+			std::string message = table.str();
+			ThrowPythonException(message + " table does not exist.");
+			return GetPyNone();
+		}
+
+		if (item->getType() != mvAppItemType::Table)
+		{
+			std::string message = table.str();
+			ThrowPythonException(message + " is not a table.");
+			return GetPyNone();
+		}
+
+		mvTable* atable = static_cast<mvTable*>(item.get());
+		atable->setSelectionRange(first_row, last_row, first_column, last_column, value);
+
+		return GetPyNone();
+	}
+
+	PyObject* select_all_table(PyObject* self, PyObject* args, PyObject* kwargs)
+	{
+		mvItemArg table;
+
+		if (!(*mvApp::GetApp()->getParsers())["select_all_table"].parse(args, kwargs, __FUNCTION__, &table))
+			return GetPyNone();
+
+		std::lock_guard<std::mutex> lk(mvApp::GetApp()->GetApp()->getMutex());
+		auto item = mvApp::GetApp()->getItemRegistry().getItem(table);
+		if (item == nullptr)
+		{
+			std::string message = table.str();
+			ThrowPythonException(message + " table does not exist.");
+			return GetPyNone();
+		}
+
+		if (item->getType() != mvAppItemType::Table)
+		{
+			std::string message = table.str();
+			ThrowPythonException(message + " is not a table.");
+			return GetPyNone();
+		}
+
+		mvTable* atable = static_cast<mvTable*>(item.get());
+		atable->selectAll();
+
+		return GetPyNone();
+	}
+
+	PyObject* clear_table_selections(PyObject* self, PyObject* args, PyObject* kwargs)
+	{
+		mvItemArg table;
+
+		if (!(*mvApp::GetApp()->getParsers())["clear_table_selections"].parse(args, kwargs, __FUNCTION__, &table))
+			return GetPyNone();
+
+		std::lock_guard<std::mutex> lk(mvApp::GetApp()->GetApp()->getMutex());
+		auto item = mvApp::GetApp()->getItemRegistry().getItem(table);
+		if (item == nullptr)
+		{
+			std::string message = table.str();
+			ThrowPythonException(message + " table does not exist.");
+			return GetPyNone();
+		}
+
+		if (item->getType() != mvAppItemType::Table)
+		{
+			std::string message = table.str();
+			ThrowPythonException(message + " is not a table.");
+			return GetPyNone();
+		}
+
+		mvTable* atable = static_cast<mvTable*>(item.get());
+		atable->clearSelections();
+
+		return GetPyNone();
+	}
+
+	PyObject* get_table_selected_rows(PyObject* self, PyObject* args, PyObject* kwargs)
+	{
+		mvItemArg table;
+
+		if (!(*mvApp::GetApp()->getParsers())["get_table_selected_rows"].parse(args, kwargs, __FUNCTION__, &table))
+			return GetPyNone();
+
+		std::lock_guard<std::mutex> lk(mvApp::GetApp()->GetApp()->getMutex());
+		auto item = mvApp::GetApp()->getItemRegistry().getItem(table);
+		if (item == nullptr)
+		{
+			std::string message = table.str();
+			ThrowPythonException(message + " table does not exist.");
+			return GetPyNone();
+		}
+
+		if (item->getType() != mvAppItemType::Table)
+		{
+			std::string message = table.str();
+			ThrowPythonException(message + " is not a table.");
+			return GetPyNone();
+		}
+
+		mvTable* atable = static_cast<mvTable*>(item.get());
+		return atable->getSelectedRows();
+	}
+
+	PyObject* sort_table(PyObject* self, PyObject* args, PyObject* kwargs)
+	{
+		mvItemArg table;
+		PyObject* columns;
+		PyObject* descending = nullptr;
+
+		if (!(*mvApp::GetApp()->getParsers())["sort_table"].parse(args, kwargs, __FUNCTION__, &table, &columns, &descending))
+			return GetPyNone();
+
+		std::lock_guard<std::mutex> lk(mvApp::GetApp()->GetApp()->getMutex());
+		auto item = mvApp::GetApp()->getItemRegistry().getItem(table);
+		if (item == nullptr)
+		{
+			std::string message = table.str();
+			ThrowPythonException(message + " table does not exist.");
+			return GetPyNone();
+		}
+
+		if (item->getType() != mvAppItemType::Table)
+		{
+			std::string message = table.str();
+			ThrowPythonException(message + " is not a table.");
+			return GetPyNone();
+		}
+
+		mvTable* atable = static_cast<mvTable*>(item.get());
+		atable->sortRows(ToIntVect(columns), ToIntVect(descending));
+
+		return GetPyNone();
+	}
+
+	PyObject* add_table_filter(PyObject* self, PyObject* args, PyObject* kwargs)
+	{
+		mvItemArg table;
+		const char* value;
+		int column = -1;
+		const char* comparison = "contains";
+		int case_sensitive = false;
+
+		if (!(*mvApp::GetApp()->getParsers())["add_table_filter"].parse(args, kwargs, __FUNCTION__, &table, &value, &column,
+			&comparison, &case_sensitive))
+			return GetPyNone();
+
+		std::lock_guard<std::mutex> lk(mvApp::GetApp()->GetApp()->getMutex());
+		auto item = mvApp::GetApp()->getItemRegistry().getItem(table);
+		if (item == nullptr)
+		{
+			std::string message = table.str();
+			ThrowPythonException(message + " table does not exist.");
+			return GetPyNone();
+		}
+
+		if (item->getType() != mvAppItemType::Table)
+		{
+			std::string message = table.str();
+			ThrowPythonException(message + " is not a table.");
+			return GetPyNone();
+		}
+
+		mvTable* atable = static_cast<mvTable*>(item.get());
+		atable->addFilter(column, comparison, value, case_sensitive);
+
+		return GetPyNone();
+	}
+
+	PyObject* clear_table_filters(PyObject* self, PyObject* args, PyObject* kwargs)
+	{
+		mvItemArg table;
+
+		if (!(*mvApp::GetApp()->getParsers())["clear_table_filters"].parse(args, kwargs, __FUNCTION__, &table))
+			return GetPyNone();
+
+		std::lock_guard<std::mutex> lk(mvApp::GetApp()->GetApp()->getMutex());
+		auto item = mvApp::GetApp()->getItemRegistry().getItem(table);
+		if (item == nullptr)
+		{
+			std::string message = table.str();
+			ThrowPythonException(message + " table does not exist.");
+			return GetPyNone();
+		}
+
+		if (item->getType() != mvAppItemType::Table)
+		{
+			std::string message = table.str();
+			ThrowPythonException(message + " is not a table.");
+			return GetPyNone();
+		}
+
+		mvTable* atable = static_cast<mvTable*>(item.get());
+		atable->clearFilters();
+
+		return GetPyNone();
+	}
+
+	PyObject* get_table_row_order(PyObject* self, PyObject* args, PyObject* kwargs)
+	{
+		mvItemArg table;
+
+		if (!(*mvApp::GetApp()->getParsers())["get_table_row_order"].parse(args, kwargs, __FUNCTION__, &table))
+			return GetPyNone();
+
+		std::lock_guard<std::mutex> lk(mvApp::GetApp()->GetApp()->getMutex());
+		auto item = mvApp::GetApp()->getItemRegistry().getItem(table);
+		if (item == nullptr)
+		{
+			std::string message = table.str();
+			ThrowPythonException(message + " table does not exist.");
+			return GetPyNone();
+		}
+
+		if (item->getType() != mvAppItemType::Table)
+		{
+			std::string message = table.str();
+			ThrowPythonException(message + " is not a table.");
+			return GetPyNone();
+		}
+
+		mvTable* atable = static_cast<mvTable*>(item.get());
+		return atable->getRowOrder();
+	}
+
 	PyObject* add_column(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
-		const char* table;
+		mvItemArg table;
 		const char* name;
 		PyObject* column;
 
@@ -329,14 +623,14 @@ namespace Marvel{
 		auto item = mvApp::GetApp()->getItemRegistry().getItem(table);
 		if (item == nullptr)
 		{
-			std::string message = table;
+			std::string message = table.str();
 			ThrowPythonException(message + " table does not exist.");
 			return GetPyNone();
 		}
 
 		if (item->getType() != mvAppItemType::Table)
 		{
-			std::string message = table;
+			std::string message = table.str();
 			ThrowPythonException(message + " is not a table.");
 			return GetPyNone();
 		}
@@ -351,7 +645,7 @@ namespace Marvel{
 
 	PyObject* insert_column(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
-		const char* table;
+		mvItemArg table;
 		int column_index;
 		const char* name;
 		PyObject* column;
@@ -363,14 +657,14 @@ namespace Marvel{
 		auto item = mvApp::GetApp()->getItemRegistry().getItem(table);
 		if (item == nullptr)
 		{
-			std::string message = table;
+			std::string message = table.str();
 			ThrowPythonException(message + " table does not exist.");
 			return GetPyNone();
 		}
 
 		if (item->getType() != mvAppItemType::Table)
 		{
-			std::string message = table;
+			std::string message = table.str();
 			ThrowPythonException(message + " is not a table.");
 			return GetPyNone();
 		}
@@ -385,7 +679,7 @@ namespace Marvel{
 
 	PyObject* delete_column(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
-		const char* table;
+		mvItemArg table;
 		int column;
 
 		if (!(*mvApp::GetApp()->getParsers())["delete_column"].parse(args, kwargs, __FUNCTION__, &table, &column))
@@ -395,14 +689,14 @@ namespace Marvel{
 		auto item = mvApp::GetApp()->getItemRegistry().getItem(table);
 		if (item == nullptr)
 		{
-			std::string message = table;
+			std::string message = table.str();
 			ThrowPythonException(message + " table does not exist.");
 			return GetPyNone();
 		}
 
 		if (item->getType() != mvAppItemType::Table)
 		{
-			std::string message = table;
+			std::string message = table.str();
 			ThrowPythonException(message + " is not a table.");
 			return GetPyNone();
 		}
@@ -415,7 +709,7 @@ namespace Marvel{
 
 	PyObject* add_row(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
-		const char* table;
+		mvItemArg table;
 		PyObject* row;
 
 		if (!(*mvApp::GetApp()->getParsers())["add_row"].parse(args, kwargs, __FUNCTION__, &table, &row))
@@ -425,14 +719,14 @@ namespace Marvel{
 		auto item = mvApp::GetApp()->getItemRegistry().getItem(table);
 		if (item == nullptr)
 		{
-			std::string message = table;
+			std::string message = table.str();
 			ThrowPythonException(message + " table does not exist.");
 			return GetPyNone();
 		}
 
 		if (item->getType() != mvAppItemType::Table)
 		{
-			std::string message = table;
+			std::string message = table.str();
 			ThrowPythonException(message + " is not a table.");
 			return GetPyNone();
 		}
@@ -453,7 +747,7 @@ namespace Marvel{
 
 	PyObject* insert_row(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
-		const char* table;
+		mvItemArg table;
 		int row_index;
 		PyObject* row;
 
@@ -464,14 +758,14 @@ namespace Marvel{
 		auto item = mvApp::GetApp()->getItemRegistry().getItem(table);
 		if (item == nullptr)
 		{
-			std::string message = table;
+			std::string message = table.str();
 			ThrowPythonException(message + " table does not exist.");
 			return GetPyNone();
 		}
 
 		if (item->getType() != mvAppItemType::Table)
 		{
-			std::string message = table;
+			std::string message = table.str();
 			ThrowPythonException(message + " is not a table.");
 			return GetPyNone();
 		}
@@ -492,7 +786,7 @@ namespace Marvel{
 
 	PyObject* delete_row(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
-		const char* table;
+		mvItemArg table;
 		int row;
 
 		if (!(*mvApp::GetApp()->getParsers())["delete_row"].parse(args, kwargs, __FUNCTION__, &table, &row))
@@ -502,14 +796,14 @@ namespace Marvel{
 		auto item = mvApp::GetApp()->getItemRegistry().getItem(table);
 		if (item == nullptr)
 		{
-			std::string message = table;
+			std::string message = table.str();
 			ThrowPythonException(message + " table does not exist.");
 			return GetPyNone();
 		}
 
 		if (item->getType() != mvAppItemType::Table)
 		{
-			std::string message = table;
+			std::string message = table.str();
 			ThrowPythonException(message + " is not a table.");
 			return GetPyNone();
 		}
@@ -11,9 +11,19 @@ namespace Marvel {
 	PyObject* set_headers         (PyObject * self, PyObject * args, PyObject * kwargs);
 	PyObject* clear_table         (PyObject * self, PyObject * args, PyObject * kwargs);
 	PyObject* get_table_item      (PyObject * self, PyObject * args, PyObject * kwargs);
-	PyObject* set_table_item      (PyObject * self, PyObject * args, PyObject * kwargs);
+	PyObject* set_table_item      (PyObject* self, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames);
 	PyObject* get_table_selections(PyObject * self, PyObject * args, PyObject * kwargs);
 	PyObject* set_table_selection (PyObject * self, PyObject * args, PyObject * kwargs);
+	PyObject* set_table_selection_range(PyObject* self, PyObject* args, PyObject* kwargs);
+	PyObject* select_all_table    (PyObject * self, PyObject * args, PyObject * kwargs);
+	PyObject* clear_table_selections(PyObject* self, PyObject* args, PyObject* kwargs);
+	PyObject* get_table_selected_rows(PyObject* self, PyObject* args, PyObject* kwargs);
+
+	// sort and filter
+	PyObject* sort_table          (PyObject * self, PyObject * args, PyObject * kwargs);
+	PyObject* add_table_filter    (PyObject * self, PyObject * args, PyObject * kwargs);
+	PyObject* clear_table_filters (PyObject * self, PyObject * args, PyObject * kwargs);
+	PyObject* get_table_row_order (PyObject * self, PyObject * args, PyObject * kwargs);
 
 	// column
 	PyObject* add_column          (PyObject * self, PyObject * args, PyObject * kwargs);
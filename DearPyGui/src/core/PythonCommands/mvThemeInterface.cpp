@@ -20,7 +20,7 @@ namespace Marvel {
 		}, "Sets an color of a theme item.", "None", "Themes and Styles") });
 
 		parsers->insert({ "set_individual_color", mvPythonParser({
-			{mvPythonDataType::String, "item", ""},
+			{mvPythonDataType::UUID, "item", ""},
 			{mvPythonDataType::Integer, "id", "mvGuiCol_* constants"},
 			{mvPythonDataType::FloatList, "color"}
 		}, "Sets an color of a theme item.", "None", "Themes and Styles") });
@@ -37,23 +37,23 @@ namespace Marvel {
 		}, "Returns the current theme.", "str", "Themes and Styles") });
 
 		parsers->insert({ "set_item_color", mvPythonParser({
-			{mvPythonDataType::String, "item"},
+			{mvPythonDataType::UUID, "item"},
 			{mvPythonDataType::Integer, "style", "mvGuiCol_* constants"},
 			{mvPythonDataType::FloatList, "color"}
 		}, "Sets an color style for a single item.", "None", "Themes and Styles") });
 
 		parsers->insert({ "clear_item_color", mvPythonParser({
-			{mvPythonDataType::String, "item"},
+			{mvPythonDataType::UUID, "item"},
 		}, "Clears individual color styles for an item.", "None", "Themes and Styles") });
 
 		parsers->insert({ "set_item_style_var", mvPythonParser({
-			{mvPythonDataType::String, "item"},
+			{mvPythonDataType::UUID, "item"},
 			{mvPythonDataType::Integer, "style", "mvGuiStyleVar_* constants"},
 			{mvPythonDataType::FloatList, "value"}
 		}, "Sets an style variable for a single item.", "None", "Themes and Styles") });
 
 		parsers->insert({ "clear_item_style_vars", mvPythonParser({
-			{mvPythonDataType::String, "item"},
+			{mvPythonDataType::UUID, "item"},
 		}, "Clears individual styles variables for an item.", "None", "Themes and Styles") });
 
 		parsers->insert({ "set_theme_item", mvPythonParser({
@@ -293,7 +293,7 @@ namespace Marvel {
 
 	PyObject* set_individual_color(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
-		const char* item;
+		mvItemArg item;
 		int id;
 		PyObject* color;
 
@@ -306,7 +306,7 @@ namespace Marvel {
 			mvEVT_CATEGORY_THEMES,
 			SID(std::string(std::to_string(id / 100) + "_color").c_str()),
 			{
-				CreateEventArgument("WIDGET", std::string(item)),
+				CreateEventArgument("WIDGET", mvApp::GetApp()->getItemRegistry().getItemName(item)),
 				CreateEventArgument("ID", id),
 				CreateEventArgument("COLOR", ToColor(color))
 			}
@@ -423,7 +423,7 @@ namespace Marvel {
 
 	PyObject* set_item_color(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
-		const char* item;
+		mvItemArg item;
 		int style;
 		PyObject* color;
 
@@ -443,7 +443,7 @@ namespace Marvel {
 
 	PyObject* clear_item_color(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
-		const char* item;
+		mvItemArg item;
 
 		if (!(*mvApp::GetApp()->getParsers())["clear_item_color"].parse(args, kwargs, __FUNCTION__, &item))
 			return GetPyNone();
@@ -459,7 +459,7 @@ namespace Marvel {
 
 	PyObject* set_item_style_var(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
-		const char* item;
+		mvItemArg item;
 		int style;
 		PyObject* value;
 
@@ -477,7 +477,7 @@ namespace Marvel {
 
 	PyObject* clear_item_style_vars(PyObject* self, PyObject* args, PyObject* kwargs)
 	{
-		const char* item;
+		mvItemArg item;
 
 		if (!(*mvApp::GetApp()->getParsers())["clear_item_style_vars"].parse(args, kwargs, __FUNCTION__, &item))
 			return GetPyNone();
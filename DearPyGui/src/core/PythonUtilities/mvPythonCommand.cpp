@@ -0,0 +1,210 @@
+#include "mvPythonCommand.h"
+#include "mvMarvel.h"
+#include "mvApp.h"
+#include <cstddef>
+#include <cstring>
+#include <vector>
+
+#if PY_VERSION_HEX >= 0x03080000 && !defined(Py_TPFLAGS_HAVE_VECTORCALL)
+#define Py_TPFLAGS_HAVE_VECTORCALL _Py_TPFLAGS_HAVE_VECTORCALL
+#endif
+
+namespace Marvel {
+
+	using mvFastFunction = PyObject* (*)(PyObject*, PyObject* const*, Py_ssize_t, PyObject*);
+
+	struct mvPythonCommand
+	{
+		PyObject_HEAD
+		PyMethodDef*   def;
+		PyObject*      doc; // built on first access
+		bool           query; // get_*, is_*, does_* commands don't trigger lazy redraws
+#if PY_VERSION_HEX >= 0x03080000
+		vectorcallfunc vectorcall;
+#endif
+	};
+
+	static PyTypeObject mvPythonCommandType = { PyVarObject_HEAD_INIT(NULL, 0) "dearpygui.core.command" };
+
+	// lazy rendering: the redraw is requested once the command has changed
+	// the state, a request made before it could be used up by frames
+	// rendered while the command waits for the app mutex
+	static PyObject* Finish(mvPythonCommand* command, PyObject* result)
+	{
+		if (!command->query)
+			mvApp::RequestRedraw();
+		return result;
+	}
+
+	static PyObject* CallFromStack(mvPythonCommand* command, PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames)
+	{
+		if (command->def->ml_flags & METH_FASTCALL)
+			return Finish(command, ((mvFastFunction)(void(*)(void))command->def->ml_meth)(nullptr, args, nargs, kwnames));
+
+		PyObject* tuple = PyTuple_New(nargs);
+		if (tuple == nullptr)
+			return nullptr;
+
+		for (Py_ssize_t i = 0; i < nargs; i++)
+		{
+			Py_INCREF(args[i]);
+			PyTuple_SET_ITEM(tuple, i, args[i]);
+		}
+
+		// keyword values follow the positional ones on the stack
+		PyObject* kwargs = nullptr;
+		Py_ssize_t kwCount = kwnames ? PyTuple_GET_SIZE(kwnames) : 0;
+		if (kwCount > 0)
+		{
+			kwargs = PyDict_New();
+			if (kwargs == nullptr)
+			{
+				Py_DECREF(tuple);
+				return nullptr;
+			}
+
+			for (Py_ssize_t i = 0; i < kwCount; i++)
+			{
+				if (PyDict_SetItem(kwargs, PyTuple_GET_ITEM(kwnames, i), args[nargs + i]) < 0)
+				{
+					Py_DECREF(tuple);
+					Py_DECREF(kwargs);
+					return nullptr;
+				}
+			}
+		}
+
+		PyObject* result = ((PyCFunctionWithKeywords)(void(*)(void))command->def->ml_meth)(nullptr, tuple, kwargs);
+
+		Py_DECREF(tuple);
+		Py_XDECREF(kwargs);
+
+		return Finish(command, result);
+	}
+
+#if PY_VERSION_HEX >= 0x03080000
+	static PyObject* CommandVectorcall(PyObject* self, PyObject* const* args, size_t nargsf, PyObject* kwnames)
+	{
+		return CallFromStack((mvPythonCommand*)self, args, PyVectorcall_NARGS(nargsf), kwnames);
+	}
+#endif
+
+	static PyObject* CommandCall(PyObject* self, PyObject* args, PyObject* kwargs)
+	{
+		auto command = (mvPythonCommand*)self;
+
+		if (!(command->def->ml_flags & METH_FASTCALL))
+			return Finish(command, ((PyCFunctionWithKeywords)(void(*)(void))command->def->ml_meth)(nullptr, args, kwargs));
+
+		// lay the arguments out as a vectorcall stack
+		Py_ssize_t nargs = PyTuple_GET_SIZE(args);
+		std::vector<PyObject*> stack;
+		stack.reserve(nargs);
+		for (Py_ssize_t i = 0; i < nargs; i++)
+			stack.push_back(PyTuple_GET_ITEM(args, i));
+
+		PyObject* kwnames = nullptr;
+		if (kwargs && PyDict_Size(kwargs) > 0)
+		{
+			kwnames = PyTuple_New(PyDict_Size(kwargs));
+			if (kwnames == nullptr)
+				return nullptr;
+
+			PyObject* key;
+			PyObject* value;
+			Py_ssize_t pos = 0;
+			Py_ssize_t i = 0;
+			while (PyDict_Next(kwargs, &pos, &key, &value))
+			{
+				Py_INCREF(key);
+				PyTuple_SET_ITEM(kwnames, i++, key);
+				stack.push_back(value);
+			}
+		}
+
+		PyObject* result = ((mvFastFunction)(void(*)(void))command->def->ml_meth)(nullptr, stack.data(), nargs, kwnames);
+		Py_XDECREF(kwnames);
+
+		return Finish(command, result);
+	}
+
+	static PyObject* CommandGetDoc(PyObject* self, void*)
+	{
+		auto command = (mvPythonCommand*)self;
+
+		if (command->doc == nullptr)
+			command->doc = PyUnicode_FromString((*GetDearPyGuiInterface())[command->def->ml_name].getDocumentation());
+
+		Py_INCREF(command->doc);
+		return command->doc;
+	}
+
+	static PyObject* CommandGetName(PyObject* self, void*)
+	{
+		return PyUnicode_FromString(((mvPythonCommand*)self)->def->ml_name);
+	}
+
+	static PyObject* CommandGetModule(PyObject* self, void*)
+	{
+		return PyUnicode_FromString("dearpygui.core");
+	}
+
+	static PyObject* CommandRepr(PyObject* self)
+	{
+		return PyUnicode_FromFormat("<dearpygui command %s>", ((mvPythonCommand*)self)->def->ml_name);
+	}
+
+	static void CommandDealloc(PyObject* self)
+	{
+		Py_XDECREF(((mvPythonCommand*)self)->doc);
+		PyObject_Del(self);
+	}
+
+	static PyGetSetDef CommandGetSet[] = {
+		{"__doc__", CommandGetDoc, nullptr, nullptr, nullptr},
+		{"__name__", CommandGetName, nullptr, nullptr, nullptr},
+		{"__qualname__", CommandGetName, nullptr, nullptr, nullptr},
+		{"__module__", CommandGetModule, nullptr, nullptr, nullptr},
+		{nullptr}
+	};
+
+	PyObject* CreatePythonCommand(PyMethodDef* def)
+	{
+		static bool ready = false;
+		if (!ready)
+		{
+			mvPythonCommandType.tp_basicsize = sizeof(mvPythonCommand);
+			mvPythonCommandType.tp_dealloc = CommandDealloc;
+			mvPythonCommandType.tp_repr = CommandRepr;
+			mvPythonCommandType.tp_call = CommandCall;
+			mvPythonCommandType.tp_getset = CommandGetSet;
+			mvPythonCommandType.tp_flags = Py_TPFLAGS_DEFAULT;
+#if PY_VERSION_HEX >= 0x03080000
+			mvPythonCommandType.tp_flags |= Py_TPFLAGS_HAVE_VECTORCALL;
+			mvPythonCommandType.tp_vectorcall_offset = offsetof(mvPythonCommand, vectorcall);
+#endif
+			if (PyType_Ready(&mvPythonCommandType) < 0)
+				return nullptr;
+			ready = true;
+		}
+
+		auto command = PyObject_New(mvPythonCommand, &mvPythonCommandType);
+		if (command == nullptr)
+			return nullptr;
+
+		command->def = def;
+		command->doc = nullptr;
+		command->query = false;
+		for (const char* prefix : { "get_", "is_", "does_" })
+		{
+			if (strncmp(def->ml_name, prefix, strlen(prefix)) == 0)
+				command->query = true;
+		}
+#if PY_VERSION_HEX >= 0x03080000
+		command->vectorcall = CommandVectorcall;
+#endif
+
+		return (PyObject*)command;
+	}
+
+}
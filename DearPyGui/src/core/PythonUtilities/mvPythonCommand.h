@@ -0,0 +1,22 @@
+#pragma once
+
+//-----------------------------------------------------------------------------
+// mvPythonCommand
+//
+//     - Callable type the module's commands are exposed through. Unlike
+//       builtin functions, the docstring is only built (along with the
+//       parser table behind it) the first time __doc__ is read.
+//
+//     - Supports METH_VARARGS | METH_KEYWORDS and
+//       METH_FASTCALL | METH_KEYWORDS method definitions
+//     
+//-----------------------------------------------------------------------------
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+namespace Marvel {
+
+	PyObject* CreatePythonCommand(PyMethodDef* def);
+
+}
@@ -3,6 +3,7 @@
 #include "mvApp.h"
 #include "mvPythonTranslator.h"
 #include "mvAppLog.h"
+#include "mvAppItem.h"
 #include <fstream>
 #include <utility>
 #include <frameobject.h>
@@ -45,6 +46,7 @@ namespace Marvel {
 		case mvPythonDataType::ListStrList:   return " : List[List[str]]";
 		case mvPythonDataType::Kwargs:        return "";
 		case mvPythonDataType::Object:        return " : Any";
+		case mvPythonDataType::UUID:          return " : Union[int, str]";
 		default:                              return " : unknown";
 		}
 	}
@@ -67,6 +69,7 @@ namespace Marvel {
 		case mvPythonDataType::ListStrList:   return "List[List[str]]";
 		case mvPythonDataType::Kwargs:        return "";
 		case mvPythonDataType::Object:        return "Any";
+		case mvPythonDataType::UUID:          return "Union[int, str]";
 		default:                              return "";
 		}
 	}
@@ -85,7 +88,9 @@ namespace Marvel {
 		{
 			// ignore name types for optional and keyword only
 			if (element.type != mvPythonDataType::Optional && element.type != mvPythonDataType::KeywordOnly)
+			{
 				m_keywords.push_back(element.name.c_str());
+			}
 
 			// ignore additional optionals
 			if (m_optional && element.type == mvPythonDataType::Optional)
@@ -110,36 +115,119 @@ namespace Marvel {
 
 		m_formatstring.push_back(0);
 		m_keywords.push_back(NULL);
+	}
+
+	void mvPythonParser::reportError(const char* message)
+	{
+		PyErr_Print();
+		mvAppLog::Show();
+		int line = PyFrame_GetLineNumber(PyEval_GetFrame());
+		PyObject* ex = PyErr_Format(PyExc_Exception,
+			"Error parsing DearPyGui %s command on line %d.", message, line);
+		PyErr_Print();
+		Py_XDECREF(ex);
+	}
+
+#if PY_VERSION_HEX >= 0x03070000
+	void mvPythonParser::prepareFastCall()
+	{
+		// python finishes initializing the parser (keyword tuple, limits) on first use
+		if (m_fastParser.format == nullptr)
+		{
+			m_fastParser.format = m_formatstring.data();
+			m_fastParser.keywords = m_keywords.data();
+		}
+	}
+#else
+	bool mvPythonParser::PackStack(PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames,
+		PyObject** tuple, PyObject** kwargs)
+	{
+		*tuple = PyTuple_New(nargs);
+		if (*tuple == nullptr)
+			return false;
+
+		for (Py_ssize_t i = 0; i < nargs; i++)
+		{
+			Py_INCREF(args[i]);
+			PyTuple_SET_ITEM(*tuple, i, args[i]);
+		}
+
+		// keyword values follow the positional ones on the stack
+		Py_ssize_t kwCount = kwnames ? PyTuple_GET_SIZE(kwnames) : 0;
+		if (kwCount == 0)
+			return true;
+
+		*kwargs = PyDict_New();
+		if (*kwargs == nullptr)
+		{
+			Py_CLEAR(*tuple);
+			return false;
+		}
 
-		buildDocumentation();
+		for (Py_ssize_t i = 0; i < kwCount; i++)
+		{
+			if (PyDict_SetItem(*kwargs, PyTuple_GET_ITEM(kwnames, i), args[nargs + i]) < 0)
+			{
+				Py_CLEAR(*tuple);
+				Py_CLEAR(*kwargs);
+				return false;
+			}
+		}
+
+		return true;
 	}
+#endif
 
-	bool mvPythonParser::parse(PyObject* args, PyObject* kwargs, const char* message, ...)
+	bool ResolveItemArg(mvItemArg* arg)
 	{
+		// not passed, the default stays
+		if (arg->object == nullptr)
+			return true;
 
-		bool check = true;
+		if (PyUnicode_Check(arg->object))
+		{
+			const char* name = PyUnicode_AsUTF8(arg->object);
+			if (name == nullptr)
+				return false;
+			arg->name = name;
+			return true;
+		}
 
-		va_list arguments;
-		va_start(arguments, message);
-		if (!PyArg_VaParseTupleAndKeywords(args, kwargs, m_formatstring.data(),
-			const_cast<char**>(m_keywords.data()), arguments))
+		// bool is an int subclass, True/False are not handles
+		if (!PyLong_Check(arg->object) || PyBool_Check(arg->object))
 		{
-			PyErr_Print();
-			check = false;
-			mvAppLog::Show();
-			int line = PyFrame_GetLineNumber(PyEval_GetFrame());
-			PyObject* ex = PyErr_Format(PyExc_Exception,
-				"Error parsing DearPyGui %s command on line %d.", message, line);
-			PyErr_Print();
-			Py_XDECREF(ex);
+			PyErr_Format(PyExc_TypeError, "item arguments must be an item handle (int) or an item name (str), not %.200s",
+				Py_TYPE(arg->object)->tp_name);
+			return false;
 		}
 
-		va_end(arguments);
+		// the command looks the slot up again under the app lock,
+		// checking here gives stale handles a clear error
+		arg->uuid = PyLong_AsUnsignedLongLong(arg->object);
+		if (PyErr_Occurred())
+		{
+			PyErr_Clear();
+			arg->uuid = 0;
+		}
+
+		if (arg->uuid == 0 || mvApp::GetApp()->getItemRegistry().getItem(arg->uuid) == nullptr)
+		{
+			PyErr_Format(PyExc_ValueError, "%S is not a valid item handle, the item may have been deleted.", arg->object);
+			return false;
+		}
+
+		arg->name.clear();
+		return true;
+	}
 
-		return check;
+	const char* mvPythonParser::getDocumentation() const
+	{
+		if (m_documentation.empty())
+			buildDocumentation();
+		return m_documentation.c_str();
 	}
 
-	void mvPythonParser::buildDocumentation()
+	void mvPythonParser::buildDocumentation() const
 	{
 		std::string documentation = m_about + "\n\nReturn Type: " + m_return + "\n";
 
@@ -178,7 +266,7 @@ namespace Marvel {
 
 	void GenerateStubFile(const std::string& file)
 	{
-		auto commands = BuildDearPyGuiInterface();
+		auto commands = GetDearPyGuiInterface();
 
 		// current date/time based on current system
 		time_t now = time(0);
@@ -189,7 +277,7 @@ namespace Marvel {
 		std::ofstream stub;
 		stub.open(file);
 
-		stub << "from typing import List, Any, Callable\n";
+		stub << "from typing import List, Any, Callable, Union\n";
 		stub << "from dearpygui.core import *\n\n";
 		stub << "##########################################################\n";
 		stub << "# This file is generated automatically by mvPythonParser #\n";
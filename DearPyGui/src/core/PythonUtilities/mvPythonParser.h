@@ -30,7 +30,7 @@ namespace Marvel {
     {
         None, String, Integer, Float, Bool, StringList, FloatList, Optional,
         Object, IntList, KeywordOnly, Double, Callable, Dict, ListFloatList, 
-        ListStrList, Kwargs
+        ListStrList, Kwargs, UUID
     };
 
     //-----------------------------------------------------------------------------
@@ -48,6 +48,36 @@ namespace Marvel {
 
     const char* PythonDataTypeActual(mvPythonDataType type);
 
+    //-----------------------------------------------------------------------------
+    // mvItemArg
+    //     - value of a UUID parameter, either an item handle or an item name.
+    //       Filled in by the parser on every call and resolved by the item
+    //       registry, handles go straight to the slot table.
+    //-----------------------------------------------------------------------------
+    struct mvItemArg
+    {
+        mvItemArg() = default;
+        explicit mvItemArg(const char* name) : name(name) {}
+
+        PyObject*   object = nullptr; // parsed value, borrowed for the call
+        mvUUID      uuid = 0;         // set when a handle was passed
+        std::string name;             // set when a name was passed
+
+        [[nodiscard]] bool        empty() const { return uuid == 0 && name.empty(); }
+        [[nodiscard]] std::string str  () const { return uuid ? std::to_string(uuid) : name; }
+    };
+
+    // UUID elements parse into mvItemArg::object, everything else as given
+    template<typename T>
+    T* ParseTarget(T* out) { return out; }
+    inline PyObject** ParseTarget(mvItemArg* out) { return &out->object; }
+
+    // fills in the handle or name once the parse succeeded, raises
+    // for other types and for handles of deleted items
+    template<typename T>
+    bool ResolveItemArg(T*) { return true; }
+    bool ResolveItemArg(mvItemArg* arg);
+
     //-----------------------------------------------------------------------------
     // mvPythonParser
     //-----------------------------------------------------------------------------
@@ -62,26 +92,72 @@ namespace Marvel {
             std::string about = "", std::string returnType = "None",
             std::string category = "App");
 
-        bool                             parse(PyObject* args, PyObject* kwargs, const char* message, ...);
-        [[nodiscard]] const char*        getDocumentation                () const { return m_documentation.c_str(); }
+        template<typename ...Args>
+        bool parse(PyObject* args, PyObject* kwargs, const char* message, Args... outs)
+        {
+            if (PyArg_ParseTupleAndKeywords(args, kwargs, m_formatstring.data(),
+                const_cast<char**>(m_keywords.data()), ParseTarget(outs)...) && (ResolveItemArg(outs) && ...))
+                return true;
+            reportError(message);
+            return false;
+        }
+
+        // METH_FASTCALL | METH_KEYWORDS entry, arguments are parsed
+        // straight off the vectorcall stack with a cached keyword table.
+        // The stack parser is private API, older pythons pack the stack
+        // into a tuple and dict and take the regular path.
+        template<typename ...Args>
+        bool parse(PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames, const char* message, Args... outs)
+        {
+#if PY_VERSION_HEX >= 0x03070000
+            prepareFastCall();
+            if (_PyArg_ParseStackAndKeywords(args, nargs, kwnames, &m_fastParser, ParseTarget(outs)...)
+                && (ResolveItemArg(outs) && ...))
+                return true;
+            reportError(message);
+            return false;
+#else
+            PyObject* tuple = nullptr;
+            PyObject* kwargs = nullptr;
+            if (!PackStack(args, nargs, kwnames, &tuple, &kwargs))
+                return false;
+            bool result = parse(tuple, kwargs, message, outs...);
+            Py_DECREF(tuple);
+            Py_XDECREF(kwargs);
+            return result;
+#endif
+        }
+
+        [[nodiscard]] const char*        getDocumentation                () const;
         [[nodiscard]] const std::string& getCategory                     () const { return m_category; }
         [[nodiscard]] const std::string& getReturnType                   () const { return m_return; }
         [[nodiscard]] const std::string& getAbout                        () const { return m_about; }
         [[nodiscard]] const std::vector<mvPythonDataElement>& getElements() const { return m_elements; }
         [[nodiscard]] const std::vector<const char*>& getKeywords        () const { return m_keywords; }
 
-        void buildDocumentation();
+        void buildDocumentation() const;
 
     private:
 
+#if PY_VERSION_HEX >= 0x03070000
+        void prepareFastCall();
+#else
+        static bool PackStack(PyObject* const* args, Py_ssize_t nargs, PyObject* kwnames,
+            PyObject** tuple, PyObject** kwargs);
+#endif
+        void reportError    (const char* message);
+
         std::vector<mvPythonDataElement> m_elements;
         std::vector<char>                m_formatstring;
         std::vector<const char*>         m_keywords;
         bool                             m_optional = false; // check if optional has been found already
         bool                             m_keyword  = false; // check if keyword has been found already
+#if PY_VERSION_HEX >= 0x03070000
+        _PyArg_Parser                    m_fastParser = {};      // must not move once used, parsers live in the app's table
+#endif
         std::string                      m_about;
         std::string                      m_return;
-        std::string                      m_documentation;
+        mutable std::string              m_documentation; // built on first request
         std::string                      m_category;
 
     };
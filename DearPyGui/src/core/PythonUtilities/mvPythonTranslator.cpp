@@ -105,6 +105,11 @@ namespace Marvel {
 		return PyBool_FromLong(value);
 	}
 
+	PyObject* ToPyUUID(mvUUID value)
+	{
+		return PyLong_FromUnsignedLongLong(value);
+	}
+
 	PyObject* ToPyMPair(int x, float y)
 	{
 		 
@@ -266,6 +271,24 @@ namespace Marvel {
 		return result;
 	}
 
+	PyObject* ToPyIntBuffer(const int* value, size_t count)
+	{
+		// one copy into a bytes object, viewed as ints so numpy and
+		// array can wrap it without converting each item
+		PyObject* bytes = PyBytes_FromStringAndSize((const char*)value, (Py_ssize_t)(count * sizeof(int)));
+		if (bytes == nullptr)
+			return nullptr;
+
+		PyObject* view = PyMemoryView_FromObject(bytes);
+		Py_DECREF(bytes);
+		if (view == nullptr)
+			return nullptr;
+
+		PyObject* result = PyObject_CallMethod(view, "cast", "s", "i");
+		Py_DECREF(view);
+		return result;
+	}
+
 	tm ToTime(PyObject* value, const std::string& message)
 	{
 		tm result = {};
@@ -308,6 +331,27 @@ namespace Marvel {
 		return PyLong_AsLong(value);
 	}
 
+	mvUUID ToUUID(PyObject* value, const std::string& message)
+	{
+		if (value == nullptr)
+			return 0;
+
+		if (!PyLong_Check(value))
+		{
+			ThrowPythonException(message);
+			return 0;
+		}
+
+		mvUUID result = PyLong_AsUnsignedLongLong(value);
+		if (PyErr_Occurred())
+		{
+			PyErr_Clear();
+			return 0;
+		}
+
+		return result;
+	}
+
 	float ToFloat(PyObject* value, const std::string& message)
 	{
 		if (value == nullptr)
@@ -468,46 +512,154 @@ namespace Marvel {
 			}
 		}
 
+		else if (PyObject_CheckBuffer(value))
+		{
+			// buffers go through the typed conversions of ToDoubleVect,
+			// keeping the GIL since callers may hold the app mutex
+			std::vector<double> values = ToDoubleVect(value, message, false);
+			items.assign(values.begin(), values.end());
+		}
+
+		else
+			ThrowPythonException(message);
+
+
+		return items;
+	}
+
+	mvBufferType GetBufferType(const Py_buffer& buffer)
+	{
+		// skip native/little endian prefixes, other byte orders are not handled
+		const char* format = buffer.format ? buffer.format : "B";
+		if (*format == '@' || *format == '=' || *format == '<')
+			format++;
+
+		if (format[0] == 0 || format[1] != 0)
+			return mvBufferType::None;
+
+		Py_ssize_t size = buffer.itemsize;
+		switch (format[0])
+		{
+		case 'd': return size == 8 ? mvBufferType::Double : mvBufferType::None;
+		case 'f': return size == 4 ? mvBufferType::Float : mvBufferType::None;
+		case 'b': return size == 1 ? mvBufferType::Int8 : mvBufferType::None;
+		case 'B': return size == 1 ? mvBufferType::UInt8 : mvBufferType::None;
+		case 'h': return size == 2 ? mvBufferType::Int16 : mvBufferType::None;
+		case 'H': return size == 2 ? mvBufferType::UInt16 : mvBufferType::None;
+
+		case 'i':
+		case 'l':
+		case 'q':
+			return size == 4 ? mvBufferType::Int32 : size == 8 ? mvBufferType::Int64 : mvBufferType::None;
+
+		case 'I':
+		case 'L':
+		case 'Q':
+			return size == 4 ? mvBufferType::UInt32 : size == 8 ? mvBufferType::UInt64 : mvBufferType::None;
+
+		default: return mvBufferType::None;
+		}
+	}
+
+	template<typename T>
+	static void ConvertBuffer(const void* buf, size_t count, double* out)
+	{
+		const T* data = (const T*)buf;
+		for (size_t i = 0; i < count; i++)
+			out[i] = (double)data[i];
+	}
+
+	std::vector<double> ToDoubleVect(PyObject* value, const std::string& message, bool releaseGIL)
+	{
+
+		std::vector<double> items;
+		if (value == nullptr)
+			return items;
+
+		if (PyTuple_Check(value) || PyList_Check(value))
+		{
+			Py_ssize_t count = PySequence_Fast_GET_SIZE(value);
+			PyObject** data = PySequence_Fast_ITEMS(value);
+			items.reserve(count);
+			for (Py_ssize_t i = 0; i < count; i++)
+			{
+				PyObject* item = data[i];
+				if (PyFloat_CheckExact(item))
+					items.push_back(PyFloat_AS_DOUBLE(item));
+				else if (PyNumber_Check(item))
+					items.push_back(PyFloat_AsDouble(item));
+			}
+		}
+
 		else if (PyObject_CheckBuffer(value))
 		{
 			Py_buffer buffer_info;
 
-			if (!PyObject_GetBuffer(value, &buffer_info,
-				PyBUF_CONTIG_RO | PyBUF_FORMAT)) 
+			if (PyObject_GetBuffer(value, &buffer_info, PyBUF_CONTIG_RO | PyBUF_FORMAT))
 			{
+				PyErr_Clear();
+				ThrowPythonException(message + " Buffers must be contiguous.");
+				return items;
+			}
 
-				if (strcmp(buffer_info.format, "d") == 0)
-				{
+			size_t count = (size_t)(buffer_info.len / buffer_info.itemsize);
+			const void* buf = buffer_info.buf;
+			mvBufferType type = GetBufferType(buffer_info);
 
-					for (Py_ssize_t i = 0; i < buffer_info.len / buffer_info.itemsize; i++)
-						items.emplace_back(*((double*)buffer_info.buf + i));
-				}
-				else if (strcmp(buffer_info.format, "l") == 0)
-				{
+			if (type != mvBufferType::None)
+			{
+				items.resize(count);
+				double* out = items.data();
+				Py_ssize_t itemsize = buffer_info.itemsize;
 
-					for (Py_ssize_t i = 0; i < buffer_info.len / buffer_info.itemsize; i++)
-						items.emplace_back(*((int*)buffer_info.buf + i));
-				}
-				else if (strcmp(buffer_info.format, "B") == 0)
+				auto copy = [&](size_t begin, size_t end)
+				{
+					const char* in = (const char*)buf + begin * itemsize;
+					size_t n = end - begin;
+					switch (type)
+					{
+					case mvBufferType::Double: memcpy(out + begin, in, n * sizeof(double)); break;
+					case mvBufferType::Float:  ConvertBuffer<float>(in, n, out + begin); break;
+					case mvBufferType::Int8:   ConvertBuffer<int8_t>(in, n, out + begin); break;
+					case mvBufferType::UInt8:  ConvertBuffer<uint8_t>(in, n, out + begin); break;
+					case mvBufferType::Int16:  ConvertBuffer<int16_t>(in, n, out + begin); break;
+					case mvBufferType::UInt16: ConvertBuffer<uint16_t>(in, n, out + begin); break;
+					case mvBufferType::Int32:  ConvertBuffer<int32_t>(in, n, out + begin); break;
+					case mvBufferType::UInt32: ConvertBuffer<uint32_t>(in, n, out + begin); break;
+					case mvBufferType::Int64:  ConvertBuffer<int64_t>(in, n, out + begin); break;
+					case mvBufferType::UInt64: ConvertBuffer<uint64_t>(in, n, out + begin); break;
+					default: break;
+					}
+				};
+
+				// large arrays are copied in chunks across the worker pool, without
+				// holding the GIL unless the caller may hold the app mutex
+				// (the buffer export keeps the memory alive meanwhile)
+				auto& parallel = mvApp::GetApp()->getParallel();
+				auto ranges = parallel.split(count);
+				auto run = [&]()
 				{
+					parallel.run(ranges.size(), [&](size_t i) { copy(ranges[i].first, ranges[i].second); });
+				};
 
-					for (Py_ssize_t i = 0; i < buffer_info.len / buffer_info.itemsize; i++)
-						items.emplace_back(*((unsigned char*)buffer_info.buf + i));
-				}
-				else
+				if (releaseGIL && count >= mvParallel::DefaultMinChunk)
 				{
-					ThrowPythonException("Unknown buffer type.");
-					ThrowPythonException(buffer_info.format);
+					Py_BEGIN_ALLOW_THREADS
+					run();
+					Py_END_ALLOW_THREADS
 				}
-	
-				PyBuffer_Release(&buffer_info);
+				else
+					run();
 			}
+			else
+				ThrowPythonException("Unknown buffer type " + std::string(buffer_info.format ? buffer_info.format : "") + ".");
+
+			PyBuffer_Release(&buffer_info);
 		}
 
 		else
 			ThrowPythonException(message);
 
-
 		return items;
 	}
 
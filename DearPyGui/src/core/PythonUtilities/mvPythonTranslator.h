@@ -24,6 +24,7 @@ namespace Marvel {
 	PyObject*   ToPyFloat (float value);
 	PyObject*   ToPyInt   (int value);
 	PyObject*   ToPyBool  (bool value);
+	PyObject*   ToPyUUID  (mvUUID value);
 	PyObject*   ToPyMPair (int x, float y);
 	PyObject*   ToPyMTrip (int i, float x, float y);
 	PyObject*   ToPyPair  (float x, float y);
@@ -40,6 +41,17 @@ namespace Marvel {
 
 	PyObject*   ToPyIntList  (int* value, int count);
 	PyObject*   ToPyFloatList(float* value, int count);
+	PyObject*   ToPyIntBuffer(const int* value, size_t count); // read only memoryview of C ints
+
+	// element type of a buffer requested with PyBUF_FORMAT. Native and little
+	// endian single element formats are decoded, integer widths come from the
+	// itemsize ('l' is 4 bytes on Windows). Anything else is None.
+	enum class mvBufferType
+	{
+		None, Double, Float, Int8, UInt8, Int16, UInt16, Int32, UInt32, Int64, UInt64
+	};
+
+	mvBufferType GetBufferType(const Py_buffer& buffer);
 
 	// updates
 	void        UpdatePyIntList         (PyObject* pyvalue, const std::vector<int>& value);
@@ -50,6 +62,7 @@ namespace Marvel {
 	int         ToInt   (PyObject* value, const std::string& message = "Type must be an integer.");
 	float       ToFloat (PyObject* value, const std::string& message = "Type must be a float.");
 	bool        ToBool  (PyObject* value, const std::string& message = "Type must be a bool.");
+	mvUUID      ToUUID  (PyObject* value, const std::string& message = "Type must be an integer.");
 	mvColor     ToColor (PyObject* value, const std::string& message = "Type must be a list or tuple of ints.");
 	mvVec2      ToVec2  (PyObject* value, const std::string& message = "Type must be a list or tuple of floats.");
 	mvVec4      ToVec4  (PyObject* value, const std::string& message = "Type must be a list or tuple of floats.");
@@ -61,6 +74,7 @@ namespace Marvel {
 	std::vector<mvVec4>                              ToVectVec4           (PyObject* value, const std::string& message = "Type must be a list/tuple of list/tuple.");
 	std::vector<int>                                 ToIntVect            (PyObject* value, const std::string& message = "Type must be a list or tuple of integers.");
 	std::vector<float>                               ToFloatVect          (PyObject* value, const std::string& message = "Type must be a list or tuple of floats.");
+	std::vector<double>                              ToDoubleVect         (PyObject* value, const std::string& message = "Type must be a list, tuple or buffer of numbers.", bool releaseGIL = true);
 	std::vector<std::string>                         ToStringVect         (PyObject* value, const std::string& message = "Type must be a list or tuple of strings.");
 	std::vector<std::pair<int, int>>                 ToVectInt2           (PyObject* value, const std::string& message = "Type must be an list/tuple of integer.");
 	std::vector<std::pair<std::string, std::string>> ToVectPairString     (PyObject* value, const std::string& message = "Type must be an list/tuple of string pairs.");
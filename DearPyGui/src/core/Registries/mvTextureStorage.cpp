@@ -1,10 +1,16 @@
 #include "mvTextureStorage.h"
 #include "mvUtilities.h"
 #include "mvPythonExceptions.h"
+#include "mvApp.h"
 #include <imgui.h>
+#include <stb_image.h>
 
 namespace Marvel {
 
+	// stands in for the texture handle on headless viewports so
+	// image widgets see a loaded texture (nothing is ever drawn)
+	static char s_headlessTexture = 0;
+
 	mvTextureStorage::mvTextureStorage()
 	{
 		mvEventBus::Subscribe(this, mvEVT_FRAME);
@@ -75,6 +81,15 @@ namespace Marvel {
 
 		mvTexture newTexture = { 0, 0, nullptr, 1 };
 
+		// headless viewports have no graphics context, only the size is kept
+		if (mvApp::GetApp()->isHeadless())
+		{
+			newTexture.texture = &s_headlessTexture;
+			if (stbi_info(name.c_str(), &newTexture.width, &newTexture.height, nullptr))
+				m_textures.insert({ name, newTexture });
+			return;
+		}
+
 		if (LoadTextureFromFile(name.c_str(), newTexture))
             m_textures.insert({ name, newTexture });
 
@@ -93,11 +108,32 @@ namespace Marvel {
 
 		mvTexture newTexture = { 0, 0, nullptr, 1 };
 
+		if (mvApp::GetApp()->isHeadless())
+		{
+			newTexture.texture = &s_headlessTexture;
+			newTexture.width = (int)width;
+			newTexture.height = (int)height;
+			m_textures[name] = newTexture;
+			return;
+		}
+
 		if (LoadTextureFromArray(name.c_str(), data, width, height, newTexture, format))
 			m_textures[name] = newTexture;
 
 	}
 
+	void mvTextureStorage::updateTexture(const std::string& name, const float* data, unsigned yoffset, unsigned rows)
+	{
+		mvTexture* texture = getTexture(name);
+		if (texture == nullptr || texture->texture == &s_headlessTexture)
+			return;
+
+		if (yoffset + rows > (unsigned)texture->height)
+			return;
+
+		UpdateTexture(*texture, data, yoffset, rows);
+	}
+
 	void mvTextureStorage::addDelayedTexture(const std::string& name)
 	{
 		m_delayedTextures.push_back({ name, {}, 0u, 0u });
@@ -131,7 +167,8 @@ namespace Marvel {
 		if (m_textures.at(name).count == 0 && name != "INTERNAL_DPG_FONT_ATLAS")
 		{
 			UnloadTexture(name);
-			FreeTexture(m_textures.at(name));
+			if (m_textures.at(name).texture != &s_headlessTexture)
+				FreeTexture(m_textures.at(name));
 			m_textures.erase(name);
 
 			mvEventBus::Publish(mvEVT_CATEGORY_TEXTURE, mvEVT_DELETE_TEXTURE, { CreateEventArgument("NAME", name) });
@@ -66,6 +66,7 @@ namespace Marvel {
 
 		void       addTexture       (const std::string& name);
 		void       addTexture       (const std::string& name, float* data, unsigned width, unsigned height, mvTextureFormat format);
+		void       updateTexture    (const std::string& name, const float* data, unsigned yoffset, unsigned rows);
 		void       addDelayedTexture(const std::string& name);
 		void       addDelayedTexture(const std::string& name, const std::vector<float>& data, unsigned width, unsigned height, mvTextureFormat format);
 		void       incrementTexture (const std::string& name);
@@ -312,6 +312,10 @@ namespace Marvel {
 					AddFloatVectorValue(name, ToFloatVect(value));
 		}
 
+		// buffer (numpy arrays, array.array)
+		else if (PyObject_CheckBuffer(value) && !PyBytes_Check(value))
+			AddFloatVectorValue(name, ToFloatVect(value));
+
 		// tuple (color)
 		else if (PyTuple_Check(value))
 		{
@@ -650,7 +654,7 @@ namespace Marvel {
 	std::vector<float>* mvValueStorage::AddFloatVectorValue(const std::string& name, const std::vector<float>& value)
 	{
 		// value exists and is proper type
-		if (HasValue(name) && GetType(name) == ValueTypes::Float4)
+		if (HasValue(name) && GetType(name) == ValueTypes::FloatVect)
 		{
 			IncrementRef(name);
 			return GetFloatVectorValue(name);
@@ -660,7 +664,7 @@ namespace Marvel {
 		else if (HasValue(name))
 		{
 			IncrementRef(name);
-			return &s_floatvects["common_float4"];
+			return &s_floatvects["common_floatvect"];
 		}
 
 		// doesn't have value
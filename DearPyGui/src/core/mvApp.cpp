@@ -94,7 +94,7 @@ namespace Marvel {
 		s_started = true;
 
 		// create window
-		m_viewport = mvWindow::CreatemvWindow(m_actualWidth, m_actualHeight, false);
+		setViewport(mvWindow::CreateViewport(m_actualWidth, m_actualHeight, false));
 		m_viewport->show();
 
 		if (!std::string(primaryWindow).empty())
@@ -124,7 +124,9 @@ namespace Marvel {
         GetApp()->getCallbackRegistry().stop();
         GetApp()->getCallbackRegistry().addCallback(nullptr, "null", nullptr);
         m_future.get();
-		delete m_viewport;
+		mvWindow* viewport = m_viewport;
+		setViewport(nullptr);
+		delete viewport;
 		s_started = false;
 	}
 
@@ -133,8 +135,6 @@ namespace Marvel {
 
 		mvEventBus::Subscribe(this, 0, mvEVT_CATEGORY_VIEWPORT);
 
-		m_parsers = BuildDearPyGuiInterface();
-
 		// info
         mvAppLog::Clear();
 		mvAppLog::AddLog("[DearPyGui Version] %0s\n", mvApp::GetVersion());
@@ -153,6 +153,8 @@ namespace Marvel {
 		m_valueStorage = CreateOwnedPtr<mvValueStorage>();
 		m_themeManager = CreateOwnedPtr<mvTheme>();
         m_callbackRegistry = CreateOwnedPtr<mvCallbackRegistry>();
+		m_frameScheduler = CreateOwnedPtr<mvFrameScheduler>();
+		m_parallel = CreateOwnedPtr<mvParallel>();
 
 	}
 
@@ -243,6 +245,46 @@ namespace Marvel {
 #endif // MV_PROFILE
 	}
 
+	void mvApp::RequestRedraw(int frames)
+	{
+		if (s_instance == nullptr || !s_instance->m_lazyRendering)
+			return;
+
+		// ImGui needs a few frames to settle (sizing, hover, etc.)
+		if (s_instance->m_pendingFrames < frames)
+			s_instance->m_pendingFrames = frames;
+
+		s_instance->wakeViewport();
+	}
+
+	void mvApp::wakeViewport()
+	{
+		std::lock_guard<std::mutex> lk(m_viewportMutex);
+		if (m_viewport)
+			m_viewport->wakeup();
+	}
+
+	void mvApp::setViewport(mvWindow* viewport)
+	{
+		// a wakeup in progress finishes before the old viewport can be deleted
+		std::lock_guard<std::mutex> lk(m_viewportMutex);
+		m_viewport = viewport;
+	}
+
+	bool mvApp::consumeRedraw()
+	{
+		if (m_pendingFrames <= 0)
+			return false;
+
+		m_pendingFrames--;
+		return true;
+	}
+
+	std::map<std::string, mvPythonParser>* mvApp::getParsers()
+	{
+		return GetDearPyGuiInterface();
+	}
+
 	void mvApp::setMainPos(int x, int y)
 	{
 
@@ -29,6 +29,8 @@
 #include "mvDrawList.h"
 #include "mvTextureStorage.h"
 #include "mvValueStorage.h"
+#include "mvFrameScheduler.h"
+#include "mvParallel.h"
 #include "mvPythonExceptions.h"
 #include <memory>
 
@@ -59,6 +61,7 @@ namespace Marvel {
         friend class mvWindowsWindow;
         friend class mvLinuxWindow;
         friend class mvAppleWindow;
+        friend class mvHeadlessWindow;
 
     public:
 
@@ -89,6 +92,9 @@ namespace Marvel {
         // Rendering
         //-----------------------------------------------------------------------------
         void                     render          (); // actual render loop
+        static void              RequestRedraw   (int frames = 3); // lazy rendering: thread safe, wakes a waiting viewport
+        void                     wakeViewport    (); // thread safe, interrupts a wait for events
+        bool                     consumeRedraw   (); // lazy rendering: true if a frame is pending
 
         //-----------------------------------------------------------------------------
         // Managers
@@ -97,6 +103,8 @@ namespace Marvel {
         mvTextureStorage&        getTextureStorage  () { return *m_textureStorage; }
         mvValueStorage&          getValueStorage    () { return *(m_valueStorage.get()); }
         mvCallbackRegistry&      getCallbackRegistry();
+        mvFrameScheduler&        getFrameScheduler  () { return *m_frameScheduler; }
+        mvParallel&              getParallel        () { return *m_parallel; }
         
         //-----------------------------------------------------------------------------
         // App Settings
@@ -105,9 +113,11 @@ namespace Marvel {
         void                     addRemapChar      (int dst, int src) { m_charRemaps.emplace_back( dst, src ); }
         void                     setVSync          (bool value) { m_vsync = value; }
         void                     setResizable      (bool value) { m_resizable = value; }			
+        void                     setHeadless       (bool value) { m_headless = value; }
+        void                     setLazyRendering  (bool value, float timeout) { m_lazyRendering = value; m_lazyTimeout = timeout; }
         void                     setMainPos        (int x, int y);			
         void                     setGlobalFontScale(float scale);
-        void                     setViewport       (mvWindow* viewport) { m_viewport = viewport; }
+        void                     setViewport       (mvWindow* viewport); // clear before deleting the viewport
         void                     setTitle          (const std::string& title) { m_title = title; }
         void                     setFont(const std::string& file, float size = 13.0f, const std::string& glyphRange = "",
                                     std::vector<std::array<ImWchar, 3>> customRanges = {},
@@ -123,6 +133,9 @@ namespace Marvel {
         mvWindow*                getViewport       ()       { return m_viewport; }
         bool                     getVSync          () const { return m_vsync; }
         bool                     getResizable      () const { return m_resizable; }
+        bool                     isHeadless        () const { return m_headless; }
+        bool                     getLazyRendering  () const { return m_lazyRendering; }
+        float                    getLazyTimeout    () const { return m_lazyTimeout; }
         
         //-----------------------------------------------------------------------------
         // Styles/Themes
@@ -148,7 +161,7 @@ namespace Marvel {
         //-----------------------------------------------------------------------------
         // Other
         //-----------------------------------------------------------------------------
-        std::map<std::string, mvPythonParser>* getParsers      () { return m_parsers.get(); }
+        std::map<std::string, mvPythonParser>* getParsers      ();
         std::mutex& getMutex() const { return m_mutex; }
             
     private:
@@ -174,6 +187,8 @@ namespace Marvel {
         mvOwnedPtr<mvValueStorage>                   m_valueStorage;
         mvOwnedPtr<mvTheme>                          m_themeManager;
         mvOwnedPtr<mvCallbackRegistry>               m_callbackRegistry;
+        mvOwnedPtr<mvFrameScheduler>                 m_frameScheduler;
+        mvOwnedPtr<mvParallel>                       m_parallel;
                                                      
         // docking                                   
         bool                                         m_docking          = false;
@@ -181,6 +196,7 @@ namespace Marvel {
         bool                                         m_dockingViewport  = false;
                                                      
         mvWindow*                                    m_viewport = nullptr;
+        std::mutex                                   m_viewportMutex; // held while waking the viewport from other threads
         int                                          m_actualWidth = 1280;
         int                                          m_actualHeight = 800;
         int                                          m_clientWidth = 1280;
@@ -188,7 +204,6 @@ namespace Marvel {
         int                                          m_mainXPos = 100;
         int                                          m_mainYPos = 100;
         std::string                                  m_title = "DearPyGui";
-        mvRef<std::map<std::string, mvPythonParser>> m_parsers;
         
         // appearance
         std::string m_theme = "Dark";
@@ -197,6 +212,12 @@ namespace Marvel {
         bool        m_styleChange = true;
         bool        m_vsync = true;
         bool        m_resizable = true;
+        bool        m_headless = false;
+
+        // lazy rendering
+        std::atomic_bool   m_lazyRendering = false;
+        std::atomic<float> m_lazyTimeout = 0.5f; // seconds between idle frames
+        std::atomic_int    m_pendingFrames = 3;
 
         // fonts
         std::string                         m_fontFile;
@@ -13,6 +13,9 @@
 
 namespace Marvel {
 
+	// stable integer handle identifying an item
+	using mvUUID = unsigned long long;
+
 	template<typename T>
 	using mvOwnedPtr = std::unique_ptr<T>;
 	template<typename T, typename ... Args>
@@ -0,0 +1,88 @@
+#include "mvFrameScheduler.h"
+#include <thread>
+#include <algorithm>
+
+namespace Marvel {
+
+	mvFrameScheduler::mvFrameScheduler()
+	{
+		m_frameStart = clock::now();
+		m_deadline = m_frameStart;
+	}
+
+	void mvFrameScheduler::setTargetFps(float fps, float backgroundFps)
+	{
+		std::lock_guard<std::mutex> lk(m_mutex);
+		m_targetFps = fps > 0.0f ? fps : 0.0f;
+		m_backgroundFps = backgroundFps > 0.0f ? backgroundFps : 0.0f;
+	}
+
+	void mvFrameScheduler::pace(bool focused)
+	{
+		float fps;
+		{
+			std::lock_guard<std::mutex> lk(m_mutex);
+			fps = m_targetFps;
+			if (!focused && m_backgroundFps > 0.0f)
+				fps = m_backgroundFps;
+		}
+
+		clock::time_point workEnd = clock::now();
+
+		if (fps > 0.0f)
+		{
+			auto period = std::chrono::duration_cast<clock::duration>(std::chrono::duration<double>(1.0 / fps));
+
+			// don't try to catch up after a long frame, just start over
+			m_deadline += period;
+			if (m_deadline < workEnd)
+				m_deadline = workEnd;
+			else
+				std::this_thread::sleep_until(m_deadline);
+		}
+
+		clock::time_point frameEnd = clock::now();
+		if (fps <= 0.0f)
+			m_deadline = frameEnd;
+
+		std::lock_guard<std::mutex> lk(m_mutex);
+		int index = (int)(m_frames % FrameHistory);
+		m_frameTimes[index] = std::chrono::duration<float, std::milli>(frameEnd - m_frameStart).count();
+		m_workTimes[index] = std::chrono::duration<float, std::milli>(workEnd - m_frameStart).count();
+		m_appliedFps = fps;
+		m_frameStart = frameEnd;
+		m_frames++;
+	}
+
+	mvFrameStats mvFrameScheduler::getStats() const
+	{
+		std::lock_guard<std::mutex> lk(m_mutex);
+
+		mvFrameStats stats;
+		stats.frames = m_frames;
+		stats.targetFps = m_appliedFps;
+
+		int count = (int)std::min<long long>(m_frames, FrameHistory);
+		if (count == 0)
+			return stats;
+
+		float frameTotal = 0.0f;
+		float workTotal = 0.0f;
+		stats.frameTimeMin = m_frameTimes[0];
+		stats.frameTimeMax = m_frameTimes[0];
+		for (int i = 0; i < count; i++)
+		{
+			frameTotal += m_frameTimes[i];
+			workTotal += m_workTimes[i];
+			stats.frameTimeMin = std::min(stats.frameTimeMin, m_frameTimes[i]);
+			stats.frameTimeMax = std::max(stats.frameTimeMax, m_frameTimes[i]);
+		}
+
+		stats.frameTime = frameTotal / (float)count;
+		stats.workTime = workTotal / (float)count;
+		stats.fps = stats.frameTime > 0.0f ? 1000.0f / stats.frameTime : 0.0f;
+
+		return stats;
+	}
+
+}
@@ -0,0 +1,70 @@
+#pragma once
+
+//-----------------------------------------------------------------------------
+// mvFrameScheduler
+//
+//     - Paces the render loop to a target frame rate independent of vsync.
+//       Viewports call pace() once per frame, after presenting.
+//
+//     - A separate (usually lower) rate can be used while the viewport is
+//       not focused.
+//
+//     - Keeps the most recent frame times for get_frame_stats.
+//     
+//-----------------------------------------------------------------------------
+
+#include <chrono>
+#include <mutex>
+#include <array>
+
+namespace Marvel {
+
+	//-----------------------------------------------------------------------------
+	// mvFrameStats
+	//     - times are in milliseconds, averaged over the recorded frames
+	//-----------------------------------------------------------------------------
+	struct mvFrameStats
+	{
+		long long frames        = 0;    // total frames paced
+		float     fps           = 0.0f;
+		float     frameTime     = 0.0f; // start to start, including sleep
+		float     frameTimeMin  = 0.0f;
+		float     frameTimeMax  = 0.0f;
+		float     workTime      = 0.0f; // excluding sleep
+		float     targetFps     = 0.0f; // currently applied target (0 is uncapped)
+	};
+
+	//-----------------------------------------------------------------------------
+	// mvFrameScheduler
+	//-----------------------------------------------------------------------------
+	class mvFrameScheduler
+	{
+
+		using clock = std::chrono::steady_clock;
+
+		static constexpr int FrameHistory = 120;
+
+	public:
+
+		mvFrameScheduler();
+
+		// fps of 0 is uncapped, backgroundFps of 0 uses fps
+		void         setTargetFps(float fps, float backgroundFps);
+		void         pace        (bool focused);
+		mvFrameStats getStats    () const;
+
+	private:
+
+		mutable std::mutex                   m_mutex;
+		float                                m_targetFps     = 0.0f;
+		float                                m_backgroundFps = 0.0f;
+		float                                m_appliedFps    = 0.0f;
+		clock::time_point                    m_frameStart;
+		clock::time_point                    m_deadline;
+		std::array<float, FrameHistory>      m_frameTimes = {};
+		std::array<float, FrameHistory>      m_workTimes = {};
+		long long                            m_frames = 0;
+
+	};
+
+}
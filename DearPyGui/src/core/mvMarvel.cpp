@@ -9,6 +9,7 @@
 #include "mvDrawCmdCommon.h"
 #include "mvWindow.h"
 #include "mvPythonExceptions.h"
+#include "mvPythonCommand.h"
 #include <ImGuiFileDialog.h>
 #include <cstdlib>
 
@@ -28,7 +29,9 @@
 //-----------------------------------------------------------------------------
 // Helper Macro
 //-----------------------------------------------------------------------------
-#define ADD_PYTHON_FUNCTION(Function) { #Function, (PyCFunction)Function, METH_VARARGS | METH_KEYWORDS, (*mvApp::GetApp()->getParsers())[#Function].getDocumentation() },
+// docstrings are provided lazily by mvPythonCommand
+#define ADD_PYTHON_FUNCTION(Function) { #Function, (PyCFunction)Function, METH_VARARGS | METH_KEYWORDS, nullptr },
+#define ADD_PYTHON_FUNCTION_FAST(Function) { #Function, (PyCFunction)(void(*)(void))Function, METH_FASTCALL | METH_KEYWORDS, nullptr },
 
 namespace Marvel {
 
@@ -97,9 +100,17 @@ namespace Marvel {
 		return parsers;
 	}
 
+	std::map<std::string, mvPythonParser>* GetDearPyGuiInterface()
+	{
+		// commands hold on to their parsers so the
+		// table must outlive any single app
+		static mvRef<std::map<std::string, mvPythonParser>> parsers = BuildDearPyGuiInterface();
+		return parsers.get();
+	}
+
 	std::vector<std::pair<std::string, std::string>> GetAllCommands()
 	{
-		auto mapping = BuildDearPyGuiInterface();
+		auto mapping = GetDearPyGuiInterface();
 
 		std::vector<std::pair<std::string, std::string>> result;
 
@@ -520,6 +531,22 @@ namespace Marvel {
 			{ "mvMouseButton_X1", 3 },
 			{ "mvMouseButton_X2", 4 },
 
+			//-----------------------------------------------------------------------------
+			// Item State Flags
+			//-----------------------------------------------------------------------------
+			{ "mvItemState_None"                , mvItemState_None },
+			{ "mvItemState_Hovered"             , mvItemState_Hovered },
+			{ "mvItemState_Active"              , mvItemState_Active },
+			{ "mvItemState_Focused"             , mvItemState_Focused },
+			{ "mvItemState_Clicked"             , mvItemState_Clicked },
+			{ "mvItemState_Visible"             , mvItemState_Visible },
+			{ "mvItemState_Edited"              , mvItemState_Edited },
+			{ "mvItemState_Activated"           , mvItemState_Activated },
+			{ "mvItemState_Deactivated"         , mvItemState_Deactivated },
+			{ "mvItemState_DeactivatedAfterEdit", mvItemState_DeactivatedAfterEdit },
+			{ "mvItemState_ToggledOpen"         , mvItemState_ToggledOpen },
+			{ "mvItemState_Shown"               , mvItemState_Shown },
+
 			//-----------------------------------------------------------------------------
 			// Cardinal directions
 			//-----------------------------------------------------------------------------
@@ -555,7 +582,11 @@ namespace Marvel {
 	static PyMethodDef dearpyguimethods[]
 	{
 		ADD_PYTHON_FUNCTION(get_item_configuration)
-		ADD_PYTHON_FUNCTION(configure_item)
+		ADD_PYTHON_FUNCTION_FAST(configure_item)
+		ADD_PYTHON_FUNCTION(get_items_configuration)
+		ADD_PYTHON_FUNCTION(configure_items)
+		ADD_PYTHON_FUNCTION(begin_batch)
+		ADD_PYTHON_FUNCTION(end_batch)
 
 		// app interface
 		ADD_PYTHON_FUNCTION(enable_docking)
@@ -577,12 +608,18 @@ namespace Marvel {
 		ADD_PYTHON_FUNCTION(select_directory_dialog)
 		ADD_PYTHON_FUNCTION(get_delta_time)
 		ADD_PYTHON_FUNCTION(get_total_time)
+		ADD_PYTHON_FUNCTION(set_target_fps)
+		ADD_PYTHON_FUNCTION(get_frame_stats)
+		ADD_PYTHON_FUNCTION(set_thread_pool)
+		ADD_PYTHON_FUNCTION(get_thread_pool_stats)
 		ADD_PYTHON_FUNCTION(get_data)
 		ADD_PYTHON_FUNCTION(delete_data)
 		ADD_PYTHON_FUNCTION(add_data)
 		ADD_PYTHON_FUNCTION(open_file_dialog)
 		ADD_PYTHON_FUNCTION(set_exit_callback)
 		ADD_PYTHON_FUNCTION(set_vsync)
+		ADD_PYTHON_FUNCTION(set_headless)
+		ADD_PYTHON_FUNCTION(set_lazy_rendering)
 		ADD_PYTHON_FUNCTION(stop_dearpygui)
 		ADD_PYTHON_FUNCTION(is_dearpygui_running)
 		ADD_PYTHON_FUNCTION(set_main_window_title)
@@ -608,11 +645,12 @@ namespace Marvel {
 		ADD_PYTHON_FUNCTION(get_item_type)
 		ADD_PYTHON_FUNCTION(set_item_callback)
 		ADD_PYTHON_FUNCTION(set_item_callback_data)
-		ADD_PYTHON_FUNCTION(get_value)
-		ADD_PYTHON_FUNCTION(set_value)
+		ADD_PYTHON_FUNCTION_FAST(get_value)
+		ADD_PYTHON_FUNCTION_FAST(set_value)
 		ADD_PYTHON_FUNCTION(add_value)
 		ADD_PYTHON_FUNCTION(incref_value)
 		ADD_PYTHON_FUNCTION(decref_value)
+		ADD_PYTHON_FUNCTION(get_item_states)
 		ADD_PYTHON_FUNCTION(is_item_hovered)
 		ADD_PYTHON_FUNCTION(is_item_shown)
 		ADD_PYTHON_FUNCTION(is_item_active)
@@ -821,9 +859,17 @@ namespace Marvel {
 		ADD_PYTHON_FUNCTION(set_headers)
 		ADD_PYTHON_FUNCTION(clear_table)
 		ADD_PYTHON_FUNCTION(get_table_item)
-		ADD_PYTHON_FUNCTION(set_table_item)
+		ADD_PYTHON_FUNCTION_FAST(set_table_item)
 		ADD_PYTHON_FUNCTION(get_table_selections)
 		ADD_PYTHON_FUNCTION(set_table_selection)
+		ADD_PYTHON_FUNCTION(set_table_selection_range)
+		ADD_PYTHON_FUNCTION(select_all_table)
+		ADD_PYTHON_FUNCTION(clear_table_selections)
+		ADD_PYTHON_FUNCTION(get_table_selected_rows)
+		ADD_PYTHON_FUNCTION(sort_table)
+		ADD_PYTHON_FUNCTION(add_table_filter)
+		ADD_PYTHON_FUNCTION(clear_table_filters)
+		ADD_PYTHON_FUNCTION(get_table_row_order)
 		ADD_PYTHON_FUNCTION(add_column)
 		ADD_PYTHON_FUNCTION(insert_column)
 		ADD_PYTHON_FUNCTION(delete_column)
@@ -838,18 +884,18 @@ namespace Marvel {
 		ADD_PYTHON_FUNCTION(send_draw_command_to_back)
 		ADD_PYTHON_FUNCTION(modify_draw_command)
 		ADD_PYTHON_FUNCTION(get_draw_command)
-		ADD_PYTHON_FUNCTION(draw_arrow)
+		ADD_PYTHON_FUNCTION_FAST(draw_arrow)
 		ADD_PYTHON_FUNCTION(add_drawing)
-		ADD_PYTHON_FUNCTION(draw_image)
-		ADD_PYTHON_FUNCTION(draw_line)
-		ADD_PYTHON_FUNCTION(draw_triangle)
-		ADD_PYTHON_FUNCTION(draw_rectangle)
-		ADD_PYTHON_FUNCTION(draw_quad)
-		ADD_PYTHON_FUNCTION(draw_text)
-		ADD_PYTHON_FUNCTION(draw_circle)
-		ADD_PYTHON_FUNCTION(draw_polyline)
-		ADD_PYTHON_FUNCTION(draw_polygon)
-		ADD_PYTHON_FUNCTION(draw_bezier_curve)
+		ADD_PYTHON_FUNCTION_FAST(draw_image)
+		ADD_PYTHON_FUNCTION_FAST(draw_line)
+		ADD_PYTHON_FUNCTION_FAST(draw_triangle)
+		ADD_PYTHON_FUNCTION_FAST(draw_rectangle)
+		ADD_PYTHON_FUNCTION_FAST(draw_quad)
+		ADD_PYTHON_FUNCTION_FAST(draw_text)
+		ADD_PYTHON_FUNCTION_FAST(draw_circle)
+		ADD_PYTHON_FUNCTION_FAST(draw_polyline)
+		ADD_PYTHON_FUNCTION_FAST(draw_polygon)
+		ADD_PYTHON_FUNCTION_FAST(draw_bezier_curve)
 		ADD_PYTHON_FUNCTION(clear_drawing)
 		ADD_PYTHON_FUNCTION(delete_draw_command)
 
@@ -862,6 +908,7 @@ namespace Marvel {
 		ADD_PYTHON_FUNCTION(delete_annotation)
 		ADD_PYTHON_FUNCTION(is_plot_queried)
 		ADD_PYTHON_FUNCTION(get_plot_query_area)
+		ADD_PYTHON_FUNCTION_FAST(get_plot_nearest_points)
 		ADD_PYTHON_FUNCTION(clear_plot)
 		ADD_PYTHON_FUNCTION(reset_xticks)
 		ADD_PYTHON_FUNCTION(reset_yticks)
@@ -875,25 +922,27 @@ namespace Marvel {
 		ADD_PYTHON_FUNCTION(get_plot_ylimits)
 		ADD_PYTHON_FUNCTION(set_color_map)
 		ADD_PYTHON_FUNCTION(add_plot)
-		ADD_PYTHON_FUNCTION(add_shade_series)
-		ADD_PYTHON_FUNCTION(add_bar_series)
-		ADD_PYTHON_FUNCTION(add_line_series)
-		ADD_PYTHON_FUNCTION(add_pie_series)
-		ADD_PYTHON_FUNCTION(add_scatter_series)
-		ADD_PYTHON_FUNCTION(add_area_series)
-		ADD_PYTHON_FUNCTION(add_stem_series)
-		ADD_PYTHON_FUNCTION(add_error_series)
-		ADD_PYTHON_FUNCTION(add_image_series)
-		ADD_PYTHON_FUNCTION(add_stair_series)
-		ADD_PYTHON_FUNCTION(add_candle_series)
+		ADD_PYTHON_FUNCTION_FAST(add_shade_series)
+		ADD_PYTHON_FUNCTION_FAST(add_bar_series)
+		ADD_PYTHON_FUNCTION_FAST(add_line_series)
+		ADD_PYTHON_FUNCTION_FAST(add_pie_series)
+		ADD_PYTHON_FUNCTION_FAST(add_scatter_series)
+		ADD_PYTHON_FUNCTION_FAST(add_area_series)
+		ADD_PYTHON_FUNCTION_FAST(add_stem_series)
+		ADD_PYTHON_FUNCTION_FAST(add_error_series)
+		ADD_PYTHON_FUNCTION_FAST(add_image_series)
+		ADD_PYTHON_FUNCTION_FAST(add_stair_series)
+		ADD_PYTHON_FUNCTION_FAST(add_candle_series)
+		ADD_PYTHON_FUNCTION_FAST(append_series_data)
 		ADD_PYTHON_FUNCTION(delete_series)
-		ADD_PYTHON_FUNCTION(add_heat_series)
+		ADD_PYTHON_FUNCTION_FAST(add_heat_series)
+		ADD_PYTHON_FUNCTION_FAST(update_heat_series)
 		ADD_PYTHON_FUNCTION(add_text_point)
 		{NULL, NULL, 0, NULL}
 	};
 
 	static PyModuleDef dearpyguiModule = {
-		PyModuleDef_HEAD_INIT, "core", NULL, -1, dearpyguimethods,
+		PyModuleDef_HEAD_INIT, "core", NULL, -1, NULL,
 		NULL, NULL, NULL, NULL
 	};
 
@@ -905,6 +954,17 @@ namespace Marvel {
 		if (m == NULL)
 			return NULL;
 
+		for (PyMethodDef* def = dearpyguimethods; def->ml_name != NULL; def++)
+		{
+			PyObject* command = CreatePythonCommand(def);
+			if (command == NULL || PyModule_AddObject(m, def->ml_name, command) < 0)
+			{
+				Py_XDECREF(command);
+				Py_DECREF(m);
+				return NULL;
+			}
+		}
+
 		auto constants = GetModuleConstants();
 
 		// handled in the stub file
@@ -927,6 +987,13 @@ namespace Marvel {
 	{
 		PyErr_Print();
 
+		// nobody could close the error window in headless mode
+		if (mvApp::GetApp()->isHeadless())
+		{
+			mvApp::DeleteApp();
+			return;
+		}
+
 		// create window
 		auto window = mvWindow::CreatemvWindow(mvApp::GetApp()->getActualWidth(), mvApp::GetApp()->getActualHeight(), true);
 		window->show();
@@ -17,6 +17,9 @@ namespace Marvel {
 
 	mvRef<std::map<std::string, mvPythonParser>> BuildDearPyGuiInterface();
 
+	// built on first use and kept for the life of the process
+	std::map<std::string, mvPythonParser>* GetDearPyGuiInterface();
+
 	std::vector<std::pair<std::string, std::string>> GetAllCommands();
 
 	std::vector<std::pair<std::string, long>> GetModuleConstants();
@@ -0,0 +1,137 @@
+#include "mvParallel.h"
+#include "mvThreadPool.h"
+#include <algorithm>
+#include <thread>
+
+namespace Marvel {
+
+	thread_local mvWorkStealingQueue* mvThreadPool::m_local_work_queue = nullptr;
+	thread_local unsigned mvThreadPool::m_index = 0;
+
+	static int DefaultThreads()
+	{
+		int cores = (int)std::thread::hardware_concurrency();
+		return std::max(cores - 1, 0);
+	}
+
+	mvParallel::mvParallel()
+		: m_threads(DefaultThreads()), m_minChunk(DefaultMinChunk)
+	{
+	}
+
+	mvParallel::~mvParallel()
+	{
+		std::unique_lock<std::shared_mutex> lock(m_poolMutex);
+		m_pool.reset();
+	}
+
+	void mvParallel::configure(int threads, size_t minChunk)
+	{
+		// waits for running work before the workers are replaced
+		std::unique_lock<std::shared_mutex> lock(m_poolMutex);
+		m_pool.reset();
+		m_threads = threads < 0 ? DefaultThreads() : threads;
+		m_minChunk = std::max(minChunk, (size_t)1);
+	}
+
+	mvParallelStats mvParallel::getStats() const
+	{
+		mvParallelStats stats;
+		{
+			std::shared_lock<std::shared_mutex> lock(m_poolMutex);
+			stats.started = m_pool != nullptr;
+		}
+		stats.threads = m_threads;
+		stats.minChunk = m_minChunk;
+		stats.runs = m_runs;
+		stats.inlineRuns = m_inlineRuns;
+		stats.chunks = m_chunks;
+		stats.busyTime = m_busyTime * 1e-9;
+		stats.wallTime = m_wallTime * 1e-9;
+		long long capacity = m_capacityTime;
+		stats.utilization = capacity > 0 ? (float)((double)m_busyTime / (double)capacity) : 0.0f;
+		return stats;
+	}
+
+	std::vector<std::pair<size_t, size_t>> mvParallel::split(size_t count, size_t align) const
+	{
+		align = std::max(align, (size_t)1);
+		size_t threads = (size_t)m_threads + 1;
+
+		// a few chunks per thread so stolen work evens out, none smaller than the minimum
+		size_t chunk = std::max((size_t)m_minChunk, (count + threads * 4 - 1) / (threads * 4));
+		chunk = (chunk + align - 1) / align * align;
+
+		std::vector<std::pair<size_t, size_t>> ranges;
+		for (size_t begin = 0; begin < count; begin += chunk)
+			ranges.push_back({ begin, std::min(begin + chunk, count) });
+		return ranges;
+	}
+
+	void mvParallel::start()
+	{
+		std::unique_lock<std::shared_mutex> lock(m_poolMutex);
+		if (m_pool == nullptr && m_threads > 0)
+			m_pool = std::make_unique<mvThreadPool>((unsigned)m_threads);
+	}
+
+	void mvParallel::run(size_t tasks, const std::function<void(size_t)>& func)
+	{
+		if (tasks == 0)
+			return;
+
+		if (tasks == 1 || m_threads == 0)
+		{
+			for (size_t i = 0; i < tasks; i++)
+				func(i);
+			m_inlineRuns++;
+			return;
+		}
+
+		{
+			std::shared_lock<std::shared_mutex> lock(m_poolMutex);
+			if (m_pool == nullptr)
+			{
+				lock.unlock();
+				start();
+			}
+		}
+
+		std::shared_lock<std::shared_mutex> lock(m_poolMutex);
+		if (m_pool == nullptr)
+		{
+			// reconfigured to run inline in the meantime
+			for (size_t i = 0; i < tasks; i++)
+				func(i);
+			m_inlineRuns++;
+			return;
+		}
+
+		std::atomic<long long> busy = 0;
+		auto timed = [&](size_t i)
+		{
+			auto chunkStart = clock::now();
+			func(i);
+			busy += std::chrono::duration_cast<std::chrono::nanoseconds>(clock::now() - chunkStart).count();
+		};
+
+		auto runStart = clock::now();
+
+		std::vector<std::future<void>> futures;
+		futures.reserve(tasks - 1);
+		for (size_t i = 1; i < tasks; i++)
+			futures.push_back(m_pool->submit([&timed, i]() { timed(i); }));
+
+		timed(0);
+		for (auto& future : futures)
+			future.get();
+
+		long long wall = std::chrono::duration_cast<std::chrono::nanoseconds>(clock::now() - runStart).count();
+		m_runs++;
+		m_chunks += (long long)tasks;
+		m_busyTime += busy;
+		m_wallTime += wall;
+		m_capacityTime += wall * ((long long)m_threads + 1);
+	}
+
+}
@@ -0,0 +1,96 @@
+#pragma once
+
+//-----------------------------------------------------------------------------
+// mvParallel
+//
+//     - Shared worker pool for splitting large data work (series ingestion,
+//       bounds, sorting checks, level of detail building) across cores.
+//       Work is cut into chunks with split() and run with run(); the
+//       calling thread runs the first chunk itself and waits for the rest.
+//
+//     - Ranges smaller than two chunks run inline on the calling thread,
+//       and the workers are only started on first use.
+//
+//     - Callers holding the GIL should release it around large runs, but
+//       never while holding the app mutex.
+//
+//-----------------------------------------------------------------------------
+
+#include <atomic>
+#include <chrono>
+#include <functional>
+#include <memory>
+#include <mutex>
+#include <shared_mutex>
+#include <utility>
+#include <vector>
+
+namespace Marvel {
+
+	class mvThreadPool;
+
+	//-----------------------------------------------------------------------------
+	// mvParallelStats
+	//     - times are in seconds, accumulated since the app started
+	//-----------------------------------------------------------------------------
+	struct mvParallelStats
+	{
+		int       threads     = 0;    // worker threads (the calling thread also runs chunks)
+		bool      started     = false;
+		size_t    minChunk    = 0;
+		long long runs        = 0;    // runs split across threads
+		long long inlineRuns  = 0;    // runs done on the calling thread only
+		long long chunks      = 0;
+		double    busyTime    = 0.0;  // time spent running chunks, all threads
+		double    wallTime    = 0.0;  // time spent in split runs
+		float     utilization = 0.0f; // busy time / (wall time * (threads + 1)) of split runs
+	};
+
+	//-----------------------------------------------------------------------------
+	// mvParallel
+	//-----------------------------------------------------------------------------
+	class mvParallel
+	{
+
+		using clock = std::chrono::steady_clock;
+
+	public:
+
+		static constexpr size_t DefaultMinChunk = 65536; // elements
+
+		mvParallel();
+		~mvParallel();
+
+		// threads < 0 uses one worker per core less the calling thread,
+		// 0 runs everything on the calling thread
+		void            configure(int threads, size_t minChunk);
+		mvParallelStats getStats () const;
+
+		// chunk ranges [begin, end) covering [0, count), chunk sizes are a
+		// multiple of align except for the last one
+		std::vector<std::pair<size_t, size_t>> split(size_t count, size_t align = 1) const;
+
+		// runs func(i) for i in [0, tasks), returns once all are done
+		void run(size_t tasks, const std::function<void(size_t)>& func);
+
+	private:
+
+		void start();
+
+	private:
+
+		mutable std::shared_mutex     m_poolMutex; // shared while running, unique to reconfigure
+		std::unique_ptr<mvThreadPool> m_pool;
+		std::atomic_int               m_threads;
+		std::atomic<size_t>           m_minChunk;
+
+		std::atomic<long long>        m_runs = 0;
+		std::atomic<long long>        m_inlineRuns = 0;
+		std::atomic<long long>        m_chunks = 0;
+		std::atomic<long long>        m_busyTime = 0;     // nanoseconds
+		std::atomic<long long>        m_wallTime = 0;     // nanoseconds
+		std::atomic<long long>        m_capacityTime = 0; // wall time * threads, nanoseconds
+
+	};
+
+}
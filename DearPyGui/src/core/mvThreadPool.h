@@ -18,6 +18,7 @@
 #include <vector>
 #include <queue>
 #include <deque>
+#include <thread>
 
 namespace Marvel {
 
@@ -329,11 +330,18 @@ namespace Marvel {
             }
         }
 
-        ~mvThreadPool() { m_done = true; }
+        ~mvThreadPool() { setDone(); }
 
         bool isReadyToDelete() const { return m_taskCount == 0; }
 
-        void setDone() { m_done = true; }
+        void setDone()
+        {
+            {
+                std::lock_guard<std::mutex> lock(m_idle_mutex);
+                m_done = true;
+            }
+            m_idle_cond.notify_all();
+        }
 
         static const char* getVersion() { return "v0.2"; }
 
@@ -350,6 +358,13 @@ namespace Marvel {
             else
                 m_pool_work_queue.push(std::move(task));
 
+            // wake idle workers
+            {
+                std::lock_guard<std::mutex> lock(m_idle_mutex);
+                m_submitted++;
+            }
+            m_idle_cond.notify_all();
+
             return res;
         }
 
@@ -367,6 +382,8 @@ namespace Marvel {
 
         void run_pending_task()
         {
+            unsigned submitted = m_submitted;
+
             task_type task;
             if (pop_task_from_local_queue(task) ||
                 pop_task_from_pool_queue(task) ||
@@ -376,9 +393,12 @@ namespace Marvel {
                 m_taskCount--;
             }
 
+            // sleep until something is submitted instead of spinning
             else
-                std::this_thread::yield();
-
+            {
+                std::unique_lock<std::mutex> lock(m_idle_mutex);
+                m_idle_cond.wait(lock, [&] { return m_submitted != submitted || m_done; });
+            }
 
         }
 
@@ -407,6 +427,9 @@ namespace Marvel {
     private:
 
         std::atomic_bool                                   m_done;
+        std::atomic_uint                                   m_submitted = 0;
+        std::mutex                                         m_idle_mutex;
+        std::condition_variable                            m_idle_cond;
         mvQueue<task_type>                                 m_pool_work_queue;
         std::vector<std::unique_ptr<mvWorkStealingQueue> > m_queues;
         std::vector<std::thread>                           m_threads;
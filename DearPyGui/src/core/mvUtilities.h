@@ -19,4 +19,7 @@ namespace Marvel {
 	bool        LoadTextureFromFile (const char* filename, mvTexture& storage);
 	void        FreeTexture         (mvTexture& storage);
 
+	// replaces rows [yoffset, yoffset + rows) of an RGBA float texture
+	void        UpdateTexture       (mvTexture& storage, const float* data, unsigned yoffset, unsigned rows);
+
 }
\ No newline at end of file
@@ -24,6 +24,13 @@ namespace Marvel {
 
 	}
 
+	mvWindow* mvWindow::CreateViewport(unsigned width, unsigned height, bool error)
+	{
+		if (mvApp::GetApp()->isHeadless())
+			return CreatemvHeadlessWindow(width, height, error);
+		return CreatemvWindow(width, height, error);
+	}
+
 	bool mvWindow::onEvent(mvEvent& event)
 	{
 		mvEventDispatcher dispatcher(event);
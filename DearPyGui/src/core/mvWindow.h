@@ -26,7 +26,9 @@ namespace Marvel {
 
 	public:
 
-		static mvWindow* CreatemvWindow(unsigned width, unsigned height, bool error = false);
+		static mvWindow* CreatemvWindow        (unsigned width, unsigned height, bool error = false); // platform specific
+		static mvWindow* CreatemvHeadlessWindow(unsigned width, unsigned height, bool error = false);
+		static mvWindow* CreateViewport        (unsigned width, unsigned height, bool error = false); // picks one of the above
 
 		mvWindow(unsigned width, unsigned height, bool error = false);
 		virtual ~mvWindow() = default;
@@ -46,6 +48,7 @@ namespace Marvel {
 		virtual void postrender () {}
 		virtual void cleanup    () {}
 		virtual void setWindowText(const std::string& name) {}
+		virtual void wakeup       () {} // lazy rendering: interrupt a wait for events (thread safe)
 		
 		void stop      () { m_running = false; }
 		void setupFonts();
@@ -84,4 +84,10 @@ namespace Marvel {
 
     }
 
+    void UpdateTexture(mvTexture& storage, const float* data, unsigned yoffset, unsigned rows)
+    {
+        id <MTLTexture> texture = (__bridge id <MTLTexture>)storage.texture;
+        [texture replaceRegion:MTLRegionMake2D(0, yoffset, storage.width, rows) mipmapLevel:0 withBytes:data bytesPerRow:storage.width * 4 * sizeof(float)];
+    }
+
 }
@@ -199,6 +199,8 @@ namespace Marvel {
             [commandBuffer presentDrawable:drawable];
             [commandBuffer commit];
         }
+
+        m_app->getFrameScheduler().pace(glfwGetWindowAttrib(m_window, GLFW_FOCUSED));
 	}
 
     void mvAppleWindow::render() {
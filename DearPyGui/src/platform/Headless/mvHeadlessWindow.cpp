@@ -0,0 +1,111 @@
+#include "platform/Headless/mvHeadlessWindow.h"
+#include "mvApp.h"
+#include "implot.h"
+#include "imgui.h"
+#include "imgui_internal.h"
+
+namespace Marvel {
+
+	mvWindow* mvWindow::CreatemvHeadlessWindow(unsigned width, unsigned height, bool error)
+	{
+		return new mvHeadlessWindow(width, height, error);
+	}
+
+	mvHeadlessWindow::mvHeadlessWindow(unsigned width, unsigned height, bool error)
+		: mvWindow(width, height, error)
+	{
+
+		mvEventBus::Publish(mvEVT_CATEGORY_VIEWPORT, mvEVT_VIEWPORT_RESIZE, {
+			CreateEventArgument("actual_width", (int)width),
+			CreateEventArgument("actual_height", (int)height),
+			CreateEventArgument("client_width", (int)width),
+			CreateEventArgument("client_height", (int)height)
+			});
+
+		// Setup Dear ImGui context
+		IMGUI_CHECKVERSION();
+		ImGui::CreateContext();
+		ImPlot::CreateContext();
+		ImGuiIO& io = ImGui::GetIO();
+		io.ConfigWindowsMoveFromTitleBarOnly = true;
+		io.IniFilename = nullptr;
+		io.BackendPlatformName = "dearpygui_headless";
+		io.BackendRendererName = "dearpygui_null";
+		io.DisplaySize = ImVec2((float)width, (float)height);
+		setupFonts();
+
+		if (mvApp::GetApp()->m_docking)
+			io.ConfigFlags |= ImGuiConfigFlags_DockingEnable;
+
+		if (mvApp::GetApp()->m_dockingShiftOnly)
+			io.ConfigDockingWithShift = true;
+
+		// there is no renderer to upload the atlas to but
+		// ImGui still requires it to be built before NewFrame
+		unsigned char* pixels;
+		int atlasWidth, atlasHeight;
+		io.Fonts->GetTexDataAsRGBA32(&pixels, &atlasWidth, &atlasHeight);
+		io.Fonts->SetTexID(nullptr);
+
+		// Setup style
+		ImGui::StyleColorsDark();
+
+		m_lastFrame = std::chrono::steady_clock::now();
+	}
+
+	mvHeadlessWindow::~mvHeadlessWindow()
+	{
+		ImPlot::DestroyContext();
+		ImGui::DestroyContext();
+		mvApp::s_started = false;
+	}
+
+	void mvHeadlessWindow::renderFrame()
+	{
+		prerender();
+
+		if (GImGui->CurrentWindow == nullptr)
+			return;
+
+		if (m_error)
+		{
+			mvAppLog::setSize(m_width, m_height);
+			mvAppLog::render();
+		}
+
+		else
+			m_app->render();
+
+		postrender();
+
+		m_app->getFrameScheduler().pace(true);
+	}
+
+	void mvHeadlessWindow::run()
+	{
+		setup();
+		while (m_running)
+			renderFrame();
+	}
+
+	void mvHeadlessWindow::prerender()
+	{
+		// no events to poll, only timing and display size are fed to ImGui
+		auto now = std::chrono::steady_clock::now();
+		float delta = std::chrono::duration<float>(now - m_lastFrame).count();
+		m_lastFrame = now;
+
+		ImGuiIO& io = ImGui::GetIO();
+		io.DisplaySize = ImVec2((float)m_width, (float)m_height);
+		io.DeltaTime = delta > 0.0f ? delta : 1.0f / 1000000.0f;
+
+		ImGui::NewFrame();
+	}
+
+	void mvHeadlessWindow::postrender()
+	{
+		// null renderer: draw lists are built but never submitted
+		ImGui::Render();
+	}
+
+}
@@ -0,0 +1,38 @@
+#pragma once
+
+//-----------------------------------------------------------------------------
+// mvHeadlessWindow
+//
+//     - Viewport without a platform window or graphics context. Frames are
+//       built by ImGui/ImPlot as usual but the draw data is discarded (null
+//       renderer), so apps can run on machines without a display or GPU.
+//
+//     - Enabled with set_headless(True) before the viewport is created.
+//     
+//-----------------------------------------------------------------------------
+
+#include <chrono>
+#include "core/mvWindow.h"
+
+namespace Marvel {
+
+	class mvHeadlessWindow : public mvWindow
+	{
+
+	public:
+
+		mvHeadlessWindow(unsigned width, unsigned height, bool error = false);
+		~mvHeadlessWindow() override;
+
+		void prerender  () override;
+		void postrender () override;
+		void renderFrame() override;
+		void run        () override;
+
+	private:
+
+		std::chrono::steady_clock::time_point m_lastFrame;
+
+	};
+
+}
@@ -27,8 +27,18 @@ namespace Marvel {
         mvApp::StopApp();
     }
 
+    // lazy rendering: any window event schedules frames. These are installed
+    // before the imgui backend, which chains to them.
+    static void redraw_callback(GLFWwindow* window) { mvApp::RequestRedraw(); }
+    static void redraw_focus_callback(GLFWwindow* window, int) { mvApp::RequestRedraw(); }
+    static void redraw_cursor_callback(GLFWwindow* window, double, double) { mvApp::RequestRedraw(); }
+    static void redraw_button_callback(GLFWwindow* window, int, int, int) { mvApp::RequestRedraw(); }
+    static void redraw_key_callback(GLFWwindow* window, int, int, int, int) { mvApp::RequestRedraw(); }
+    static void redraw_char_callback(GLFWwindow* window, unsigned int) { mvApp::RequestRedraw(); }
+
     static void window_size_callback(GLFWwindow* window, int width, int height)
     {
+        mvApp::RequestRedraw();
         mvEventBus::Publish(mvEVT_CATEGORY_VIEWPORT, mvEVT_VIEWPORT_RESIZE, {
             CreateEventArgument("actual_width", width),
             CreateEventArgument("actual_height", height),
@@ -87,6 +97,16 @@ namespace Marvel {
         // Setup style
         ImGui::StyleColorsDark();
 
+        // Setup lazy rendering callbacks
+        glfwSetWindowRefreshCallback(m_window, redraw_callback);
+        glfwSetWindowFocusCallback(m_window, redraw_focus_callback);
+        glfwSetCursorEnterCallback(m_window, redraw_focus_callback);
+        glfwSetCursorPosCallback(m_window, redraw_cursor_callback);
+        glfwSetMouseButtonCallback(m_window, redraw_button_callback);
+        glfwSetScrollCallback(m_window, redraw_cursor_callback);
+        glfwSetKeyCallback(m_window, redraw_key_callback);
+        glfwSetCharCallback(m_window, redraw_char_callback);
+
         // Setup Platform/Renderer bindings
         ImGui_ImplGlfw_InitForOpenGL(m_window, true);
         ImGui_ImplOpenGL3_Init(glsl_version);
@@ -134,6 +154,8 @@ namespace Marvel {
             m_app->render();
 
         postrender();
+
+        m_app->getFrameScheduler().pace(glfwGetWindowAttrib(m_window, GLFW_FOCUSED));
     }
 
     void mvLinuxWindow::run()
@@ -160,7 +182,18 @@ namespace Marvel {
         // - When io.WantCaptureMouse is true, do not dispatch mouse input data to your main application.
         // - When io.WantCaptureKeyboard is true, do not dispatch keyboard input data to your main application.
         // Generally you may always pass all inputs to dear imgui, and hide them from your application based on those two flags.
-        glfwPollEvents();
+        if (!mvApp::GetApp()->getLazyRendering())
+            glfwPollEvents();
+
+        // lazy rendering: sleep until an event, a wakeup or the idle timeout
+        else if (!mvApp::GetApp()->consumeRedraw())
+        {
+            glfwWaitEventsTimeout(mvApp::GetApp()->getLazyTimeout());
+            mvApp::GetApp()->consumeRedraw();
+        }
+
+        else
+            glfwPollEvents();
 
         // Start the Dear ImGui frame
         ImGui_ImplOpenGL3_NewFrame();
@@ -169,8 +202,17 @@ namespace Marvel {
 
     }
 
+    void mvLinuxWindow::wakeup()
+    {
+        glfwPostEmptyEvent();
+    }
+
     void mvLinuxWindow::postrender()
     {
+        // keep rendering while the user is interacting (dragging, typing, etc.)
+        if (ImGui::IsAnyItemActive() || ImGui::IsAnyMouseDown())
+            mvApp::RequestRedraw(1);
+
         // Rendering
         ImGui::Render();
         int display_w, display_h;
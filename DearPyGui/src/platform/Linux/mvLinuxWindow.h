@@ -20,6 +20,7 @@ namespace Marvel {
 		void cleanup    () override;
 		void run        () override;
 		void setWindowText(const std::string& name) override;
+		void wakeup       () override;
 
 
 	private:
@@ -75,4 +75,11 @@ namespace Marvel {
         glDeleteTextures(1, &out_srv);
     }
 
+    void UpdateTexture(mvTexture& storage, const float* data, unsigned yoffset, unsigned rows)
+    {
+        glBindTexture(GL_TEXTURE_2D, (GLuint)(size_t)storage.texture);
+        glPixelStorei(GL_UNPACK_ROW_LENGTH, 0);
+        glTexSubImage2D(GL_TEXTURE_2D, 0, 0, yoffset, storage.width, rows, GL_RGBA, GL_FLOAT, data);
+    }
+
 }
@@ -132,4 +132,15 @@ namespace Marvel {
         storage.count = 0;
     }
 
+    void UpdateTexture(mvTexture& storage, const float* data, unsigned yoffset, unsigned rows)
+    {
+        auto view = static_cast<ID3D11ShaderResourceView*>(storage.texture);
+        ID3D11Resource* resource = nullptr;
+        view->GetResource(&resource);
+
+        D3D11_BOX box = { 0u, yoffset, 0u, (UINT)storage.width, yoffset + rows, 1u };
+        mvWindowsWindow::getDeviceContext()->UpdateSubresource(resource, 0, &box, data, storage.width * 4 * sizeof(float), 0);
+        resource->Release();
+    }
+
 }
\ No newline at end of file
@@ -145,6 +145,8 @@ namespace Marvel {
 			m_app->render();
 
 		postrender();
+
+		m_app->getFrameScheduler().pace(GetForegroundWindow() == m_hwnd);
 	}
 
 	void mvWindowsWindow::run()
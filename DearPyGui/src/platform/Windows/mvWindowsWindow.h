@@ -40,7 +40,8 @@ namespace Marvel {
 
 	public:
 
-		static ID3D11Device* getDevice() { return s_pd3dDevice; }
+		static ID3D11Device*        getDevice       () { return s_pd3dDevice; }
+		static ID3D11DeviceContext* getDeviceContext() { return s_pd3dDeviceContext; }
 
 		static LRESULT CALLBACK HandleMsgSetup(HWND hWnd, UINT msg, WPARAM wParam, LPARAM lParam) noexcept;
 